@@ -1,5 +1,13 @@
 """
 __init__.py for the grid-points module
 """
-__all__ = ['Point2D', 'GridIterator2D', 'Point3D', 'GridIterator3D']
+__all__ = ['Point2D', 'GridIterator2D', 'Point3D', 'GridIterator3D',
+           'FrozenPoint2D', 'FrozenPoint3D', 'PointArray2D', 'PointArray3D',
+           'distance', 'GridRange2D', 'GridRange3D', 'parallel',
+           'Grid2D', 'Grid3D', 'SparseGrid2D', 'SparseGrid3D', 'neighborhood',
+           'pathfinding', 'components', 'spatial_index', 'Box2D', 'Box3D',
+           'CuboidSet', 'automaton', 'BitGrid2D',
+           'grid_file', 'char_map', 'buffers', 'bench', 'curves',
+           'traversal', 'async_scan', 'CoordinateCompression', 'SummedAreaTable',
+           'FenwickTree']
 __version__ = "1.0.0"
@@ -0,0 +1,161 @@
+"""
+Module containing asyncio helpers, which scan large grids without blocking the event loop
+
+- `iterate` - iterates over a grid (or any iterable of points) and gives the control back to
+  the event loop every `cells` cells and/or every `milliseconds` milliseconds. The time also
+  includes the work done by the `async for` body, so a slow body yields the control sooner.
+- `map_blocks` - evaluates a function over blocks of a grid in a `concurrent.futures` pool
+  and streams the results back as they complete. At most `max_pending` blocks are submitted
+  at a time, so the scan never queues the whole grid, and the event loop only waits for
+  the pool.
+"""
+import asyncio
+import os
+import time
+from collections import deque
+from concurrent.futures import Executor
+from itertools import islice
+from typing import Any, AsyncIterator, Callable, Iterable, Optional, TypeVar, Union
+
+from src.grid_points.grid_range_2d import GridRange2D
+from src.grid_points.grid_range_3d import GridRange3D
+from src.grid_points.parallel import create_executor
+
+GridRange = Union[GridRange2D, GridRange3D]
+T = TypeVar('T')
+
+
+async def iterate(grid: Iterable[T], cells: Optional[int] = 4096,
+                  milliseconds: Optional[float] = None) -> AsyncIterator[T]:
+    """
+    Iterate over a grid, giving the control back to the event loop periodically
+
+    :param grid: The grid - a GridRange2D/GridRange3D, a grid iterator or any iterable
+    :type grid: Iterable[T]
+    :param cells: Yield the control every `cells` cells, defaults to 4096
+    :type cells: Optional[int], optional
+    :param milliseconds: Yield the control when that much time passed since the last time,
+      defaults to None (only by cells)
+    :type milliseconds: Optional[float], optional
+    :raises ValueError: If both `cells` and `milliseconds` are None, or one of them
+      is not positive
+    :return: Async iterator over the points of the grid
+    :rtype: AsyncIterator[T]
+    """
+    if cells is None and milliseconds is None:
+        raise ValueError("Either the cells or the milliseconds must be given")
+
+    if (cells is not None and cells <= 0) or (milliseconds is not None and milliseconds <= 0):
+        raise ValueError("The cells and the milliseconds must be positive")
+
+    iterator = iter(grid)
+
+    if milliseconds is None:
+        while True:
+            block = list(islice(iterator, cells))
+            if not block:
+                return
+
+            for point in block:
+                yield point
+            await asyncio.sleep(0)
+
+    counted = 0
+    deadline = time.monotonic() + milliseconds / 1000
+    for point in iterator:
+        yield point
+
+        counted += 1
+        if counted == cells or time.monotonic() >= deadline:
+            await asyncio.sleep(0)
+            counted = 0
+            deadline = time.monotonic() + milliseconds / 1000
+
+
+def _map_block(function: Callable, block: GridRange) -> Any:
+    """
+    Evaluate `function` over a block of a grid, passed as a PointArray2D/PointArray3D
+    """
+    return function(next(block.blocks(len(block))))
+
+
+async def map_blocks(function: Callable, grid: GridRange,
+                     executor: Union[str, Executor] = 'process',
+                     max_workers: Optional[int] = None, block_size: int = 4096,
+                     max_pending: Optional[int] = None,
+                     ordered: bool = False) -> AsyncIterator[tuple[GridRange, Any]]:
+    """
+    Evaluate `function` over blocks of a grid in a pool of workers and stream the results.
+
+    The blocks are sent to the workers as slices of the grid range (bounds and a range of
+    cell indices). When `executor` is 'process', `function` must be picklable
+    (e.g. defined on module level).
+
+    The pending blocks are cancelled and an executor created by name is shut down only when
+    the generator is closed. A consumer, which can leave the `async for` early, should close it
+    explicitly, e.g. `async with contextlib.aclosing(map_blocks(...)) as scan:`, otherwise
+    the queued work keeps running until the generator is garbage collected.
+
+    :param function: Called with a PointArray2D/PointArray3D block of up to `block_size` cells
+    :type function: Callable
+    :param grid: The grid
+    :type grid: GridRange
+    :param executor: 'process', 'thread' or an existing executor, defaults to 'process'.
+      An executor created by name is shut down when the generator is closed.
+    :type executor: Union[str, Executor], optional
+    :param max_workers: The amount of workers, defaults to None (the amount of CPUs)
+    :type max_workers: Optional[int], optional
+    :param block_size: The maximum amount of cells per block, defaults to 4096
+    :type block_size: int, optional
+    :param max_pending: The maximum amount of submitted blocks, which are not returned yet,
+      defaults to None (2 per worker)
+    :type max_pending: Optional[int], optional
+    :param ordered: Return the results in the order of the grid instead of the order in which
+      they complete, defaults to False
+    :type ordered: bool, optional
+    :raises ValueError: If `block_size` or `max_pending` are not positive
+    :return: Async iterator over the blocks (as grid ranges) and their results
+    :rtype: AsyncIterator[tuple[GridRange, Any]]
+    """
+    # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+    if block_size <= 0 or (max_pending is not None and max_pending <= 0):
+        raise ValueError("The block size and the amount of pending blocks must be positive")
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    if max_pending is None:
+        max_pending = 2 * max_workers
+
+    loop = asyncio.get_running_loop()
+    pool = executor if isinstance(executor, Executor) else create_executor(executor, max_workers)
+    blocks = (grid[begin:begin + block_size] for begin in range(0, len(grid), block_size))
+    pending: deque[tuple[GridRange, asyncio.Future]] = deque()
+
+    try:
+        while True:
+            for block in islice(blocks, max_pending - len(pending)):
+                pending.append((block, loop.run_in_executor(pool, _map_block, function, block)))
+
+            if not pending:
+                return
+
+            if ordered:
+                await asyncio.wait([pending[0][1]])
+                while pending and pending[0][1].done():
+                    block, future = pending.popleft()
+                    yield block, future.result()
+                continue
+
+            await asyncio.wait([future for _, future in pending],
+                               return_when=asyncio.FIRST_COMPLETED)
+            done = [item for item in pending if item[1].done()]
+            pending = deque(item for item in pending if not item[1].done())
+            for block, future in done:
+                yield block, future.result()
+    finally:
+        for _, future in pending:
+            future.cancel()
+
+        if pool is not executor:
+            pool.shutdown(wait=False, cancel_futures=True)
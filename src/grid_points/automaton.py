@@ -0,0 +1,419 @@
+"""
+Module containing cellular automata over 2D and 3D boards
+
+The cells are either alive (1) or dead (0). A rule maps the state of a cell and the amount
+of its alive neighbors to its next state. The rule is tabulated once, so a generation is
+computed with whole-buffer operations:
+- the neighbor counts are the sum of the board, shifted by every offset of the neighborhood
+- the next states are a table lookup by state and count
+
+Automaton works on a bounded board (the cells outside of it are dead), while SparseAutomaton
+keeps only the alive cells and grows in every direction.
+"""
+import re
+from array import array
+from collections import Counter
+from itertools import product, repeat
+from operator import add, mul
+from typing import Callable, Iterable, Optional, Sequence, Union
+
+from src.grid_points.grid_2d import Grid2D
+from src.grid_points.grid_3d import Grid3D
+from src.grid_points.neighborhood import OFFSETS_2D, OFFSETS_3D
+from src.grid_points.point_2d import Point2D
+from src.grid_points.point_3d import Point3D
+
+Grid = Union[Grid2D, Grid3D]
+Point = Union[Point2D, Point3D]
+
+
+class Rule:
+    """
+    Represents the rule of a cellular automaton.
+
+    The rule is either given by the neighbor counts, at which a dead cell is born
+    and an alive cell survives (e.g. `Rule({3}, {2, 3})` for Conway's Game of Life),
+    or by a function `function(state, count) -> state`, which overrides them.
+    """
+    __slots__ = ('__birth', '__survival', '__function')
+
+    def __init__(self, birth: Iterable[int] = (3,), survival: Iterable[int] = (2, 3),
+                 function: Optional[Callable[[int, int], int]] = None):
+        self.__birth = frozenset(birth)
+        self.__survival = frozenset(survival)
+        self.__function = function
+
+    @classmethod
+    def from_string(cls, rule: str) -> "Rule":
+        """
+        Create a rule from its B/S notation, e.g. 'B3/S23'
+
+        :param rule: The rule, as 'B<digits>/S<digits>'
+        :type rule: str
+        :raises ValueError: If the rule is not in the B/S notation
+        :return: The rule
+        :rtype: Rule
+        """
+        match = re.fullmatch(r'B(\d*)/S(\d*)', rule.upper())
+        if match is None:
+            raise ValueError(f"Invalid rule '{rule}', expected e.g. 'B3/S23'")
+
+        return cls(map(int, match.group(1)), map(int, match.group(2)))
+
+    @property
+    def birth(self) -> frozenset[int]:
+        """
+        Return the neighbor counts, at which a dead cell becomes alive
+
+        :rtype: frozenset[int]
+        """
+        return self.__birth
+
+    @property
+    def survival(self) -> frozenset[int]:
+        """
+        Return the neighbor counts, at which an alive cell stays alive
+
+        :rtype: frozenset[int]
+        """
+        return self.__survival
+
+    def next_state(self, state: int, count: int) -> int:
+        """
+        Return the next state of a cell
+
+        :param state: 1 if the cell is alive, 0 otherwise
+        :type state: int
+        :param count: The amount of alive neighbors
+        :type count: int
+        :rtype: int
+        """
+        if self.__function is not None:
+            return int(bool(self.__function(state, count)))
+
+        return int(count in (self.__survival if state else self.__birth))
+
+    def table(self, neighbors: int) -> array:
+        """
+        Return the next states of every state and count,
+        where the next state of `state` and `count` is at `state * (neighbors + 1) + count`
+
+        :param neighbors: The amount of neighbors of a cell
+        :type neighbors: int
+        :rtype: array
+        """
+        return array('b', (self.next_state(state, count)
+                           for state in (0, 1) for count in range(neighbors + 1)))
+
+    def __repr__(self) -> str:
+        if self.__function is not None:
+            return f"Rule(function={self.__function!r})"
+
+        return f"Rule.from_string('B{''.join(map(str, sorted(self.__birth)))}" \
+               f"/S{''.join(map(str, sorted(self.__survival)))}')"
+
+
+def _offsets(dimensions: int, connectivity: Optional[int]) -> tuple[tuple[int, ...], ...]:
+    """
+    Return the offsets of a neighborhood, defaulting to the Moore neighborhood
+    """
+    offsets = OFFSETS_2D if dimensions == 2 else OFFSETS_3D
+    if connectivity is None:
+        connectivity = max(offsets)
+
+    if connectivity not in offsets:
+        raise ValueError(f"Invalid connectivity {connectivity}, expected one of {list(offsets)}")
+
+    return offsets[connectivity]
+
+
+class Automaton:
+    """
+    Cellular automaton over a bounded 2D or 3D board. The cells outside the board are dead.
+
+    The board is kept in two flat buffers, padded with a layer of dead cells, so the neighbors
+    of every cell are at fixed offsets in the buffer. A generation reads one buffer
+    and writes the other, then the buffers are swapped.
+    """
+    # pylint: disable=too-many-instance-attributes
+    __slots__ = ('__grid', '__rule', '__table', '__deltas', '__strides', '__first', '__length',
+                 '__mask', '__rows', '__current', '__next', '__generation')
+
+    def __init__(self, grid: Grid, rule: Optional[Rule] = None,
+                 connectivity: Optional[int] = None):
+        """
+        :param grid: The initial board - every non-zero cell is alive. The grid is not changed.
+        :type grid: Grid
+        :param rule: The rule, defaults to None (Conway's Game of Life)
+        :type rule: Optional[Rule], optional
+        :param connectivity: The neighborhood, defaults to None (8 in 2D, 26 in 3D)
+        :type connectivity: Optional[int], optional
+        """
+        shape = grid.shape
+        offsets = _offsets(len(shape), connectivity)
+
+        self.__grid = grid
+        self.__rule = Rule() if rule is None else rule
+        self.__table = self.__rule.table(len(offsets))
+        self.__generation = 0
+
+        padded = [size + 2 for size in shape]
+        strides = [1] * len(padded)
+        for axis in range(len(padded) - 2, -1, -1):
+            strides[axis] = strides[axis + 1] * padded[axis + 1]
+
+        self.__deltas = [sum(map(mul, offset, strides)) for offset in offsets]
+        # The Moore neighborhood is counted as a box sum, one axis at a time
+        self.__strides = strides[::-1] if len(offsets) == 3 ** len(shape) - 1 else []
+        # The cells are updated as one run from the first to the last cell of the board,
+        # the padding cells inside the run are kept dead by the mask
+        self.__first = sum(strides)
+        self.__length = sum(map(mul, shape, strides)) - self.__first + 1 if all(shape) else 0
+
+        mask = array('b', [1]) * shape[-1]
+        for axis in range(len(shape) - 2, -1, -1):
+            mask = (mask + array('b', [0]) * (2 * strides[axis + 1])) * shape[axis]
+        self.__mask = mask[:self.__length]
+
+        # The positions of the lines of the board (along the last axis) in the padded buffer
+        self.__rows = [self.__first + sum(map(mul, outer, strides))
+                       for outer in product(*map(range, shape[:-1]))] if all(shape) else []
+
+        cells = 1
+        for size in padded:
+            cells *= size
+        self.__current = array('b', [0]) * cells
+        self.__next = array('b', [0]) * cells
+
+        line = shape[-1]
+        for index, row in enumerate(self.__rows):
+            self.__current[row:row + line] = array(
+                'b', map(bool, grid.data[index * line:(index + 1) * line]))
+
+    @property
+    def generation(self) -> int:
+        """
+        Return the amount of steps done so far
+
+        :rtype: int
+        """
+        return self.__generation
+
+    @property
+    def population(self) -> int:
+        """
+        Return the amount of alive cells
+
+        :rtype: int
+        """
+        return sum(self.__current)
+
+    def step(self, generations: int = 1):
+        """
+        Advance the automaton
+
+        :param generations: The amount of generations, defaults to 1
+        :type generations: int, optional
+        """
+        first = self.__first
+        length = self.__length
+        stride = len(self.__table) // 2
+        # The box sums include the cell itself, so alive cells are shifted back by one
+        multiplier = stride - 1 if self.__strides else stride
+
+        for _ in range(generations):
+            current = self.__current
+
+            counts: Iterable[int]
+            if self.__strides:
+                counts = self.__box_sums()
+            else:
+                counts = repeat(0, length)
+                for delta in self.__deltas:
+                    counts = map(add, counts, current[first + delta:first + delta + length])
+
+            states = map(mul, current[first:first + length], repeat(multiplier))
+            result = map(self.__table.__getitem__, map(add, states, counts))
+            self.__next[first:first + length] = array('b', map(mul, result, self.__mask))
+
+            self.__current, self.__next = self.__next, self.__current
+            self.__generation += 1
+
+    def __box_sums(self) -> Sequence[int]:
+        """
+        Return the sums of the 3x3 (3x3x3) boxes around every cell of the run.
+
+        The box is separable - it is summed along one axis at a time, which takes 2 additions
+        per axis instead of one per neighbor. The sum along an axis is valid `stride` cells
+        inside both ends of the buffer, so after all axes the sums start at the first cell.
+        """
+        sums: Sequence[int] = self.__current
+        for stride in self.__strides:
+            size = len(sums)
+            sums = list(map(add, map(add, sums[:size - 2 * stride], sums[stride:size - stride]),
+                            sums[2 * stride:]))
+
+        return sums
+
+    def to_grid(self) -> Grid:
+        """
+        Return the board as a grid with the bounds of the initial one (1 for alive cells)
+
+        :rtype: Grid
+        """
+        line = self.__grid.shape[-1]
+        data = array('b')
+        for row in self.__rows:
+            data.extend(self.__current[row:row + line])
+
+        if not data:
+            data = array('b', [0]) * len(self.__grid)
+
+        return self.__grid.__class__.from_buffer(data, self.__grid.end,  # type: ignore[arg-type]
+                                                 self.__grid.start)  # type: ignore[arg-type]
+
+    def __repr__(self) -> str:
+        return f"Automaton({self.__grid!r}, {self.__rule!r})"
+
+
+class SparseAutomaton:
+    """
+    Cellular automaton over an unbounded 2D or 3D board, which keeps only the alive cells.
+
+    The neighbor counts are collected in a Counter by shifting the coordinates of all alive
+    cells by every offset, so the work per generation depends on the amount of alive cells,
+    not on the extent of the board.
+    """
+    __slots__ = ('__rule', '__table', '__offsets', '__dimensions', '__alive', '__generation')
+
+    def __init__(self, cells: Iterable[Point], rule: Optional[Rule] = None,
+                 dimensions: int = 2, connectivity: Optional[int] = None):
+        """
+        :param cells: The alive cells
+        :type cells: Iterable[Point]
+        :param rule: The rule, defaults to None (Conway's Game of Life)
+        :type rule: Optional[Rule], optional
+        :param dimensions: 2 or 3, defaults to 2
+        :type dimensions: int, optional
+        :param connectivity: The neighborhood, defaults to None (8 in 2D, 26 in 3D)
+        :type connectivity: Optional[int], optional
+        :raises ValueError: If the rule makes dead cells with no alive neighbors alive
+        """
+        self.__offsets = _offsets(dimensions, connectivity)
+        self.__rule = Rule() if rule is None else rule
+        self.__table = self.__rule.table(len(self.__offsets))
+        self.__dimensions = dimensions
+        self.__generation = 0
+
+        if self.__table[0]:
+            raise ValueError("The rule makes an infinite amount of cells alive")
+
+        self.__alive: set[tuple[int, ...]]
+        if dimensions == 2:
+            self.__alive = {(point.x, point.y) for point in cells}
+        else:
+            self.__alive = {(point.x, point.y, point.z)  # type: ignore[union-attr]
+                            for point in cells}
+
+    @property
+    def generation(self) -> int:
+        """
+        Return the amount of steps done so far
+
+        :rtype: int
+        """
+        return self.__generation
+
+    @property
+    def population(self) -> int:
+        """
+        Return the amount of alive cells
+
+        :rtype: int
+        """
+        return len(self.__alive)
+
+    def step(self, generations: int = 1):
+        """
+        Advance the automaton
+
+        :param generations: The amount of generations, defaults to 1
+        :type generations: int, optional
+        """
+        table = self.__table
+        stride = len(table) // 2
+
+        for _ in range(generations):
+            alive = self.__alive
+            axes = list(zip(*alive)) or [()] * self.__dimensions
+
+            counts: Counter = Counter()
+            for offset in self.__offsets:
+                counts.update(zip(*(map(add, axis, repeat(delta))
+                                    for axis, delta in zip(axes, offset))))
+
+            result = {cell for cell, count in counts.items()
+                      if table[stride * (cell in alive) + count]}
+            if table[stride]:
+                # Alive cells without alive neighbors are not counted
+                result.update(cell for cell in alive if cell not in counts)
+
+            self.__alive = result
+            self.__generation += 1
+
+    def cells(self) -> list[Point]:
+        """
+        Return the alive cells, in the order of the grid iterators
+
+        :rtype: list[Point]
+        """
+        point_class: type = Point2D if self.__dimensions == 2 else Point3D
+        return [point_class(*cell) for cell in sorted(self.__alive)]
+
+    def bounding_box(self) -> Optional[tuple[Point, Point]]:
+        """
+        Return the smallest bounds, which contain every alive cell
+
+        :return: (start, end) with the same meaning as in `is_within` and the grid iterators,
+          or None if there are no alive cells
+        :rtype: Optional[tuple[Point, Point]]
+        """
+        if not self.__alive:
+            return None
+
+        point_class: type = Point2D if self.__dimensions == 2 else Point3D
+        axes = list(zip(*self.__alive))
+        return (point_class(*map(min, axes)),
+                point_class(*(value + 1 for value in map(max, axes))))
+
+    def to_grid(self) -> Grid:
+        """
+        Convert to a dense grid of type 'b', covering the bounding box of the alive cells
+
+        :rtype: Grid
+        """
+        grid_class: type = Grid2D if self.__dimensions == 2 else Grid3D
+        bounds = self.bounding_box()
+        if bounds is None:
+            origin = (0,) * self.__dimensions
+            point_class: type = Point2D if self.__dimensions == 2 else Point3D
+            return grid_class(point_class(*origin), point_class(*origin), 'b')
+
+        start, end = bounds
+        grid = grid_class(end, start, 'b')
+        for cell in self.__alive:
+            grid.set_unchecked(*cell, 1)
+
+        return grid
+
+    def __contains__(self, point: object) -> bool:
+        if isinstance(point, Point3D):
+            return (point.x, point.y, point.z) in self.__alive
+
+        if isinstance(point, Point2D):
+            return (point.x, point.y) in self.__alive
+
+        return False
+
+    def __repr__(self) -> str:
+        return f"SparseAutomaton({self.population} cells, {self.__rule!r})"
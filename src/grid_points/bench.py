@@ -0,0 +1,431 @@
+"""
+Benchmark suite of the points (mutable and frozen), the iterators and the engines built on top
+of them. DictPoint2D/DictPoint3D are the points without `__slots__` (a `__dict__` per instance),
+the baseline of the memory and set benchmarks.
+
+Every benchmark runs a batch of operations several times and keeps the fastest run, so the
+result is the time of a single operation with as little noise as possible. The memory is
+the peak amount of bytes allocated per operation, measured in a separate run.
+Run from the root of the repository:
+
+    python -m src.grid_points.bench run [--output results.json] [--filter TEXT] [--repeat N]
+    python -m src.grid_points.bench compare baseline.json results.json [--threshold 0.1]
+
+`compare` prints the ratio of every benchmark between two runs and exits with 1 if any of them
+is slower (or uses more memory) by more than the threshold.
+New benchmarks are added with the `benchmark` decorator.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from collections import deque
+from functools import partial
+from typing import Callable, Optional
+
+from src.grid_points.automaton import Automaton
+from src.grid_points.bit_grid_2d import BitGrid2D
+from src.grid_points.components import label
+from src.grid_points.curves import hilbert_encode, morton_encode
+from src.grid_points.frozen_point_2d import FrozenPoint2D
+from src.grid_points.frozen_point_3d import FrozenPoint3D
+from src.grid_points.grid_2d import Grid2D
+from src.grid_points.grid_iterator_2d import GridIterator2D
+from src.grid_points.grid_iterator_3d import GridIterator3D
+from src.grid_points.pathfinding import astar
+from src.grid_points.point_2d import Point2D
+from src.grid_points.point_3d import Point3D
+from src.grid_points.point_array_2d import PointArray2D
+from src.grid_points.spatial_index import KDTree
+from src.grid_points.summed_area import SummedAreaTable
+
+# A setup creates the state of a benchmark and returns the function, which runs a batch
+# of operations, and the amount of operations in the batch
+Setup = Callable[[], tuple[Callable[[], object], int]]
+Results = dict[str, dict[str, float]]
+
+BENCHMARKS: dict[str, Setup] = {}
+
+
+def benchmark(name: str, *sizes: int) -> Callable[[Callable], Callable]:
+    """
+    Register a benchmark, once per size (or once, if there are no sizes)
+
+    :param name: The name of the benchmark, the size is added as `name[size]`
+    :type name: str
+    :param sizes: The sizes, with which the setup is called
+    :type sizes: int
+    :return: Decorator of the setup - a function, which takes the size and returns the batch
+      function and the amount of operations in it
+    :rtype: Callable[[Callable], Callable]
+    """
+    def register(setup: Callable) -> Callable:
+        if not sizes:
+            BENCHMARKS[name] = setup
+        for size in sizes:
+            BENCHMARKS[f'{name}[{size}]'] = partial(setup, size)
+
+        return setup
+
+    return register
+
+
+def _coordinates(count: int, dimensions: int) -> list[tuple[int, ...]]:
+    """
+    Return pseudo-random, repeatable coordinates
+    """
+    return [tuple((i * (7919 + 104729 * axis)) % 1000 for axis in range(dimensions))
+            for i in range(count)]
+
+
+def _points(count: int, dimensions: int) -> list:
+    """
+    Return pseudo-random, repeatable points
+    """
+    point_class: type = Point2D if dimensions == 2 else Point3D
+    return [point_class(*coordinates) for coordinates in _coordinates(count, dimensions)]
+
+
+def _register_points(point_class: type, dimensions: int, count: int = 10_000):
+    """
+    Register the benchmarks of the operations of a point class
+    """
+    name = point_class.__name__
+
+    def instances() -> list:
+        return [point_class(*c) for c in _coordinates(count, dimensions)]
+
+    @benchmark(f'{name}()')
+    def construction():
+        coordinates = _coordinates(count, dimensions)
+        return lambda: [point_class(*c) for c in coordinates], count
+
+    @benchmark(f'{name}.__add__')
+    def addition():
+        points, others = instances(), instances()[::-1]
+        return lambda: list(map(point_class.__add__, points, others)), count
+
+    @benchmark(f'{name}.__sub__')
+    def subtraction():
+        points, others = instances(), instances()[::-1]
+        return lambda: list(map(point_class.__sub__, points, others)), count
+
+    @benchmark(f'{name}.__hash__')
+    def hashing():
+        points = instances()
+        return lambda: list(map(hash, points)), count
+
+    @benchmark(f'{name} set insert')
+    def insertion():
+        points = instances()
+        return lambda: set(points), count
+
+    @benchmark(f'{name} in set')
+    def membership():
+        points = instances()
+        visited = set(points[::2])
+        return lambda: sum(map(visited.__contains__, points)), count
+
+    @benchmark(f'{name}.distance_to')
+    def distance():
+        points, others = instances(), instances()[::-1]
+        return lambda: list(map(point_class.distance_to, points, others)), count
+
+    @benchmark(f'{name}.is_within')
+    def within():
+        points = instances()
+        end = point_class(*[500] * dimensions)
+        start = point_class(*[100] * dimensions)
+        return lambda: [point.is_within(end, start) for point in points], count
+
+
+class _DictPoint2D:
+    """
+    Point2D with the layout it had before `__slots__` - the coordinates are kept in
+    a per-instance `__dict__`. Baseline of the memory and set benchmarks of the slotted points.
+    """
+    def __init__(self, x: int, y: int):
+        self.x = x
+        self.y = y
+
+    def __hash__(self) -> int:
+        return hash((self.x, self.y))
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _DictPoint2D) and self.x == other.x and self.y == other.y
+
+
+class _DictPoint3D:
+    """
+    Point3D with the layout it had before `__slots__`, see _DictPoint2D
+    """
+    def __init__(self, x: int, y: int, z: int):
+        self.x = x
+        self.y = y
+        self.z = z
+
+    def __hash__(self) -> int:
+        return hash((self.x, self.y, self.z))
+
+    def __eq__(self, other: object) -> bool:
+        return (isinstance(other, _DictPoint3D) and self.x == other.x and self.y == other.y and
+                self.z == other.z)
+
+
+def _register_baseline(point_class: type, dimensions: int, name: str, count: int = 10_000):
+    """
+    Register the construction (memory per instance) and set benchmarks of a baseline class
+    """
+    @benchmark(f'{name}()')
+    def construction():
+        coordinates = _coordinates(count, dimensions)
+        return lambda: [point_class(*c) for c in coordinates], count
+
+    @benchmark(f'{name}.__hash__')
+    def hashing():
+        points = [point_class(*c) for c in _coordinates(count, dimensions)]
+        return lambda: list(map(hash, points)), count
+
+    @benchmark(f'{name} set insert')
+    def insertion():
+        points = [point_class(*c) for c in _coordinates(count, dimensions)]
+        return lambda: set(points), count
+
+    @benchmark(f'{name} in set')
+    def membership():
+        points = [point_class(*c) for c in _coordinates(count, dimensions)]
+        visited = set(points[::2])
+        return lambda: sum(map(visited.__contains__, points)), count
+
+
+_register_points(Point2D, 2)
+_register_points(Point3D, 3)
+_register_points(FrozenPoint2D, 2)
+_register_points(FrozenPoint3D, 3)
+_register_baseline(_DictPoint2D, 2, 'DictPoint2D')
+_register_baseline(_DictPoint3D, 3, 'DictPoint3D')
+
+
+@benchmark('GridIterator2D', 16, 128, 512)
+def _grid_iterator_2d(size: int):
+    end = Point2D(size, size)
+    return lambda: deque(GridIterator2D(end), maxlen=0), size * size
+
+
+@benchmark('GridIterator3D', 8, 32, 64)
+def _grid_iterator_3d(size: int):
+    end = Point3D(size, size, size)
+    return lambda: deque(GridIterator3D(end), maxlen=0), size ** 3
+
+
+@benchmark('morton_encode', 100_000)
+def _morton(size: int):
+    points = PointArray2D.from_points(_points(size, 2))
+    return partial(morton_encode, points), size
+
+
+@benchmark('hilbert_encode', 100_000)
+def _hilbert(size: int):
+    points = PointArray2D.from_points(_points(size, 2))
+    return partial(hilbert_encode, points, 10), size
+
+
+def _random_grid(size: int) -> Grid2D:
+    """
+    Return a repeatable grid with about 30% of non-zero cells
+    """
+    grid = Grid2D(Point2D(size, size), typecode='b')
+    for index in range(len(grid)):
+        grid.data[index] = (index * 2654435761) % 1000 < 300
+
+    return grid
+
+
+@benchmark('Automaton.step', 256)
+def _automaton(size: int):
+    automaton = Automaton(_random_grid(size))
+    return automaton.step, size * size
+
+
+@benchmark('BitGrid2D.step', 1024)
+def _bit_grid(size: int):
+    grid = BitGrid2D.from_grid(_random_grid(size))
+    return grid.step, size * size
+
+
+@benchmark('components.label', 256)
+def _label(size: int):
+    grid = _random_grid(size)
+    return partial(label, grid), size * size
+
+
+@benchmark('pathfinding.astar', 128)
+def _astar(size: int):
+    grid = _random_grid(size)
+    grid.set(0, 0, 0)
+    grid.set(size - 1, size - 1, 0)
+    passable: Callable[[object], bool] = lambda value: value == 0
+    return partial(astar, grid, Point2D(0, 0), Point2D(size - 1, size - 1), passable), 1
+
+
+@benchmark('SummedAreaTable.query_many', 512)
+def _summed_area(size: int):
+    table = SummedAreaTable(_random_grid(size), value=1)
+    ends = PointArray2D.from_points(_points(10_000, 2)) * Point2D(size, size)
+    ends = ends // Point2D(1000, 1000)
+    starts = ends - Point2D(size // 4, size // 4)
+    return partial(table.query_many, ends, starts), len(ends)
+
+
+@benchmark('KDTree.nearest', 10_000)
+def _kd_tree(size: int):
+    tree = KDTree(_points(size, 2))
+    queries = _points(1000, 2)[::-1]
+    return lambda: [tree.nearest(query, 4) for query in queries], len(queries)
+
+
+def measure(setup: Setup, repeat: int = 5) -> dict[str, float]:
+    """
+    Run a benchmark
+
+    :param setup: The setup of the benchmark
+    :type setup: Setup
+    :param repeat: The amount of timed runs, defaults to 5
+    :type repeat: int, optional
+    :return: The seconds per operation of the fastest run (`seconds`) and the peak amount of
+      allocated bytes per operation (`memory`)
+    :rtype: dict[str, float]
+    """
+    run, operations = setup()
+    run()  # Warm up
+
+    best = float('inf')
+    for _ in range(repeat):
+        begin = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - begin)
+
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {'seconds': best / operations, 'memory': peak / operations}
+
+
+def run_all(pattern: str = '', repeat: int = 5,
+            report: Optional[Callable[[str, dict[str, float]], None]] = None) -> Results:
+    """
+    Run the registered benchmarks
+
+    :param pattern: Run only the benchmarks, whose names contain it, defaults to '' (all)
+    :type pattern: str, optional
+    :param repeat: The amount of timed runs of every benchmark, defaults to 5
+    :type repeat: int, optional
+    :param report: Called with the name and the result of every benchmark, as soon as it is done,
+      defaults to None
+    :type report: Optional[Callable[[str, dict[str, float]], None]], optional
+    :return: The result of every benchmark by name
+    :rtype: Results
+    """
+    results: Results = {}
+    for name, setup in BENCHMARKS.items():
+        if pattern in name:
+            results[name] = measure(setup, repeat)
+            if report is not None:
+                report(name, results[name])
+
+    return results
+
+
+def compare(baseline: Results, current: Results,
+            threshold: float = 0.1) -> list[tuple[str, float, float, bool]]:
+    """
+    Compare the results of two runs
+
+    :param baseline: The results of the earlier run
+    :type baseline: Results
+    :param current: The results of the later run
+    :type current: Results
+    :param threshold: The relative slowdown (or growth of memory), which is a regression,
+      defaults to 0.1 (10%). Growth of memory below a byte per operation is ignored, as it is
+      the noise of the allocations shared by the whole batch.
+    :type threshold: float, optional
+    :return: (name, time ratio, memory ratio, is regression) for every benchmark in both runs,
+      where a ratio is current / baseline
+    :rtype: list[tuple[str, float, float, bool]]
+    """
+    rows = []
+    for name in baseline.keys() & current.keys():
+        before, after = baseline[name], current[name]
+        seconds = after['seconds'] / before['seconds'] if before['seconds'] else 1.0
+        memory = after['memory'] / before['memory'] if before['memory'] else 1.0
+        grown = after['memory'] > before['memory'] * (1 + threshold) + 1
+        rows.append((name, seconds, memory, seconds > 1 + threshold or grown))
+
+    return sorted(rows)
+
+
+def _print_result(name: str, result: dict[str, float]):
+    """
+    Print a row of the results table
+    """
+    print(f'{name:<32}{result["seconds"] * 1e9:>14,.1f}{result["memory"]:>14,.1f}')
+
+
+def main(arguments: Optional[list[str]] = None) -> int:
+    """
+    Run the command line interface
+
+    :param arguments: The command line arguments, defaults to None (sys.argv)
+    :type arguments: Optional[list[str]], optional
+    :return: The exit code - 1 if `compare` found regressions, 0 otherwise
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='Run the benchmarks')
+    run_parser.add_argument('--output', help='Save the results as JSON to this file')
+    run_parser.add_argument('--filter', default='', help='Run only the matching benchmarks')
+    run_parser.add_argument('--repeat', type=int, default=5, help='Amount of timed runs')
+
+    compare_parser = commands.add_parser('compare', help='Compare the results of two runs')
+    compare_parser.add_argument('baseline', help='JSON file of the earlier run')
+    compare_parser.add_argument('current', help='JSON file of the later run')
+    compare_parser.add_argument('--threshold', type=float, default=0.1,
+                                help='Relative slowdown, which is a regression')
+
+    args = parser.parse_args(arguments)
+
+    if args.command == 'run':
+        print(f'{"benchmark":<32}{"ns/op":>14}{"bytes/op":>14}')
+        results = run_all(args.filter, args.repeat, _print_result)
+
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as file:
+                json.dump({'python': platform.python_version(), 'platform': platform.platform(),
+                           'timestamp': time.time(), 'results': results}, file, indent=2)
+        return 0
+
+    with open(args.baseline, encoding='utf-8') as file:
+        baseline = json.load(file)['results']
+    with open(args.current, encoding='utf-8') as file:
+        current = json.load(file)['results']
+
+    rows = compare(baseline, current, args.threshold)
+    print(f'{"benchmark":<32}{"time":>10}{"memory":>10}')
+    for name, seconds, memory, regression in rows:
+        print(f'{name:<32}{seconds:>10.2f}{memory:>10.2f}{"  REGRESSION" if regression else ""}')
+
+    for name in sorted(baseline.keys() ^ current.keys()):
+        print(f'{name:<32}{"only in " + ("baseline" if name in baseline else "current"):>20}')
+
+    return 1 if any(row[3] for row in rows) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,442 @@
+"""
+Module containing the BitGrid2D class
+"""
+from array import array
+from functools import lru_cache
+from itertools import compress, repeat
+from operator import add, floordiv, mod, mul
+from typing import Iterable, Optional, Union
+
+from src.grid_points.automaton import Rule
+from src.grid_points.grid_2d import Grid2D
+from src.grid_points.neighborhood import OFFSETS_2D
+from src.grid_points.point_2d import Point2D
+from src.grid_points.point_array_2d import PointArray2D
+
+# Between the cells (0/1 bytes) and the digits of a binary string
+_TO_DIGITS = bytes.maketrans(b'\x00\x01', b'01')
+_FROM_DIGITS = bytes.maketrans(b'01', b'\x00\x01')
+
+
+@lru_cache(maxsize=32)
+def _columns(size_x: int, size_y: int, low: int, high: int) -> int:
+    """
+    Return the bits of the cells with `low <= y < high` (local coordinates) in every row
+    """
+    low, high = max(low, 0), min(high, size_y)
+    if low >= high or not size_x:
+        return 0
+
+    # The row is copied by doubling, instead of one shift per row
+    result = ((1 << (high - low)) - 1) << low
+    rows = 1
+    while rows < size_x:
+        result |= result << (rows * size_y)
+        rows *= 2
+
+    return result & ((1 << (size_x * size_y)) - 1)
+
+
+def _pack(cells: bytes) -> int:
+    """
+    Return the bits of a sequence of 0/1 bytes, the first byte being the lowest bit
+    """
+    return int(cells.translate(_TO_DIGITS)[::-1] or b'0', 2)
+
+
+def _unpack(bits: int, length: int) -> bytes:
+    """
+    Return the lowest `length` bits as a sequence of 0/1 bytes, the lowest bit first
+    """
+    if not length:
+        return b''
+
+    return format(bits, f'0{length}b').encode('ascii')[::-1].translate(_FROM_DIGITS)
+
+
+class BitGrid2D:
+    """
+    Boolean grid over the 2D cells defined by `end` and `start` (default is (0, 0)),
+    which stores a single bit per cell.
+
+    The whole grid is a single Python integer - the cell (x, y) is the bit at its row-major
+    position (the same as in Grid2D), so every row is a run of `shape[1]` bits. The operators
+    (`&`, `|`, `^`, `~`), the shifts and the neighbor counts are a few operations over the whole
+    integer, which are done word by word in C, instead of once per cell.
+
+    The grids of a binary operation must have the same bounds. The operations return new grids.
+    Changing a single cell rebuilds the integer, so it is better to build a grid at once
+    with `from_points`/`from_grid`.
+    """
+    __slots__ = ('__start_x', '__start_y', '__size_x', '__size_y', '__bits')
+
+    def __init__(self, end: Point2D, start: Optional[Point2D] = None, fill: bool = False):
+        if start is None:
+            start = Point2D(0, 0)
+
+        self.__start_x = start.x
+        self.__start_y = start.y
+        self.__size_x = max(0, end.x - start.x)
+        self.__size_y = max(0, end.y - start.y)
+        self.__bits = self.__full() if fill else 0
+
+    def __full(self) -> int:
+        """
+        Return the bits of all cells
+        """
+        return (1 << (self.__size_x * self.__size_y)) - 1
+
+    def __with_bits(self, bits: int) -> "BitGrid2D":
+        """
+        Return a grid with the same bounds and the given bits
+        """
+        # pylint: disable=protected-access,unused-private-member
+        result = BitGrid2D.__new__(BitGrid2D)
+        result.__start_x = self.__start_x
+        result.__start_y = self.__start_y
+        result.__size_x = self.__size_x
+        result.__size_y = self.__size_y
+        result.__bits = bits
+        return result
+
+    @classmethod
+    def from_points(cls, points: Union[Iterable[Point2D], PointArray2D], end: Point2D,
+                    start: Optional[Point2D] = None) -> "BitGrid2D":
+        """
+        Create a grid, where the given points are set
+
+        :param points: The set cells
+        :type points: Union[Iterable[Point2D], PointArray2D]
+        :param end: The upper bounds of the grid
+        :type end: Point2D
+        :param start: The lower bounds of the grid, defaults to None (0, 0)
+        :type start: Optional[Point2D], optional
+        :raises IndexError: If a point is outside the grid
+        :rtype: BitGrid2D
+        """
+        result = cls(end, start)
+        if not isinstance(points, PointArray2D):
+            points = PointArray2D.from_points(points)
+
+        size_x, size_y = result.shape
+        xs = array('q', map(add, points.xs, repeat(-result.__start_x)))
+        ys = array('q', map(add, points.ys, repeat(-result.__start_y)))
+        if xs and not (0 <= min(xs) and max(xs) < size_x and 0 <= min(ys) and max(ys) < size_y):
+            raise IndexError("A point is outside the grid")
+
+        cells = bytearray(size_x * size_y)
+        for index in map(add, map(mul, xs, repeat(size_y)), ys):
+            cells[index] = 1
+
+        return result.__with_bits(_pack(bytes(cells)))
+
+    @classmethod
+    def from_grid(cls, grid: Grid2D) -> "BitGrid2D":
+        """
+        Create a grid with the bounds of a dense grid, where the non-zero cells are set
+
+        :param grid: The dense grid
+        :type grid: Grid2D
+        :rtype: BitGrid2D
+        """
+        return cls.from_bytes(bytes(map(bool, grid.data)), grid.end, grid.start)
+
+    @classmethod
+    def from_bytes(cls, cells: bytes, end: Point2D,
+                   start: Optional[Point2D] = None) -> "BitGrid2D":
+        """
+        Create a grid from a byte per cell (0 or 1), in row-major order
+
+        :param cells: The cells, 1 for the set ones and 0 for the others
+        :type cells: bytes
+        :param end: The upper bounds of the grid
+        :type end: Point2D
+        :param start: The lower bounds of the grid, defaults to None (0, 0)
+        :type start: Optional[Point2D], optional
+        :raises ValueError: If the amount of bytes does not match the amount of cells
+        :rtype: BitGrid2D
+        """
+        result = cls(end, start)
+        if len(cells) != len(result):
+            raise ValueError(f"Expected {len(result)} cells, got {len(cells)}")
+
+        return result.__with_bits(_pack(cells))
+
+    @property
+    def start(self) -> Point2D:
+        """
+        Return the lower (inclusive) bounds of the grid
+
+        :rtype: Point2D
+        """
+        return Point2D(self.__start_x, self.__start_y)
+
+    @property
+    def end(self) -> Point2D:
+        """
+        Return the upper (exclusive) bounds of the grid
+
+        :rtype: Point2D
+        """
+        return Point2D(self.__start_x + self.__size_x, self.__start_y + self.__size_y)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """
+        Return the amount of cells along every axis
+
+        :rtype: tuple[int, int]
+        """
+        return self.__size_x, self.__size_y
+
+    @property
+    def bits(self) -> int:
+        """
+        Return the bits of the grid, with the cell (x, y) at its row-major position
+
+        :rtype: int
+        """
+        return self.__bits
+
+    def index(self, x: int, y: int) -> int:
+        """
+        Return the position of a cell in the bits
+
+        :raises IndexError: If the cell is outside the grid
+        :rtype: int
+        """
+        local_x = x - self.__start_x
+        local_y = y - self.__start_y
+
+        if not (0 <= local_x < self.__size_x and 0 <= local_y < self.__size_y):
+            raise IndexError(f"({x}, {y}) is outside the grid")
+
+        return local_x * self.__size_y + local_y
+
+    def get(self, x: int, y: int) -> bool:
+        """
+        Check if a cell is set
+
+        :raises IndexError: If the cell is outside the grid
+        :rtype: bool
+        """
+        return bool(self.__bits >> self.index(x, y) & 1)
+
+    def set(self, x: int, y: int, value: bool):
+        """
+        Set or clear a cell
+
+        :raises IndexError: If the cell is outside the grid
+        """
+        bit = 1 << self.index(x, y)
+        self.__bits = self.__bits | bit if value else self.__bits & ~bit
+
+    def count(self) -> int:
+        """
+        Return the amount of set cells
+
+        :rtype: int
+        """
+        return self.__bits.bit_count()
+
+    def shift(self, dx: int, dy: int) -> "BitGrid2D":
+        """
+        Return the grid with every cell moved by (dx, dy).
+        The cells moved outside the grid are dropped and the uncovered cells are clear.
+
+        :param dx: The offset along x
+        :type dx: int
+        :param dy: The offset along y
+        :type dy: int
+        :rtype: BitGrid2D
+        """
+        size_x, size_y = self.__size_x, self.__size_y
+        bits = self.__bits
+        if abs(dx) >= size_x or abs(dy) >= size_y:
+            return self.__with_bits(0)
+
+        # Along x whole rows move, along y the bits, which cross the end of a row, are cleared
+        bits = bits << (dx * size_y) if dx >= 0 else bits >> (-dx * size_y)
+        if dy >= 0:
+            bits = (bits << dy) & _columns(size_x, size_y, dy, size_y)
+        else:
+            bits = (bits >> -dy) & _columns(size_x, size_y, 0, size_y + dy)
+
+        return self.__with_bits(bits)
+
+    def __planes(self, connectivity: int) -> list[int]:
+        """
+        Return the binary digits of the neighbor counts, the least significant first
+        """
+        if connectivity not in OFFSETS_2D:
+            raise ValueError(f"Invalid connectivity {connectivity}, "
+                             f"expected one of {list(OFFSETS_2D)}")
+
+        planes: list[int] = []
+        for dx, dy in OFFSETS_2D[connectivity]:
+            # Add the shifted grid to every cell at once, as a ripple-carry adder of bit planes
+            carry = self.shift(-dx, -dy).bits
+            for digit, plane in enumerate(planes):
+                if not carry:
+                    break
+                planes[digit], carry = plane ^ carry, plane & carry
+            if carry:
+                planes.append(carry)
+
+        return planes
+
+    def neighbor_counts(self, connectivity: int = 8) -> list["BitGrid2D"]:
+        """
+        Return the amount of set neighbors of every cell as bit planes
+
+        :param connectivity: 4 or 8, defaults to 8
+        :type connectivity: int, optional
+        :raises ValueError: If the connectivity is not 4 or 8
+        :return: The binary digits of the counts, the least significant first -
+          a cell of the plane `k` is set if the bit `k` of the count of the cell is set
+        :rtype: list[BitGrid2D]
+        """
+        return [self.__with_bits(plane) for plane in self.__planes(connectivity)]
+
+    def neighbor_mask(self, counts: Iterable[int], connectivity: int = 8) -> "BitGrid2D":
+        """
+        Return the cells, whose amount of set neighbors is one of `counts`
+
+        :param counts: The accepted amounts of set neighbors
+        :type counts: Iterable[int]
+        :param connectivity: 4 or 8, defaults to 8
+        :type connectivity: int, optional
+        :raises ValueError: If the connectivity is not 4 or 8
+        :rtype: BitGrid2D
+        """
+        return self.__with_bits(self.__count_mask(self.__planes(connectivity), counts))
+
+    def __count_mask(self, planes: list[int], counts: Iterable[int]) -> int:
+        """
+        Return the bits of the cells, whose count (given by its bit planes) is one of `counts`
+        """
+        result = 0
+        for count in set(counts):
+            if count < 0 or count >> len(planes):
+                continue
+
+            bits = self.__full()
+            for digit, plane in enumerate(planes):
+                bits &= plane if count >> digit & 1 else ~plane
+            result |= bits
+
+        return result
+
+    def step(self, rule: Optional[Rule] = None, connectivity: int = 8) -> "BitGrid2D":
+        """
+        Return the next generation of a cellular automaton, where the set cells are alive.
+        The cells outside the grid are dead.
+
+        :param rule: The rule, defaults to None (Conway's Game of Life)
+        :type rule: Optional[Rule], optional
+        :param connectivity: 4 or 8, defaults to 8
+        :type connectivity: int, optional
+        :raises ValueError: If the connectivity is not 4 or 8
+        :rtype: BitGrid2D
+        """
+        if rule is None:
+            rule = Rule()
+
+        table = rule.table(connectivity)
+        stride = connectivity + 1
+        birth = compress(range(stride), table[:stride])
+        survival = compress(range(stride), table[stride:])
+
+        planes = self.__planes(connectivity)
+        bits = (~self.__bits & self.__count_mask(planes, birth) |
+                self.__bits & self.__count_mask(planes, survival))
+        return self.__with_bits(bits & self.__full())
+
+    def cells(self) -> PointArray2D:
+        """
+        Return the set cells, in row-major order
+
+        :rtype: PointArray2D
+        """
+        size_y = self.__size_y
+        cells = _unpack(self.__bits, self.__size_x * size_y)
+        indices = array('q', compress(range(len(cells)), cells))
+
+        xs = array('q', map(add, map(floordiv, indices, repeat(size_y)), repeat(self.__start_x)))
+        ys = array('q', map(add, map(mod, indices, repeat(size_y)), repeat(self.__start_y)))
+        return PointArray2D(xs, ys)
+
+    def to_grid(self, typecode: str = 'b') -> Grid2D:
+        """
+        Convert to a dense grid with the same bounds (1 for the set cells, 0 otherwise)
+
+        :param typecode: The type of the values of the grid, defaults to 'b'
+        :type typecode: str, optional
+        :rtype: Grid2D
+        """
+        cells = _unpack(self.__bits, self.__size_x * self.__size_y)
+        # Bytes are copied as they are only into arrays of bytes, other arrays iterate them
+        data = array(typecode, cells if typecode in 'bB' else iter(cells))
+        return Grid2D.from_buffer(data, self.end, self.start)
+
+    def copy(self) -> "BitGrid2D":
+        """
+        Return a copy of the grid
+
+        :rtype: BitGrid2D
+        """
+        return self.__with_bits(self.__bits)
+
+    def __check_bounds(self, other: "BitGrid2D"):
+        """
+        Check that the other grid has the same bounds
+        """
+        if self.start != other.start or self.end != other.end:
+            raise ValueError("The grids must have the same bounds")
+
+    def __and__(self, other: "BitGrid2D") -> "BitGrid2D":
+        self.__check_bounds(other)
+        return self.__with_bits(self.__bits & other.bits)
+
+    def __or__(self, other: "BitGrid2D") -> "BitGrid2D":
+        self.__check_bounds(other)
+        return self.__with_bits(self.__bits | other.bits)
+
+    def __xor__(self, other: "BitGrid2D") -> "BitGrid2D":
+        self.__check_bounds(other)
+        return self.__with_bits(self.__bits ^ other.bits)
+
+    def __sub__(self, other: "BitGrid2D") -> "BitGrid2D":
+        self.__check_bounds(other)
+        return self.__with_bits(self.__bits & ~other.bits)
+
+    def __invert__(self) -> "BitGrid2D":
+        return self.__with_bits(~self.__bits & self.__full())
+
+    def __len__(self) -> int:
+        return self.__size_x * self.__size_y
+
+    def __contains__(self, point: object) -> bool:
+        if not isinstance(point, Point2D):
+            return False
+
+        local_x = point.x - self.__start_x
+        local_y = point.y - self.__start_y
+        return (0 <= local_x < self.__size_x and 0 <= local_y < self.__size_y and
+                bool(self.__bits >> (local_x * self.__size_y + local_y) & 1))
+
+    def __getitem__(self, point: Point2D) -> bool:
+        return self.get(point.x, point.y)
+
+    def __setitem__(self, point: Point2D, value: bool):
+        self.set(point.x, point.y, value)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BitGrid2D):
+            # https://mypy.readthedocs.io/en/stable/common_issues.html#incompatible-overrides
+            raise NotImplementedError("Invalid type for other")
+
+        return self.start == other.start and self.end == other.end and self.__bits == other.bits
+
+    def __repr__(self) -> str:
+        return f"BitGrid2D({self.end!r}, {self.start!r})"
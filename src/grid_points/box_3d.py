@@ -0,0 +1,186 @@
+"""
+Module containing the Box3D class
+"""
+from itertools import repeat
+from operator import and_, le, lt
+from typing import Optional
+
+from src.grid_points.point_3d import Point3D
+from src.grid_points.point_array_3d import PointArray3D
+
+
+class Box3D:
+    """
+    Represents the 3D region defined by `end` and `start` (default is (0, 0, 0)).
+
+    The region is half-open, the same as in `is_within` and the grid iterators - `start` is
+    inside the box and `end` is not. A box with `end` not greater than `start` on some axis
+    is empty. Every operation works on the bounds only, so its cost does not depend on
+    the amount of cells in the box.
+
+    Boxes are immutable and hashable.
+    """
+    __slots__ = ('__start_x', '__start_y', '__start_z', '__end_x', '__end_y', '__end_z')
+
+    def __init__(self, end: Point3D, start: Optional[Point3D] = None):
+        self.__start_x, self.__start_y, self.__start_z = \
+            (0, 0, 0) if start is None else (start.x, start.y, start.z)
+        self.__end_x = end.x
+        self.__end_y = end.y
+        self.__end_z = end.z
+
+    @classmethod
+    def _from_bounds(cls, lower: list[int], upper: list[int]) -> "Box3D":
+        """
+        Create a box from the lists of its lower and upper coordinates
+        """
+        return cls(Point3D(upper[0], upper[1], upper[2]), Point3D(lower[0], lower[1], lower[2]))
+
+    @property
+    def start(self) -> Point3D:
+        """
+        Return the lower (inclusive) bounds of the box
+
+        :rtype: Point3D
+        """
+        return Point3D(self.__start_x, self.__start_y, self.__start_z)
+
+    @property
+    def end(self) -> Point3D:
+        """
+        Return the upper (exclusive) bounds of the box
+
+        :rtype: Point3D
+        """
+        return Point3D(self.__end_x, self.__end_y, self.__end_z)
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        """
+        Return the amount of cells along every axis
+
+        :rtype: tuple[int, int, int]
+        """
+        return (max(0, self.__end_x - self.__start_x), max(0, self.__end_y - self.__start_y),
+                max(0, self.__end_z - self.__start_z))
+
+    @property
+    def volume(self) -> int:
+        """
+        Return the amount of cells in the box
+
+        :rtype: int
+        """
+        size_x, size_y, size_z = self.shape
+        return size_x * size_y * size_z
+
+    def is_empty(self) -> bool:
+        """
+        Check if the box contains no cells
+
+        :rtype: bool
+        """
+        return (self.__end_x <= self.__start_x or self.__end_y <= self.__start_y or
+                self.__end_z <= self.__start_z)
+
+    def contains(self, points: PointArray3D) -> list[bool]:
+        """
+        Check which points of a batch are inside the box
+
+        :param points: The points to check
+        :type points: PointArray3D
+        :return: If every point is inside the box, in the order of the batch
+        :rtype: list[bool]
+        """
+        inside = map(and_, map(le, repeat(self.__start_x), points.xs),
+                     map(lt, points.xs, repeat(self.__end_x)))
+        inside = map(and_, inside, map(le, repeat(self.__start_y), points.ys))
+        inside = map(and_, inside, map(lt, points.ys, repeat(self.__end_y)))
+        inside = map(and_, inside, map(le, repeat(self.__start_z), points.zs))
+        inside = map(and_, inside, map(lt, points.zs, repeat(self.__end_z)))
+        return list(inside)
+
+    def intersection(self, other: "Box3D") -> "Box3D":
+        """
+        Return the box of the cells, which are inside both boxes (it can be empty)
+
+        :param other: The other box
+        :type other: Box3D
+        :rtype: Box3D
+        """
+        return Box3D(Point3D(min(self.__end_x, other.end.x), min(self.__end_y, other.end.y),
+                             min(self.__end_z, other.end.z)),
+                     Point3D(max(self.__start_x, other.start.x),
+                             max(self.__start_y, other.start.y),
+                             max(self.__start_z, other.start.z)))
+
+    def difference(self, other: "Box3D") -> list["Box3D"]:
+        """
+        Return the cells of the box, which are not inside `other`, as disjoint boxes.
+        The result contains at most 6 boxes - the slabs of the box around the intersection.
+
+        :param other: The box to subtract
+        :type other: Box3D
+        :return: Disjoint, non-empty boxes
+        :rtype: list[Box3D]
+        """
+        overlap = self.intersection(other)
+        if overlap.is_empty():
+            return [] if self.is_empty() else [self]
+
+        lower = [self.__start_x, self.__start_y, self.__start_z]
+        upper = [self.__end_x, self.__end_y, self.__end_z]
+        cut_lower = [overlap.start.x, overlap.start.y, overlap.start.z]
+        cut_upper = [overlap.end.x, overlap.end.y, overlap.end.z]
+
+        # Cut a slab on both sides of the intersection along every axis,
+        # then continue with what is left between the cuts
+        result = []
+        for axis in range(3):
+            if lower[axis] < cut_lower[axis]:
+                result.append(Box3D._from_bounds(lower, upper[:axis] + [cut_lower[axis]] +
+                                                 upper[axis + 1:]))
+                lower[axis] = cut_lower[axis]
+
+            if cut_upper[axis] < upper[axis]:
+                result.append(Box3D._from_bounds(lower[:axis] + [cut_upper[axis]] +
+                                                 lower[axis + 1:], upper))
+                upper[axis] = cut_upper[axis]
+
+        return result
+
+    def union(self, other: "Box3D") -> list["Box3D"]:
+        """
+        Return the cells, which are inside any of the boxes, as disjoint boxes
+
+        :param other: The other box
+        :type other: Box3D
+        :return: Disjoint, non-empty boxes
+        :rtype: list[Box3D]
+        """
+        return ([] if self.is_empty() else [self]) + other.difference(self)
+
+    def __contains__(self, point: object) -> bool:
+        if not isinstance(point, Point3D):
+            return False
+
+        return (self.__start_x <= point.x < self.__end_x and
+                self.__start_y <= point.y < self.__end_y and
+                self.__start_z <= point.z < self.__end_z)
+
+    def __and__(self, other: "Box3D") -> "Box3D":
+        return self.intersection(other)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Box3D):
+            # https://mypy.readthedocs.io/en/stable/common_issues.html#incompatible-overrides
+            raise NotImplementedError("Invalid type for other")
+
+        return self.start == other.start and self.end == other.end
+
+    def __hash__(self) -> int:
+        return hash((self.__start_x, self.__start_y, self.__start_z,
+                     self.__end_x, self.__end_y, self.__end_z))
+
+    def __repr__(self) -> str:
+        return f"Box3D({self.end!r}, {self.start!r})"
@@ -0,0 +1,92 @@
+"""
+Module containing the helpers, which move the typed buffers of the containers (the coordinates
+of PointArray2D/PointArray3D and the values of Grid2D/Grid3D) between processes and libraries
+
+- pickling - with protocol 5 a buffer is passed as a `PickleBuffer`, so it can be sent
+  out-of-band (`buffer_callback`) without being copied into the pickle. With older protocols
+  it is pickled as bytes. A writable buffer with the native byte order is restored as a typed
+  memoryview of the unpickled memory, without copying it. Read-only buffers, buffers from a
+  machine with another byte order (which are swapped) and the coordinates of the batches
+  (which have to grow) are restored with a single copy into a new array.
+- `__array_interface__` - describes a buffer to NumPy (`numpy.asarray`), which then uses
+  the memory of the buffer instead of copying it
+"""
+import sys
+from array import array
+from pickle import PickleBuffer
+from typing import Any, Literal, Union, overload
+
+# A flat typed buffer - an array, or a typed memoryview (e.g. of a mapped file)
+Buffer = Union[array, "memoryview[Any]"]
+
+
+def pickle_buffer(data: Buffer, protocol: int) -> Union[PickleBuffer, bytes]:
+    """
+    Return the form of a buffer, which is pickled with the given protocol
+
+    :param data: The buffer
+    :type data: Buffer
+    :param protocol: The pickle protocol
+    :type protocol: int
+    :rtype: Union[PickleBuffer, bytes]
+    """
+    if protocol >= 5:
+        return PickleBuffer(data)
+
+    return memoryview(data).tobytes()
+
+
+@overload
+def restore_array(typecode: str, byteorder: str, data: Any, resizable: Literal[True]) -> array:
+    ...
+
+
+@overload
+def restore_array(typecode: str, byteorder: str, data: Any, resizable: bool = False) -> Buffer:
+    ...
+
+
+def restore_array(typecode: str, byteorder: str, data: Any, resizable: bool = False) -> Buffer:
+    """
+    Return a buffer with the values of a pickled buffer
+
+    :param typecode: The typecode of the values
+    :type typecode: str
+    :param byteorder: The byte order of the machine, which pickled the buffer
+    :type byteorder: str
+    :param data: The pickled buffer (any object supporting the buffer protocol)
+    :type data: Any
+    :param resizable: Whether the result must be an array, defaults to False (a typed
+        memoryview of `data` when it is writable and has the native byte order)
+    :type resizable: bool, optional
+    :rtype: Buffer
+    """
+    view = memoryview(data).cast('B')
+    if not resizable and not view.readonly and byteorder == sys.byteorder:
+        return view.cast(typecode)  # type: ignore[call-overload]
+
+    result = array(typecode)
+    result.frombytes(view)
+    if byteorder != sys.byteorder:
+        result.byteswap()
+
+    return result
+
+
+def array_interface(data: Buffer, typecode: str, shape: tuple[int, ...]) -> dict:
+    """
+    Return the NumPy array interface of a buffer
+
+    :param data: The buffer
+    :type data: Buffer
+    :param typecode: The typecode of the values
+    :type typecode: str
+    :param shape: The shape of the array
+    :type shape: tuple[int, ...]
+    :rtype: dict
+    """
+    itemsize = array(typecode).itemsize
+    kind = 'f' if typecode in 'fd' else 'u' if typecode.isupper() else 'i'
+    order = '|' if itemsize == 1 else '<' if sys.byteorder == 'little' else '>'
+
+    return {'version': 3, 'shape': shape, 'typestr': f'{order}{kind}{itemsize}', 'data': data}
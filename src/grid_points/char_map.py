@@ -0,0 +1,155 @@
+"""
+Module containing parsers of character maps (ASCII art grids) into Grid2D and BitGrid2D
+
+Every line of the map is a row - the line index is x and the column is y, so a line is
+contiguous in the buffer of the grid. Lines shorter than the longest one are padded with
+cells of the default value. The map is processed as bytes, so no Python code runs
+per character:
+- `bytes.translate` converts the whole map to the bytes of the cell values at once
+  (once per byte of a value)
+- the markers (e.g. 'S' and 'E' for the start and the end) are found with `bytes.find`
+
+A map can be given as bytes, as the path of a file, or as a binary or text stream.
+The characters are expected to be ASCII (one byte per cell).
+"""
+from array import array
+from os import PathLike
+from typing import BinaryIO, Iterable, Optional, TextIO, Union
+
+from src.grid_points.bit_grid_2d import BitGrid2D
+from src.grid_points.grid_2d import Grid2D, Value
+from src.grid_points.point_2d import Point2D
+
+Source = Union[bytes, bytearray, str, PathLike, BinaryIO, TextIO]
+Markers = dict[str, list[Point2D]]
+
+
+def _read(source: Source) -> bytes:
+    """
+    Return the content of a map as bytes
+    """
+    if isinstance(source, (bytes, bytearray)):
+        return bytes(source)
+
+    if isinstance(source, (str, PathLike)):
+        with open(source, 'rb') as file:
+            return file.read()
+
+    content = source.read()
+    return content.encode('ascii') if isinstance(content, str) else content
+
+
+def _layout(content: bytes, used: Iterable[int]) -> tuple[bytes, int, int]:
+    """
+    Return the lines of a map joined into a single row-major buffer, the amount of lines
+    and the length of the longest line. Shorter lines are padded with a byte,
+    which is not in `used`.
+    """
+    lines = content.splitlines()
+    width = max(map(len, lines), default=0)
+
+    if any(len(line) != width for line in lines):
+        pad = bytes([min(set(range(256)).difference(used))])
+        lines = [line.ljust(width, pad) for line in lines]
+
+    return b''.join(lines), len(lines), width
+
+
+def _markers(cells: bytes, markers: Iterable[str], width: int, origin: Point2D) -> Markers:
+    """
+    Return the positions of every marker in the joined lines of a map
+    """
+    result: Markers = {}
+    for marker in markers:
+        code = marker.encode('ascii')
+        positions = result.setdefault(marker, [])
+
+        index = cells.find(code)
+        while index >= 0:
+            x, y = divmod(index, width)
+            positions.append(Point2D(origin.x + x, origin.y + y))
+            index = cells.find(code, index + 1)
+
+    return result
+
+
+def parse_grid(source: Source, mapping: Optional[dict[str, Value]] = None, default: Value = 0,
+               markers: Iterable[str] = (), typecode: str = 'b',
+               start: Optional[Point2D] = None) -> tuple[Grid2D, Markers]:
+    """
+    Parse a character map into a dense grid
+
+    :param source: The map - bytes, the path of a file or a binary/text stream
+    :type source: Source
+    :param mapping: The value of the cells of every character,
+      defaults to None ({'#': 1} - walls are 1)
+    :type mapping: Optional[dict[str, Value]], optional
+    :param default: The value of the other characters and of the padding of short lines,
+      defaults to 0
+    :type default: Value, optional
+    :param markers: The characters, whose positions are returned, defaults to ()
+    :type markers: Iterable[str], optional
+    :param typecode: The type of the values of the grid, defaults to 'b'
+    :type typecode: str, optional
+    :param start: The position of the first character of the map, defaults to None (0, 0)
+    :type start: Optional[Point2D], optional
+    :return: The grid and the positions of every marker, in row-major order
+    :rtype: tuple[Grid2D, Markers]
+    """
+    # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+    if mapping is None:
+        mapping = {'#': 1}
+    if start is None:
+        start = Point2D(0, 0)
+    markers = list(markers)
+
+    # The bytes of the value of every character, one translation table per byte of a value
+    encoded = array(typecode, [default]) * 256
+    for char, value in mapping.items():
+        encoded[ord(char)] = value
+    table = encoded.tobytes()
+    itemsize = encoded.itemsize
+
+    used = [*map(ord, mapping), *map(ord, markers)]
+    cells, lines, width = _layout(_read(source), used)
+
+    values = bytearray(len(cells) * itemsize)
+    for offset in range(itemsize):
+        values[offset::itemsize] = cells.translate(table[offset::itemsize])
+    data = array(typecode)
+    data.frombytes(values)
+
+    grid = Grid2D.from_buffer(data, Point2D(start.x + lines, start.y + width), start)
+    return grid, _markers(cells, markers, width, start)
+
+
+def parse_bit_grid(source: Source, walls: str = '#', markers: Iterable[str] = (),
+                   start: Optional[Point2D] = None) -> tuple[BitGrid2D, Markers]:
+    """
+    Parse a character map into a bit grid
+
+    :param source: The map - bytes, the path of a file or a binary/text stream
+    :type source: Source
+    :param walls: The characters of the set cells, defaults to '#'
+    :type walls: str, optional
+    :param markers: The characters, whose positions are returned, defaults to ()
+    :type markers: Iterable[str], optional
+    :param start: The position of the first character of the map, defaults to None (0, 0)
+    :type start: Optional[Point2D], optional
+    :return: The grid and the positions of every marker, in row-major order
+    :rtype: tuple[BitGrid2D, Markers]
+    """
+    if start is None:
+        start = Point2D(0, 0)
+    markers = list(markers)
+
+    table = bytearray(256)
+    for char in walls:
+        table[ord(char)] = 1
+
+    used = [*map(ord, walls), *map(ord, markers)]
+    cells, lines, width = _layout(_read(source), used)
+
+    grid = BitGrid2D.from_bytes(cells.translate(table), Point2D(start.x + lines, start.y + width),
+                                start)
+    return grid, _markers(cells, markers, width, start)
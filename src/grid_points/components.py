@@ -0,0 +1,293 @@
+"""
+Module containing flood fill and connected-component labeling over the dense grids
+(Grid2D/Grid3D)
+
+Both work on the flat cell indices of the grid and never recurse, so the size of a region
+is limited only by the size of the grid. Two cells belong to the same region when they have
+the same value and are connected through cells with that value, using the 4/8 (2D)
+or 6/26 (3D) neighborhood.
+"""
+from array import array
+from itertools import compress, product
+from operator import add, ne
+from typing import Iterator, NamedTuple, Optional, Union
+
+from src.grid_points.buffers import Buffer
+from src.grid_points.grid_2d import Grid2D, Value
+from src.grid_points.grid_3d import Grid3D
+from src.grid_points.neighborhood import OFFSETS_2D, OFFSETS_3D
+from src.grid_points.point_2d import Point2D
+from src.grid_points.point_3d import Point3D
+
+Grid = Union[Grid2D, Grid3D]
+Point = Union[Point2D, Point3D]
+
+
+class Component(NamedTuple):
+    """
+    Statistics of a connected component
+
+    - `label` - the value of the cells of the component in the labels grid (starting from 1)
+    - `value` - the value of the cells of the component in the labeled grid
+    - `area` - the amount of cells
+    - `perimeter` - the amount of cell edges (faces in 3D) between the component and
+      the rest of the grid, including the border of the grid
+    - `start`, `end` - the bounding box, with the same meaning as in the grid iterators
+    """
+    label: int
+    value: Value
+    area: int
+    perimeter: int
+    start: Point
+    end: Point
+
+
+def _check_connectivity(grid: Grid, connectivity: Optional[int]) -> int:
+    """
+    Return the connectivity, defaulting to the von Neumann neighborhood of the grid
+    """
+    offsets = OFFSETS_2D if len(grid.shape) == 2 else OFFSETS_3D
+    if connectivity is None:
+        return 2 * len(grid.shape)
+
+    if connectivity not in offsets:
+        raise ValueError(f"Invalid connectivity {connectivity}, expected one of {list(offsets)}")
+
+    return connectivity
+
+
+def flood_fill(grid: Grid, seed: Point, value: Value, connectivity: Optional[int] = None) -> int:
+    """
+    Change the value of the region, which contains `seed`, to `value`.
+
+    The region is filled with a scanline algorithm: every run of cells along the last axis
+    (the contiguous one in the buffer) is filled with a single slice assignment and only one
+    cell per run of the neighboring lines is pushed on the stack.
+
+    :param grid: The grid to fill
+    :type grid: Grid
+    :param seed: A cell of the region
+    :type seed: Point
+    :param value: The new value of the cells of the region
+    :type value: Value
+    :param connectivity: 4 or 8 in 2D, 6 or 26 in 3D, defaults to None (4 in 2D, 6 in 3D)
+    :type connectivity: Optional[int], optional
+    :raises IndexError: If `seed` is outside the grid
+    :raises ValueError: If the connectivity is not supported for the grid
+    :return: The amount of filled cells
+    :rtype: int
+    """
+    # pylint: disable=too-many-locals,too-many-branches
+    connectivity = _check_connectivity(grid, connectivity)
+    first = grid.points().flat_index(seed)  # type: ignore[arg-type]
+    if first is None:
+        raise IndexError(f"{seed} is outside the grid")
+
+    data = grid.data
+    target = data[first]
+    if target == value:
+        return 0
+
+    *outer_shape, length = grid.shape
+    # The neighboring lines of a 3D line are at the 4 (for 6) or 8 (for 26) neighborhood
+    # of its outer coordinates. Diagonal neighborhoods also connect the cells one past
+    # the ends of a run.
+    if len(outer_shape) == 1:
+        line_offsets: tuple[tuple[int, ...], ...] = ((-1,), (1,))
+    else:
+        line_offsets = OFFSETS_2D[4 if connectivity == 6 else 8]
+    extend = 0 if connectivity == 2 * len(grid.shape) else 1
+
+    deltas = []
+    for offset in line_offsets:
+        delta = 0
+        for axis, step in enumerate(offset):
+            delta = delta * outer_shape[axis] + step
+        deltas.append((offset, delta * length))
+
+    filled = 0
+    stack = [first]
+    while stack:
+        index = stack.pop()
+        if data[index] != target:
+            continue
+
+        line_start = index - index % length
+        line_end = line_start + length
+
+        left = index
+        while left > line_start and data[left - 1] == target:
+            left -= 1
+        right = index + 1
+        while right < line_end and data[right] == target:
+            right += 1
+
+        data[left:right] = array(grid.typecode, [value]) * (right - left)
+        filled += right - left
+
+        line = line_start // length
+        outer = divmod(line, outer_shape[1]) if len(outer_shape) == 2 else (line,)
+        for offset, delta in deltas:
+            if not all(0 <= c + d < size for c, d, size in zip(outer, offset, outer_shape)):
+                continue
+
+            cell = max(left - extend, line_start) + delta
+            stop = min(right + extend, line_end) + delta
+            while cell < stop:
+                if data[cell] != target:
+                    cell += 1
+                    continue
+
+                stack.append(cell)
+                while cell < stop and data[cell] == target:
+                    cell += 1
+
+    return filled
+
+
+def _find(parents: array, node: int) -> int:
+    """
+    Return the root of a provisional label, halving the path to it
+    """
+    while parents[node] != node:
+        parents[node] = parents[parents[node]]
+        node = parents[node]
+
+    return node
+
+
+def _runs(segment: Buffer, background: Optional[Value]) -> Iterator[tuple[int, int, Value]]:
+    """
+    Return the (begin, end, value) runs of equal values of a line, skipping the background
+    """
+    length = len(segment)
+    if length == 0:
+        return
+
+    bounds = [0, *compress(range(1, length), map(ne, segment[1:], segment[:-1])), length]
+
+    for begin, end in zip(bounds, bounds[1:]):
+        if segment[begin] != background:
+            yield begin, end, segment[begin]
+
+
+def label(grid: Grid, connectivity: Optional[int] = None,
+          background: Optional[Value] = 0) -> tuple[Grid, list[Component]]:
+    """
+    Label the connected components of the grid with a two-pass union-find algorithm.
+
+    The labeling works on runs of equal values along the last axis (the contiguous one in
+    the buffer), instead of single cells. The first pass splits every line into runs,
+    gives every run a provisional label and merges it with the touching runs of the same value
+    in the earlier lines. The area, perimeter and bounding box of every provisional label are
+    collected in the same pass. The second pass writes the final, consecutive labels,
+    a whole run at a time.
+
+    :param grid: The grid to label
+    :type grid: Grid
+    :param connectivity: 4 or 8 in 2D, 6 or 26 in 3D, defaults to None (4 in 2D, 6 in 3D)
+    :type connectivity: Optional[int], optional
+    :param background: Cells with this value are not labeled,
+      defaults to 0 (None labels every cell)
+    :type background: Optional[Value], optional
+    :raises ValueError: If the connectivity is not supported for the grid
+    :return: A grid of the same bounds with the label of every cell (0 for the background)
+      and the components, ordered by label (the order of their first cell in the grid)
+    :rtype: tuple[Grid, list[Component]]
+    """
+    # pylint: disable=too-many-locals,too-many-branches,too-many-statements
+    connectivity = _check_connectivity(grid, connectivity)
+    faces = 2 * len(grid.shape)
+    extend = 0 if connectivity == faces else 1
+    data = grid.data
+
+    *outer_shape, length = grid.shape
+    # The earlier lines, which can touch a line, and if they share faces with it
+    if len(outer_shape) == 1:
+        earlier: list[tuple[tuple[int, ...], bool]] = [((-1,), True)]
+    else:
+        offsets = OFFSETS_2D[4 if connectivity == 6 else 8]
+        earlier = [(offset, 0 in offset) for offset in offsets[:len(offsets) // 2]]
+
+    parents = array('q', [0])
+    # Per provisional label: value, area, adjacent cell pairs inside the label,
+    # lower and upper corner of the bounding box
+    stats: list[list] = [[]]
+    lines: list[list[tuple[int, int, Value, int]]] = []
+
+    for line, outer in enumerate(product(*map(range, outer_shape))):
+        runs = []
+        for begin, end, value in _runs(data[line * length:(line + 1) * length], background):
+            provisional = len(parents)
+            parents.append(provisional)
+            stats.append([value, end - begin, end - begin - 1, [*outer, begin], [*outer, end - 1]])
+            runs.append((begin, end, value, provisional))
+
+        lines.append(runs)
+
+        for offset, is_face in earlier:
+            neighbor = tuple(map(add, outer, offset))
+            if not all(0 <= c < size for c, size in zip(neighbor, outer_shape)):
+                continue
+
+            other = lines[neighbor[0] if len(neighbor) == 1 else
+                          neighbor[0] * outer_shape[1] + neighbor[1]]
+            first = 0
+            for begin, end, value, provisional in runs:
+                while first < len(other) and other[first][1] <= begin - extend:
+                    first += 1
+
+                for other_begin, other_end, other_value, other_provisional in other[first:]:
+                    if other_begin >= end + extend:
+                        break
+
+                    if other_value != value:
+                        continue
+
+                    root = _find(parents, provisional)
+                    other_root = _find(parents, other_provisional)
+                    if root != other_root:
+                        parents[max(root, other_root)] = min(root, other_root)
+
+                    if is_face:
+                        stats[provisional][2] += min(end, other_end) - max(begin, other_begin)
+
+    final = array('q', [0]) * len(parents)
+    merged: dict[int, list] = {}
+    for provisional in range(1, len(parents)):
+        root = _find(parents, provisional)
+        entry = stats[provisional]
+
+        if root not in merged:
+            merged[root] = entry
+            final[root] = len(merged)
+            continue
+
+        total = merged[root]
+        total[1] += entry[1]
+        total[2] += entry[2]
+        total[3] = list(map(min, total[3], entry[3]))
+        total[4] = list(map(max, total[4], entry[4]))
+
+    labels = array('q', [0]) * len(data)
+    for line, runs in enumerate(lines):
+        base = line * length
+        for begin, end, _, provisional in runs:
+            labels[base + begin:base + end] = array('q', [final[_find(parents, provisional)]]) * (
+                end - begin)
+
+    if isinstance(grid, Grid2D):
+        point_class: type = Point2D
+        origin: tuple[int, ...] = (grid.start.x, grid.start.y)
+    else:
+        point_class = Point3D
+        origin = (grid.start.x, grid.start.y, grid.start.z)
+
+    # Every pair of adjacent cells inside a component hides two of their faces
+    components = [Component(final[root], value, area, faces * area - 2 * adjacent,
+                            point_class(*map(add, origin, lower)),
+                            point_class(*(c + i + 1 for c, i in zip(origin, upper))))
+                  for root, (value, area, adjacent, lower, upper) in merged.items()]
+
+    result = grid.__class__.from_buffer(labels, grid.end, grid.start)  # type: ignore[arg-type]
+    return result, components
@@ -0,0 +1,414 @@
+"""
+Module containing the CoordinateCompression class
+"""
+from bisect import bisect_left, bisect_right
+from itertools import compress, product, repeat
+from math import prod
+from operator import add, countOf, eq, mul, ne, sub
+from typing import Optional, Sequence, Union
+
+from src.grid_points.box_2d import Box2D
+from src.grid_points.box_3d import Box3D
+from src.grid_points.components import flood_fill
+from src.grid_points.distance import coordinate_axes
+from src.grid_points.grid_2d import Grid2D, Value
+from src.grid_points.grid_3d import Grid3D
+from src.grid_points.point_2d import Point2D
+from src.grid_points.point_3d import Point3D
+from src.grid_points.point_array_2d import PointArray2D
+from src.grid_points.point_array_3d import PointArray3D
+
+Box = Union[Box2D, Box3D]
+Grid = Union[Grid2D, Grid3D]
+Point = Union[Point2D, Point3D]
+PointArray = Union[PointArray2D, PointArray3D]
+Points = Union[PointArray2D, PointArray3D, Sequence[Point2D], Sequence[Point3D]]
+
+
+def _coordinates(point: Point) -> tuple[int, ...]:
+    """
+    Return the coordinates of a single point as a tuple
+    """
+    if isinstance(point, Point3D):
+        return (point.x, point.y, point.z)
+
+    return (point.x, point.y)
+
+
+def _bounds(box: Box) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """
+    Return the lower and upper coordinates of a box
+    """
+    if isinstance(box, Box3D):
+        return (box.start.x, box.start.y, box.start.z), (box.end.x, box.end.y, box.end.z)
+
+    return (box.start.x, box.start.y), (box.end.x, box.end.y)
+
+
+class CoordinateCompression:
+    """
+    Rank-indexed compression of the coordinates of a sparse set of 2D/3D points.
+
+    Every axis is split at the coordinates of the points, one past them and at the bounds.
+    The splits tile the bounds with boxes - the cells of the compressed grid. The cell with
+    ranks (i, j) covers `[breaks(0)[i], breaks(0)[i + 1]) x [breaks(1)[j], breaks(1)[j + 1])`,
+    so every point has a cell of its own and every gap between the points is a single cell,
+    as wide as the gap (its weight). N points give at most 2N + 1 cells per axis, however large
+    their coordinates are.
+
+    The compressed grids are ordinary Grid2D/Grid3D, starting at (0, 0), so every algorithm
+    over the dense grids works on them. Two cells touch in the compressed grid exactly when
+    their boxes touch in the original space, so the regions are the same in both, and their
+    areas (volumes in 3D) are recovered exactly with the weights.
+    """
+    __slots__ = ('__breaks',)
+
+    def __init__(self, points: Points, bounds: Optional[Box] = None):
+        """
+        :param points: The points
+        :type points: Points
+        :param bounds: The compressed space, defaults to None (the bounding box of the points)
+        :type bounds: Optional[Box], optional
+        :raises ValueError: If there are neither points nor bounds, or a point is outside
+          the bounds or has another amount of dimensions
+        """
+        dimensions = None if bounds is None else 3 if isinstance(bounds, Box3D) else 2
+        axes = coordinate_axes(points, dimensions)
+
+        if bounds is None:
+            if len(axes[0]) == 0:
+                raise ValueError("The bounds are required when there are no points")
+
+            lower: Sequence[int] = list(map(min, axes))
+            upper: Sequence[int] = [max(axis) + 1 for axis in axes]
+        else:
+            lower, upper = _bounds(bounds)
+
+        self.__breaks: list[list[int]] = []
+        for axis, low, high in zip(axes, lower, upper):
+            if len(axis) > 0 and (min(axis) < low or max(axis) >= high):
+                raise ValueError("The points must be inside the bounds")
+
+            self.__breaks.append(sorted({low, high, *axis, *map(add, axis, repeat(1))}))
+
+    @property
+    def dimensions(self) -> int:
+        """
+        Return the amount of axes (2 or 3)
+
+        :rtype: int
+        """
+        return len(self.__breaks)
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """
+        Return the amount of compressed cells along every axis
+
+        :rtype: tuple[int, ...]
+        """
+        return tuple(len(breaks) - 1 for breaks in self.__breaks)
+
+    @property
+    def bounds(self) -> Box:
+        """
+        Return the compressed space in original coordinates
+
+        :rtype: Box
+        """
+        return self.__box([0] * self.dimensions, self.shape)
+
+    def breaks(self, axis: int) -> list[int]:
+        """
+        Return the original coordinates, at which the cells along an axis start,
+        followed by the end of the last cell
+
+        :param axis: 0 (x), 1 (y) or 2 (z)
+        :type axis: int
+        :rtype: list[int]
+        """
+        return list(self.__breaks[axis])
+
+    def weights(self, axis: int) -> list[int]:
+        """
+        Return the amount of original cells, covered by every compressed cell along an axis
+
+        :param axis: 0 (x), 1 (y) or 2 (z)
+        :type axis: int
+        :rtype: list[int]
+        """
+        breaks = self.__breaks[axis]
+        return list(map(sub, breaks[1:], breaks[:-1]))
+
+    def __axes(self, points: Points) -> tuple[Sequence[int], ...]:
+        """
+        Return the per-axis coordinates of points with the dimensions of the compression
+        """
+        return coordinate_axes(points, self.dimensions)
+
+    def __box(self, lower: Sequence[int], upper: Sequence[int]) -> Box:
+        """
+        Return the original box, covered by the compressed cells from `lower` to `upper`
+        """
+        start = [breaks[rank] for breaks, rank in zip(self.__breaks, lower)]
+        end = [breaks[rank] for breaks, rank in zip(self.__breaks, upper)]
+
+        if self.dimensions == 3:
+            return Box3D(Point3D(*end), Point3D(*start))
+
+        return Box2D(Point2D(*end), Point2D(*start))
+
+    def __ranks(self, points: Points) -> tuple[list[int], ...]:
+        """
+        Return the per-axis ranks of the cells, which contain the points (not checked)
+        """
+        return tuple(list(map(sub, map(bisect_right, repeat(breaks), axis), repeat(1)))
+                     for breaks, axis in zip(self.__breaks, self.__axes(points)))
+
+    def __flat(self, ranks: Sequence[Sequence[int]]) -> list[int]:
+        """
+        Return the flat indices of the compressed cells in row-major order
+        """
+        flat = ranks[0]
+        for axis, size in zip(ranks[1:], self.shape[1:]):
+            flat = list(map(add, map(mul, flat, repeat(size)), axis))
+
+        return list(flat)
+
+    def __check(self, grid: Grid):
+        """
+        Check that a grid is a compressed grid of this compression
+        """
+        if grid.shape != self.shape:
+            raise ValueError(f"Expected a grid of shape {self.shape}, got {grid.shape}")
+
+    def compress(self, points: Points) -> PointArray:
+        """
+        Return the ranks of the compressed cells, which contain the points
+
+        :param points: Points in original coordinates
+        :type points: Points
+        :raises ValueError: If a point is outside the bounds or has another amount of dimensions
+        :return: The points in compressed coordinates
+        :rtype: PointArray
+        """
+        if not all(self.__inside(points)):
+            raise ValueError("The points must be inside the bounds")
+
+        return self.__array(self.__ranks(points))
+
+    def decompress(self, points: Points) -> PointArray:
+        """
+        Return the original coordinates of the first cell of the compressed cells.
+        This is the inverse of `compress` for the points, from which the compression was built.
+
+        :param points: Points in compressed coordinates
+        :type points: Points
+        :raises IndexError: If a point is outside the compressed grid
+        :return: The points in original coordinates
+        :rtype: PointArray
+        """
+        axes = []
+        for breaks, axis in zip(self.__breaks, self.__axes(points)):
+            if len(axis) > 0 and (min(axis) < 0 or max(axis) >= len(breaks) - 1):
+                raise IndexError("The points must be inside the compressed grid")
+
+            axes.append(map(breaks.__getitem__, axis))
+
+        return self.__array(axes)
+
+    def __inside(self, points: Points) -> list[bool]:
+        """
+        Check which points are inside the bounds
+        """
+        return self.bounds.contains(self.__array(self.__axes(points)))  # type: ignore[arg-type]
+
+    def __array(self, axes: Sequence) -> PointArray:
+        """
+        Create a batch of points of the dimensions of the compression
+        """
+        if self.dimensions == 3:
+            return PointArray3D(*axes)
+
+        return PointArray2D(*axes)
+
+    def cell(self, point: Point) -> Box:
+        """
+        Return the original box, covered by a compressed cell
+
+        :param point: The cell in compressed coordinates
+        :type point: Point
+        :raises IndexError: If the point is outside the compressed grid
+        :rtype: Box
+        """
+        lower = _coordinates(point)
+        if len(lower) != self.dimensions or \
+                not all(0 <= rank < size for rank, size in zip(lower, self.shape)):
+            raise IndexError(f"{point} is outside the compressed grid")
+
+        return self.__box(lower, [rank + 1 for rank in lower])
+
+    def grid(self, points: Points, value: Value = 1, typecode: str = 'q',
+             fill: Value = 0) -> Grid:
+        """
+        Create a compressed grid, in which the cells of the points are set to `value`
+
+        :param points: Points in original coordinates
+        :type points: Points
+        :param value: The value of the cells of the points, defaults to 1
+        :type value: Value, optional
+        :param typecode: The typecode of the values, defaults to 'q'
+        :type typecode: str, optional
+        :param fill: The value of the rest of the cells, defaults to 0
+        :type fill: Value, optional
+        :raises ValueError: If a point is outside the bounds
+        :rtype: Grid
+        """
+        compressed = self.compress(points)
+        if self.dimensions == 3:
+            grid: Grid = Grid3D(Point3D(*self.shape), typecode=typecode, fill=fill)
+        else:
+            grid = Grid2D(Point2D(*self.shape), typecode=typecode, fill=fill)
+
+        data = grid.data
+        for index in self.__flat(coordinate_axes(compressed)):
+            data[index] = value
+
+        return grid
+
+    def volume(self, grid: Grid, value: Value, bounds: Optional[Box] = None) -> int:
+        """
+        Return the amount of original cells, covered by the compressed cells with `value`
+
+        :param grid: A compressed grid
+        :type grid: Grid
+        :param value: The value of the counted cells
+        :type value: Value
+        :param bounds: Count only the original cells inside this box, defaults to None (all)
+        :type bounds: Optional[Box], optional
+        :raises ValueError: If the shape of the grid does not match the compression
+        :return: The area in 2D, the volume in 3D
+        :rtype: int
+        """
+        # pylint: disable=too-many-locals
+        self.__check(grid)
+        lower, upper = _bounds(self.bounds if bounds is None else bounds)
+        upper = tuple(map(max, lower, upper))
+
+        # The ranks of the cells, which overlap the bounds, and their clipped weights per axis
+        ranks, weights = [], []
+        for breaks, low, high in zip(self.__breaks, lower, upper):
+            first = max(0, bisect_right(breaks, low) - 1)
+            last = min(len(breaks) - 1, bisect_left(breaks, high))
+            ranks.append(range(first, max(first, last)))
+            weights.append([min(breaks[rank + 1], high) - max(breaks[rank], low)
+                            for rank in ranks[-1]])
+
+        data = grid.data
+        *outer_shape, length = self.shape
+        first, last = ranks[-1].start, ranks[-1].stop
+
+        full = sum(weights[-1])
+
+        total = 0
+        for outer, outer_weights in zip(product(*ranks[:-1]), product(*weights[:-1])):
+            line = outer[0] if len(outer) == 1 else outer[0] * outer_shape[1] + outer[1]
+            segment = data[line * length + first:line * length + last]
+
+            # Lines without the value or only with it are counted without weighing every cell
+            count = countOf(segment, value)
+            if count == len(segment):
+                total += prod(outer_weights) * full
+            elif count > 0:
+                total += prod(outer_weights) * sum(compress(weights[-1],
+                                                            map(eq, segment, repeat(value))))
+
+        return total
+
+    def flood_fill(self, grid: Grid, seed: Point, value: Value,
+                   connectivity: Optional[int] = None) -> int:
+        """
+        Fill the region of a compressed grid, which contains an original cell
+        (see `components.flood_fill`)
+
+        :param grid: A compressed grid
+        :type grid: Grid
+        :param seed: A cell of the region in original coordinates
+        :type seed: Point
+        :param value: The new value of the cells of the region
+        :type value: Value
+        :param connectivity: 4 or 8 in 2D, 6 or 26 in 3D, defaults to None (4 in 2D, 6 in 3D)
+        :type connectivity: Optional[int], optional
+        :raises IndexError: If `seed` is outside the bounds
+        :raises ValueError: If the shape of the grid does not match the compression
+        :return: The amount of filled original cells
+        :rtype: int
+        """
+        self.__check(grid)
+        if seed not in self.bounds:
+            raise IndexError(f"{seed} is outside the bounds")
+
+        # Only the cells of the region change and all of them get `value`
+        before = self.volume(grid, value)
+        flood_fill(grid, self.compress([seed])[0], value, connectivity)  # type: ignore[arg-type]
+        return self.volume(grid, value) - before
+
+    def contains(self, grid: Grid, points: Points, value: Value) -> list[bool]:
+        """
+        Check which original points are inside compressed cells with `value`
+
+        :param grid: A compressed grid
+        :type grid: Grid
+        :param points: Points in original coordinates
+        :type points: Points
+        :param value: The value of the region
+        :type value: Value
+        :raises ValueError: If the shape of the grid does not match the compression
+        :return: If every point is inside the region (False outside the bounds),
+          in the order of the points
+        :rtype: list[bool]
+        """
+        self.__check(grid)
+        inside = self.__inside(points)
+        flat = self.__flat(self.__ranks(points))
+        data = grid.data
+
+        result = [False] * len(inside)
+        for position in compress(range(len(inside)), inside):
+            result[position] = data[flat[position]] == value
+
+        return result
+
+    def boxes(self, grid: Grid, value: Value) -> list[Box]:
+        """
+        Return the original cells, covered by the compressed cells with `value`,
+        as disjoint boxes. The runs of such cells along the last axis are merged into one box.
+
+        :param grid: A compressed grid
+        :type grid: Grid
+        :param value: The value of the region
+        :type value: Value
+        :raises ValueError: If the shape of the grid does not match the compression
+        :return: Disjoint, non-empty boxes in row-major order
+        :rtype: list[Box]
+        """
+        self.__check(grid)
+        data = grid.data
+        *outer_shape, length = self.shape
+
+        result = []
+        for line, outer in enumerate(product(*map(range, outer_shape))):
+            segment = data[line * length:(line + 1) * length]
+            if value not in segment:
+                continue
+
+            splits = [0, *compress(range(1, length), map(ne, segment[1:], segment[:-1])), length]
+            for begin, end in zip(splits, splits[1:]):
+                if segment[begin] == value:
+                    result.append(self.__box([*outer, begin],
+                                             [rank + 1 for rank in outer] + [end]))
+
+        return result
+
+    def __repr__(self) -> str:
+        return f"CoordinateCompression({self.bounds!r}, shape={self.shape})"
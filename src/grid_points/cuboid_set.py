@@ -0,0 +1,208 @@
+"""
+Module containing the CuboidSet class
+"""
+from collections import Counter
+from math import prod
+from operator import le, lt, sub
+from typing import Iterable, Optional, Union
+
+from src.grid_points.box_2d import Box2D
+from src.grid_points.box_3d import Box3D
+from src.grid_points.point_2d import Point2D
+from src.grid_points.point_3d import Point3D
+
+Box = Union[Box2D, Box3D]
+# The lower coordinates of a box, followed by its upper coordinates
+Bounds = tuple[int, ...]
+
+
+def _bounds(box: Box) -> Bounds:
+    """
+    Return the bounds of a box as a flat tuple
+    """
+    if isinstance(box, Box3D):
+        return (box.start.x, box.start.y, box.start.z, box.end.x, box.end.y, box.end.z)
+
+    return (box.start.x, box.start.y, box.end.x, box.end.y)
+
+
+def _coordinates(point: object) -> tuple[int, ...]:
+    """
+    Return the coordinates of a point as a tuple (empty for other objects)
+    """
+    if isinstance(point, Point3D):
+        return (point.x, point.y, point.z)
+
+    if isinstance(point, Point2D):
+        return (point.x, point.y)
+
+    return ()
+
+
+class CuboidSet:
+    """
+    Set of cells, described by a sequence of boxes turned on and off.
+
+    The set is kept as signed boxes (inclusion–exclusion) - every cell is inside the set when
+    the sum of the signs of the boxes, which contain it, is 1. Adding or removing a box cancels
+    its intersections with the existing boxes, and equal boxes are merged into a single counter
+    entry, so the amount of entries stays small when the boxes repeat or nest.
+    Nothing is enumerated per cell - the volume is exact for boxes of any size.
+
+    The boxes are kept as flat tuples of their bounds, so the intersections do not allocate
+    points. Works with Box3D (cuboids) as well as Box2D (rectangles). The first box decides
+    the dimensions of the set, boxes with other dimensions are rejected.
+    """
+    __slots__ = ('__counts', '__dimensions')
+
+    def __init__(self, boxes: Iterable[Box] = ()):
+        self.__counts: Counter[Bounds] = Counter()
+        self.__dimensions: Optional[int] = None
+
+        for box in boxes:
+            self.add(box)
+
+    def __bounds(self, box: Box) -> Bounds:
+        """
+        Return the bounds of a box, which must have the dimensions of the set
+        """
+        bounds = _bounds(box)
+        if self.__dimensions is None:
+            self.__dimensions = len(bounds) // 2
+        elif len(bounds) != 2 * self.__dimensions:
+            raise ValueError(f"Expected a box with {self.__dimensions} dimensions, "
+                             f"got {len(bounds) // 2}")
+
+        return bounds
+
+    def __cancel(self, bounds: Bounds) -> Counter[Bounds]:
+        """
+        Return the changes, which remove the cells inside `bounds` from the set
+        """
+        dimensions = len(bounds) // 2
+        lower, upper = bounds[:dimensions], bounds[dimensions:]
+
+        first_lower, first_upper = lower[0], upper[0]
+
+        changes: Counter[Bounds] = Counter()
+        for existing, count in self.__counts.items():
+            # Most boxes are rejected by the first axis, without building tuples
+            if existing[0] >= first_upper or existing[dimensions] <= first_lower:
+                continue
+
+            overlap_lower = tuple(map(max, existing[:dimensions], lower))
+            overlap_upper = tuple(map(min, existing[dimensions:], upper))
+
+            if all(map(lt, overlap_lower, overlap_upper)):
+                changes[overlap_lower + overlap_upper] -= count
+
+        return changes
+
+    def __apply(self, changes: Counter[Bounds]):
+        """
+        Add the changes to the counts and drop the boxes, whose count became 0
+        """
+        for bounds, count in changes.items():
+            total = self.__counts[bounds] + count
+            if total:
+                self.__counts[bounds] = total
+            else:
+                del self.__counts[bounds]
+
+    def add(self, box: Box):
+        """
+        Add the cells of a box to the set
+
+        :param box: The box to add
+        :type box: Box
+        :raises ValueError: If the box has other dimensions than the set
+        """
+        bounds = self.__bounds(box)
+        if box.is_empty():
+            return
+
+        changes = self.__cancel(bounds)
+        changes[bounds] += 1
+        self.__apply(changes)
+
+    def remove(self, box: Box):
+        """
+        Remove the cells of a box from the set
+
+        :param box: The box to remove
+        :type box: Box
+        :raises ValueError: If the box has other dimensions than the set
+        """
+        bounds = self.__bounds(box)
+        if box.is_empty():
+            return
+
+        self.__apply(self.__cancel(bounds))
+
+    def intersect(self, box: Box):
+        """
+        Keep only the cells of the set, which are inside the box
+
+        :param box: The box to intersect with
+        :type box: Box
+        :raises ValueError: If the box has other dimensions than the set
+        """
+        # The negated changes of a removal are exactly the parts inside the box
+        changes = self.__cancel(self.__bounds(box))
+        self.__counts = Counter({bounds: -count for bounds, count in changes.items() if count})
+
+    @property
+    def volume(self) -> int:
+        """
+        Return the amount of cells in the set
+
+        :rtype: int
+        """
+        total = 0
+        for bounds, count in self.__counts.items():
+            dimensions = len(bounds) // 2
+            total += count * prod(map(sub, bounds[dimensions:], bounds[:dimensions]))
+
+        return total
+
+    @property
+    def dimensions(self) -> Optional[int]:
+        """
+        Return the amount of dimensions of the boxes, None before the first box
+
+        :rtype: Optional[int]
+        """
+        return self.__dimensions
+
+    @property
+    def terms(self) -> int:
+        """
+        Return the amount of signed boxes, which describe the set
+
+        :rtype: int
+        """
+        return len(self.__counts)
+
+    def copy(self) -> "CuboidSet":
+        """
+        Return a copy of the set
+
+        :rtype: CuboidSet
+        """
+        result = CuboidSet()
+        # pylint: disable=protected-access,unused-private-member
+        result.__counts = self.__counts.copy()
+        result.__dimensions = self.__dimensions
+        return result
+
+    def __contains__(self, point: object) -> bool:
+        coordinates = _coordinates(point)
+        dimensions = len(coordinates)
+
+        return sum(count for bounds, count in self.__counts.items()
+                   if len(bounds) == 2 * dimensions and
+                   all(map(le, bounds[:dimensions], coordinates)) and
+                   all(map(lt, coordinates, bounds[dimensions:]))) > 0
+
+    def __repr__(self) -> str:
+        return f"CuboidSet({self.terms} terms, volume={self.volume})"
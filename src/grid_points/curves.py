@@ -0,0 +1,552 @@
+"""
+Module containing space-filling curves - Morton (Z-order) and Hilbert - over 2D/3D points
+
+A curve maps every point with non-negative coordinates to an index, so that points with
+close indices are close in space. Walking a grid, sorting points or laying out grid storage
+in curve order keeps neighboring cells close in memory, which improves the cache and page
+locality of blocked processing.
+
+- Morton - interleaves the bits of the coordinates, the first axis in the most significant
+  bit (so a 2x2 block is walked row by row, like GridIterator2D)
+- Hilbert - the index of `order` bits per axis (the curve covers coordinates up to
+  `2 ** order`). Unlike Morton, consecutive indices are always neighboring points.
+
+The batched functions process all points at once, so no Python code runs per point:
+- the bits are interleaved with `bytes.translate` - every byte of a coordinate is spread
+  into the bytes of the index with a lookup table
+- the Hilbert rotations and reflections are bitwise operations on a big integer,
+  in which every point is a 64-bit lane
+Indices are 63-bit integers, so the coordinates are limited to 31 bits in 2D
+and 21 bits in 3D.
+"""
+import sys
+from array import array
+from itertools import compress, repeat
+from operator import add, and_, lt, mul
+from typing import Iterator, Optional, Sequence, Union
+
+from src.grid_points.distance import coordinate_axes
+from src.grid_points.grid_2d import Grid2D
+from src.grid_points.grid_3d import Grid3D
+from src.grid_points.point_2d import Point2D
+from src.grid_points.point_3d import Point3D
+from src.grid_points.point_array_2d import TYPECODE, PointArray2D
+from src.grid_points.point_array_3d import PointArray3D
+
+CURVES = ('morton', 'hilbert')
+
+Points = Union[PointArray2D, PointArray3D, Sequence[Point2D], Sequence[Point3D]]
+PointArray = Union[PointArray2D, PointArray3D]
+
+# The bits per axis of an index
+_BITS = {2: 31, 3: 21}
+
+
+def _spread_tables(dimensions: int) -> list[list[bytes]]:
+    """
+    Return the translation tables, which spread a byte of a coordinate into the bytes
+    of an index - [offset][byte] is the `byte`-th of the `dimensions` bytes, into which
+    the byte is spread, when its bits start at bit `offset` of the index
+    """
+    tables = []
+    for offset in range(dimensions):
+        spread = [sum(((value >> bit) & 1) << (bit * dimensions + offset) for bit in range(8))
+                  for value in range(256)]
+        tables.append([bytes((value >> (8 * byte)) & 255 for value in spread)
+                       for byte in range(dimensions)])
+
+    return tables
+
+
+def _gather_tables(dimensions: int) -> list[list[bytes]]:
+    """
+    Return the translation tables, which gather the bits of a coordinate from a byte of
+    an index - the inverse of `_spread_tables`
+    """
+    tables = []
+    for offset in range(dimensions):
+        rows = []
+        for byte in range(dimensions):
+            rows.append(bytes(
+                sum(((value >> bit) & 1) << ((8 * byte + bit - offset) // dimensions)
+                    for bit in range(8) if (8 * byte + bit) % dimensions == offset)
+                for value in range(256)))
+        tables.append(rows)
+
+    return tables
+
+
+_SPREAD = {dimensions: _spread_tables(dimensions) for dimensions in _BITS}
+_GATHER = {dimensions: _gather_tables(dimensions) for dimensions in _BITS}
+
+
+def _coordinates(point: Union[Point2D, Point3D]) -> tuple[int, ...]:
+    """
+    Return the coordinates of a single point as a tuple
+    """
+    if isinstance(point, Point3D):
+        return (point.x, point.y, point.z)
+
+    return (point.x, point.y)
+
+
+def _point_array(axes: Sequence[array]) -> PointArray:
+    """
+    Return a point array of the given coordinate arrays
+    """
+    if len(axes) == 3:
+        return PointArray3D(*axes)
+
+    return PointArray2D(*axes)
+
+
+def _to_bytes(values: array) -> bytes:
+    """
+    Return the little-endian bytes of an array
+    """
+    if sys.byteorder != 'little':
+        values = array(values.typecode, values)
+        values.byteswap()
+
+    return values.tobytes()
+
+
+def _from_bytes(data: Union[bytes, bytearray]) -> array:
+    """
+    Return the array of little-endian bytes - the inverse of `_to_bytes`
+    """
+    result = array(TYPECODE)
+    result.frombytes(data)
+    if sys.byteorder != 'little':
+        result.byteswap()
+
+    return result
+
+
+def _to_lanes(values: array) -> int:
+    """
+    Return a big integer with a 64-bit lane per value of a non-negative array
+    """
+    return int.from_bytes(_to_bytes(values), 'little')
+
+
+def _from_lanes(lanes: int, count: int) -> array:
+    """
+    Return the lanes of a big integer as an array - the inverse of `_to_lanes`
+    """
+    return _from_bytes(lanes.to_bytes(count * 8, 'little'))
+
+
+def _interleave(axes: Sequence[array]) -> array:
+    """
+    Interleave the bits of the coordinates of every point, the first axis in the most
+    significant bit
+    """
+    dimensions = len(axes)
+    count = len(axes[0])
+    result = 0
+
+    for index, axis in enumerate(axes):
+        tables = _SPREAD[dimensions][dimensions - 1 - index]
+        data = _to_bytes(axis)
+        spread = bytearray(count * 8)
+
+        for source in range((_BITS[dimensions] + 7) // 8):
+            plane = data[source::8]
+            for byte, table in enumerate(tables):
+                if source * dimensions + byte < 8:
+                    spread[source * dimensions + byte::8] = plane.translate(table)
+
+        result |= int.from_bytes(spread, 'little')
+
+    return _from_lanes(result, count)
+
+
+def _deinterleave(codes: array, dimensions: int) -> list[array]:
+    """
+    Split the bits of every index into the coordinates of a point - the inverse of `_interleave`
+    """
+    count = len(codes)
+    data = _to_bytes(codes)
+    result = []
+
+    for index in range(dimensions):
+        tables = _GATHER[dimensions][dimensions - 1 - index]
+        axis = 0
+
+        for byte, table in enumerate(tables):
+            gathered = bytearray(count * 8)
+            for target in range((_BITS[dimensions] + 7) // 8):
+                if target * dimensions + byte < 8:
+                    gathered[target::8] = data[target * dimensions + byte::8].translate(table)
+            axis |= int.from_bytes(gathered, 'little')
+
+        result.append(_from_lanes(axis, count))
+
+    return result
+
+
+def _check(axes: Sequence[array], bits: int):
+    """
+    Raise a ValueError if any coordinate does not fit in a curve of `bits` bits per axis
+    """
+    for axis in axes:
+        if len(axis) > 0 and (min(axis) < 0 or max(axis) >= 1 << bits):
+            raise ValueError(f"The coordinates must be between 0 and {(1 << bits) - 1}")
+
+
+def _check_codes(codes: array, bits: int):
+    """
+    Raise a ValueError if any index does not fit in `bits` bits
+    """
+    if len(codes) > 0 and (min(codes) < 0 or max(codes) >= 1 << bits):
+        raise ValueError(f"The indices must be between 0 and {(1 << bits) - 1}")
+
+
+def _bit(lanes: int, bit: int, ones: int) -> int:
+    """
+    Return 1 in the lanes, in which the given bit is set, and 0 in the others
+    """
+    return (lanes >> bit) & ones
+
+
+def _low_mask(flags: int, bit: int) -> int:
+    """
+    Return the `bit` lowest bits set in the lanes flagged with 1
+    """
+    return (flags << bit) - flags
+
+
+def _exchange(axes: list[int], index: int, bit: int, ones: int):
+    """
+    The step of the Hilbert transform - invert the low bits of the first axis, where
+    the bit of the given axis is set, and exchange them with the low bits of the given axis,
+    where it is not
+    """
+    flags = _bit(axes[index], bit, ones)
+    axes[0] ^= _low_mask(flags, bit)
+
+    if index > 0:
+        swap = (axes[0] ^ axes[index]) & _low_mask(ones ^ flags, bit)
+        axes[0] ^= swap
+        axes[index] ^= swap
+
+
+def _hilbert_transpose(axes: list[int], ones: int, order: int) -> list[int]:
+    """
+    Convert the coordinates of every lane to the transposed Hilbert index
+    (J. Skilling, "Programming the Hilbert curve"), for all lanes at once
+    """
+    for bit in range(order - 1, 0, -1):
+        for index in range(len(axes)):
+            _exchange(axes, index, bit, ones)
+
+    # Gray encode
+    for index in range(1, len(axes)):
+        axes[index] ^= axes[index - 1]
+
+    gray = 0
+    for bit in range(order - 1, 0, -1):
+        gray ^= _low_mask(_bit(axes[-1], bit, ones), bit)
+
+    return [axis ^ gray for axis in axes]
+
+
+def _hilbert_untranspose(axes: list[int], ones: int, order: int) -> list[int]:
+    """
+    Convert the transposed Hilbert index of every lane to coordinates - the inverse of
+    `_hilbert_transpose`
+    """
+    # Gray decode
+    gray = (axes[-1] >> 1) & ones * ((1 << 63) - 1)
+    for index in range(len(axes) - 1, 0, -1):
+        axes[index] ^= axes[index - 1]
+    axes[0] ^= gray
+
+    for bit in range(1, order):
+        for index in range(len(axes) - 1, -1, -1):
+            _exchange(axes, index, bit, ones)
+
+    return axes
+
+
+def _dimensions(dimensions: int):
+    """
+    Raise a ValueError if the dimensions are not 2 or 3
+    """
+    if dimensions not in _BITS:
+        raise ValueError("The dimensions must be 2 or 3")
+
+
+def _check_order(order: int, dimensions: int):
+    """
+    Raise a ValueError if a Hilbert index of the given order does not fit in 63 bits
+    """
+    if not 0 <= order <= _BITS[dimensions]:
+        raise ValueError(f"The order must be between 0 and {_BITS[dimensions]}")
+
+
+def _ones(count: int) -> int:
+    """
+    Return `count` lanes, all equal to 1. Multiplying them by a value repeats it in every lane.
+    """
+    return _to_lanes(array(TYPECODE, [1]) * count)
+
+
+def _encode_axes(axes: Sequence[array], curve: str, order: int) -> array:
+    """
+    Return the curve indices of the points given by their coordinate arrays
+    """
+    if curve == 'hilbert':
+        count = len(axes[0])
+        ones = _ones(count)
+        lanes = _hilbert_transpose([_to_lanes(axis) for axis in axes], ones, order)
+        axes = [_from_lanes(axis, count) for axis in lanes]
+    elif curve != 'morton':
+        raise ValueError(f"Unknown curve: {curve}, expected one of {CURVES}")
+
+    return _interleave(axes)
+
+
+def _decode_axes(codes: array, dimensions: int, curve: str, order: int) -> list[array]:
+    """
+    Return the coordinate arrays of the points with the given curve indices
+    """
+    axes = _deinterleave(codes, dimensions)
+
+    if curve == 'hilbert':
+        count = len(codes)
+        ones = _ones(count)
+        lanes = _hilbert_untranspose([_to_lanes(axis) for axis in axes], ones, order)
+        axes = [_from_lanes(axis, count) for axis in lanes]
+    elif curve != 'morton':
+        raise ValueError(f"Unknown curve: {curve}, expected one of {CURVES}")
+
+    return axes
+
+
+def morton_encode(points: Points) -> array:
+    """
+    Compute the Morton (Z-order) index of every point
+
+    :param points: The points, with non-negative coordinates (31 bits in 2D, 21 bits in 3D)
+    :type points: Points
+    :raises ValueError: If a coordinate is out of range
+    :return: The indices, in the order of the points
+    :rtype: array
+    """
+    axes = coordinate_axes(points)
+    _check(axes, _BITS[len(axes)])
+
+    return _encode_axes(axes, 'morton', 0)
+
+
+def morton_decode(codes: Sequence[int], dimensions: int = 2) -> PointArray:
+    """
+    Compute the points of Morton (Z-order) indices - the inverse of `morton_encode`
+
+    :param codes: The indices
+    :type codes: Sequence[int]
+    :param dimensions: 2 or 3, defaults to 2
+    :type dimensions: int, optional
+    :raises ValueError: If the dimensions or an index are out of range
+    :return: The points, in the order of the indices
+    :rtype: PointArray
+    """
+    _dimensions(dimensions)
+    codes = array(TYPECODE, codes)
+    _check_codes(codes, _BITS[dimensions] * dimensions)
+
+    return _point_array(_decode_axes(codes, dimensions, 'morton', 0))
+
+
+def hilbert_encode(points: Points, order: int = 16) -> array:
+    """
+    Compute the Hilbert index of every point
+
+    :param points: The points, with coordinates between 0 and `2 ** order - 1`
+    :type points: Points
+    :param order: The bits per axis of the curve - at most 31 in 2D and 21 in 3D,
+      defaults to 16
+    :type order: int, optional
+    :raises ValueError: If the order or a coordinate are out of range
+    :return: The indices, in the order of the points
+    :rtype: array
+    """
+    axes = coordinate_axes(points)
+    _check_order(order, len(axes))
+    _check(axes, order)
+
+    return _encode_axes(axes, 'hilbert', order)
+
+
+def hilbert_decode(codes: Sequence[int], dimensions: int = 2, order: int = 16) -> PointArray:
+    """
+    Compute the points of Hilbert indices - the inverse of `hilbert_encode`
+
+    :param codes: The indices
+    :type codes: Sequence[int]
+    :param dimensions: 2 or 3, defaults to 2
+    :type dimensions: int, optional
+    :param order: The bits per axis of the curve, defaults to 16
+    :type order: int, optional
+    :raises ValueError: If the dimensions, the order or an index are out of range
+    :return: The points, in the order of the indices
+    :rtype: PointArray
+    """
+    _dimensions(dimensions)
+    _check_order(order, dimensions)
+    codes = array(TYPECODE, codes)
+    _check_codes(codes, order * dimensions)
+
+    return _point_array(_decode_axes(codes, dimensions, 'hilbert', order))
+
+
+def argsort(points: Points, curve: str = 'morton') -> list[int]:
+    """
+    Return the indices of the points, sorted by their position on a curve.
+    The curve starts at the per-axis minimum of the points, so any coordinates are accepted
+    as long as their per-axis span fits in the curve.
+
+    :param points: The points
+    :type points: Points
+    :param curve: 'morton' or 'hilbert', defaults to 'morton'
+    :type curve: str, optional
+    :raises ValueError: If the curve is unknown or the points span too far
+    :return: The permutation, which sorts the points
+    :rtype: list[int]
+    """
+    axes = coordinate_axes(points)
+    if len(axes[0]) == 0:
+        return []
+
+    offsets = [array(TYPECODE, map(add, axis, repeat(-min(axis)))) for axis in axes]
+    order = max(max(axis) for axis in offsets).bit_length()
+    _check(offsets, _BITS[len(axes)])
+
+    codes = _encode_axes(offsets, curve, order)
+    return sorted(range(len(codes)), key=codes.__getitem__)
+
+
+def sort_points(points: Points, curve: str = 'morton') -> PointArray:
+    """
+    Return the points sorted by their position on a curve. See `argsort`.
+
+    :param points: The points
+    :type points: Points
+    :param curve: 'morton' or 'hilbert', defaults to 'morton'
+    :type curve: str, optional
+    :return: The sorted points
+    :rtype: PointArray
+    """
+    axes = coordinate_axes(points)
+    permutation = argsort(points, curve)
+
+    return _point_array([array(TYPECODE, map(axis.__getitem__, permutation)) for axis in axes])
+
+
+def _cells(shape: Sequence[int], curve: str, block_size: int) -> Iterator[list[array]]:
+    """
+    Iterate over the offsets of the cells of a grid with the given shape in curve order,
+    as coordinate arrays of at most `block_size` points.
+
+    The curve covers the smallest power of 2 cube around the grid. Both curves are
+    hierarchical - the cells with the same index prefix form a cube - so the cubes outside
+    the grid are skipped, and only the cubes crossing its border are filtered.
+    """
+    if block_size <= 0:
+        raise ValueError("The block size must be positive")
+
+    if curve not in CURVES:
+        raise ValueError(f"Unknown curve: {curve}, expected one of {CURVES}")
+
+    if 0 in shape:
+        return
+
+    dimensions = len(shape)
+    order = (max(shape) - 1).bit_length()
+
+    def visit(prefix: int, level: int, origin: Sequence[int]) -> Iterator[list[array]]:
+        side = 1 << (order - level)
+        span = side ** dimensions
+
+        if span <= block_size:
+            axes = _decode_axes(array(TYPECODE, range(prefix * span, (prefix + 1) * span)),
+                                dimensions, curve, order)
+
+            if any(corner + side > size for corner, size in zip(origin, shape)):
+                selectors = list(map(lt, axes[0], repeat(shape[0])))
+                for axis, size in zip(axes[1:], shape[1:]):
+                    selectors = list(map(and_, selectors, map(lt, axis, repeat(size))))
+                axes = [array(TYPECODE, compress(axis, selectors)) for axis in axes]
+
+            yield axes
+            return
+
+        children = [(prefix << dimensions | child) * (span >> dimensions)
+                    for child in range(1 << dimensions)]
+        corners = _decode_axes(array(TYPECODE, children), dimensions, curve, order)
+        half = side >> 1
+
+        for child, point in enumerate(zip(*corners)):
+            corner = [coordinate & -half for coordinate in point]
+            if all(map(lt, corner, shape)):
+                yield from visit(prefix << dimensions | child, level + 1, corner)
+
+    yield from visit(0, 0, [0] * dimensions)
+
+
+def traverse(end: Union[Point2D, Point3D], start: Optional[Union[Point2D, Point3D]] = None,
+             curve: str = 'morton', block_size: int = 4096) -> Iterator[PointArray]:
+    """
+    Iterate over the grid defined by `end` and `start` (default is the origin) in curve order,
+    in blocks of points. The curve starts at `start`.
+
+    :param end: The end of the grid (exclusive)
+    :type end: Union[Point2D, Point3D]
+    :param start: The start of the grid (inclusive), defaults to None (the origin)
+    :type start: Optional[Union[Point2D, Point3D]], optional
+    :param curve: 'morton' or 'hilbert', defaults to 'morton'
+    :type curve: str, optional
+    :param block_size: The maximum amount of points per block, defaults to 4096
+    :type block_size: int, optional
+    :raises ValueError: If the curve is unknown or `block_size` is not positive
+    :return: Iterator over PointArray2D/PointArray3D blocks
+    :rtype: Iterator[PointArray]
+    """
+    upper = _coordinates(end)
+    lower = (0,) * len(upper) if start is None else _coordinates(start)
+    shape = [max(0, high - low) for low, high in zip(lower, upper)]
+
+    for axes in _cells(shape, curve, block_size):
+        if len(axes[0]) > 0:
+            yield _point_array([array(TYPECODE, map(add, axis, repeat(low))) if low else axis
+                                for axis, low in zip(axes, lower)])
+
+
+def flat_order(grid: Union[Grid2D, Grid3D], curve: str = 'morton') -> array:
+    """
+    Return the flat indices of the cells of a grid in curve order.
+    The values of the grid can be laid out in curve order with
+    `array(grid.typecode, map(grid.data.__getitem__, flat_order(grid)))`.
+
+    :param grid: The grid
+    :type grid: Union[Grid2D, Grid3D]
+    :param curve: 'morton' or 'hilbert', defaults to 'morton'
+    :type curve: str, optional
+    :return: The flat indices
+    :rtype: array
+    """
+    shape = grid.shape
+    strides = [1] * len(shape)
+    for index in range(len(shape) - 2, -1, -1):
+        strides[index] = strides[index + 1] * shape[index + 1]
+
+    result = array(TYPECODE)
+    for axes in _cells(shape, curve, 4096):
+        flat: Iterator[int] = iter(axes[-1])
+        for axis, stride in zip(axes[:-1], strides):
+            flat = map(add, flat, map(mul, axis, repeat(stride)))
+        result.extend(flat)
+
+    return result
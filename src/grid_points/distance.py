@@ -0,0 +1,210 @@
+"""
+Module containing batched distance functions over collections of points
+
+Every function accepts the points either as a PointArray2D/PointArray3D or as a sequence of
+Point2D/Point3D. The supported metrics are:
+- `euclidean` - the same distance as `Point2D.distance_to`
+- `squared_euclidean` - the euclidean distance without the square root
+- `manhattan` - the sum of the absolute coordinate differences
+- `chebyshev` - the largest absolute coordinate difference
+
+The euclidean distances are returned as `array('d')`. The other metrics are returned as lists
+of Python ints, so they stay exact for any coordinates (a float is rounded above 2 ** 53 and
+the square of a billion-scale difference does not fit in 64 bits).
+"""
+import heapq
+from array import array
+from itertools import repeat
+from math import hypot
+from operator import add, mul, sub
+from typing import Iterator, Optional, Sequence, Union
+
+from src.grid_points.point_2d import Point2D
+from src.grid_points.point_3d import Point3D
+from src.grid_points.point_array_2d import TYPECODE, PointArray2D
+from src.grid_points.point_array_3d import PointArray3D
+
+METRICS = ('euclidean', 'squared_euclidean', 'manhattan', 'chebyshev')
+
+Points = Union[PointArray2D, PointArray3D, Sequence[Point2D], Sequence[Point3D]]
+# Euclidean distances as floats, the other metrics as exact ints
+Distances = Union[array, list[int]]
+
+
+def coordinate_axes(points: Points, dimensions: Optional[int] = None) -> tuple[array, ...]:
+    """
+    Return the per-axis coordinate arrays of a collection of points
+
+    :param points: The points
+    :type points: Points
+    :param dimensions: The expected amount of axes, which is also the amount of axes of
+      an empty sequence of points, defaults to None (any, 2 for an empty sequence)
+    :type dimensions: Optional[int], optional
+    :raises ValueError: If the points do not have `dimensions` axes
+    :return: A coordinate array per axis
+    :rtype: tuple[array, ...]
+    """
+    if isinstance(points, PointArray3D):
+        axes: tuple[array, ...] = (points.xs, points.ys, points.zs)
+    elif isinstance(points, PointArray2D):
+        axes = (points.xs, points.ys)
+    elif len(points) == 0:
+        axes = tuple(array(TYPECODE) for _ in range(dimensions or 2))
+    elif isinstance(points[0], Point3D):
+        axes = coordinate_axes(PointArray3D.from_points(points))  # type: ignore[arg-type]
+    else:
+        axes = coordinate_axes(PointArray2D.from_points(points))  # type: ignore[arg-type]
+
+    if dimensions is not None and len(axes) != dimensions:
+        raise ValueError(f"Expected points with {dimensions} dimensions, got {len(axes)}")
+
+    return axes
+
+
+def _coordinates(point: Union[Point2D, Point3D]) -> tuple[int, ...]:
+    """
+    Return the coordinates of a single point as a tuple
+    """
+    if isinstance(point, Point3D):
+        return (point.x, point.y, point.z)
+
+    return (point.x, point.y)
+
+
+def _distances(origin: tuple[int, ...], axes: tuple[Sequence[int], ...],
+               metric: str) -> Distances:
+    """
+    Compute the distances from `origin` to every point described by `axes`
+    """
+    if len(origin) != len(axes):
+        raise ValueError("The origin and the points must have the same dimensions")
+
+    if metric == 'euclidean':
+        return array('d', map(hypot, *(map(sub, axis, repeat(value))
+                                       for axis, value in zip(axes, origin))))
+
+    if metric == 'squared_euclidean':
+        total = [0] * len(axes[0])
+        for axis, value in zip(axes, origin):
+            difference = list(map(sub, axis, repeat(value)))
+            total = list(map(add, total, map(mul, difference, difference)))
+        return total
+
+    if metric == 'manhattan':
+        total = [0] * len(axes[0])
+        for axis, value in zip(axes, origin):
+            total = list(map(add, total, map(abs, map(sub, axis, repeat(value)))))
+        return total
+
+    if metric == 'chebyshev':
+        return list(map(max, *(map(abs, map(sub, axis, repeat(value)))
+                               for axis, value in zip(axes, origin))))
+
+    raise ValueError(f"Unknown metric '{metric}', expected one of {METRICS}")
+
+
+def distances_to(origin: Union[Point2D, Point3D], points: Points,
+                 metric: str = 'euclidean') -> Distances:
+    """
+    Calculate the distance from a single point to every point of a collection
+
+    Example:
+    ```python
+    distances_to(Point2D(0, 0), [Point2D(3, 4), Point2D(1, 1)], 'manhattan')  # [7, 2]
+    ```
+
+    :param origin: The point to calculate the distances from
+    :type origin: Union[Point2D, Point3D]
+    :param points: The points to calculate the distances to
+    :type points: Points
+    :param metric: The name of the metric, defaults to 'euclidean'
+    :type metric: str, optional
+    :return: The distances, in the order of `points` - `array('d')` for 'euclidean',
+      a list of ints for the other metrics
+    :rtype: Distances
+    """
+    coordinates = _coordinates(origin)
+    return _distances(coordinates, coordinate_axes(points, len(coordinates)), metric)
+
+
+def distance_blocks(sources: Points, targets: Points, metric: str = 'euclidean',
+                    block_size: int = 1024) -> Iterator[tuple[int, list[Distances]]]:
+    """
+    Calculate the pairwise distances between two collections, one block of rows at a time.
+    At most `block_size * len(targets)` distances are held in memory by every block.
+
+    :param sources: The points corresponding to the rows of the matrix
+    :type sources: Points
+    :param targets: The points corresponding to the columns of the matrix
+    :type targets: Points
+    :param metric: The name of the metric, defaults to 'euclidean'
+    :type metric: str, optional
+    :param block_size: The maximum amount of rows per block, defaults to 1024
+    :type block_size: int, optional
+    :return: Iterator of (index of the first row in the block, rows of the block), the rows
+      have the types of `distances_to`
+    :rtype: Iterator[tuple[int, list[Distances]]]
+    """
+    if block_size <= 0:
+        raise ValueError("The block size must be positive")
+
+    if metric not in METRICS:
+        raise ValueError(f"Unknown metric '{metric}', expected one of {METRICS}")
+
+    source_axes = coordinate_axes(sources)
+    amount = len(source_axes[0])
+    # Empty sources have no rows, so they do not decide the dimensions of the targets
+    target_axes = coordinate_axes(targets, len(source_axes) if amount > 0 else None)
+
+    for begin in range(0, amount, block_size):
+        end = min(begin + block_size, amount)
+        rows = [_distances(origin, target_axes, metric)
+                for origin in zip(*(axis[begin:end] for axis in source_axes))]
+        yield begin, rows
+
+
+def distance_matrix(sources: Points, targets: Points, metric: str = 'euclidean',
+                    block_size: int = 1024) -> list[Distances]:
+    """
+    Calculate the full pairwise distance matrix between two collections.
+    Row `i`, column `j` holds the distance between `sources[i]` and `targets[j]`.
+
+    :param sources: The points corresponding to the rows of the matrix
+    :type sources: Points
+    :param targets: The points corresponding to the columns of the matrix
+    :type targets: Points
+    :param metric: The name of the metric, defaults to 'euclidean'
+    :type metric: str, optional
+    :param block_size: The amount of rows computed at once, defaults to 1024
+    :type block_size: int, optional
+    :return: The distance matrix, as one row per source - `array('d')` for 'euclidean',
+      a list of ints for the other metrics
+    :rtype: list[Distances]
+    """
+    matrix: list[Distances] = []
+    for _, rows in distance_blocks(sources, targets, metric, block_size):
+        matrix.extend(rows)
+
+    return matrix
+
+
+def k_nearest(origin: Union[Point2D, Point3D], points: Points, k: int,
+              metric: str = 'euclidean') -> list[int]:
+    """
+    Find the `k` points of a collection, which are nearest to `origin`.
+    Ties are broken by the position of the points in the collection. The integer metrics
+    are compared exactly, also for coordinates above 2 ** 53.
+
+    :param origin: The point to search around
+    :type origin: Union[Point2D, Point3D]
+    :param points: The points to search in
+    :type points: Points
+    :param k: The amount of points to return
+    :type k: int
+    :param metric: The name of the metric, defaults to 'euclidean'
+    :type metric: str, optional
+    :return: The indices of the nearest points, from the nearest to the farthest
+    :rtype: list[int]
+    """
+    distances = distances_to(origin, points, metric)
+    return heapq.nsmallest(k, range(len(distances)), key=distances.__getitem__)
@@ -0,0 +1,74 @@
+"""
+Module containing the FrozenPoint2D class
+"""
+from typing import Any
+
+from src.grid_points.point_2d import Point2D
+
+
+class FrozenPoint2D(Point2D):
+    """
+    Immutable variant of Point2D, meant to be stored in sets and used as dictionary keys.
+
+    The coordinates are read directly from the slots (no property getter involved) and
+    the hash is computed once, on construction. Since the hash is the same as the one of
+    an equal Point2D, frozen and mutable points can be mixed in the same set or dict.
+
+    All arithmetic operators return FrozenPoint2D instances.
+    """
+    __slots__ = ('_hash',)
+    _hash: int
+
+    # Re-expose the slots of Point2D under the public names, bypassing the property getters
+    x = Point2D.__dict__['_Point2D__x']  # type: ignore[assignment]
+    y = Point2D.__dict__['_Point2D__y']  # type: ignore[assignment]
+
+    def __init__(self, x: int, y: int):  # pylint: disable=super-init-not-called
+        object.__setattr__(self, 'x', x)
+        object.__setattr__(self, 'y', y)
+        object.__setattr__(self, '_hash', hash((x, y)))
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"Cannot set attribute '{name}' of a FrozenPoint2D")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"Cannot delete attribute '{name}' of a FrozenPoint2D")
+
+    def __repr__(self) -> str:
+        return f'FrozenPoint2D({self.x}, {self.y})'
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self):
+        return (FrozenPoint2D, (self.x, self.y))
+
+    def __copy__(self) -> "FrozenPoint2D":
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "FrozenPoint2D":
+        return self
+
+    def thaw(self) -> Point2D:
+        """
+        Return a mutable copy of the point
+
+        :return: A Point2D with the same coordinates
+        :rtype: Point2D
+        """
+        return Point2D(self.x, self.y)
+
+    @classmethod
+    def from_point(cls, point: Point2D) -> "FrozenPoint2D":
+        """
+        Create a frozen copy of an existing point
+
+        :param point: The point to freeze
+        :type point: Point2D
+        :return: A FrozenPoint2D with the same coordinates
+        :rtype: FrozenPoint2D
+        """
+        if isinstance(point, FrozenPoint2D):
+            return point
+
+        return cls(point.x, point.y)
@@ -0,0 +1,76 @@
+"""
+Module containing the FrozenPoint3D class
+"""
+from typing import Any
+
+from src.grid_points.point_3d import Point3D
+
+
+class FrozenPoint3D(Point3D):
+    """
+    Immutable variant of Point3D, meant to be stored in sets and used as dictionary keys.
+
+    The coordinates are read directly from the slots (no property getter involved) and
+    the hash is computed once, on construction. Since the hash is the same as the one of
+    an equal Point3D, frozen and mutable points can be mixed in the same set or dict.
+
+    All arithmetic operators return FrozenPoint3D instances.
+    """
+    __slots__ = ('_hash',)
+    _hash: int
+
+    # Re-expose the slots of Point3D under the public names, bypassing the property getters
+    x = Point3D.__dict__['_Point3D__x']  # type: ignore[assignment]
+    y = Point3D.__dict__['_Point3D__y']  # type: ignore[assignment]
+    z = Point3D.__dict__['_Point3D__z']  # type: ignore[assignment]
+
+    def __init__(self, x: int, y: int, z: int):  # pylint: disable=super-init-not-called
+        object.__setattr__(self, 'x', x)
+        object.__setattr__(self, 'y', y)
+        object.__setattr__(self, 'z', z)
+        object.__setattr__(self, '_hash', hash((x, y, z)))
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"Cannot set attribute '{name}' of a FrozenPoint3D")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"Cannot delete attribute '{name}' of a FrozenPoint3D")
+
+    def __repr__(self) -> str:
+        return f'FrozenPoint3D({self.x}, {self.y}, {self.z})'
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self):
+        return (FrozenPoint3D, (self.x, self.y, self.z))
+
+    def __copy__(self) -> "FrozenPoint3D":
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "FrozenPoint3D":
+        return self
+
+    def thaw(self) -> Point3D:
+        """
+        Return a mutable copy of the point
+
+        :return: A Point3D with the same coordinates
+        :rtype: Point3D
+        """
+        return Point3D(self.x, self.y, self.z)
+
+    @classmethod
+    def from_point(cls, point: Point3D) -> "FrozenPoint3D":
+        """
+        Create a frozen copy of an existing point
+
+        :param point: The point to freeze
+        :type point: Point3D
+        :return: A FrozenPoint3D with the same coordinates
+        :rtype: FrozenPoint3D
+        """
+        if isinstance(point, FrozenPoint3D):
+            return point
+
+        return cls(point.x, point.y, point.z)
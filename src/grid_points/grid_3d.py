@@ -0,0 +1,355 @@
+"""
+Module containing the Grid3D class
+"""
+import sys
+from array import array
+from typing import Iterator, Optional, Union
+
+from src.grid_points.buffers import Buffer, array_interface, pickle_buffer, restore_array
+from src.grid_points.grid_range_3d import GridRange3D
+from src.grid_points.neighborhood import offsets_3d
+from src.grid_points.point_3d import Point3D
+
+Value = Union[int, float]
+
+
+def _restore(typecode: str, byteorder: str, data: object, end: Point3D,
+             start: Point3D) -> "Grid3D":
+    """
+    Create a grid from its pickled buffer
+    """
+    return Grid3D.from_buffer(restore_array(typecode, byteorder, data), end, start)
+
+
+class Grid3D:
+    """
+    Dense container, which stores a value for every cell of the 3D grid defined by
+    `end` and `start` (default is (0, 0, 0)).
+
+    The values are kept in a single flat `array` buffer with the given typecode, in the order
+    of GridIterator3D (z fastest, then y, then x), so a cell costs only the size of its value.
+    The cells can be accessed by Point3D (`grid[point]`) or by raw coordinates
+    (`grid.get(x, y, z)`). Both are bounds checked and raise IndexError for cells outside the grid.
+    `get_unchecked`/`set_unchecked` skip the check for hot loops, where the coordinates
+    are already known to be inside the grid.
+
+    `from_buffer` can also wrap a typed memoryview, e.g. of a memory-mapped file (see grid_file).
+    The grid then reads and writes the memory of the view, without copying it.
+    """
+    __slots__ = ('__start_x', '__start_y', '__start_z', '__size_x', '__size_y', '__size_z',
+                 '__data', '__deltas')
+
+    def __init__(self, end: Point3D, start: Optional[Point3D] = None, typecode: str = 'q',
+                 fill: Value = 0):
+        if start is None:
+            start = Point3D(0, 0, 0)
+
+        self.__start_x = start.x
+        self.__start_y = start.y
+        self.__start_z = start.z
+        self.__size_x = max(0, end.x - start.x)
+        self.__size_y = max(0, end.y - start.y)
+        self.__size_z = max(0, end.z - start.z)
+        self.__data: Buffer = array(typecode, [fill]) * (
+            self.__size_x * self.__size_y * self.__size_z)
+        self.__deltas: dict[int, tuple[tuple[int, int, int, int], ...]] = {}
+
+    @classmethod
+    def from_buffer(cls, data: Buffer, end: Point3D, start: Optional[Point3D] = None) -> "Grid3D":
+        """
+        Create a grid, which uses an existing buffer for its values (without copying it)
+
+        :param data: The values of the cells, in the order of GridIterator3D
+        :type data: Buffer
+        :param end: The upper bounds of the grid
+        :type end: Point3D
+        :param start: The lower bounds of the grid, defaults to None (0, 0, 0)
+        :type start: Optional[Point3D], optional
+        :raises ValueError: If the size of the buffer does not match the amount of cells
+        :return: The new grid
+        :rtype: Grid3D
+        """
+        if start is None:
+            start = Point3D(0, 0, 0)
+
+        cells = max(0, end.x - start.x) * max(0, end.y - start.y) * max(0, end.z - start.z)
+        if len(data) != cells:
+            raise ValueError(f"Expected {cells} values, got {len(data)}")
+
+        # pylint: disable=protected-access,unused-private-member
+        result = cls.__new__(cls)
+        result.__start_x = start.x
+        result.__start_y = start.y
+        result.__start_z = start.z
+        result.__size_x = max(0, end.x - start.x)
+        result.__size_y = max(0, end.y - start.y)
+        result.__size_z = max(0, end.z - start.z)
+        result.__data = data
+        result.__deltas = {}
+        return result
+
+    @property
+    def start(self) -> Point3D:
+        """
+        Return the lower (inclusive) bounds of the grid
+
+        :rtype: Point3D
+        """
+        return Point3D(self.__start_x, self.__start_y, self.__start_z)
+
+    @property
+    def end(self) -> Point3D:
+        """
+        Return the upper (exclusive) bounds of the grid
+
+        :rtype: Point3D
+        """
+        return Point3D(self.__start_x + self.__size_x, self.__start_y + self.__size_y,
+                       self.__start_z + self.__size_z)
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        """
+        Return the amount of cells along every axis
+
+        :rtype: tuple[int, int, int]
+        """
+        return self.__size_x, self.__size_y, self.__size_z
+
+    @property
+    def typecode(self) -> str:
+        """
+        Return the typecode of the values, as used by the `array` module
+
+        :rtype: str
+        """
+        if isinstance(self.__data, memoryview):
+            return self.__data.format
+
+        return self.__data.typecode
+
+    @property
+    def data(self) -> Buffer:
+        """
+        Return the flat buffer with the values. The buffer is shared, not copied.
+
+        :rtype: Buffer
+        """
+        return self.__data
+
+    def points(self) -> GridRange3D:
+        """
+        Return the points of the grid, in the order of the values in `data`
+
+        :rtype: GridRange3D
+        """
+        return GridRange3D(self.end, self.start)
+
+    def index(self, x: int, y: int, z: int) -> int:
+        """
+        Return the position of a cell in the flat buffer
+
+        :param x: The x coordinate of the cell
+        :type x: int
+        :param y: The y coordinate of the cell
+        :type y: int
+        :param z: The z coordinate of the cell
+        :type z: int
+        :raises IndexError: If the cell is outside the grid
+        :return: The position of the cell in `data`
+        :rtype: int
+        """
+        local_x = x - self.__start_x
+        local_y = y - self.__start_y
+        local_z = z - self.__start_z
+
+        if not (0 <= local_x < self.__size_x and 0 <= local_y < self.__size_y and
+                0 <= local_z < self.__size_z):
+            raise IndexError(f"({x}, {y}, {z}) is outside the grid")
+
+        return (local_x * self.__size_y + local_y) * self.__size_z + local_z
+
+    def get(self, x: int, y: int, z: int) -> Value:
+        """
+        Return the value of a cell
+
+        :raises IndexError: If the cell is outside the grid
+        :rtype: Value
+        """
+        return self.__data[self.index(x, y, z)]
+
+    def set(self, x: int, y: int, z: int, value: Value):
+        """
+        Change the value of a cell
+
+        :raises IndexError: If the cell is outside the grid
+        """
+        self.__data[self.index(x, y, z)] = value
+
+    def get_unchecked(self, x: int, y: int, z: int) -> Value:
+        """
+        Return the value of a cell, without checking if it is inside the grid.
+        A cell outside the grid returns the value of another cell or raises IndexError.
+
+        :rtype: Value
+        """
+        return self.__data[((x - self.__start_x) * self.__size_y + y - self.__start_y)
+                           * self.__size_z + z - self.__start_z]
+
+    def set_unchecked(self, x: int, y: int, z: int, value: Value):
+        """
+        Change the value of a cell, without checking if it is inside the grid.
+        A cell outside the grid changes the value of another cell or raises IndexError.
+        """
+        self.__data[((x - self.__start_x) * self.__size_y + y - self.__start_y)
+                    * self.__size_z + z - self.__start_z] = value
+
+    def neighbors(self, point: Point3D, connectivity: int = 6) -> list[Point3D]:
+        """
+        Return the neighbors of a point, which are inside the grid
+
+        :param point: The point, whose neighbors are returned
+        :type point: Point3D
+        :param connectivity: 6 or 26, defaults to 6
+        :type connectivity: int, optional
+        :rtype: list[Point3D]
+        """
+        return point.neighbors(connectivity, self.end, self.start)
+
+    def neighbor_indices(self, flat_index: int, connectivity: int = 6) -> list[int]:
+        """
+        Return the positions in `data` of the neighbors of a cell, which are inside the grid.
+        The neighbors are computed on flat indices, with a table of offsets cached per grid,
+        so no points are created.
+
+        :param flat_index: The position of the cell in `data`
+        :type flat_index: int
+        :param connectivity: 6 or 26, defaults to 6
+        :type connectivity: int, optional
+        :return: The positions of the neighbors, in the order of the offsets in `neighborhood`
+        :rtype: list[int]
+        """
+        size_x, size_y, size_z = self.__size_x, self.__size_y, self.__size_z
+
+        deltas = self.__deltas.get(connectivity)
+        if deltas is None:
+            deltas = self.__deltas[connectivity] = tuple(
+                (dx, dy, dz, (dx * size_y + dy) * size_z + dz)
+                for dx, dy, dz in offsets_3d(connectivity))
+
+        rest, z = divmod(flat_index, size_z)
+        x, y = divmod(rest, size_y)
+        if 0 < x < size_x - 1 and 0 < y < size_y - 1 and 0 < z < size_z - 1:
+            # Cells away from the border have every neighbor inside the grid
+            return [flat_index + delta for _, _, _, delta in deltas]
+
+        return [flat_index + delta for dx, dy, dz, delta in deltas
+                if 0 <= x + dx < size_x and 0 <= y + dy < size_y and 0 <= z + dz < size_z]
+
+    def fill(self, value: Value, end: Optional[Point3D] = None, start: Optional[Point3D] = None):
+        """
+        Set the value of every cell of the grid, or of every cell inside the given bounds.
+        The bounds are clipped to the grid.
+
+        :param value: The new value
+        :type value: Value
+        :param end: The upper bounds of the region to fill, defaults to None (the whole grid)
+        :type end: Optional[Point3D], optional
+        :param start: The lower bounds of the region to fill, defaults to None (the whole grid)
+        :type start: Optional[Point3D], optional
+        """
+        if end is None and start is None:
+            self.__data[:] = array(self.typecode, [value]) * len(self.__data)
+            return
+
+        end = self.end if end is None else end
+        start = self.start if start is None else start
+
+        begin_x = max(start.x, self.__start_x) - self.__start_x
+        end_x = min(end.x, self.__start_x + self.__size_x) - self.__start_x
+        begin_y = max(start.y, self.__start_y) - self.__start_y
+        end_y = min(end.y, self.__start_y + self.__size_y) - self.__start_y
+        begin_z = max(start.z, self.__start_z) - self.__start_z
+        end_z = min(end.z, self.__start_z + self.__size_z) - self.__start_z
+
+        if begin_z >= end_z:
+            return
+
+        column = array(self.typecode, [value]) * (end_z - begin_z)
+        for x in range(begin_x, end_x):
+            for y in range(begin_y, end_y):
+                offset = (x * self.__size_y + y) * self.__size_z
+                self.__data[offset + begin_z:offset + end_z] = column
+
+    def copy(self) -> "Grid3D":
+        """
+        Return a copy of the grid, which does not share its buffer with the current one
+
+        :rtype: Grid3D
+        """
+        data = array(self.typecode)
+        data.frombytes(memoryview(self.__data).cast('B'))
+        return Grid3D.from_buffer(data, self.end, self.start)
+
+    def values(self) -> Iterator[Value]:
+        """
+        Return an iterator over the values, in the order of GridIterator3D
+
+        :rtype: Iterator[Value]
+        """
+        return iter(self.__data)
+
+    def items(self) -> Iterator[tuple[Point3D, Value]]:
+        """
+        Return an iterator over (point, value) pairs, in the order of GridIterator3D
+
+        :rtype: Iterator[tuple[Point3D, Value]]
+        """
+        return zip(self.points(), self.__data)
+
+    def __len__(self) -> int:
+        return len(self.__data)
+
+    def __iter__(self) -> Iterator[Point3D]:
+        return iter(self.points())
+
+    def __contains__(self, point: object) -> bool:
+        if not isinstance(point, Point3D):
+            return False
+
+        return (0 <= point.x - self.__start_x < self.__size_x and
+                0 <= point.y - self.__start_y < self.__size_y and
+                0 <= point.z - self.__start_z < self.__size_z)
+
+    def __getitem__(self, point: Point3D) -> Value:
+        return self.__data[self.index(point.x, point.y, point.z)]
+
+    def __setitem__(self, point: Point3D, value: Value):
+        self.__data[self.index(point.x, point.y, point.z)] = value
+
+    @property
+    def __array_interface__(self) -> dict:
+        """
+        Return the description of the buffer for NumPy - `numpy.asarray(grid)` is an array
+        with the shape of the grid, which shares the memory of the grid
+
+        :rtype: dict
+        """
+        return array_interface(self.__data, self.typecode, self.shape)
+
+    def __reduce_ex__(self, protocol):
+        # With protocol 5 the buffer can be sent out-of-band, without copying it
+        return (_restore, (self.typecode, sys.byteorder, pickle_buffer(self.__data, protocol),
+                           self.end, self.start))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Grid3D):
+            # https://mypy.readthedocs.io/en/stable/common_issues.html#incompatible-overrides
+            raise NotImplementedError("Invalid type for other")
+
+        # An array is never equal to a memoryview, while memoryviews compare any buffers by value
+        return (self.start == other.start and self.end == other.end and
+                memoryview(self.__data) == memoryview(other.data))
+
+    def __repr__(self) -> str:
+        return f"Grid3D({self.end!r}, {self.start!r}, '{self.typecode}')"
@@ -0,0 +1,249 @@
+"""
+Module containing a binary file format for the dense grids (Grid2D/Grid3D)
+
+A file is a header of 64 bytes, followed by the raw values of the cells, in the order of the
+buffer of the grid (row-major). The header contains (little-endian):
+- the magic `GRIDPTS\\0` and the version of the format (uint16)
+- the amount of dimensions (2 or 3), the typecode of the values (as in the `array` module),
+  the byte order of the values (`<` or `>`) and the size of a value in bytes
+- the start and the end of the grid, as 3 int64 each (z is 0 for 2D grids)
+
+The values are kept in the byte order of the machine, which saved them, so they can be mapped
+into memory as they are - opening a file does not read or convert the values, the operating
+system pages them in when they are accessed. Processes, which open the same file read-only,
+share the same physical memory.
+"""
+import mmap
+import struct
+import sys
+from array import array
+from itertools import product
+from operator import lt
+from os import PathLike
+from typing import Iterator, Optional, Union
+
+from src.grid_points.grid_2d import Grid2D
+from src.grid_points.grid_3d import Grid3D
+from src.grid_points.point_2d import Point2D
+from src.grid_points.point_3d import Point3D
+
+Grid = Union[Grid2D, Grid3D]
+Point = Union[Point2D, Point3D]
+Path = Union[str, PathLike]
+
+MAGIC = b'GRIDPTS\0'
+VERSION = 1
+# magic, version, dimensions, typecode, byte order, item size, start (x, y, z), end (x, y, z)
+HEADER = struct.Struct('<8sHBccB2x3q3q')
+
+BYTE_ORDER = b'<' if sys.byteorder == 'little' else b'>'
+# The modes of GridFile and how the file is mapped
+MODES = {'r': mmap.ACCESS_READ, 'r+': mmap.ACCESS_WRITE, 'c': mmap.ACCESS_COPY}
+
+
+def _coordinates(point: Point) -> tuple[int, ...]:
+    """
+    Return the coordinates of a point as a tuple
+    """
+    if isinstance(point, Point3D):
+        return (point.x, point.y, point.z)
+
+    return (point.x, point.y)
+
+
+def save(grid: Grid, path: Path):
+    """
+    Write a grid to a file
+
+    :param grid: The grid to save
+    :type grid: Grid
+    :param path: The path of the file, which is created or overwritten
+    :type path: Path
+    """
+    start = _coordinates(grid.start)
+    end = _coordinates(grid.end)
+    padding = (0,) * (3 - len(start))
+    data = memoryview(grid.data)
+
+    with open(path, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, VERSION, len(start), grid.typecode.encode('ascii'),
+                               BYTE_ORDER, data.itemsize, *start, *padding, *end, *padding))
+        file.write(data.cast('B'))
+
+
+def _runs(lower: tuple[int, ...], upper: tuple[int, ...], origin: tuple[int, ...],
+          shape: tuple[int, ...]) -> Iterator[tuple[int, int]]:
+    """
+    Return the (begin, end) positions in the buffer of the lines of a region along the last axis,
+    merging the lines next to each other
+    """
+    if not all(map(lt, lower, upper)):
+        return
+
+    ranges = [range(low - first, high - first)
+              for low, high, first in zip(lower[:-1], upper[:-1], origin[:-1])]
+    offset = lower[-1] - origin[-1]
+    length = upper[-1] - lower[-1]
+
+    begin = end = -1
+    for outer in product(*ranges):
+        line = 0
+        for coordinate, size in zip(outer, shape):
+            line = line * size + coordinate
+        position = line * shape[-1] + offset
+
+        if position != end:
+            if begin >= 0:
+                yield begin, end
+            begin = position
+        end = position + length
+
+    yield begin, end
+
+
+class GridFile:
+    """
+    A grid file, mapped into memory.
+
+    `grid` works directly on the mapped memory - nothing is copied when the file is opened
+    and only the pages of the accessed cells are read. `region` copies only the cells inside
+    some bounds. The mode tells what happens with the changes of `grid`:
+    - 'r' - read-only, changing a cell raises TypeError
+    - 'r+' - the changes are written to the file (on `flush`/`close` at the latest)
+    - 'c' - copy-on-write, the changes stay in the memory of the process
+
+    The grid must not be used after the file is closed. It is closed at the end of a `with`
+    block.
+    """
+    __slots__ = ('__file', '__mmap', '__bytes', '__values', '__grid', '__itemsize')
+
+    def __init__(self, path: Path, mode: str = 'r'):
+        """
+        :param path: The path of the file
+        :type path: Path
+        :param mode: 'r', 'r+' or 'c', defaults to 'r'
+        :type mode: str, optional
+        :raises ValueError: If the mode is not supported, or the file is not a valid grid file,
+          or it was saved on a machine with another byte order or size of the values
+        """
+        if mode not in MODES:
+            raise ValueError(f"Invalid mode '{mode}', expected one of {list(MODES)}")
+
+        # pylint: disable=consider-using-with
+        self.__file = open(path, 'r+b' if mode == 'r+' else 'rb')
+        try:
+            self.__mmap = mmap.mmap(self.__file.fileno(), 0, access=MODES[mode])
+        except ValueError:
+            self.__file.close()
+            raise ValueError(f"{path} is not a grid file") from None
+
+        try:
+            self.__grid = self.__map(str(path))
+        except ValueError:
+            self.__mmap.close()
+            self.__file.close()
+            raise
+
+    def __map(self, path: str) -> Grid:
+        """
+        Check the header and create the grid over the mapped values
+        """
+        # pylint: disable=too-many-locals
+        if len(self.__mmap) < HEADER.size:
+            raise ValueError(f"{path} is not a grid file")
+
+        magic, version, dimensions, typecode, byte_order, itemsize, *bounds = \
+            HEADER.unpack_from(self.__mmap)
+
+        if magic != MAGIC or version != VERSION or dimensions not in (2, 3):
+            raise ValueError(f"{path} is not a grid file of version {VERSION}")
+
+        typecode = typecode.decode('ascii')
+        if byte_order != BYTE_ORDER or typecode not in 'bBhHiIlLqQfd' or \
+                array(typecode).itemsize != itemsize:
+            raise ValueError(f"{path} contains values of type '{typecode}', "
+                             f"which cannot be mapped on this machine")
+
+        cells = 1
+        for lower, upper in zip(bounds[:dimensions], bounds[3:3 + dimensions]):
+            cells *= max(0, upper - lower)
+
+        size = cells * itemsize
+        if len(self.__mmap) != HEADER.size + size:
+            raise ValueError(f"{path} should contain {cells} values")
+
+        self.__itemsize = itemsize
+        self.__bytes = memoryview(self.__mmap)[HEADER.size:]
+        self.__values = self.__bytes.cast(typecode)
+        if dimensions == 2:
+            return Grid2D.from_buffer(self.__values, Point2D(*bounds[3:5]), Point2D(*bounds[:2]))
+
+        return Grid3D.from_buffer(self.__values, Point3D(*bounds[3:]), Point3D(*bounds[:3]))
+
+    @property
+    def grid(self) -> Grid:
+        """
+        Return the grid, which uses the mapped memory as its buffer
+
+        :rtype: Grid
+        """
+        return self.__grid
+
+    def region(self, end: Point, start: Optional[Point] = None) -> Grid:
+        """
+        Return a copy of the cells inside some bounds, as a new grid (with an array buffer).
+        Only the lines of the region are read, so the pages of the other cells are not touched.
+
+        :param end: The upper (exclusive) bounds of the region
+        :type end: Point
+        :param start: The lower (inclusive) bounds of the region, defaults to None (the start
+          of the grid)
+        :type start: Optional[Point], optional
+        :raises IndexError: If the region is not inside the grid
+        :rtype: Grid
+        """
+        grid = self.__grid
+        lower = _coordinates(grid.start if start is None else start)
+        upper = _coordinates(end)
+        origin = _coordinates(grid.start)
+        shape = grid.shape
+
+        if any(low < first or high > first + size
+               for low, high, first, size in zip(lower, upper, origin, shape)):
+            raise IndexError(f"The region {start}-{end} is not inside the grid")
+
+        data = array(grid.typecode)
+        for begin, stop in _runs(lower, upper, origin, shape):
+            data.frombytes(self.__bytes[begin * self.__itemsize:stop * self.__itemsize])
+
+        point_class: type = Point2D if len(shape) == 2 else Point3D
+        return grid.__class__.from_buffer(data, end, point_class(*lower))  # type: ignore[arg-type]
+
+    def flush(self):
+        """
+        Write the changes to the file (only in mode 'r+')
+        """
+        self.__mmap.flush()
+
+    def close(self):
+        """
+        Unmap and close the file. The grid cannot be used afterwards.
+
+        :raises BufferError: If views of the grid buffer (e.g. slices of `grid.data`) still exist
+        """
+        if self.__file.closed:
+            return
+
+        self.__values.release()
+        self.__bytes.release()
+        self.__mmap.close()
+        self.__file.close()
+
+    def __enter__(self) -> "GridFile":
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"GridFile({self.__file.name!r})"
@@ -3,30 +3,88 @@ Module containing the 2D grid iterator class
 """
 
 from collections import abc
-from typing import Optional
+from itertools import chain, starmap
+from typing import Iterator, Optional, Union
 
+from src.grid_points.grid_range_2d import GridRange2D
+from src.grid_points.box_2d import Box2D
+from src.grid_points.curves import CURVES, traverse
 from src.grid_points.point_2d import Point2D
+from src.grid_points.point_array_2d import PointArray2D
+from src.grid_points.traversal import axis_order, axis_ranges, walk, walk_blocks
 
 
 class GridIterator2D(abc.Iterator):
     """
     Represents the 2D Grid iterator.
-    This class iterates the 2D grid defined by `end` and `start` (default is (0, 0)).
+    This class iterates the 2D grid defined by `end` and `start` (default is (0, 0)),
+    or by a single Box2D.
 
     Iteration is done row by row - iterate over the points on the first row,
     then the second one, etc.
+
+    With `order='morton'` or `order='hilbert'` the grid is walked along a space-filling curve
+    instead, which keeps consecutive points close in all axes (see the curves module).
+
+    The row order can be changed with `step` (the distance between the visited cells of
+    every axis, negative to walk an axis in reverse), `axes` (the axes from the slowest to
+    the fastest changing one, e.g. 'yx') and `tile` (walk the grid tile by tile, with
+    the given amount of visited cells per axis). See the traversal module.
     """
-    def __init__(self, end: Point2D, start: Optional[Point2D] = None):
+    def __init__(self, end: Union[Point2D, Box2D], start: Optional[Point2D] = None,
+                 order: str = 'row', step: Optional[Point2D] = None, axes: str = 'xy',
+                 tile: Optional[Point2D] = None):
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        if isinstance(end, Box2D):
+            start = end.start
+            end = end.end
+
+        if order != 'row' and order not in CURVES:
+            raise ValueError(f"Unknown order: {order}, expected 'row' or one of {CURVES}")
+
+        if order != 'row' and (step is not None or axes != 'xy' or tile is not None):
+            raise ValueError("The steps, the axes and the tiles are supported only in row order")
+
         self.__end = end
         self.__start = start
+        self.__order = order
 
         if self.__start is None:
             self.__start = Point2D(0, 0)
 
-        x_range = range(self.__start.x, self.__end.x)
-        y_range = range(self.__start.y, self.__end.y)
+        lower, upper = self.__start, self.__end
+        # The ranges, the order of the axes and the tiles of the traversal
+        self.__walk = (axis_ranges((lower.x, lower.y), (upper.x, upper.y),
+                                   None if step is None else (step.x, step.y)),
+                       axis_order(axes, 2), None if tile is None else (tile.x, tile.y))
+        self.__is_row_major = step is None and axes == 'xy' and tile is None
 
-        self.__iterator = (Point2D(x, y) for x in x_range for y in y_range)
+        if order != 'row':
+            self.__iterator: Iterator[Point2D] = chain.from_iterable(
+                traverse(self.__end, self.__start, order))
+        else:
+            self.__iterator = starmap(Point2D, walk(*self.__walk))
 
     def __next__(self) -> Point2D:
         return next(self.__iterator)
+
+    def blocks(self, block_size: int = 4096) -> Iterator[PointArray2D]:
+        """
+        Iterate over the whole grid in blocks of points, instead of one point at a time.
+        The blocks cover the grid from its beginning, regardless of how many points were
+        already returned by `next()`. See `GridRange2D.blocks`.
+
+        :param block_size: The maximum amount of points per block, defaults to 4096
+        :type block_size: int, optional
+        :return: Iterator over PointArray2D blocks, in the same order as the points
+        :rtype: Iterator[PointArray2D]
+        """
+        if self.__order != 'row':
+            return traverse(self.__end, self.__start, self.__order,
+                            block_size)  # type: ignore[return-value]
+
+        if not self.__is_row_major:
+            blocks = walk_blocks(*self.__walk, block_size)
+            return (PointArray2D(*block) for block in blocks)
+
+        return GridRange2D(self.__end, self.__start).blocks(block_size)
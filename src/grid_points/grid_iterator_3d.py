@@ -3,15 +3,22 @@ Module containing the 3D grid iterator class
 """
 
 from collections import abc
-from typing import Optional
+from itertools import chain, starmap
+from typing import Iterator, Optional, Union
 
+from src.grid_points.grid_range_3d import GridRange3D
+from src.grid_points.box_3d import Box3D
+from src.grid_points.curves import CURVES, traverse
 from src.grid_points.point_3d import Point3D
+from src.grid_points.point_array_3d import PointArray3D
+from src.grid_points.traversal import axis_order, axis_ranges, walk, walk_blocks
 
 
 class GridIterator3D(abc.Iterator):
     """
     Represents the 3D Grid iterator.
-    This class iterates the 3D grid defined by `end` and `start` (default is (0, 0, 0)).
+    This class iterates the 3D grid defined by `end` and `start` (default is (0, 0, 0)),
+    or by a single Box3D.
 
     Iteration is done first on the z axis, then on y, then on x.
 
@@ -20,19 +27,69 @@ class GridIterator3D(abc.Iterator):
         (0, 1, 0), (0, 1, 1),
         (1, 0, 0), (1, 0, 1),
         (1, 1, 0), (1, 1, 1)
+
+    With `order='morton'` or `order='hilbert'` the grid is walked along a space-filling curve
+    instead, which keeps consecutive points close in all axes (see the curves module).
+
+    The row order can be changed with `step` (the distance between the visited cells of
+    every axis, negative to walk an axis in reverse), `axes` (the axes from the slowest to
+    the fastest changing one, e.g. 'zyx') and `tile` (walk the grid tile by tile, with
+    the given amount of visited cells per axis). See the traversal module.
     """
-    def __init__(self, end: Point3D, start: Optional[Point3D] = None):
+    def __init__(self, end: Union[Point3D, Box3D], start: Optional[Point3D] = None,
+                 order: str = 'row', step: Optional[Point3D] = None, axes: str = 'xyz',
+                 tile: Optional[Point3D] = None):
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        if isinstance(end, Box3D):
+            start = end.start
+            end = end.end
+
+        if order != 'row' and order not in CURVES:
+            raise ValueError(f"Unknown order: {order}, expected 'row' or one of {CURVES}")
+
+        if order != 'row' and (step is not None or axes != 'xyz' or tile is not None):
+            raise ValueError("The steps, the axes and the tiles are supported only in row order")
+
         self.__end = end
         self.__start = start
+        self.__order = order
 
         if self.__start is None:
             self.__start = Point3D(0, 0, 0)
 
-        x_range = range(self.__start.x, self.__end.x)
-        y_range = range(self.__start.y, self.__end.y)
-        z_range = range(self.__start.z, self.__end.z)
+        lower, upper = self.__start, self.__end
+        # The ranges, the order of the axes and the tiles of the traversal
+        self.__walk = (axis_ranges((lower.x, lower.y, lower.z), (upper.x, upper.y, upper.z),
+                                   None if step is None else (step.x, step.y, step.z)),
+                       axis_order(axes, 3), None if tile is None else (tile.x, tile.y, tile.z))
+        self.__is_row_major = step is None and axes == 'xyz' and tile is None
 
-        self.__iterator = (Point3D(x, y, z) for x in x_range for y in y_range for z in z_range)
+        if order != 'row':
+            self.__iterator: Iterator[Point3D] = chain.from_iterable(
+                traverse(self.__end, self.__start, order))
+        else:
+            self.__iterator = starmap(Point3D, walk(*self.__walk))
 
     def __next__(self) -> Point3D:
         return next(self.__iterator)
+
+    def blocks(self, block_size: int = 4096) -> Iterator[PointArray3D]:
+        """
+        Iterate over the whole grid in blocks of points, instead of one point at a time.
+        The blocks cover the grid from its beginning, regardless of how many points were
+        already returned by `next()`. See `GridRange3D.blocks`.
+
+        :param block_size: The maximum amount of points per block, defaults to 4096
+        :type block_size: int, optional
+        :return: Iterator over PointArray3D blocks, in the same order as the points
+        :rtype: Iterator[PointArray3D]
+        """
+        if self.__order != 'row':
+            return traverse(self.__end, self.__start, self.__order,
+                            block_size)  # type: ignore[return-value]
+
+        if not self.__is_row_major:
+            blocks = walk_blocks(*self.__walk, block_size)
+            return (PointArray3D(*block) for block in blocks)
+
+        return GridRange3D(self.__end, self.__start).blocks(block_size)
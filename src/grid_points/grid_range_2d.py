@@ -0,0 +1,230 @@
+"""
+Module containing the 2D grid range class
+"""
+
+from array import array
+from collections import abc
+from typing import Iterator, Optional, Union, overload
+
+from src.grid_points.box_2d import Box2D
+from src.grid_points.point_2d import Point2D
+from src.grid_points.point_array_2d import TYPECODE, PointArray2D
+
+
+class GridRange2D(abc.Sequence):
+    """
+    Represents the 2D grid defined by `end` and `start` (default is (0, 0)) as a sequence.
+    The bounds can also be given as a single Box2D.
+
+    The points are in the same order as the ones returned by GridIterator2D (row by row),
+    but unlike the iterator, the range is reusable and never materializes its points -
+    `len()`, indexing, slicing, `in`, `index()` and `count()` are all computed arithmetically
+    in constant time, similar to the builtin `range`.
+
+    Slicing returns a new GridRange2D over the same grid, which covers only the selected cells.
+    """
+    __slots__ = ('__start_x', '__start_y', '__size_x', '__size_y', '__indices')
+
+    def __init__(self, end: Union[Point2D, Box2D], start: Optional[Point2D] = None):
+        if isinstance(end, Box2D):
+            start = end.start
+            end = end.end
+
+        if start is None:
+            start = Point2D(0, 0)
+
+        self.__start_x = start.x
+        self.__start_y = start.y
+        self.__size_x = max(0, end.x - start.x)
+        self.__size_y = max(0, end.y - start.y)
+        self.__indices = range(self.__size_x * self.__size_y)
+
+    def _with_indices(self, indices: range) -> "GridRange2D":
+        """
+        Return a range over the same grid, covering only the cells with the given flat indices
+        """
+        result = GridRange2D(self.end, self.start)
+        # pylint: disable=protected-access,unused-private-member
+        result.__indices = indices
+        return result
+
+    @property
+    def start(self) -> Point2D:
+        """
+        Return the lower (inclusive) bounds of the grid
+
+        :rtype: Point2D
+        """
+        return Point2D(self.__start_x, self.__start_y)
+
+    @property
+    def end(self) -> Point2D:
+        """
+        Return the upper (exclusive) bounds of the grid
+
+        :rtype: Point2D
+        """
+        return Point2D(self.__start_x + self.__size_x, self.__start_y + self.__size_y)
+
+    @property
+    def indices(self) -> range:
+        """
+        Return the flat (row-major) indices of the cells covered by the range
+
+        :rtype: range
+        """
+        return self.__indices
+
+    def point_at(self, flat_index: int) -> Point2D:
+        """
+        Convert a flat (row-major) cell index of the grid to a point.
+        The index is not checked against the bounds.
+
+        :param flat_index: Index of the cell in the whole grid
+        :type flat_index: int
+        :return: The point at that index
+        :rtype: Point2D
+        """
+        x, y = divmod(flat_index, self.__size_y)
+        return Point2D(self.__start_x + x, self.__start_y + y)
+
+    def flat_index(self, point: Point2D) -> Optional[int]:
+        """
+        Convert a point to the flat (row-major) index of its cell in the grid
+
+        :param point: The point to convert
+        :type point: Point2D
+        :return: The flat index, or None if the point is outside the grid
+        :rtype: Optional[int]
+        """
+        x = point.x - self.__start_x
+        y = point.y - self.__start_y
+
+        if 0 <= x < self.__size_x and 0 <= y < self.__size_y:
+            return x * self.__size_y + y
+
+        return None
+
+    def blocks(self, block_size: int = 4096) -> Iterator[PointArray2D]:
+        """
+        Iterate over the range in blocks of points, instead of one point at a time.
+        Every block is a PointArray2D with `block_size` points (the last one can be shorter),
+        in the same order as the point-at-a-time iteration.
+
+        The coordinate buffers are built with bulk copies of whole row segments,
+        so no Point2D is allocated.
+
+        :param block_size: The maximum amount of points per block, defaults to 4096
+        :type block_size: int, optional
+        :raises ValueError: If `block_size` is not positive
+        :return: Iterator over the blocks
+        :rtype: Iterator[PointArray2D]
+        """
+        if block_size <= 0:
+            raise ValueError("The block size must be positive")
+
+        # Every row segment of a block is a slice of the y coordinates of a whole row
+        row = array(TYPECODE, range(self.__start_y, self.__start_y + self.__size_y))
+
+        for begin in range(0, len(self.__indices), block_size):
+            indices = self.__indices[begin:begin + block_size]
+
+            if indices.step != 1:
+                yield PointArray2D.from_points(map(self.point_at, indices))
+                continue
+
+            xs = array(TYPECODE)
+            ys = array(TYPECODE)
+            flat_index = indices.start
+            while flat_index < indices.stop:
+                x, y = divmod(flat_index, self.__size_y)
+                length = min(self.__size_y - y, indices.stop - flat_index)
+
+                xs.extend(array(TYPECODE, [self.__start_x + x]) * length)
+                ys.extend(row[y:y + length])
+                flat_index += length
+
+            yield PointArray2D.from_arrays(xs, ys)
+
+    def __len__(self) -> int:
+        return len(self.__indices)
+
+    @overload
+    def __getitem__(self, index: int) -> Point2D:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "GridRange2D":
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Point2D, "GridRange2D"]:
+        if isinstance(index, slice):
+            return self._with_indices(self.__indices[index])
+
+        return self.point_at(self.__indices[index])
+
+    def __iter__(self) -> Iterator[Point2D]:
+        return map(self.point_at, self.__indices)
+
+    def __reversed__(self) -> Iterator[Point2D]:
+        return map(self.point_at, reversed(self.__indices))
+
+    def __contains__(self, point: object) -> bool:
+        if not isinstance(point, Point2D):
+            return False
+
+        flat_index = self.flat_index(point)
+        return flat_index is not None and flat_index in self.__indices
+
+    def index(self, value: object, start: int = 0, stop: Optional[int] = None) -> int:
+        """
+        Return the position of a point in the range
+
+        :param value: The point to search for
+        :type value: Point2D
+        :param start: Position to start the search from, defaults to 0
+        :type start: int, optional
+        :param stop: Position to stop the search at, defaults to None (the end of the range)
+        :type stop: Optional[int], optional
+        :raises ValueError: If the point is not in the range
+        :return: The position of the point
+        :rtype: int
+        """
+        indices = self.__indices[start:stop]
+        if isinstance(value, Point2D):
+            flat_index = self.flat_index(value)
+            if flat_index is not None and flat_index in indices:
+                return self.__indices.index(flat_index)
+
+        raise ValueError(f"{value} is not in range")
+
+    def count(self, value: object) -> int:
+        """
+        Return the amount of times a point appears in the range (either 0 or 1)
+
+        :param value: The point to count
+        :type value: Point2D
+        :rtype: int
+        """
+        return int(value in self)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, GridRange2D):
+            # https://mypy.readthedocs.io/en/stable/common_issues.html#incompatible-overrides
+            raise NotImplementedError("Invalid type for other")
+
+        return (self.start == other.start and self.end == other.end and
+                self.__indices == other.indices)
+
+    def __hash__(self) -> int:
+        return hash((self.__start_x, self.__start_y, self.__size_x, self.__size_y,
+                     self.__indices))
+
+    def __repr__(self) -> str:
+        full = f'GridRange2D({self.end!r}, {self.start!r})'
+        if self.__indices == range(self.__size_x * self.__size_y):
+            return full
+
+        # A reversed slice ends before the first cell, which is expressed as an omitted stop
+        start, stop, step = self.__indices.start, self.__indices.stop, self.__indices.step
+        return f'{full}[{start}:{stop if stop >= 0 else ""}:{step}]'
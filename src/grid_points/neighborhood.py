@@ -0,0 +1,54 @@
+"""
+Module containing the precomputed offsets of the neighborhoods of a cell
+
+The neighborhoods are identified by their connectivity (the amount of neighbors):
+- 4 - von Neumann neighborhood in 2D (the cells sharing an edge)
+- 8 - Moore neighborhood in 2D (the cells sharing an edge or a corner)
+- 6 - von Neumann neighborhood in 3D (the cells sharing a face)
+- 26 - Moore neighborhood in 3D (the cells sharing a face, an edge or a corner)
+
+The offsets of every neighborhood are sorted, so the neighbors are always returned
+in the same order.
+"""
+from itertools import product
+
+VON_NEUMANN_2D = ((-1, 0), (0, -1), (0, 1), (1, 0))
+MOORE_2D = tuple(offset for offset in product((-1, 0, 1), repeat=2) if offset != (0, 0))
+
+VON_NEUMANN_3D = ((-1, 0, 0), (0, -1, 0), (0, 0, -1), (0, 0, 1), (0, 1, 0), (1, 0, 0))
+MOORE_3D = tuple(offset for offset in product((-1, 0, 1), repeat=3) if offset != (0, 0, 0))
+
+OFFSETS_2D = {4: VON_NEUMANN_2D, 8: MOORE_2D}
+OFFSETS_3D = {6: VON_NEUMANN_3D, 26: MOORE_3D}
+
+
+def offsets_2d(connectivity: int) -> tuple[tuple[int, ...], ...]:
+    """
+    Return the offsets of a 2D neighborhood
+
+    :param connectivity: 4 or 8
+    :type connectivity: int
+    :raises ValueError: If the connectivity is not supported in 2D
+    :return: The (dx, dy) offsets of the neighbors
+    :rtype: tuple[tuple[int, ...], ...]
+    """
+    if connectivity not in OFFSETS_2D:
+        raise ValueError(f"Invalid 2D connectivity {connectivity}, expected 4 or 8")
+
+    return OFFSETS_2D[connectivity]
+
+
+def offsets_3d(connectivity: int) -> tuple[tuple[int, ...], ...]:
+    """
+    Return the offsets of a 3D neighborhood
+
+    :param connectivity: 6 or 26
+    :type connectivity: int
+    :raises ValueError: If the connectivity is not supported in 3D
+    :return: The (dx, dy, dz) offsets of the neighbors
+    :rtype: tuple[tuple[int, ...], ...]
+    """
+    if connectivity not in OFFSETS_3D:
+        raise ValueError(f"Invalid 3D connectivity {connectivity}, expected 6 or 26")
+
+    return OFFSETS_3D[connectivity]
@@ -0,0 +1,176 @@
+"""
+Module containing functions, which evaluate a function over a grid using a pool of workers
+
+The grid is split into contiguous, balanced shards (slices of a GridRange2D/GridRange3D).
+Only the shards are sent to the workers - a shard pickles as its bounds and a `range` of
+cell indices, so the amount of data sent does not depend on the size of the grid.
+The results are always combined in the order of the grid, which makes the reduction
+deterministic regardless of the order in which the shards finish.
+"""
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional, Union
+
+from src.grid_points.grid_range_2d import GridRange2D
+from src.grid_points.grid_range_3d import GridRange3D
+
+GridRange = Union[GridRange2D, GridRange3D]
+
+EXECUTORS = ('process', 'thread')
+
+
+def partition(grid: GridRange, shards: int) -> list[GridRange]:
+    """
+    Split a grid range into contiguous shards, whose sizes differ by at most one cell
+
+    :param grid: The grid to split
+    :type grid: GridRange
+    :param shards: The amount of shards
+    :type shards: int
+    :raises ValueError: If `shards` is not positive
+    :return: The non-empty shards, in the order of the grid
+    :rtype: list[GridRange]
+    """
+    if shards <= 0:
+        raise ValueError("The amount of shards must be positive")
+
+    size = len(grid)
+    bounds = [size * i // shards for i in range(shards + 1)]
+    return [grid[begin:end] for begin, end in zip(bounds, bounds[1:]) if begin < end]
+
+
+def _reduce_shard(shard: GridRange, function: Callable, reducer: Callable[[Any, Any], Any],
+                  block_size: Optional[int]) -> tuple[bool, Any]:
+    """
+    Evaluate `function` over a single shard and reduce the results.
+    Returns if there was at least one result and the reduced value.
+    """
+    items = shard if block_size is None else shard.blocks(block_size)
+
+    has_result = False
+    result = None
+    for item in items:
+        value = function(item)
+        result = reducer(result, value) if has_result else value
+        has_result = True
+
+    return has_result, result
+
+
+def _map_shard(shard: GridRange, function: Callable, block_size: Optional[int]) -> list:
+    """
+    Evaluate `function` over a single shard
+    """
+    items = shard if block_size is None else shard.blocks(block_size)
+    return [function(item) for item in items]
+
+
+def create_executor(executor: str, max_workers: int) -> Executor:
+    """
+    Create an executor by its name
+
+    :param executor: 'process' or 'thread'
+    :type executor: str
+    :param max_workers: The amount of workers
+    :type max_workers: int
+    :raises ValueError: If the name is unknown
+    :rtype: Executor
+    """
+    if executor == 'process':
+        return ProcessPoolExecutor(max_workers)
+
+    if executor == 'thread':
+        return ThreadPoolExecutor(max_workers)
+
+    raise ValueError(f"Unknown executor '{executor}', expected one of {EXECUTORS}")
+
+
+def _run(task: Callable, grid: GridRange, arguments: tuple, executor: Union[str, Executor],
+         max_workers: Optional[int], shards: Optional[int]) -> list:
+    """
+    Run `task` over every shard of the grid and return the results in the order of the grid
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    if shards is None:
+        # A few shards per worker keep the workers busy when some shards are slower
+        shards = 4 * max_workers
+
+    parts = partition(grid, shards)
+
+    if isinstance(executor, Executor):
+        futures = [executor.submit(task, part, *arguments) for part in parts]
+        return [future.result() for future in futures]
+
+    with create_executor(executor, max_workers) as pool:
+        futures = [pool.submit(task, part, *arguments) for part in parts]
+        return [future.result() for future in futures]
+
+
+def parallel_map_reduce(function: Callable, reducer: Callable[[Any, Any], Any], grid: GridRange,
+                        initial: Any, executor: Union[str, Executor] = 'process',
+                        max_workers: Optional[int] = None, shards: Optional[int] = None,
+                        block_size: Optional[int] = None) -> Any:
+    """
+    Evaluate `function` on every cell (or block of cells) of the grid in parallel
+    and combine the results with `reducer`.
+
+    The reducer is applied in the order of the grid, starting from `initial`, so it only needs
+    to be associative for the result to be the same as the one of a sequential loop:
+    ```python
+    result = initial
+    for point in grid:
+        result = reducer(result, function(point))
+    ```
+
+    When `executor` is 'process', `function` and `reducer` must be picklable
+    (e.g. defined on module level).
+
+    :param function: Called with a Point2D/Point3D, or with a PointArray2D/PointArray3D block
+      when `block_size` is given
+    :type function: Callable
+    :param reducer: Combines two results
+    :type reducer: Callable[[Any, Any], Any]
+    :param grid: The grid to evaluate `function` on
+    :type grid: GridRange
+    :param initial: The value the reduction starts from
+    :type initial: Any
+    :param executor: 'process', 'thread' or an existing executor, defaults to 'process'
+    :type executor: Union[str, Executor], optional
+    :param max_workers: The amount of workers, defaults to None (the amount of CPUs)
+    :type max_workers: Optional[int], optional
+    :param shards: The amount of shards, defaults to None (4 per worker)
+    :type shards: Optional[int], optional
+    :param block_size: If given, `function` is called once per block of up to
+      `block_size` cells, defaults to None (once per cell)
+    :type block_size: Optional[int], optional
+    :return: The reduced result
+    :rtype: Any
+    """
+    partials = _run(_reduce_shard, grid, (function, reducer, block_size), executor,
+                    max_workers, shards)
+
+    result = initial
+    for has_result, value in partials:
+        if has_result:
+            result = reducer(result, value)
+
+    return result
+
+
+def parallel_map(function: Callable, grid: GridRange, executor: Union[str, Executor] = 'process',
+                 max_workers: Optional[int] = None, shards: Optional[int] = None,
+                 block_size: Optional[int] = None) -> list:
+    """
+    Evaluate `function` on every cell (or block of cells) of the grid in parallel.
+    See `parallel_map_reduce` for the meaning of the parameters.
+
+    :return: The results, in the order of the grid
+    :rtype: list
+    """
+    results: list = []
+    for part in _run(_map_shard, grid, (function, block_size), executor, max_workers, shards):
+        results.extend(part)
+
+    return results
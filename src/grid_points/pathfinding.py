@@ -0,0 +1,225 @@
+"""
+Module containing shortest path searches over the dense grids (Grid2D/Grid3D)
+
+The searches work on the flat cell indices of the grid - the distances and the parents of the
+cells are kept in arrays, preallocated for the whole grid, and the neighbors are found with
+`neighbor_indices`, so no points are created or hashed while searching.
+The path is converted to points only once the goal is reached.
+
+Cells are tested for passability and costed by their value in the grid:
+- `passable(value) -> bool` - if the cell can be entered, defaults to every cell
+- `cost(value) -> number` - the cost of entering the cell, defaults to 1
+"""
+from array import array
+from collections import deque
+from heapq import heappop, heappush
+from math import inf
+from operator import sub
+from typing import Callable, Optional, Union
+
+from src.grid_points.grid_2d import Grid2D, Value
+from src.grid_points.grid_3d import Grid3D
+from src.grid_points.point_2d import Point2D
+from src.grid_points.point_3d import Point3D
+
+Grid = Union[Grid2D, Grid3D]
+Point = Union[Point2D, Point3D]
+Path = tuple[float, list]
+
+HEURISTICS = ('manhattan', 'chebyshev')
+
+
+def _flat_index(grid: Grid, point: Point) -> int:
+    """
+    Return the position of a point in the buffer of the grid
+    """
+    flat_index = grid.points().flat_index(point)  # type: ignore[arg-type]
+    if flat_index is None:
+        raise IndexError(f"{point} is outside the grid")
+
+    return flat_index
+
+
+def _path(grid: Grid, parents: array, goal: int) -> list:
+    """
+    Follow the parents from the goal back to the start and convert the cells to points
+    """
+    cells = [goal]
+    while parents[cells[-1]] != -1:
+        cells.append(parents[cells[-1]])
+
+    return list(map(grid.points().point_at, reversed(cells)))
+
+
+def _coordinates(grid: Grid) -> Callable[[int], tuple[int, ...]]:
+    """
+    Return a function, which converts a flat index to local coordinates
+    """
+    if len(grid.shape) == 2:
+        size_y = grid.shape[1]
+        return lambda flat_index: divmod(flat_index, size_y)
+
+    size_y, size_z = grid.shape[1], grid.shape[2]
+
+    def coordinates(flat_index: int) -> tuple[int, ...]:
+        rest, z = divmod(flat_index, size_z)
+        return divmod(rest, size_y) + (z,)
+
+    return coordinates
+
+
+def _heuristic(grid: Grid, goal: int, name: str) -> Callable[[int], int]:
+    """
+    Return the estimated distance from a flat index to the goal, by the name of the metric
+    """
+    coordinates = _coordinates(grid)
+    target = coordinates(goal)
+
+    if name == 'manhattan':
+        return lambda flat_index: sum(map(abs, map(sub, coordinates(flat_index), target)))
+
+    if name == 'chebyshev':
+        return lambda flat_index: max(map(abs, map(sub, coordinates(flat_index), target)))
+
+    raise ValueError(f"Unknown heuristic '{name}', expected one of {HEURISTICS}")
+
+
+def bfs(grid: Grid, start: Point, goal: Point,
+        passable: Optional[Callable[[Value], bool]] = None,
+        connectivity: Optional[int] = None) -> Optional[Path]:
+    """
+    Find a path with the least amount of steps with breadth-first search
+
+    :param grid: The grid to search in
+    :type grid: Grid
+    :param start: The first cell of the path
+    :type start: Point
+    :param goal: The last cell of the path
+    :type goal: Point
+    :param passable: If a cell can be entered, by its value, defaults to None (every cell)
+    :type passable: Optional[Callable[[Value], bool]], optional
+    :param connectivity: The neighborhood of a cell, defaults to None (4 in 2D, 6 in 3D)
+    :type connectivity: Optional[int], optional
+    :raises IndexError: If `start` or `goal` is outside the grid
+    :return: The amount of steps and the points of the path (including `start` and `goal`),
+      or None if the goal can not be reached
+    :rtype: Optional[Path]
+    """
+    if connectivity is None:
+        connectivity = 2 * len(grid.shape)
+
+    source = _flat_index(grid, start)
+    target = _flat_index(grid, goal)
+
+    data = grid.data
+    parents = array('q', [-1]) * len(data)
+    steps = array('q', [-1]) * len(data)
+    steps[source] = 0
+
+    queue = deque([source])
+    while queue:
+        current = queue.popleft()
+        if current == target:
+            return steps[target], _path(grid, parents, target)
+
+        for neighbor in grid.neighbor_indices(current, connectivity):
+            if steps[neighbor] != -1 or (passable is not None and not passable(data[neighbor])):
+                continue
+
+            steps[neighbor] = steps[current] + 1
+            parents[neighbor] = current
+            queue.append(neighbor)
+
+    return None
+
+
+def dijkstra(grid: Grid, start: Point, goal: Point,
+             passable: Optional[Callable[[Value], bool]] = None,
+             cost: Optional[Callable[[Value], float]] = None,
+             connectivity: Optional[int] = None) -> Optional[Path]:
+    """
+    Find the cheapest path with Dijkstra's algorithm.
+    The costs must not be negative.
+
+    :param cost: The cost of entering a cell, by its value, defaults to None (1 per cell)
+    :type cost: Optional[Callable[[Value], float]], optional
+    :return: The cost and the points of the path (including `start` and `goal`),
+      or None if the goal can not be reached
+    :rtype: Optional[Path]
+
+    See `bfs` for the rest of the parameters.
+    """
+    return _search(grid, start, goal, passable, cost, connectivity, None)
+
+
+def astar(grid: Grid, start: Point, goal: Point,
+          passable: Optional[Callable[[Value], bool]] = None,
+          cost: Optional[Callable[[Value], float]] = None,
+          connectivity: Optional[int] = None, heuristic: Optional[str] = None) -> Optional[Path]:
+    """
+    Find the cheapest path with A*, which explores the cells closer to the goal first.
+    The path is the cheapest one as long as entering a cell costs at least 1.
+
+    :param heuristic: 'manhattan' or 'chebyshev', defaults to None - 'manhattan' for
+      the 4 and 6 neighborhoods and 'chebyshev' for the 8 and 26 neighborhoods
+    :type heuristic: Optional[str], optional
+    :return: The cost and the points of the path (including `start` and `goal`),
+      or None if the goal can not be reached
+    :rtype: Optional[Path]
+
+    See `bfs` and `dijkstra` for the rest of the parameters.
+    """
+    if connectivity is None:
+        connectivity = 2 * len(grid.shape)
+
+    if heuristic is None:
+        heuristic = 'manhattan' if connectivity == 2 * len(grid.shape) else 'chebyshev'
+
+    return _search(grid, start, goal, passable, cost, connectivity, heuristic)
+
+
+def _search(grid: Grid, start: Point, goal: Point,
+            passable: Optional[Callable[[Value], bool]],
+            cost: Optional[Callable[[Value], float]],
+            connectivity: Optional[int], heuristic: Optional[str]) -> Optional[Path]:
+    """
+    Dijkstra's algorithm, guided by the named heuristic if one is given (A*)
+    """
+    # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+    if connectivity is None:
+        connectivity = 2 * len(grid.shape)
+
+    source = _flat_index(grid, start)
+    target = _flat_index(grid, goal)
+    estimate = None if heuristic is None else _heuristic(grid, target, heuristic)
+
+    data = grid.data
+    parents = array('q', [-1]) * len(data)
+    distances = array('d', [inf]) * len(data)
+    distances[source] = 0
+
+    # The entries are (distance + estimate, -distance, cell) - on equal priorities the cells
+    # further from the start are closer to the goal. The stale entries are skipped.
+    queue: list[tuple[float, float, int]] = [(0, 0, source)]
+    while queue:
+        _, negated, current = heappop(queue)
+        distance = -negated
+        if current == target:
+            return distance, _path(grid, parents, target)
+
+        if distance > distances[current]:
+            continue
+
+        for neighbor in grid.neighbor_indices(current, connectivity):
+            value = data[neighbor]
+            if passable is not None and not passable(value):
+                continue
+
+            candidate = distance + (1 if cost is None else cost(value))
+            if candidate < distances[neighbor]:
+                distances[neighbor] = candidate
+                parents[neighbor] = current
+                priority = candidate if estimate is None else candidate + estimate(neighbor)
+                heappush(queue, (priority, -candidate, neighbor))
+
+    return None
@@ -4,11 +4,18 @@ Module containing the Point2D class
 from math import sqrt
 from typing import Optional
 
+from src.grid_points.neighborhood import offsets_2d
+
 
 class Point2D:
     """
-    Class modeling a point in the discrete 2D space
+    Class modeling a point in the discrete 2D space.
+
+    The coordinates are kept in `__slots__`, so the instances have no `__dict__` and
+    do not support weak references - subclass without `__slots__` to get them.
     """
+    __slots__ = ('__x', '__y')
+
     def __init__(self, x: int, y: int):
         self.__x = x
         self.__y = y
@@ -60,6 +67,10 @@ class Point2D:
     def __hash__(self) -> int:
         return hash((self.x, self.y))
 
+    def __reduce__(self):
+        # Only the class and the coordinates, instead of the mangled names of the slots
+        return (self.__class__, (self.__x, self.__y))
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Point2D):
             # https://mypy.readthedocs.io/en/stable/common_issues.html#incompatible-overrides
@@ -105,7 +116,11 @@ class Point2D:
         :return: Resulting point
         :rtype: Point2D
         """
-        return Point2D(self.x + other.x, self.y + other.y)
+        try:
+            return self.__class__(self.x + other.x, self.y + other.y)
+        except AttributeError:
+            # Let the other operand handle it, e.g. a batch broadcasting the point
+            return NotImplemented
 
     def __sub__(self, other: "Point2D") -> "Point2D":
         """
@@ -117,7 +132,10 @@ class Point2D:
         :return: Resulting point
         :rtype: Point2D
         """
-        return Point2D(self.x - other.x, self.y - other.y)
+        try:
+            return self.__class__(self.x - other.x, self.y - other.y)
+        except AttributeError:
+            return NotImplemented
 
     def __mul__(self, other: "Point2D") -> "Point2D":
         """
@@ -129,7 +147,10 @@ class Point2D:
         :return: Resulting point
         :rtype: Point2D
         """
-        return Point2D(self.x * other.x, self.y * other.y)
+        try:
+            return self.__class__(self.x * other.x, self.y * other.y)
+        except AttributeError:
+            return NotImplemented
 
     def __floordiv__(self, other: "Point2D") -> "Point2D":
         """
@@ -141,7 +162,10 @@ class Point2D:
         :return: Resulting point
         :rtype: Point2D
         """
-        return Point2D(self.x // other.x, self.y // other.y)
+        try:
+            return self.__class__(self.x // other.x, self.y // other.y)
+        except AttributeError:
+            return NotImplemented
 
     def distance_to(self, other: "Point2D") -> float:
         """
@@ -180,6 +204,38 @@ class Point2D:
         :rtype: bool
         """
         if start is None:
-            start = Point2D(0, 0)
+            return 0 <= self.x < end.x and 0 <= self.y < end.y
 
         return start.x <= self.x < end.x and start.y <= self.y < end.y
+
+    def neighbors(self, connectivity: int = 4, end: Optional["Point2D"] = None,
+                  start: Optional["Point2D"] = None) -> list["Point2D"]:
+        """
+        Return the neighbors of the point, optionally only the ones inside bounds.
+
+        Example:
+        ```python
+        Point2D(0, 0).neighbors()  # [(-1, 0), (0, -1), (0, 1), (1, 0)]
+        Point2D(0, 0).neighbors(8, Point2D(3, 3))  # [(0, 1), (1, 0), (1, 1)]
+        ```
+
+        :param connectivity: 4 (sharing an edge) or 8 (sharing an edge or a corner),
+          defaults to 4
+        :type connectivity: int, optional
+        :param end: The upper bounds of the region, defaults to None (no bounds)
+        :type end: Optional[Point2D], optional
+        :param start: The lower bounds of the region, defaults to None,
+          which is interpreted to (0, 0) when `end` is given
+        :type start: Optional[Point2D], optional
+        :return: The neighbors, in the order of the offsets in `neighborhood`
+        :rtype: list[Point2D]
+        """
+        x, y = self.x, self.y
+        offsets = offsets_2d(connectivity)
+
+        if end is None:
+            return [self.__class__(x + dx, y + dy) for dx, dy in offsets]
+
+        start_x, start_y = (0, 0) if start is None else (start.x, start.y)
+        return [self.__class__(x + dx, y + dy) for dx, dy in offsets
+                if start_x <= x + dx < end.x and start_y <= y + dy < end.y]
@@ -4,11 +4,18 @@ Module containing the Point3D class
 from math import sqrt
 from typing import Optional
 
+from src.grid_points.neighborhood import offsets_3d
+
 
 class Point3D:
     """
-    Class modeling a point in the discrete 3D space
+    Class modeling a point in the discrete 3D space.
+
+    The coordinates are kept in `__slots__`, so the instances have no `__dict__` and
+    do not support weak references - subclass without `__slots__` to get them.
     """
+    __slots__ = ('__x', '__y', '__z')
+
     def __init__(self, x: int, y: int, z: int):
         self.__x = x
         self.__y = y
@@ -80,6 +87,10 @@ class Point3D:
     def __hash__(self) -> int:
         return hash((self.x, self.y, self.z))
 
+    def __reduce__(self):
+        # Only the class and the coordinates, instead of the mangled names of the slots
+        return (self.__class__, (self.__x, self.__y, self.__z))
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Point3D):
             # https://mypy.readthedocs.io/en/stable/common_issues.html#incompatible-overrides
@@ -125,7 +136,11 @@ class Point3D:
         :return: Resulting point
         :rtype: Point3D
         """
-        return Point3D(self.x + other.x, self.y + other.y, self.z + other.z)
+        try:
+            return self.__class__(self.x + other.x, self.y + other.y, self.z + other.z)
+        except AttributeError:
+            # Let the other operand handle it, e.g. a batch broadcasting the point
+            return NotImplemented
 
     def __sub__(self, other: "Point3D") -> "Point3D":
         """
@@ -137,7 +152,10 @@ class Point3D:
         :return: Resulting point
         :rtype: Point3D
         """
-        return Point3D(self.x - other.x, self.y - other.y, self.z - other.z)
+        try:
+            return self.__class__(self.x - other.x, self.y - other.y, self.z - other.z)
+        except AttributeError:
+            return NotImplemented
 
     def __mul__(self, other: "Point3D") -> "Point3D":
         """
@@ -149,7 +167,10 @@ class Point3D:
         :return: Resulting point
         :rtype: Point3D
         """
-        return Point3D(self.x * other.x, self.y * other.y, self.z * other.z)
+        try:
+            return self.__class__(self.x * other.x, self.y * other.y, self.z * other.z)
+        except AttributeError:
+            return NotImplemented
 
     def __floordiv__(self, other: "Point3D") -> "Point3D":
         """
@@ -162,7 +183,10 @@ class Point3D:
         :return: Resulting point
         :rtype: Point3D
         """
-        return Point3D(self.x // other.x, self.y // other.y, self.z // other.z)
+        try:
+            return self.__class__(self.x // other.x, self.y // other.y, self.z // other.z)
+        except AttributeError:
+            return NotImplemented
 
     def distance_to(self, other: "Point3D") -> float:
         """
@@ -201,10 +225,42 @@ class Point3D:
         :rtype: bool
         """
         if start is None:
-            start = Point3D(0, 0, 0)
+            return 0 <= self.x < end.x and 0 <= self.y < end.y and 0 <= self.z < end.z
 
         is_x_inside = start.x <= self.x < end.x
         is_y_inside = start.y <= self.y < end.y
         is_z_inside = start.z <= self.z < end.z
 
         return is_x_inside and is_y_inside and is_z_inside
+
+    def neighbors(self, connectivity: int = 6, end: Optional["Point3D"] = None,
+                  start: Optional["Point3D"] = None) -> list["Point3D"]:
+        """
+        Return the neighbors of the point, optionally only the ones inside bounds.
+
+        Example:
+        ```python
+        Point3D(0, 0, 0).neighbors(6, Point3D(3, 3, 3))  # [(0, 0, 1), (0, 1, 0), (1, 0, 0)]
+        ```
+
+        :param connectivity: 6 (sharing a face) or 26 (sharing a face, an edge or a corner),
+          defaults to 6
+        :type connectivity: int, optional
+        :param end: The upper bounds of the region, defaults to None (no bounds)
+        :type end: Optional[Point3D], optional
+        :param start: The lower bounds of the region, defaults to None,
+          which is interpreted to (0, 0, 0) when `end` is given
+        :type start: Optional[Point3D], optional
+        :return: The neighbors, in the order of the offsets in `neighborhood`
+        :rtype: list[Point3D]
+        """
+        x, y, z = self.x, self.y, self.z
+        offsets = offsets_3d(connectivity)
+
+        if end is None:
+            return [self.__class__(x + dx, y + dy, z + dz) for dx, dy, dz in offsets]
+
+        start_x, start_y, start_z = (0, 0, 0) if start is None else (start.x, start.y, start.z)
+        return [self.__class__(x + dx, y + dy, z + dz) for dx, dy, dz in offsets
+                if start_x <= x + dx < end.x and start_y <= y + dy < end.y and
+                start_z <= z + dz < end.z]
@@ -0,0 +1,387 @@
+"""
+Module containing the PointArray2D class
+"""
+import sys
+from array import array
+from collections import abc
+from itertools import compress, repeat
+from operator import add, and_, floordiv, le, lt, mul, sub
+from typing import Callable, Iterable, Iterator, Optional, Union, overload
+
+from src.grid_points.buffers import pickle_buffer, restore_array
+from src.grid_points.neighborhood import offsets_2d
+from src.grid_points.point_2d import Point2D
+
+# Signed 64-bit integers
+TYPECODE = 'q'
+
+
+def _restore(byteorder: str, xs: object, ys: object) -> "PointArray2D":
+    """
+    Create a batch from its pickled coordinate buffers
+    """
+    # pylint: disable=protected-access
+    return PointArray2D._from_arrays(*(restore_array(TYPECODE, byteorder, data, True)
+                                       for data in (xs, ys)))
+
+
+class PointArray2D(abc.Sequence):
+    """
+    Struct-of-arrays container of 2D points.
+
+    The x and y coordinates are kept in two contiguous typed buffers (`array('q')`),
+    so a million points take 16MB instead of a million Python objects.
+    The arithmetic operators work element-wise on the whole batch - the other operand
+    can be another PointArray2D of the same length or a single Point2D (on either side of
+    the operator), which is broadcast to every point.
+
+    Indexing returns a new Point2D, slicing returns a new PointArray2D.
+    """
+    __slots__ = ('__xs', '__ys')
+
+    def __init__(self, xs: Iterable[int] = (), ys: Iterable[int] = ()):
+        self.__xs = array(TYPECODE, xs)
+        self.__ys = array(TYPECODE, ys)
+
+        if len(self.__xs) != len(self.__ys):
+            raise ValueError("The coordinate sequences must have the same length")
+
+    @classmethod
+    def from_points(cls, points: Iterable[Point2D]) -> "PointArray2D":
+        """
+        Create a batch from existing points
+
+        :param points: The points to store
+        :type points: Iterable[Point2D]
+        :return: Batch holding the coordinates of the points
+        :rtype: PointArray2D
+        """
+        if not isinstance(points, abc.Sequence):
+            points = list(points)
+
+        return cls._from_arrays(array(TYPECODE, [point.x for point in points]),
+                                array(TYPECODE, [point.y for point in points]))
+
+    @classmethod
+    def from_arrays(cls, xs: array, ys: array, copy: bool = False) -> "PointArray2D":
+        """
+        Create a batch from coordinate arrays. Without `copy` the batch uses the arrays
+        themselves, so later changes of the arrays are visible in the batch (and vice versa).
+
+        :param xs: The x coordinates
+        :type xs: array
+        :param ys: The y coordinates
+        :type ys: array
+        :param copy: Whether to copy the arrays, defaults to False
+        :type copy: bool, optional
+        :raises ValueError: If the arrays have different lengths, or are not `array('q')`
+          when they are not copied
+        :return: Batch holding the coordinates
+        :rtype: PointArray2D
+        """
+        if len(xs) != len(ys):
+            raise ValueError("The coordinate sequences must have the same length")
+
+        if copy:
+            return cls._from_arrays(array(TYPECODE, xs), array(TYPECODE, ys))
+
+        if xs.typecode != TYPECODE or ys.typecode != TYPECODE:
+            raise ValueError(f"Expected arrays with typecode '{TYPECODE}'")
+
+        return cls._from_arrays(xs, ys)
+
+    @classmethod
+    def _from_arrays(cls, xs: array, ys: array) -> "PointArray2D":
+        """
+        Wrap already built arrays without copying them
+        """
+        # pylint: disable=unused-private-member
+        result = cls.__new__(cls)
+        result.__xs = xs
+        result.__ys = ys
+        return result
+
+    @property
+    def xs(self) -> array:
+        """
+        Return the buffer with the x coordinates. The buffer is shared, not copied.
+
+        :rtype: array
+        """
+        return self.__xs
+
+    @property
+    def ys(self) -> array:
+        """
+        Return the buffer with the y coordinates. The buffer is shared, not copied.
+
+        :rtype: array
+        """
+        return self.__ys
+
+    def to_points(self) -> list[Point2D]:
+        """
+        Convert the batch to a list of points
+
+        :return: A new Point2D for every stored point
+        :rtype: list[Point2D]
+        """
+        return list(map(Point2D, self.__xs, self.__ys))
+
+    def copy(self) -> "PointArray2D":
+        """
+        Return a copy of the batch, which does not share buffers with the current one
+
+        :rtype: PointArray2D
+        """
+        return PointArray2D._from_arrays(self.__xs[:], self.__ys[:])
+
+    def append(self, point: Point2D):
+        """
+        Add a point to the end of the batch
+
+        :param point: The point to add
+        :type point: Point2D
+        """
+        self.__xs.append(point.x)
+        self.__ys.append(point.y)
+
+    def extend(self, points: Iterable[Point2D]):
+        """
+        Add multiple points to the end of the batch
+
+        :param points: The points to add
+        :type points: Iterable[Point2D]
+        """
+        if isinstance(points, PointArray2D):
+            self.__xs.extend(points.xs)
+            self.__ys.extend(points.ys)
+            return
+
+        other = PointArray2D.from_points(points)
+        self.__xs.extend(other.xs)
+        self.__ys.extend(other.ys)
+
+    def neighbors(self, connectivity: int = 4, end: Optional[Point2D] = None,
+                  start: Optional[Point2D] = None) -> tuple["PointArray2D", array]:
+        """
+        Return the neighbors of every point in the batch, optionally only the ones inside bounds.
+
+        The neighbors are grouped by offset (all neighbors along the first offset, then all
+        along the second one and so on), so every group is computed with a single broadcast
+        over the coordinate buffers. The second result maps every neighbor to the position
+        of the point it belongs to.
+
+        :param connectivity: 4 or 8, defaults to 4
+        :type connectivity: int, optional
+        :param end: The upper bounds of the region, defaults to None (no bounds)
+        :type end: Optional[Point2D], optional
+        :param start: The lower bounds of the region, defaults to None,
+          which is interpreted to (0, 0) when `end` is given
+        :type start: Optional[Point2D], optional
+        :return: The neighbors and the positions of their source points
+        :rtype: tuple[PointArray2D, array]
+        """
+        result_xs = array(TYPECODE)
+        result_ys = array(TYPECODE)
+        sources = array(TYPECODE)
+        positions = array(TYPECODE, range(len(self)))
+
+        offsets = offsets_2d(connectivity)
+
+        if end is None:
+            for dx, dy in offsets:
+                result_xs.extend(map(add, self.__xs, repeat(dx)))
+                result_ys.extend(map(add, self.__ys, repeat(dy)))
+                sources.extend(positions)
+
+            return PointArray2D._from_arrays(result_xs, result_ys), sources
+
+        lower = (0, 0) if start is None else (start.x, start.y)
+        upper = (end.x, end.y)
+
+        for dx, dy in offsets:
+            xs = array(TYPECODE, map(add, self.__xs, repeat(dx)))
+            ys = array(TYPECODE, map(add, self.__ys, repeat(dy)))
+
+            inside = map(and_, map(le, repeat(lower[0]), xs), map(lt, xs, repeat(upper[0])))
+            inside = map(and_, inside, map(le, repeat(lower[1]), ys))
+            inside = map(and_, inside, map(lt, ys, repeat(upper[1])))
+            mask = list(inside)
+
+            result_xs.extend(compress(xs, mask))
+            result_ys.extend(compress(ys, mask))
+            sources.extend(compress(positions, mask))
+
+        return PointArray2D._from_arrays(result_xs, result_ys), sources
+
+    def __len__(self) -> int:
+        return len(self.__xs)
+
+    @overload
+    def __getitem__(self, index: int) -> Point2D:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "PointArray2D":
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Point2D, "PointArray2D"]:
+        if isinstance(index, slice):
+            return PointArray2D._from_arrays(self.__xs[index], self.__ys[index])
+
+        return Point2D(self.__xs[index], self.__ys[index])
+
+    def __setitem__(self, index: int, point: Point2D):
+        self.__xs[index] = point.x
+        self.__ys[index] = point.y
+
+    def __iter__(self) -> Iterator[Point2D]:
+        return map(Point2D, self.__xs, self.__ys)
+
+    def __str__(self) -> str:
+        return '[' + ', '.join(map(str, self)) + ']'
+
+    def __repr__(self) -> str:
+        return f'PointArray2D({self.__xs.tolist()}, {self.__ys.tolist()})'
+
+    def __reduce_ex__(self, protocol):
+        # With protocol 5 the coordinate buffers can be sent out-of-band, without copying them
+        return (_restore, (sys.byteorder, *(pickle_buffer(data, protocol)
+                                            for data in (self.__xs, self.__ys))))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PointArray2D):
+            # https://mypy.readthedocs.io/en/stable/common_issues.html#incompatible-overrides
+            raise NotImplementedError("Invalid type for other")
+
+        return self.__xs == other.xs and self.__ys == other.ys
+
+    def __apply(self, other: Union[Point2D, "PointArray2D"], operation: Callable[[int, int], int],
+                reflected: bool = False) -> "PointArray2D":
+        """
+        Apply a binary operation on every coordinate, broadcasting `other` if it's a point.
+        When `reflected` is set, `other` is the left operand of the operation.
+        """
+        if isinstance(other, Point2D):
+            other_xs: Iterable[int] = repeat(other.x)
+            other_ys: Iterable[int] = repeat(other.y)
+        elif isinstance(other, PointArray2D):
+            if len(other) != len(self):
+                raise ValueError(f"Length mismatch: {len(self)} and {len(other)}")
+
+            other_xs = other.xs
+            other_ys = other.ys
+        else:
+            raise NotImplementedError("Invalid type for other")
+
+        ours: tuple[Iterable[int], ...] = (self.__xs, self.__ys)
+        theirs: tuple[Iterable[int], ...] = (other_xs, other_ys)
+        lefts, rights = (theirs, ours) if reflected else (ours, theirs)
+
+        return PointArray2D._from_arrays(*(array(TYPECODE, map(operation, left, right))
+                                         for left, right in zip(lefts, rights)))
+
+    def __add__(self, other: Union[Point2D, "PointArray2D"]) -> "PointArray2D":
+        """
+        Add a point (or a batch of points) to every point in the batch.
+        For example -
+        `PointArray2D([x1], [y1]) + Point2D(x2, y2) = PointArray2D([x1 + x2], [y1 + y2])`
+
+        :param other: The point(s) that will be added
+        :type other: Union[Point2D, PointArray2D]
+        :return: Resulting batch
+        :rtype: PointArray2D
+        """
+        return self.__apply(other, add)
+
+    def __sub__(self, other: Union[Point2D, "PointArray2D"]) -> "PointArray2D":
+        """
+        Subtract a point (or a batch of points) from every point in the batch.
+        For example -
+        `PointArray2D([x1], [y1]) - Point2D(x2, y2) = PointArray2D([x1 - x2], [y1 - y2])`
+
+        :param other: The point(s) that will be subtracted
+        :type other: Union[Point2D, PointArray2D]
+        :return: Resulting batch
+        :rtype: PointArray2D
+        """
+        return self.__apply(other, sub)
+
+    def __mul__(self, other: Union[Point2D, "PointArray2D"]) -> "PointArray2D":
+        """
+        Multiply every point in the batch by a point (or a batch of points).
+        For example -
+        `PointArray2D([x1], [y1]) * Point2D(x2, y2) = PointArray2D([x1 * x2], [y1 * y2])`
+
+        :param other: The multiplier point(s)
+        :type other: Union[Point2D, PointArray2D]
+        :return: Resulting batch
+        :rtype: PointArray2D
+        """
+        return self.__apply(other, mul)
+
+    def __floordiv__(self, other: Union[Point2D, "PointArray2D"]) -> "PointArray2D":
+        """
+        Divide every point in the batch by a point (or a batch of points).
+        For example -
+        `PointArray2D([x1], [y1]) // Point2D(x2, y2) = PointArray2D([x1 // x2], [y1 // y2])`
+
+        :param other: The divisor point(s)
+        :type other: Union[Point2D, PointArray2D]
+        :return: Resulting batch
+        :rtype: PointArray2D
+        """
+        return self.__apply(other, floordiv)
+
+    def __radd__(self, other: Point2D) -> "PointArray2D":
+        """
+        Add every point in the batch to a point.
+        For example -
+        `Point2D(x1, y1) + PointArray2D([x2], [y2]) = PointArray2D([x1 + x2], [y1 + y2])`
+
+        :param other: The point on the left
+        :type other: Point2D
+        :return: Resulting batch
+        :rtype: PointArray2D
+        """
+        return self.__apply(other, add, True)
+
+    def __rsub__(self, other: Point2D) -> "PointArray2D":
+        """
+        Subtract every point in the batch from a point.
+        For example -
+        `Point2D(x1, y1) - PointArray2D([x2], [y2]) = PointArray2D([x1 - x2], [y1 - y2])`
+
+        :param other: The point, which is subtracted from
+        :type other: Point2D
+        :return: Resulting batch
+        :rtype: PointArray2D
+        """
+        return self.__apply(other, sub, True)
+
+    def __rmul__(self, other: Point2D) -> "PointArray2D":
+        """
+        Multiply a point by every point in the batch.
+        For example -
+        `Point2D(x1, y1) * PointArray2D([x2], [y2]) = PointArray2D([x1 * x2], [y1 * y2])`
+
+        :param other: The point on the left
+        :type other: Point2D
+        :return: Resulting batch
+        :rtype: PointArray2D
+        """
+        return self.__apply(other, mul, True)
+
+    def __rfloordiv__(self, other: Point2D) -> "PointArray2D":
+        """
+        Divide a point by every point in the batch.
+        For example -
+        `Point2D(x1, y1) // PointArray2D([x2], [y2]) = PointArray2D([x1 // x2], [y1 // y2])`
+
+        :param other: The dividend point
+        :type other: Point2D
+        :return: Resulting batch
+        :rtype: PointArray2D
+        """
+        return self.__apply(other, floordiv, True)
@@ -0,0 +1,421 @@
+"""
+Module containing the PointArray3D class
+"""
+import sys
+from array import array
+from collections import abc
+from itertools import compress, repeat
+from operator import add, and_, floordiv, le, lt, mul, sub
+from typing import Callable, Iterable, Iterator, Optional, Union, overload
+
+from src.grid_points.buffers import pickle_buffer, restore_array
+from src.grid_points.neighborhood import offsets_3d
+from src.grid_points.point_3d import Point3D
+
+# Signed 64-bit integers
+TYPECODE = 'q'
+
+
+def _restore(byteorder: str, xs: object, ys: object, zs: object) -> "PointArray3D":
+    """
+    Create a batch from its pickled coordinate buffers
+    """
+    # pylint: disable=protected-access
+    return PointArray3D._from_arrays(*(restore_array(TYPECODE, byteorder, data, True)
+                                       for data in (xs, ys, zs)))
+
+
+class PointArray3D(abc.Sequence):
+    """
+    Struct-of-arrays container of 3D points.
+
+    The x, y and z coordinates are kept in three contiguous typed buffers (`array('q')`),
+    so a million points take 24MB instead of a million Python objects.
+    The arithmetic operators work element-wise on the whole batch - the other operand
+    can be another PointArray3D of the same length or a single Point3D (on either side of
+    the operator), which is broadcast to every point.
+
+    Indexing returns a new Point3D, slicing returns a new PointArray3D.
+    """
+    __slots__ = ('__xs', '__ys', '__zs')
+
+    def __init__(self, xs: Iterable[int] = (), ys: Iterable[int] = (), zs: Iterable[int] = ()):
+        self.__xs = array(TYPECODE, xs)
+        self.__ys = array(TYPECODE, ys)
+        self.__zs = array(TYPECODE, zs)
+
+        if not len(self.__xs) == len(self.__ys) == len(self.__zs):
+            raise ValueError("The coordinate sequences must have the same length")
+
+    @classmethod
+    def from_points(cls, points: Iterable[Point3D]) -> "PointArray3D":
+        """
+        Create a batch from existing points
+
+        :param points: The points to store
+        :type points: Iterable[Point3D]
+        :return: Batch holding the coordinates of the points
+        :rtype: PointArray3D
+        """
+        if not isinstance(points, abc.Sequence):
+            points = list(points)
+
+        return cls._from_arrays(array(TYPECODE, [point.x for point in points]),
+                                array(TYPECODE, [point.y for point in points]),
+                                array(TYPECODE, [point.z for point in points]))
+
+    @classmethod
+    def from_arrays(cls, xs: array, ys: array, zs: array, copy: bool = False) -> "PointArray3D":
+        """
+        Create a batch from coordinate arrays. Without `copy` the batch uses the arrays
+        themselves, so later changes of the arrays are visible in the batch (and vice versa).
+
+        :param xs: The x coordinates
+        :type xs: array
+        :param ys: The y coordinates
+        :type ys: array
+        :param zs: The z coordinates
+        :type zs: array
+        :param copy: Whether to copy the arrays, defaults to False
+        :type copy: bool, optional
+        :raises ValueError: If the arrays have different lengths, or are not `array('q')`
+          when they are not copied
+        :return: Batch holding the coordinates
+        :rtype: PointArray3D
+        """
+        if not len(xs) == len(ys) == len(zs):
+            raise ValueError("The coordinate sequences must have the same length")
+
+        if copy:
+            return cls._from_arrays(array(TYPECODE, xs), array(TYPECODE, ys), array(TYPECODE, zs))
+
+        if any(axis.typecode != TYPECODE for axis in (xs, ys, zs)):
+            raise ValueError(f"Expected arrays with typecode '{TYPECODE}'")
+
+        return cls._from_arrays(xs, ys, zs)
+
+    @classmethod
+    def _from_arrays(cls, xs: array, ys: array, zs: array) -> "PointArray3D":
+        """
+        Wrap already built arrays without copying them
+        """
+        # pylint: disable=unused-private-member
+        result = cls.__new__(cls)
+        result.__xs = xs
+        result.__ys = ys
+        result.__zs = zs
+        return result
+
+    @property
+    def xs(self) -> array:
+        """
+        Return the buffer with the x coordinates. The buffer is shared, not copied.
+
+        :rtype: array
+        """
+        return self.__xs
+
+    @property
+    def ys(self) -> array:
+        """
+        Return the buffer with the y coordinates. The buffer is shared, not copied.
+
+        :rtype: array
+        """
+        return self.__ys
+
+    @property
+    def zs(self) -> array:
+        """
+        Return the buffer with the z coordinates. The buffer is shared, not copied.
+
+        :rtype: array
+        """
+        return self.__zs
+
+    def to_points(self) -> list[Point3D]:
+        """
+        Convert the batch to a list of points
+
+        :return: A new Point3D for every stored point
+        :rtype: list[Point3D]
+        """
+        return list(map(Point3D, self.__xs, self.__ys, self.__zs))
+
+    def copy(self) -> "PointArray3D":
+        """
+        Return a copy of the batch, which does not share buffers with the current one
+
+        :rtype: PointArray3D
+        """
+        return PointArray3D._from_arrays(self.__xs[:], self.__ys[:], self.__zs[:])
+
+    def append(self, point: Point3D):
+        """
+        Add a point to the end of the batch
+
+        :param point: The point to add
+        :type point: Point3D
+        """
+        self.__xs.append(point.x)
+        self.__ys.append(point.y)
+        self.__zs.append(point.z)
+
+    def extend(self, points: Iterable[Point3D]):
+        """
+        Add multiple points to the end of the batch
+
+        :param points: The points to add
+        :type points: Iterable[Point3D]
+        """
+        if isinstance(points, PointArray3D):
+            self.__xs.extend(points.xs)
+            self.__ys.extend(points.ys)
+            self.__zs.extend(points.zs)
+            return
+
+        other = PointArray3D.from_points(points)
+        self.__xs.extend(other.xs)
+        self.__ys.extend(other.ys)
+        self.__zs.extend(other.zs)
+
+    def neighbors(self, connectivity: int = 6, end: Optional[Point3D] = None,
+                  start: Optional[Point3D] = None) -> tuple["PointArray3D", array]:
+        """
+        Return the neighbors of every point in the batch, optionally only the ones inside bounds.
+
+        The neighbors are grouped by offset (all neighbors along the first offset, then all
+        along the second one and so on), so every group is computed with a single broadcast
+        over the coordinate buffers. The second result maps every neighbor to the position
+        of the point it belongs to.
+
+        :param connectivity: 6 or 26, defaults to 6
+        :type connectivity: int, optional
+        :param end: The upper bounds of the region, defaults to None (no bounds)
+        :type end: Optional[Point3D], optional
+        :param start: The lower bounds of the region, defaults to None,
+          which is interpreted to (0, 0, 0) when `end` is given
+        :type start: Optional[Point3D], optional
+        :return: The neighbors and the positions of their source points
+        :rtype: tuple[PointArray3D, array]
+        """
+        result_xs = array(TYPECODE)
+        result_ys = array(TYPECODE)
+        result_zs = array(TYPECODE)
+        sources = array(TYPECODE)
+        positions = array(TYPECODE, range(len(self)))
+
+        offsets = offsets_3d(connectivity)
+
+        if end is None:
+            for dx, dy, dz in offsets:
+                result_xs.extend(map(add, self.__xs, repeat(dx)))
+                result_ys.extend(map(add, self.__ys, repeat(dy)))
+                result_zs.extend(map(add, self.__zs, repeat(dz)))
+                sources.extend(positions)
+
+            return PointArray3D._from_arrays(result_xs, result_ys, result_zs), sources
+
+        lower = (0, 0, 0) if start is None else (start.x, start.y, start.z)
+        upper = (end.x, end.y, end.z)
+
+        for dx, dy, dz in offsets:
+            xs = array(TYPECODE, map(add, self.__xs, repeat(dx)))
+            ys = array(TYPECODE, map(add, self.__ys, repeat(dy)))
+            zs = array(TYPECODE, map(add, self.__zs, repeat(dz)))
+
+            inside = map(and_, map(le, repeat(lower[0]), xs), map(lt, xs, repeat(upper[0])))
+            inside = map(and_, inside, map(le, repeat(lower[1]), ys))
+            inside = map(and_, inside, map(lt, ys, repeat(upper[1])))
+            inside = map(and_, inside, map(le, repeat(lower[2]), zs))
+            inside = map(and_, inside, map(lt, zs, repeat(upper[2])))
+            mask = list(inside)
+
+            result_xs.extend(compress(xs, mask))
+            result_ys.extend(compress(ys, mask))
+            result_zs.extend(compress(zs, mask))
+            sources.extend(compress(positions, mask))
+
+        return PointArray3D._from_arrays(result_xs, result_ys, result_zs), sources
+
+    def __len__(self) -> int:
+        return len(self.__xs)
+
+    @overload
+    def __getitem__(self, index: int) -> Point3D:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "PointArray3D":
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Point3D, "PointArray3D"]:
+        if isinstance(index, slice):
+            return PointArray3D._from_arrays(self.__xs[index], self.__ys[index], self.__zs[index])
+
+        return Point3D(self.__xs[index], self.__ys[index], self.__zs[index])
+
+    def __setitem__(self, index: int, point: Point3D):
+        self.__xs[index] = point.x
+        self.__ys[index] = point.y
+        self.__zs[index] = point.z
+
+    def __iter__(self) -> Iterator[Point3D]:
+        return map(Point3D, self.__xs, self.__ys, self.__zs)
+
+    def __str__(self) -> str:
+        return '[' + ', '.join(map(str, self)) + ']'
+
+    def __repr__(self) -> str:
+        return f'PointArray3D({self.__xs.tolist()}, {self.__ys.tolist()}, {self.__zs.tolist()})'
+
+    def __reduce_ex__(self, protocol):
+        # With protocol 5 the coordinate buffers can be sent out-of-band, without copying them
+        return (_restore, (sys.byteorder, *(pickle_buffer(data, protocol)
+                                            for data in (self.__xs, self.__ys, self.__zs))))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PointArray3D):
+            # https://mypy.readthedocs.io/en/stable/common_issues.html#incompatible-overrides
+            raise NotImplementedError("Invalid type for other")
+
+        return self.__xs == other.xs and self.__ys == other.ys and self.__zs == other.zs
+
+    def __apply(self, other: Union[Point3D, "PointArray3D"], operation: Callable[[int, int], int],
+                reflected: bool = False) -> "PointArray3D":
+        """
+        Apply a binary operation on every coordinate, broadcasting `other` if it's a point.
+        When `reflected` is set, `other` is the left operand of the operation.
+        """
+        if isinstance(other, Point3D):
+            other_xs: Iterable[int] = repeat(other.x)
+            other_ys: Iterable[int] = repeat(other.y)
+            other_zs: Iterable[int] = repeat(other.z)
+        elif isinstance(other, PointArray3D):
+            if len(other) != len(self):
+                raise ValueError(f"Length mismatch: {len(self)} and {len(other)}")
+
+            other_xs = other.xs
+            other_ys = other.ys
+            other_zs = other.zs
+        else:
+            raise NotImplementedError("Invalid type for other")
+
+        ours: tuple[Iterable[int], ...] = (self.__xs, self.__ys, self.__zs)
+        theirs: tuple[Iterable[int], ...] = (other_xs, other_ys, other_zs)
+        lefts, rights = (theirs, ours) if reflected else (ours, theirs)
+
+        return PointArray3D._from_arrays(*(array(TYPECODE, map(operation, left, right))
+                                         for left, right in zip(lefts, rights)))
+
+    def __add__(self, other: Union[Point3D, "PointArray3D"]) -> "PointArray3D":
+        """
+        Add a point (or a batch of points) to every point in the batch.
+        For example -
+        `PointArray3D([x1], [y1], [z1]) + Point3D(x2, y2, z2)`
+        `= PointArray3D([x1 + x2], [y1 + y2], [z1 + z2])`
+
+        :param other: The point(s) that will be added
+        :type other: Union[Point3D, PointArray3D]
+        :return: Resulting batch
+        :rtype: PointArray3D
+        """
+        return self.__apply(other, add)
+
+    def __sub__(self, other: Union[Point3D, "PointArray3D"]) -> "PointArray3D":
+        """
+        Subtract a point (or a batch of points) from every point in the batch.
+        For example -
+        `PointArray3D([x1], [y1], [z1]) - Point3D(x2, y2, z2)`
+        `= PointArray3D([x1 - x2], [y1 - y2], [z1 - z2])`
+
+        :param other: The point(s) that will be subtracted
+        :type other: Union[Point3D, PointArray3D]
+        :return: Resulting batch
+        :rtype: PointArray3D
+        """
+        return self.__apply(other, sub)
+
+    def __mul__(self, other: Union[Point3D, "PointArray3D"]) -> "PointArray3D":
+        """
+        Multiply every point in the batch by a point (or a batch of points).
+        For example -
+        `PointArray3D([x1], [y1], [z1]) * Point3D(x2, y2, z2)`
+        `= PointArray3D([x1 * x2], [y1 * y2], [z1 * z2])`
+
+        :param other: The multiplier point(s)
+        :type other: Union[Point3D, PointArray3D]
+        :return: Resulting batch
+        :rtype: PointArray3D
+        """
+        return self.__apply(other, mul)
+
+    def __floordiv__(self, other: Union[Point3D, "PointArray3D"]) -> "PointArray3D":
+        """
+        Divide every point in the batch by a point (or a batch of points).
+        For example -
+        `PointArray3D([x1], [y1], [z1]) // Point3D(x2, y2, z2)`
+        `= PointArray3D([x1 // x2], [y1 // y2], [z1 // z2])`
+
+        :param other: The divisor point(s)
+        :type other: Union[Point3D, PointArray3D]
+        :return: Resulting batch
+        :rtype: PointArray3D
+        """
+        return self.__apply(other, floordiv)
+
+    def __radd__(self, other: Point3D) -> "PointArray3D":
+        """
+        Add every point in the batch to a point.
+        For example -
+        `Point3D(x1, y1, z1) + PointArray3D([x2], [y2], [z2])`
+        `= PointArray3D([x1 + x2], [y1 + y2], [z1 + z2])`
+
+        :param other: The point on the left
+        :type other: Point3D
+        :return: Resulting batch
+        :rtype: PointArray3D
+        """
+        return self.__apply(other, add, True)
+
+    def __rsub__(self, other: Point3D) -> "PointArray3D":
+        """
+        Subtract every point in the batch from a point.
+        For example -
+        `Point3D(x1, y1, z1) - PointArray3D([x2], [y2], [z2])`
+        `= PointArray3D([x1 - x2], [y1 - y2], [z1 - z2])`
+
+        :param other: The point, which is subtracted from
+        :type other: Point3D
+        :return: Resulting batch
+        :rtype: PointArray3D
+        """
+        return self.__apply(other, sub, True)
+
+    def __rmul__(self, other: Point3D) -> "PointArray3D":
+        """
+        Multiply a point by every point in the batch.
+        For example -
+        `Point3D(x1, y1, z1) * PointArray3D([x2], [y2], [z2])`
+        `= PointArray3D([x1 * x2], [y1 * y2], [z1 * z2])`
+
+        :param other: The point on the left
+        :type other: Point3D
+        :return: Resulting batch
+        :rtype: PointArray3D
+        """
+        return self.__apply(other, mul, True)
+
+    def __rfloordiv__(self, other: Point3D) -> "PointArray3D":
+        """
+        Divide a point by every point in the batch.
+        For example -
+        `Point3D(x1, y1, z1) // PointArray3D([x2], [y2], [z2])`
+        `= PointArray3D([x1 // x2], [y1 // y2], [z1 // z2])`
+
+        :param other: The dividend point
+        :type other: Point3D
+        :return: Resulting batch
+        :rtype: PointArray3D
+        """
+        return self.__apply(other, floordiv, True)
@@ -0,0 +1,202 @@
+"""
+Module containing the SparseGrid2D class
+"""
+from array import array
+from itertools import compress, repeat
+from operator import ne
+from typing import Iterator, Optional, Union
+
+from src.grid_points.grid_2d import Grid2D
+from src.grid_points.point_2d import Point2D
+
+Value = Union[int, float]
+Tile = tuple[int, int]
+
+
+class SparseGrid2D:
+    """
+    Unbounded 2D grid, which stores values in dense square tiles, allocated on first write.
+
+    The tiles are kept in a dictionary keyed by tile coordinates, so the grid can grow in every
+    direction (including negative coordinates) while only paying for the regions that are used.
+    A cell is occupied when its value differs from `default`. Tiles, which become fully
+    unoccupied, are released.
+
+    The size of a tile must be a power of two, so the tile of a cell is found with shifts.
+    """
+    __slots__ = ('__shift', '__mask', '__default', '__blank', '__tiles', '__counts')
+
+    def __init__(self, tile_size: int = 16, typecode: str = 'q', default: Value = 0):
+        if tile_size <= 0 or tile_size & (tile_size - 1):
+            raise ValueError("The tile size must be a power of two")
+
+        self.__shift = tile_size.bit_length() - 1
+        self.__mask = tile_size - 1
+        self.__default = default
+        self.__blank = array(typecode, [default]) * (tile_size * tile_size)
+        self.__tiles: dict[Tile, array] = {}
+        self.__counts: dict[Tile, int] = {}
+
+    @property
+    def tile_size(self) -> int:
+        """
+        Return the amount of cells along each side of a tile
+
+        :rtype: int
+        """
+        return self.__mask + 1
+
+    @property
+    def default(self) -> Value:
+        """
+        Return the value of the unoccupied cells
+
+        :rtype: Value
+        """
+        return self.__default
+
+    @property
+    def tile_count(self) -> int:
+        """
+        Return the amount of allocated tiles
+
+        :rtype: int
+        """
+        return len(self.__tiles)
+
+    def get(self, x: int, y: int) -> Value:
+        """
+        Return the value of a cell. Cells, which were never set, have the default value.
+
+        :rtype: Value
+        """
+        tile = self.__tiles.get((x >> self.__shift, y >> self.__shift))
+        if tile is None:
+            return self.__default
+
+        return tile[((x & self.__mask) << self.__shift) | (y & self.__mask)]
+
+    def set(self, x: int, y: int, value: Value):
+        """
+        Change the value of a cell, allocating its tile if needed
+        """
+        key = (x >> self.__shift, y >> self.__shift)
+        tile = self.__tiles.get(key)
+
+        if tile is None:
+            if value == self.__default:
+                return
+
+            tile = self.__tiles[key] = self.__blank[:]
+            self.__counts[key] = 0
+
+        index = ((x & self.__mask) << self.__shift) | (y & self.__mask)
+        was_occupied = tile[index] != self.__default
+        is_occupied = value != self.__default
+        tile[index] = value
+
+        if was_occupied != is_occupied:
+            self.__counts[key] += 1 if is_occupied else -1
+
+            if self.__counts[key] == 0:
+                del self.__tiles[key]
+                del self.__counts[key]
+
+    def items(self) -> Iterator[tuple[Point2D, Value]]:
+        """
+        Return an iterator over the occupied cells and their values.
+        The cells are returned tile by tile, with no particular order of the tiles.
+
+        :rtype: Iterator[tuple[Point2D, Value]]
+        """
+        shift = self.__shift
+        mask = self.__mask
+        cells = range(len(self.__blank))
+
+        for (tile_x, tile_y), tile in self.__tiles.items():
+            base_x = tile_x << shift
+            base_y = tile_y << shift
+
+            for index in compress(cells, map(ne, tile, repeat(self.__default))):
+                yield Point2D(base_x + (index >> shift), base_y + (index & mask)), tile[index]
+
+    def bounding_box(self) -> Optional[tuple[Point2D, Point2D]]:
+        """
+        Return the smallest bounds, which contain every occupied cell.
+        Only the tiles on the border of the occupied area are scanned.
+
+        :return: (start, end) with the same meaning as in `is_within` and the grid iterators,
+          or None if there are no occupied cells
+        :rtype: Optional[tuple[Point2D, Point2D]]
+        """
+        if not self.__tiles:
+            return None
+
+        lower = []
+        upper = []
+        for axis in range(2):
+            first = min(key[axis] for key in self.__tiles)
+            last = max(key[axis] for key in self.__tiles)
+
+            lower.append((first << self.__shift) + min(
+                self.__extent(tile, axis)[0] for key, tile in self.__tiles.items()
+                if key[axis] == first))
+            upper.append((last << self.__shift) + 1 + max(
+                self.__extent(tile, axis)[1] for key, tile in self.__tiles.items()
+                if key[axis] == last))
+
+        return Point2D(lower[0], lower[1]), Point2D(upper[0], upper[1])
+
+    def __extent(self, tile: array, axis: int) -> tuple[int, int]:
+        """
+        Return the lowest and highest local coordinate along `axis` of an occupied cell of a tile
+        """
+        size = self.tile_size
+        if axis == 0:
+            lines = [tile[i * size:(i + 1) * size] for i in range(size)]
+        else:
+            lines = [tile[i::size] for i in range(size)]
+
+        occupied = [i for i, line in enumerate(lines) if line.count(self.__default) != size]
+        return occupied[0], occupied[-1]
+
+    def to_grid(self) -> Grid2D:
+        """
+        Convert to a dense grid, covering the bounding box of the occupied cells
+
+        :rtype: Grid2D
+        """
+        bounds = self.bounding_box()
+        if bounds is None:
+            return Grid2D(Point2D(0, 0), Point2D(0, 0), self.__blank.typecode, self.__default)
+
+        start, end = bounds
+        grid = Grid2D(end, start, self.__blank.typecode, self.__default)
+        for point, value in self.items():
+            grid.set_unchecked(point.x, point.y, value)
+
+        return grid
+
+    def __len__(self) -> int:
+        return sum(self.__counts.values())
+
+    def __iter__(self) -> Iterator[Point2D]:
+        return (point for point, _ in self.items())
+
+    def __contains__(self, point: object) -> bool:
+        if not isinstance(point, Point2D):
+            return False
+
+        return self.get(point.x, point.y) != self.__default
+
+    def __getitem__(self, point: Point2D) -> Value:
+        return self.get(point.x, point.y)
+
+    def __setitem__(self, point: Point2D, value: Value):
+        self.set(point.x, point.y, value)
+
+    def __delitem__(self, point: Point2D):
+        self.set(point.x, point.y, self.__default)
+
+    def __repr__(self) -> str:
+        return f"SparseGrid2D({self.tile_size}, '{self.__blank.typecode}', {self.__default!r})"
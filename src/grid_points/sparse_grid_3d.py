@@ -0,0 +1,220 @@
+"""
+Module containing the SparseGrid3D class
+"""
+from array import array
+from itertools import compress, repeat
+from operator import ne
+from typing import Iterator, Optional, Union
+
+from src.grid_points.grid_3d import Grid3D
+from src.grid_points.point_3d import Point3D
+
+Value = Union[int, float]
+Tile = tuple[int, int, int]
+
+
+class SparseGrid3D:
+    """
+    Unbounded 3D grid, which stores values in dense cubic tiles, allocated on first write.
+
+    The tiles are kept in a dictionary keyed by tile coordinates, so the grid can grow in every
+    direction (including negative coordinates) while only paying for the regions that are used.
+    A cell is occupied when its value differs from `default`. Tiles, which become fully
+    unoccupied, are released.
+
+    The size of a tile must be a power of two, so the tile of a cell is found with shifts.
+    """
+    __slots__ = ('__shift', '__mask', '__default', '__blank', '__tiles', '__counts')
+
+    def __init__(self, tile_size: int = 16, typecode: str = 'q', default: Value = 0):
+        if tile_size <= 0 or tile_size & (tile_size - 1):
+            raise ValueError("The tile size must be a power of two")
+
+        self.__shift = tile_size.bit_length() - 1
+        self.__mask = tile_size - 1
+        self.__default = default
+        self.__blank = array(typecode, [default]) * (tile_size * tile_size * tile_size)
+        self.__tiles: dict[Tile, array] = {}
+        self.__counts: dict[Tile, int] = {}
+
+    @property
+    def tile_size(self) -> int:
+        """
+        Return the amount of cells along each edge of a tile
+
+        :rtype: int
+        """
+        return self.__mask + 1
+
+    @property
+    def default(self) -> Value:
+        """
+        Return the value of the unoccupied cells
+
+        :rtype: Value
+        """
+        return self.__default
+
+    @property
+    def tile_count(self) -> int:
+        """
+        Return the amount of allocated tiles
+
+        :rtype: int
+        """
+        return len(self.__tiles)
+
+    def get(self, x: int, y: int, z: int) -> Value:
+        """
+        Return the value of a cell. Cells, which were never set, have the default value.
+
+        :rtype: Value
+        """
+        shift = self.__shift
+        tile = self.__tiles.get((x >> shift, y >> shift, z >> shift))
+        if tile is None:
+            return self.__default
+
+        mask = self.__mask
+        return tile[((((x & mask) << shift) | (y & mask)) << shift) | (z & mask)]
+
+    def set(self, x: int, y: int, z: int, value: Value):
+        """
+        Change the value of a cell, allocating its tile if needed
+        """
+        shift = self.__shift
+        key = (x >> shift, y >> shift, z >> shift)
+        tile = self.__tiles.get(key)
+
+        if tile is None:
+            if value == self.__default:
+                return
+
+            tile = self.__tiles[key] = self.__blank[:]
+            self.__counts[key] = 0
+
+        mask = self.__mask
+        index = ((((x & mask) << shift) | (y & mask)) << shift) | (z & mask)
+        was_occupied = tile[index] != self.__default
+        is_occupied = value != self.__default
+        tile[index] = value
+
+        if was_occupied != is_occupied:
+            self.__counts[key] += 1 if is_occupied else -1
+
+            if self.__counts[key] == 0:
+                del self.__tiles[key]
+                del self.__counts[key]
+
+    def items(self) -> Iterator[tuple[Point3D, Value]]:
+        """
+        Return an iterator over the occupied cells and their values.
+        The cells are returned tile by tile, with no particular order of the tiles.
+
+        :rtype: Iterator[tuple[Point3D, Value]]
+        """
+        shift = self.__shift
+        mask = self.__mask
+        cells = range(len(self.__blank))
+
+        for (tile_x, tile_y, tile_z), tile in self.__tiles.items():
+            base_x = tile_x << shift
+            base_y = tile_y << shift
+            base_z = tile_z << shift
+
+            for index in compress(cells, map(ne, tile, repeat(self.__default))):
+                point = Point3D(base_x + (index >> shift >> shift),
+                                base_y + ((index >> shift) & mask),
+                                base_z + (index & mask))
+                yield point, tile[index]
+
+    def bounding_box(self) -> Optional[tuple[Point3D, Point3D]]:
+        """
+        Return the smallest bounds, which contain every occupied cell.
+        Only the tiles on the border of the occupied area are scanned.
+
+        :return: (start, end) with the same meaning as in `is_within` and the grid iterators,
+          or None if there are no occupied cells
+        :rtype: Optional[tuple[Point3D, Point3D]]
+        """
+        if not self.__tiles:
+            return None
+
+        lower = []
+        upper = []
+        for axis in range(3):
+            first = min(key[axis] for key in self.__tiles)
+            last = max(key[axis] for key in self.__tiles)
+
+            lower.append((first << self.__shift) + min(
+                self.__extent(tile, axis)[0] for key, tile in self.__tiles.items()
+                if key[axis] == first))
+            upper.append((last << self.__shift) + 1 + max(
+                self.__extent(tile, axis)[1] for key, tile in self.__tiles.items()
+                if key[axis] == last))
+
+        return Point3D(lower[0], lower[1], lower[2]), Point3D(upper[0], upper[1], upper[2])
+
+    def __extent(self, tile: array, axis: int) -> tuple[int, int]:
+        """
+        Return the lowest and highest local coordinate along `axis` of an occupied cell of a tile
+        """
+        size = self.tile_size
+        plane = size * size
+        if axis == 0:
+            planes = [tile[i * plane:(i + 1) * plane] for i in range(size)]
+        elif axis == 1:
+            planes = []
+            for y in range(size):
+                cells = array(tile.typecode)
+                for x in range(size):
+                    offset = x * plane + y * size
+                    cells.extend(tile[offset:offset + size])
+                planes.append(cells)
+        else:
+            planes = [tile[i::size] for i in range(size)]
+
+        occupied = [i for i, cells in enumerate(planes) if cells.count(self.__default) != plane]
+        return occupied[0], occupied[-1]
+
+    def to_grid(self) -> Grid3D:
+        """
+        Convert to a dense grid, covering the bounding box of the occupied cells
+
+        :rtype: Grid3D
+        """
+        bounds = self.bounding_box()
+        if bounds is None:
+            origin = Point3D(0, 0, 0)
+            return Grid3D(origin, origin, self.__blank.typecode, self.__default)
+
+        start, end = bounds
+        grid = Grid3D(end, start, self.__blank.typecode, self.__default)
+        for point, value in self.items():
+            grid.set_unchecked(point.x, point.y, point.z, value)
+
+        return grid
+
+    def __len__(self) -> int:
+        return sum(self.__counts.values())
+
+    def __iter__(self) -> Iterator[Point3D]:
+        return (point for point, _ in self.items())
+
+    def __contains__(self, point: object) -> bool:
+        if not isinstance(point, Point3D):
+            return False
+
+        return self.get(point.x, point.y, point.z) != self.__default
+
+    def __getitem__(self, point: Point3D) -> Value:
+        return self.get(point.x, point.y, point.z)
+
+    def __setitem__(self, point: Point3D, value: Value):
+        self.set(point.x, point.y, point.z, value)
+
+    def __delitem__(self, point: Point3D):
+        self.set(point.x, point.y, point.z, self.__default)
+
+    def __repr__(self) -> str:
+        return f"SparseGrid3D({self.tile_size}, '{self.__blank.typecode}', {self.__default!r})"
@@ -0,0 +1,468 @@
+"""
+Module containing spatial indexes over collections of Point2D/Point3D
+
+Both indexes are built in bulk from a collection of points (a sequence of points or
+a PointArray2D/PointArray3D) and answer the same queries:
+- `radius(center, radius, metric)` - the points within a distance of a center
+- `nearest(center, k, metric)` - the `k` points closest to a center
+- `rectangle(end, start)` - the points inside bounds, with the same meaning as in `is_within`
+
+The queries return the ids of the points - the position of a point in the collection
+the index was built from (or the id returned by `insert`). The supported metrics are
+`euclidean`, `manhattan` and `chebyshev`.
+
+HashGridIndex buckets the points by a uniform grid of cells and supports `insert` and `delete`.
+KDTree is static, but does not depend on the distribution of the points.
+"""
+import heapq
+from array import array
+from itertools import product
+from math import dist, floor
+from operator import add, sub
+from typing import Callable, Iterable, Iterator, Optional, Union
+
+from src.grid_points.point_2d import Point2D
+from src.grid_points.point_3d import Point3D
+
+Point = Union[Point2D, Point3D]
+Coordinates = tuple[int, ...]
+
+METRICS = ('euclidean', 'manhattan', 'chebyshev')
+
+
+def _coordinates(point: Point) -> Coordinates:
+    """
+    Return the coordinates of a point as a tuple
+    """
+    if isinstance(point, Point3D):
+        return (point.x, point.y, point.z)
+
+    return (point.x, point.y)
+
+
+def _metric(name: str) -> Callable[[Coordinates, Coordinates], float]:
+    """
+    Return the distance function of a metric by its name
+    """
+    if name == 'euclidean':
+        return dist
+
+    if name == 'manhattan':
+        return lambda first, second: sum(map(abs, map(sub, first, second)))
+
+    if name == 'chebyshev':
+        return lambda first, second: max(map(abs, map(sub, first, second)))
+
+    raise ValueError(f"Unknown metric '{name}', expected one of {METRICS}")
+
+
+def _is_within(coordinates: Coordinates, lower: Coordinates, upper: Coordinates) -> bool:
+    """
+    Return if coordinates are inside half-open bounds
+    """
+    return all(low <= value < high for value, low, high in zip(coordinates, lower, upper))
+
+
+class HashGridIndex:
+    """
+    Spatial index, which buckets the points by the cell of a uniform grid they fall in.
+
+    A query only visits the cells, which overlap the queried region. The index works best when
+    `cell_size` is close to the typical query radius. Points can be inserted and deleted
+    at any time.
+    """
+    __slots__ = ('__cell_size', '__points', '__coordinates', '__buckets', '__count', '__lower',
+                 '__upper')
+
+    def __init__(self, points: Iterable[Point] = (), cell_size: int = 16):
+        if cell_size <= 0:
+            raise ValueError("The cell size must be positive")
+
+        self.__cell_size = cell_size
+        self.__points: list[Optional[Point]] = []
+        self.__coordinates: list[Coordinates] = []
+        self.__buckets: dict[Coordinates, list[int]] = {}
+        self.__count = 0
+        # Bounds of the cells, which were ever occupied (they do not shrink on `delete`)
+        self.__lower: Coordinates = ()
+        self.__upper: Coordinates = ()
+
+        for point in points:
+            self.insert(point)
+
+    @property
+    def cell_size(self) -> int:
+        """
+        Return the size of the cells along every axis
+
+        :rtype: int
+        """
+        return self.__cell_size
+
+    def __cell(self, coordinates: Coordinates) -> Coordinates:
+        """
+        Return the cell of coordinates
+        """
+        return tuple(value // self.__cell_size for value in coordinates)
+
+    def insert(self, point: Point) -> int:
+        """
+        Add a point to the index
+
+        :param point: The point to add
+        :type point: Point
+        :return: The id of the point
+        :rtype: int
+        """
+        identifier = len(self.__points)
+        coordinates = _coordinates(point)
+        cell = self.__cell(coordinates)
+
+        self.__points.append(point)
+        self.__coordinates.append(coordinates)
+        self.__buckets.setdefault(cell, []).append(identifier)
+        if self.__lower:
+            self.__lower = tuple(map(min, self.__lower, cell))
+            self.__upper = tuple(map(max, self.__upper, cell))
+        else:
+            self.__lower = self.__upper = cell
+        self.__count += 1
+        return identifier
+
+    def delete(self, identifier: int):
+        """
+        Remove a point from the index. The ids of the other points do not change.
+
+        :param identifier: The id of the point
+        :type identifier: int
+        :raises KeyError: If there is no point with that id
+        """
+        if not 0 <= identifier < len(self.__points) or self.__points[identifier] is None:
+            raise KeyError(identifier)
+
+        cell = self.__cell(self.__coordinates[identifier])
+        bucket = self.__buckets[cell]
+        bucket.remove(identifier)
+        if not bucket:
+            del self.__buckets[cell]
+
+        self.__points[identifier] = None
+        self.__count -= 1
+
+    def radius(self, center: Point, radius: float, metric: str = 'euclidean') -> list[int]:
+        """
+        Return the points, whose distance to the center is at most `radius`
+
+        :param center: The center of the query
+        :type center: Point
+        :param radius: The maximum distance
+        :type radius: float
+        :param metric: 'euclidean', 'manhattan' or 'chebyshev', defaults to 'euclidean'
+        :type metric: str, optional
+        :return: The ids of the points, in ascending order
+        :rtype: list[int]
+        """
+        distance = _metric(metric)
+        origin = _coordinates(center)
+        lower = self.__cell(tuple(floor(value - radius) for value in origin))
+        upper = self.__cell(tuple(floor(value + radius) for value in origin))
+
+        return sorted(identifier for identifier in self.__candidates(lower, upper)
+                      if distance(origin, self.__coordinates[identifier]) <= radius)
+
+    def nearest(self, center: Point, k: int = 1, metric: str = 'euclidean') -> list[int]:
+        """
+        Return the `k` points closest to the center.
+        The cells are visited in rings of growing size around the cell of the center,
+        until no unvisited cell can contain a closer point. Once a ring has more cells than
+        there are occupied ones, the remaining occupied cells are scanned instead.
+
+        :param center: The center of the query
+        :type center: Point
+        :param k: The amount of points, defaults to 1
+        :type k: int, optional
+        :param metric: 'euclidean', 'manhattan' or 'chebyshev', defaults to 'euclidean'
+        :type metric: str, optional
+        :return: The ids of the points, from the closest one (ties are ordered by id)
+        :rtype: list[int]
+        """
+        distance = _metric(metric)
+        if k <= 0 or not self.__buckets:
+            return []
+
+        origin = _coordinates(center)
+        cell = self.__cell(origin)
+        # No occupied cell is further than `last` rings from the cell of the center
+        last = max(max(value - low, high - value)
+                   for value, low, high in zip(cell, self.__lower, self.__upper))
+
+        # Max-heap of the best candidates so far, as (-distance, -id)
+        best: list[tuple[float, int]] = []
+        seen = 0
+        for ring in range(last + 1):
+            if (2 * ring + 1) ** len(cell) > len(self.__buckets):
+                # Scanning the occupied cells is cheaper than enumerating the remaining rings,
+                # afterwards every point is seen
+                buckets = [bucket for other, bucket in self.__buckets.items()
+                           if max(map(abs, map(sub, other, cell))) >= ring]
+            else:
+                buckets = [self.__buckets.get(tuple(map(add, cell, offset)), [])
+                           for offset in self.__ring(ring, len(cell))]
+
+            for bucket in buckets:
+                seen += len(bucket)
+                for identifier in bucket:
+                    entry = (-distance(origin, self.__coordinates[identifier]), -identifier)
+                    if len(best) < k:
+                        heapq.heappush(best, entry)
+                    elif entry > best[0]:
+                        heapq.heapreplace(best, entry)
+
+            # Every point outside the visited rings is more than `ring` cells away on some axis
+            if seen == self.__count or (len(best) == k and -best[0][0] <= ring * self.__cell_size):
+                break
+
+        return [-identifier for _, identifier in sorted(best, reverse=True)]
+
+    def rectangle(self, end: Point, start: Optional[Point] = None) -> list[int]:
+        """
+        Return the points inside bounds, with the same meaning as in `is_within`
+
+        :param end: The upper bounds
+        :type end: Point
+        :param start: The lower bounds, defaults to None (0, 0) or (0, 0, 0)
+        :type start: Optional[Point], optional
+        :return: The ids of the points, in ascending order
+        :rtype: list[int]
+        """
+        upper = _coordinates(end)
+        lower = (0,) * len(upper) if start is None else _coordinates(start)
+        cells = self.__cell(tuple(value - 1 for value in upper))
+
+        return sorted(identifier for identifier in self.__candidates(self.__cell(lower), cells)
+                      if _is_within(self.__coordinates[identifier], lower, upper))
+
+    def __candidates(self, lower: Coordinates, upper: Coordinates) -> Iterator[int]:
+        """
+        Return the ids of the points in the cells between `lower` and `upper` (inclusive)
+        """
+        if any(low > high for low, high in zip(lower, upper)):
+            return
+
+        cells = 1
+        for low, high in zip(lower, upper):
+            cells *= high - low + 1
+
+        if cells > len(self.__buckets):
+            # Scanning the occupied cells is cheaper than enumerating the covered ones
+            for cell, bucket in self.__buckets.items():
+                if all(low <= value <= high for value, low, high in zip(cell, lower, upper)):
+                    yield from bucket
+            return
+
+        for cell in product(*(range(low, high + 1) for low, high in zip(lower, upper))):
+            yield from self.__buckets.get(cell, ())
+
+    @staticmethod
+    def __ring(ring: int, dimensions: int) -> Iterator[Coordinates]:
+        """
+        Return the offsets of the cells at Chebyshev distance `ring` from a cell
+        """
+        if ring == 0:
+            yield (0,) * dimensions
+            return
+
+        inner = range(-ring + 1, ring)
+        full = range(-ring, ring + 1)
+        # The first axis with a coordinate of +/-ring determines the face of the ring
+        for axis in range(dimensions):
+            for side in (-ring, ring):
+                ranges = [inner] * axis + [(side,)] + [full] * (dimensions - axis - 1)
+                yield from product(*ranges)
+
+    def __len__(self) -> int:
+        return self.__count
+
+    def __iter__(self) -> Iterator[int]:
+        return (identifier for identifier, point in enumerate(self.__points)
+                if point is not None)
+
+    def __contains__(self, identifier: object) -> bool:
+        return (isinstance(identifier, int) and 0 <= identifier < len(self.__points) and
+                self.__points[identifier] is not None)
+
+    def __getitem__(self, identifier: int) -> Point:
+        point = self.__points[identifier]
+        if point is None:
+            raise KeyError(identifier)
+
+        return point
+
+    def __repr__(self) -> str:
+        return f"HashGridIndex({len(self)} points, cell_size={self.__cell_size})"
+
+
+class KDTree:
+    """
+    Static k-d tree over a collection of points.
+
+    The tree is implicit - it is a permutation of the ids, where every subtree is a contiguous
+    range with its splitting point in the middle, so no node objects are created.
+    The splitting axis cycles through the coordinates with the depth of the node.
+    """
+    __slots__ = ('__points', '__coordinates', '__order', '__dimensions')
+
+    def __init__(self, points: Iterable[Point]):
+        self.__points = list(points)
+        self.__coordinates = [_coordinates(point) for point in self.__points]
+        self.__dimensions = len(self.__coordinates[0]) if self.__coordinates else 2
+
+        order = list(range(len(self.__points)))
+        axes = [[coordinates[axis] for coordinates in self.__coordinates]
+                for axis in range(self.__dimensions)]
+
+        stack = [(0, len(order), 0)]
+        while stack:
+            low, high, depth = stack.pop()
+            if high - low <= 1:
+                continue
+
+            axis = axes[depth % self.__dimensions]
+            order[low:high] = sorted(order[low:high], key=axis.__getitem__)
+
+            middle = (low + high) // 2
+            stack.append((low, middle, depth + 1))
+            stack.append((middle + 1, high, depth + 1))
+
+        self.__order = array('q', order)
+
+    def radius(self, center: Point, radius: float, metric: str = 'euclidean') -> list[int]:
+        """
+        Return the points, whose distance to the center is at most `radius`
+
+        :param center: The center of the query
+        :type center: Point
+        :param radius: The maximum distance
+        :type radius: float
+        :param metric: 'euclidean', 'manhattan' or 'chebyshev', defaults to 'euclidean'
+        :type metric: str, optional
+        :return: The ids of the points, in ascending order
+        :rtype: list[int]
+        """
+        distance = _metric(metric)
+        origin = _coordinates(center)
+        result = []
+
+        stack = [(0, len(self.__order), 0)]
+        while stack:
+            low, high, depth = stack.pop()
+            if low >= high:
+                continue
+
+            middle = (low + high) // 2
+            identifier = self.__order[middle]
+            coordinates = self.__coordinates[identifier]
+            if distance(origin, coordinates) <= radius:
+                result.append(identifier)
+
+            # No metric is smaller than the difference along a single axis
+            difference = origin[depth % self.__dimensions] - coordinates[depth % self.__dimensions]
+            if difference >= -radius:
+                stack.append((middle + 1, high, depth + 1))
+            if difference <= radius:
+                stack.append((low, middle, depth + 1))
+
+        return sorted(result)
+
+    def nearest(self, center: Point, k: int = 1, metric: str = 'euclidean') -> list[int]:
+        """
+        Return the `k` points closest to the center
+
+        :param center: The center of the query
+        :type center: Point
+        :param k: The amount of points, defaults to 1
+        :type k: int, optional
+        :param metric: 'euclidean', 'manhattan' or 'chebyshev', defaults to 'euclidean'
+        :type metric: str, optional
+        :return: The ids of the points, from the closest one (ties are ordered by id)
+        :rtype: list[int]
+        """
+        # pylint: disable=too-many-locals
+        distance = _metric(metric)
+        if k <= 0:
+            return []
+
+        origin = _coordinates(center)
+        # Max-heap of the best candidates so far, as (-distance, -id)
+        best: list[tuple[float, int]] = []
+
+        # The entries are (low, high, depth, the smallest possible distance to the subtree)
+        stack: list[tuple[int, int, int, float]] = [(0, len(self.__order), 0, 0)]
+        while stack:
+            low, high, depth, bound = stack.pop()
+            if low >= high or (len(best) == k and bound > -best[0][0]):
+                continue
+
+            middle = (low + high) // 2
+            identifier = self.__order[middle]
+            coordinates = self.__coordinates[identifier]
+
+            entry = (-distance(origin, coordinates), -identifier)
+            if len(best) < k:
+                heapq.heappush(best, entry)
+            elif entry > best[0]:
+                heapq.heapreplace(best, entry)
+
+            difference = origin[depth % self.__dimensions] - coordinates[depth % self.__dimensions]
+            near, far = ((low, middle), (middle + 1, high)) if difference < 0 else \
+                ((middle + 1, high), (low, middle))
+
+            # The nearer side is pushed last, so it is searched first
+            stack.append((*far, depth + 1, max(bound, abs(difference))))
+            stack.append((*near, depth + 1, bound))
+
+        return [-identifier for _, identifier in sorted(best, reverse=True)]
+
+    def rectangle(self, end: Point, start: Optional[Point] = None) -> list[int]:
+        """
+        Return the points inside bounds, with the same meaning as in `is_within`
+
+        :param end: The upper bounds
+        :type end: Point
+        :param start: The lower bounds, defaults to None (0, 0) or (0, 0, 0)
+        :type start: Optional[Point], optional
+        :return: The ids of the points, in ascending order
+        :rtype: list[int]
+        """
+        upper = _coordinates(end)
+        lower = (0,) * len(upper) if start is None else _coordinates(start)
+        result = []
+
+        stack = [(0, len(self.__order), 0)]
+        while stack:
+            low, high, depth = stack.pop()
+            if low >= high:
+                continue
+
+            middle = (low + high) // 2
+            identifier = self.__order[middle]
+            coordinates = self.__coordinates[identifier]
+            if _is_within(coordinates, lower, upper):
+                result.append(identifier)
+
+            axis = depth % self.__dimensions
+            if coordinates[axis] < upper[axis]:
+                stack.append((middle + 1, high, depth + 1))
+            if lower[axis] <= coordinates[axis]:
+                stack.append((low, middle, depth + 1))
+
+        return sorted(result)
+
+    def __len__(self) -> int:
+        return len(self.__points)
+
+    def __getitem__(self, identifier: int) -> Point:
+        return self.__points[identifier]
+
+    def __repr__(self) -> str:
+        return f"KDTree({len(self)} points)"
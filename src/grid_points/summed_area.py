@@ -0,0 +1,439 @@
+"""
+Module containing prefix-sum tables over the dense grids (Grid2D/Grid3D), which answer
+the sum of the values (or the count of the cells with a value) inside a box without
+iterating over its cells
+
+- `SummedAreaTable` - every entry is the sum of the cells before it on every axis. A box sum is
+  combined from the entries of its 4 (8 in 3D) corners, so every query is O(1). The table is
+  static - it describes the grid at the time it was built.
+- `FenwickTree` - a binary indexed tree, in which every entry holds the sum of a power-of-two
+  range per axis. Queries and point updates take O(log(n) ** dimensions), so it follows
+  a mutable grid.
+
+Both tables are padded with a zero entry in front of every axis and stored in a flat `array`.
+They are built axis by axis, where every step adds whole planes (or strided columns for the
+last axis) of the table with `map`, so no Python code runs per cell.
+"""
+from array import array
+from itertools import accumulate, product, repeat
+from math import prod
+from operator import add, eq, mul, sub
+from typing import Iterable, Iterator, Optional, Sequence, Union
+
+from src.grid_points.box_2d import Box2D
+from src.grid_points.box_3d import Box3D
+from src.grid_points.distance import coordinate_axes
+from src.grid_points.grid_2d import Grid2D, Value
+from src.grid_points.grid_3d import Grid3D
+from src.grid_points.point_2d import Point2D
+from src.grid_points.point_3d import Point3D
+from src.grid_points.point_array_2d import PointArray2D
+from src.grid_points.point_array_3d import PointArray3D
+
+Box = Union[Box2D, Box3D]
+Grid = Union[Grid2D, Grid3D]
+Point = Union[Point2D, Point3D]
+PointArray = Union[PointArray2D, PointArray3D]
+
+
+def _coordinates(point: Point) -> tuple[int, ...]:
+    """
+    Return the coordinates of a single point as a tuple
+    """
+    if isinstance(point, Point3D):
+        return (point.x, point.y, point.z)
+
+    return (point.x, point.y)
+
+
+def _typecode(grid: Grid, value: Optional[Value]) -> str:
+    """
+    Return the typecode of the sums - floats for grids of floats, integers otherwise
+    """
+    return 'd' if value is None and grid.typecode in 'fd' else 'q'
+
+
+def _padded(grid: Grid, value: Optional[Value], typecode: str,
+            prefix: bool) -> tuple[array, tuple[int, ...]]:
+    """
+    Copy the values of a grid (or if they are equal to `value`) to a table with a zero entry
+    in front of every axis, summing every line along the last axis when `prefix` is set
+    """
+    shape = tuple(size + 1 for size in grid.shape)
+    table = array(typecode, [0]) * prod(shape)
+    *outer_shape, length = grid.shape
+
+    data = grid.data
+    for line, outer in enumerate(product(*map(range, outer_shape))):
+        cells: Iterable = data[line * length:(line + 1) * length]
+        if value is not None:
+            cells = map(eq, cells, repeat(value))
+
+        begin = 0
+        for coordinate, size in zip(outer, shape[1:]):
+            begin = (begin + coordinate + 1) * size
+
+        begin += 1
+        table[begin:begin + length] = array(typecode, accumulate(cells) if prefix else cells)
+
+    return table, shape
+
+
+def _add_planes(table: array, shape: Sequence[int], axis: int,
+                pairs: Iterable[tuple[int, int]]):
+    """
+    Add the plane of the table at index `source` along `axis` to the plane at `target`,
+    for every (target, source) pair in order
+    """
+    stride = prod(shape[axis + 1:])
+    block = stride * shape[axis]
+
+    for target, source in pairs:
+        if stride == 1:
+            # The planes of the last axis are strided columns
+            table[target::block] = array(table.typecode, map(add, table[target::block],
+                                                             table[source::block]))
+            continue
+
+        for base in range(0, len(table), block):
+            begin, other = base + target * stride, base + source * stride
+            table[begin:begin + stride] = array(table.typecode, map(
+                add, table[begin:begin + stride], table[other:other + stride]))
+
+
+def _clip(origin: Sequence[int], size: Sequence[int], end: Union[Point, Box],
+          start: Optional[Point]) -> tuple[list[int], list[int]]:
+    """
+    Return the padded lower and upper corners of a box, clipped to the grid
+    """
+    if isinstance(end, (Box2D, Box3D)):
+        start, end = end.start, end.end
+
+    upper = _coordinates(end)  # type: ignore[arg-type]
+    lower = origin if start is None else _coordinates(start)
+    if len(upper) != len(origin) or len(lower) != len(origin):
+        raise ValueError(f"Expected bounds with {len(origin)} dimensions")
+
+    low = [min(max(c - o, 0), s) for c, o, s in zip(lower, origin, size)]
+    high = [max(min(c - o, s), clipped) for c, o, s, clipped in zip(upper, origin, size, low)]
+    return low, high
+
+
+def _corners(low: Sequence[int], high: Sequence[int]) -> Iterator[tuple[bool, tuple[int, ...]]]:
+    """
+    Return the corners of a box and if they are added (or subtracted) in its sum -
+    the corners with an odd amount of lower coordinates are subtracted
+    """
+    for corner in product((False, True), repeat=len(low)):
+        yield (sum(corner) % 2 == len(corner) % 2,
+               tuple(upper if is_high else lower
+                     for is_high, lower, upper in zip(corner, low, high)))
+
+
+class SummedAreaTable:
+    """
+    Summed-area table (summed-volume table in 3D) of a Grid2D/Grid3D.
+
+    The entry of the table at (x, y) is the sum of the cells of the grid before (x, y) on
+    both axes, so the sum of any box is `S(x2, y2) - S(x1, y2) - S(x2, y1) + S(x1, y1)`.
+    When `value` is given, the table counts the cells equal to it instead (e.g. the obstacles).
+
+    The bounds of the queries have the same meaning as in the grid iterators and are clipped to
+    the grid - the cells outside the grid count as 0. The sums of integer grids are kept as
+    64-bit integers and the sums of float grids as doubles.
+    """
+    __slots__ = ('__origin', '__size', '__shape', '__table')
+
+    def __init__(self, grid: Grid, value: Optional[Value] = None):
+        """
+        :param grid: The grid
+        :type grid: Grid
+        :param value: Count the cells with this value instead of summing the values,
+          defaults to None
+        :type value: Optional[Value], optional
+        :raises OverflowError: If a sum does not fit into 64 bits
+        """
+        self.__origin = _coordinates(grid.start)
+        self.__size = grid.shape
+        self.__table, self.__shape = _padded(grid, value, _typecode(grid, value), True)
+
+        for axis in range(len(self.__shape) - 1):
+            _add_planes(self.__table, self.__shape, axis,
+                        ((index, index - 1) for index in range(2, self.__shape[axis])))
+
+    @property
+    def start(self) -> Point:
+        """
+        Return the lower bounds of the grid
+
+        :rtype: Point
+        """
+        return Point3D(*self.__origin) if len(self.__origin) == 3 else Point2D(*self.__origin)
+
+    @property
+    def end(self) -> Point:
+        """
+        Return the upper bounds of the grid
+
+        :rtype: Point
+        """
+        end = tuple(map(add, self.__origin, self.__size))
+        return Point3D(*end) if len(end) == 3 else Point2D(*end)
+
+    @property
+    def total(self) -> Value:
+        """
+        Return the sum of the whole grid
+
+        :rtype: Value
+        """
+        return self.__table[-1]
+
+    def query(self, end: Union[Point, Box], start: Optional[Point] = None) -> Value:
+        """
+        Return the sum of the cells inside bounds
+
+        :param end: The upper bounds (exclusive) or a box
+        :type end: Union[Point, Box]
+        :param start: The lower bounds (inclusive), defaults to None (the start of the grid)
+        :type start: Optional[Point], optional
+        :raises ValueError: If the bounds have other dimensions than the grid
+        :return: The sum (the count when the table was built with a value)
+        :rtype: Value
+        """
+        low, high = _clip(self.__origin, self.__size, end, start)
+        strides = [prod(self.__shape[axis + 1:]) for axis in range(len(self.__shape))]
+
+        total: Value = 0
+        for is_added, corner in _corners(low, high):
+            entry = self.__table[sum(map(mul, corner, strides))]
+            total = total + entry if is_added else total - entry
+
+        return total
+
+    def query_many(self, ends: PointArray, starts: Optional[PointArray] = None) -> list[Value]:
+        """
+        Return the sums of the cells inside many bounds at once
+
+        :param ends: The upper bounds (exclusive) of every query
+        :type ends: PointArray
+        :param starts: The lower bounds (inclusive) of every query,
+          defaults to None (the start of the grid)
+        :type starts: Optional[PointArray], optional
+        :raises ValueError: If `ends` and `starts` have different lengths or other dimensions
+          than the grid
+        :return: The sums, in the order of the queries
+        :rtype: list[Value]
+        """
+        # pylint: disable=too-many-locals
+        count = len(ends)
+        if starts is not None and len(starts) != count:
+            raise ValueError("The ends and the starts must have the same length")
+
+        dimensions = len(self.__origin)
+        start_axes = None if starts is None else coordinate_axes(starts, dimensions)
+
+        lows, highs = [], []
+        for axis, upper in enumerate(coordinate_axes(ends, dimensions)):
+            origin, size = self.__origin[axis], self.__size[axis]
+            lower: Iterable[int] = repeat(0, count) if start_axes is None else map(
+                sub, start_axes[axis], repeat(origin))
+
+            low = list(map(min, map(max, lower, repeat(0)), repeat(size)))
+            high = list(map(max, map(min, map(sub, upper, repeat(origin)), repeat(size)), low))
+            lows.append(low)
+            highs.append(high)
+
+        totals: list[Value] = [0] * count
+        strides = [prod(self.__shape[axis + 1:]) for axis in range(len(self.__shape))]
+        for corner in product((False, True), repeat=len(strides)):
+            flat: Iterable[int] = repeat(0, count)
+            for is_high, low, high, stride in zip(corner, lows, highs, strides):
+                flat = map(add, flat, map(mul, high if is_high else low, repeat(stride)))
+
+            operation = add if sum(corner) % 2 == len(corner) % 2 else sub
+            totals = list(map(operation, totals, map(self.__table.__getitem__, flat)))
+
+        return totals
+
+    def __repr__(self) -> str:
+        return f"SummedAreaTable({self.end!r}, {self.start!r}, total={self.total})"
+
+
+class FenwickTree:
+    """
+    Binary indexed (Fenwick) tree over a Grid2D/Grid3D, which answers box sums like
+    SummedAreaTable and also supports changing single cells.
+
+    The tree keeps its own copy of the cells, so after a cell of the grid is changed,
+    `update` is called with the new value of the cell. Queries and updates take
+    O(log(n) ** dimensions) time. When `value` is given, the tree counts the cells
+    equal to it instead (and `update` still takes the value of the cell).
+    """
+    __slots__ = ('__origin', '__size', '__shape', '__tree', '__cells', '__value')
+
+    def __init__(self, grid: Grid, value: Optional[Value] = None):
+        """
+        :param grid: The grid
+        :type grid: Grid
+        :param value: Count the cells with this value instead of summing the values,
+          defaults to None
+        :type value: Optional[Value], optional
+        :raises OverflowError: If a sum does not fit into 64 bits
+        """
+        self.__origin = _coordinates(grid.start)
+        self.__size = grid.shape
+        self.__value = value
+        typecode = _typecode(grid, value)
+        self.__tree, self.__shape = _padded(grid, value, typecode, False)
+
+        if value is None:
+            self.__cells = array(typecode, grid.data)
+        else:
+            self.__cells = array(typecode, map(eq, grid.data, repeat(value)))
+
+        # Linear construction - every entry is added to its parent, once it is complete
+        for axis, size in enumerate(self.__shape):
+            _add_planes(self.__tree, self.__shape, axis,
+                        ((index + (index & -index), index) for index in range(1, size)
+                         if index + (index & -index) < size))
+
+    def __cell(self, point: Point) -> tuple[int, ...]:
+        """
+        Return the padded coordinates of a cell
+        """
+        cell = tuple(c - o + 1 for c, o in zip(_coordinates(point), self.__origin))
+        if len(cell) != len(self.__size) or \
+                not all(0 < c <= size for c, size in zip(cell, self.__size)):
+            raise IndexError(f"{point} is outside the grid")
+
+        return cell
+
+    def __prefix(self, corner: Sequence[int]) -> Value:
+        """
+        Return the sum of the cells before a padded corner on every axis
+        """
+        chains = []
+        for index in corner:
+            chain = []
+            while index > 0:
+                chain.append(index)
+                index -= index & -index
+            chains.append(chain)
+
+        tree, shape = self.__tree, self.__shape
+        if len(chains) == 2:
+            return sum(tree[x * shape[1] + y] for x in chains[0] for y in chains[1])
+
+        return sum(tree[(x * shape[1] + y) * shape[2] + z]
+                   for x in chains[0] for y in chains[1] for z in chains[2])
+
+    def add(self, point: Point, delta: Value):
+        """
+        Add `delta` to the summed value of a cell
+
+        :param point: The cell
+        :type point: Point
+        :param delta: The change
+        :type delta: Value
+        :raises IndexError: If the point is outside the grid
+        """
+        cell = self.__cell(point)
+        chains = []
+        for index, size in zip(cell, self.__shape):
+            chain = []
+            while index < size:
+                chain.append(index)
+                index += index & -index
+            chains.append(chain)
+
+        self.__cells[self.__flat(cell)] += delta
+
+        tree, shape = self.__tree, self.__shape
+        for entry in product(*chains):
+            index = entry[0]
+            for coordinate, size in zip(entry[1:], shape[1:]):
+                index = index * size + coordinate
+            tree[index] += delta
+
+    def __flat(self, cell: Sequence[int]) -> int:
+        """
+        Return the index of a padded cell in the copy of the cells
+        """
+        index = 0
+        for coordinate, size in zip(cell, self.__size):
+            index = index * size + coordinate - 1
+
+        return index
+
+    def update(self, point: Point, value: Value):
+        """
+        Change the value of a cell
+
+        :param point: The cell
+        :type point: Point
+        :param value: The new value of the cell in the grid
+        :type value: Value
+        :raises IndexError: If the point is outside the grid
+        """
+        if self.__value is not None:
+            value = value == self.__value
+
+        delta = value - self.__cells[self.__flat(self.__cell(point))]
+        if delta != 0:
+            self.add(point, delta)
+
+    @property
+    def total(self) -> Value:
+        """
+        Return the sum of the whole grid
+
+        :rtype: Value
+        """
+        return self.__prefix(self.__size)
+
+    def query(self, end: Union[Point, Box], start: Optional[Point] = None) -> Value:
+        """
+        Return the sum of the cells inside bounds
+
+        :param end: The upper bounds (exclusive) or a box
+        :type end: Union[Point, Box]
+        :param start: The lower bounds (inclusive), defaults to None (the start of the grid)
+        :type start: Optional[Point], optional
+        :raises ValueError: If the bounds have other dimensions than the grid
+        :return: The sum (the count when the tree was built with a value)
+        :rtype: Value
+        """
+        low, high = _clip(self.__origin, self.__size, end, start)
+
+        total: Value = 0
+        for is_added, corner in _corners(low, high):
+            entry = self.__prefix(corner)
+            total = total + entry if is_added else total - entry
+
+        return total
+
+    def query_many(self, ends: PointArray, starts: Optional[PointArray] = None) -> list[Value]:
+        """
+        Return the sums of the cells inside many bounds
+
+        :param ends: The upper bounds (exclusive) of every query
+        :type ends: PointArray
+        :param starts: The lower bounds (inclusive) of every query,
+          defaults to None (the start of the grid)
+        :type starts: Optional[PointArray], optional
+        :raises ValueError: If `ends` and `starts` have different lengths or other dimensions
+          than the grid
+        :return: The sums, in the order of the queries
+        :rtype: list[Value]
+        """
+        if starts is not None and len(starts) != len(ends):
+            raise ValueError("The ends and the starts must have the same length")
+
+        if starts is None:
+            return [self.query(end) for end in ends]
+
+        return [self.query(end, start) for end, start in zip(ends, starts)]
+
+    def __repr__(self) -> str:
+        return f"FenwickTree({len(self.__cells)} cells, total={self.total})"
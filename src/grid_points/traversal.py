@@ -0,0 +1,133 @@
+"""
+Module containing the arithmetic traversals of 2D/3D grids, used by the grid iterators
+
+A traversal is described by a range per axis and the order of the axes:
+- `step` - the distance between the visited cells of every axis. A negative step walks
+  the axis in reverse, starting from its last cell, so `step=-1` visits every cell backwards.
+- `axes` - the axes from the slowest to the fastest changing one, e.g. 'xy' (row by row,
+  the default) or 'yx' (column by column) in 2D, and any permutation of 'xyz' in 3D
+- `tile` - the amount of visited cells per axis of a tile. The grid is walked tile by tile,
+  in the same order of the axes, and every tile is walked completely before the next one.
+
+Every range is a builtin `range` and the tiles are slices of it, so the skipped cells are never
+generated and the points are produced by `itertools.product`, without filtering.
+"""
+from array import array
+from itertools import chain, islice, product, starmap
+from operator import itemgetter
+from typing import Iterable, Iterator, Optional, Sequence
+
+from src.grid_points.point_array_2d import TYPECODE
+
+AXES = 'xyz'
+
+
+def axis_ranges(start: Sequence[int], end: Sequence[int],
+                step: Optional[Sequence[int]] = None) -> list[range]:
+    """
+    Return the range of the visited coordinates of every axis
+
+    :param start: The start of the grid (inclusive)
+    :type start: Sequence[int]
+    :param end: The end of the grid (exclusive)
+    :type end: Sequence[int]
+    :param step: The step of every axis, negative to walk it in reverse, defaults to None (1)
+    :type step: Optional[Sequence[int]], optional
+    :raises ValueError: If a step is 0
+    :return: The ranges
+    :rtype: list[range]
+    """
+    if step is None:
+        step = [1] * len(start)
+
+    ranges = []
+    for low, high, delta in zip(start, end, step):
+        if delta == 0:
+            raise ValueError("The steps must not be 0")
+
+        ranges.append(range(low, high, delta) if delta > 0 else range(high - 1, low - 1, delta))
+
+    return ranges
+
+
+def axis_order(axes: str, dimensions: int) -> list[int]:
+    """
+    Return the indices of the axes, from the slowest to the fastest changing one
+
+    :param axes: The names of the axes, e.g. 'yx'
+    :type axes: str
+    :param dimensions: 2 or 3
+    :type dimensions: int
+    :raises ValueError: If `axes` is not a permutation of the axes of the grid
+    :return: The indices
+    :rtype: list[int]
+    """
+    if sorted(axes) != list(AXES[:dimensions]):
+        raise ValueError(f"The axes must be a permutation of '{AXES[:dimensions]}'")
+
+    return [AXES.index(axis) for axis in axes]
+
+
+def _tiles(axis: range, size: int) -> list[range]:
+    """
+    Split the range of an axis into tiles
+    """
+    if size <= 0:
+        raise ValueError("The tile sizes must be positive")
+
+    return [axis[begin:begin + size] for begin in range(0, len(axis), size)]
+
+
+def walk(ranges: Sequence[range], order: Sequence[int],
+         tile: Optional[Sequence[int]] = None) -> Iterator[tuple[int, ...]]:
+    """
+    Iterate over the coordinates of the visited cells
+
+    :param ranges: The range of every axis (see `axis_ranges`)
+    :type ranges: Sequence[range]
+    :param order: The axes, from the slowest to the fastest changing one (see `axis_order`)
+    :type order: Sequence[int]
+    :param tile: The visited cells per axis of a tile, defaults to None (no tiles)
+    :type tile: Optional[Sequence[int]], optional
+    :raises ValueError: If a tile size is not positive
+    :return: Iterator over the coordinates, in the order of the axes of the grid
+    :rtype: Iterator[tuple[int, ...]]
+    """
+    ordered = [ranges[axis] for axis in order]
+
+    if tile is None:
+        cells: Iterable[tuple[int, ...]] = product(*ordered)
+    else:
+        tiles = product(*[_tiles(axis, tile[index]) for axis, index in zip(ordered, order)])
+        cells = chain.from_iterable(starmap(product, tiles))
+
+    if list(order) == sorted(order):
+        return iter(cells)
+
+    # The position of every axis of the grid in the coordinates ordered by speed
+    return map(itemgetter(*[order.index(axis) for axis in range(len(order))]), cells)
+
+
+def walk_blocks(ranges: Sequence[range], order: Sequence[int], tile: Optional[Sequence[int]],
+                block_size: int) -> Iterator[list[array]]:
+    """
+    Iterate over the coordinates of the visited cells in blocks - a coordinate array per axis
+
+    :param block_size: The maximum amount of points per block
+    :type block_size: int
+    :raises ValueError: If `block_size` or a tile size are not positive
+    :return: Iterator over the blocks
+    :rtype: Iterator[list[array]]
+
+    See `walk` for the rest of the parameters.
+    """
+    if block_size <= 0:
+        raise ValueError("The block size must be positive")
+
+    cells = walk(ranges, order, tile)
+    while True:
+        block = list(islice(cells, block_size))
+        if not block:
+            return
+
+        yield [array(TYPECODE, axis) for axis in zip(*block)]
@@ -0,0 +1,133 @@
+"""
+Module containing the unittests for the async_scan module
+"""
+import asyncio
+import time
+import unittest
+from contextlib import aclosing
+from concurrent.futures import ThreadPoolExecutor
+
+from src.grid_points.async_scan import iterate, map_blocks
+from src.grid_points.grid_iterator_3d import GridIterator3D
+from src.grid_points.grid_range_2d import GridRange2D
+from src.grid_points.grid_range_3d import GridRange3D
+from src.grid_points.point_2d import Point2D
+from src.grid_points.point_3d import Point3D
+
+
+def block_sum(block) -> int:
+    """
+    Per-block function used by the tests
+    """
+    return sum(block.xs) + sum(block.ys) + sum(block.zs)
+
+
+class TestAsyncScan(unittest.IsolatedAsyncioTestCase):
+    """
+    Test cases for the asyncio grid scans
+    """
+    async def asyncSetUp(self):
+        self.ticks = 0
+        self.ticker = asyncio.create_task(self.tick())
+
+    async def asyncTearDown(self):
+        self.ticker.cancel()
+
+    async def tick(self):
+        """
+        Count how many times the event loop got the control
+        """
+        while True:
+            self.ticks += 1
+            await asyncio.sleep(0)
+
+    async def test_01_iterate_by_cells(self):
+        """
+        Verify that every point is returned in order and the control is given back
+        every `cells` cells
+        """
+        # Arrange
+        grid = GridRange2D(Point2D(10, 10), Point2D(-5, 0))
+        await asyncio.sleep(0)
+        ticks_before = self.ticks
+
+        # Act
+        points = [point async for point in iterate(grid, cells=10)]
+
+        # Assert
+        self.assertEqual(list(grid), points)
+        self.assertGreaterEqual(self.ticks - ticks_before, 14)
+
+    async def test_02_iterate_by_time(self):
+        """
+        Verify that a slow loop body gives the control back by time
+        """
+        # Arrange
+        grid = GridIterator3D(Point3D(2, 2, 20))
+        await asyncio.sleep(0)
+        ticks_before = self.ticks
+
+        # Act
+        count = 0
+        async for _ in iterate(grid, cells=None, milliseconds=1):
+            time.sleep(0.001)
+            count += 1
+
+        # Assert
+        self.assertEqual(80, count)
+        self.assertGreater(self.ticks - ticks_before, 10)
+        with self.assertRaises(ValueError):
+            await iterate(grid, cells=None).__anext__()
+        with self.assertRaises(ValueError):
+            await iterate(grid, cells=0).__anext__()
+
+    async def test_03_map_blocks(self):
+        """
+        Verify that the results of every block are streamed, in order when requested
+        """
+        # Arrange
+        grid = GridRange3D(Point3D(5, 4, 7), Point3D(-1, 0, 2))
+        expected = sum(point.x + point.y + point.z for point in grid)
+
+        with ThreadPoolExecutor(3) as executor:
+            # Act
+            unordered = [item async for item in map_blocks(block_sum, grid, executor,
+                                                           block_size=10, max_pending=2)]
+            ordered = [item async for item in map_blocks(block_sum, grid, executor,
+                                                         block_size=10, ordered=True)]
+
+        # Assert
+        self.assertEqual(expected, sum(result for _, result in unordered))
+        self.assertEqual(len(grid), sum(len(block) for block, _ in unordered))
+        self.assertEqual(list(grid), [point for block, _ in ordered for point in block])
+        self.assertEqual([block_sum(next(block.blocks(10))) for block, _ in ordered],
+                         [result for _, result in ordered])
+
+    async def test_04_map_blocks_stops_early(self):
+        """
+        Verify that leaving the iteration early stops the submission of blocks
+        and that invalid parameters are rejected
+        """
+        # Arrange
+        grid = GridRange2D(Point2D(100, 100))
+        submitted = []
+
+        def record(block):
+            submitted.append(len(block))
+            return len(block)
+
+        # Act
+        first = None
+        async with aclosing(map_blocks(record, grid, 'thread', max_workers=2, block_size=100,
+                                       max_pending=4)) as scan:
+            async for _, result in scan:
+                first = result
+                break
+
+        # Assert
+        self.assertEqual(100, first)
+        self.assertLessEqual(len(submitted), 8)
+        with self.assertRaises(ValueError):
+            await map_blocks(record, grid, 'thread', block_size=0).__anext__()
+        with self.assertRaises(ValueError):
+            await map_blocks(record, grid, 'fiber').__anext__()
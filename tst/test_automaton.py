@@ -0,0 +1,199 @@
+"""
+Module containing the unittests for the automaton module
+"""
+import random
+import unittest
+from itertools import product
+
+from src.grid_points.automaton import Automaton, Rule, SparseAutomaton
+from src.grid_points.grid_2d import Grid2D
+from src.grid_points.grid_3d import Grid3D
+from src.grid_points.neighborhood import OFFSETS_2D, OFFSETS_3D
+from src.grid_points.point_2d import Point2D
+from src.grid_points.point_3d import Point3D
+
+GLIDER = [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)]
+
+
+def reference_step(alive: set, rule: Rule, offsets: tuple, shape: tuple) -> set:
+    """
+    Compute the next generation of a bounded board cell by cell
+    """
+    result = set()
+    for cell in product(*map(range, shape)):
+        count = sum(tuple(c + d for c, d in zip(cell, offset)) in alive for offset in offsets)
+        if rule.next_state(int(cell in alive), count):
+            result.add(cell)
+
+    return result
+
+
+def alive_cells(grid) -> set:
+    """
+    Return the coordinates of the alive cells of a grid
+    """
+    if isinstance(grid, Grid3D):
+        return {(point.x, point.y, point.z) for point, value in grid.items() if value}
+
+    return {(point.x, point.y) for point, value in grid.items() if value}
+
+
+class TestAutomaton(unittest.TestCase):
+    """
+    Test cases for the Rule, Automaton and SparseAutomaton classes
+    """
+    def test_01_rule_from_string(self):
+        """
+        Verify parsing of the B/S notation
+        """
+        # Arrange
+        notation = 'B36/S23'
+
+        # Act
+        out = Rule.from_string(notation)
+
+        # Assert
+        self.assertEqual(frozenset({3, 6}), out.birth)
+        self.assertEqual(frozenset({2, 3}), out.survival)
+        self.assertEqual("Rule.from_string('B36/S23')", repr(out))
+        self.assertEqual([0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0, 1, 1, 0, 0, 0, 0, 0],
+                         list(out.table(8)))
+
+    def test_02_blinker(self):
+        """
+        Verify that a blinker oscillates with a period of 2
+        """
+        # Arrange
+        grid = Grid2D(Point2D(5, 5))
+        for y in range(1, 4):
+            grid.set(2, y, 1)
+        out = Automaton(grid)
+
+        # Act
+        out.step()
+        first = alive_cells(out.to_grid())
+        out.step()
+        second = alive_cells(out.to_grid())
+
+        # Assert
+        self.assertEqual({(1, 2), (2, 2), (3, 2)}, first)
+        self.assertEqual({(2, 1), (2, 2), (2, 3)}, second)
+        self.assertEqual(2, out.generation)
+        self.assertEqual(3, out.population)
+
+    def test_03_glider_at_the_border(self):
+        """
+        Verify that a glider moves and turns into a block at the border of a bounded board
+        """
+        # Arrange
+        grid = Grid2D(Point2D(13, 8), Point2D(5, 2), 'b')
+        for x, y in GLIDER:
+            grid.set(x + 5, y + 2, 1)
+        out = Automaton(grid)
+
+        # Act
+        out.step(4)
+        moved = alive_cells(out.to_grid())
+        out.step(40)
+
+        # Assert
+        self.assertEqual({(x + 6, y + 3) for x, y in GLIDER}, moved)
+        self.assertEqual(Point2D(5, 2), out.to_grid().start)
+        self.assertEqual({(10, 6), (10, 7), (11, 6), (11, 7)}, alive_cells(out.to_grid()))
+
+    def test_04_random_against_reference(self):
+        """
+        Verify random boards, rules and neighborhoods against a cell by cell computation
+        """
+        # Arrange
+        generator = random.Random(15)
+
+        for shape, connectivity in [((9, 14), 8), ((11, 7), 4), ((5, 6, 7), 26), ((6, 4, 5), 6)]:
+            offsets = (OFFSETS_2D if len(shape) == 2 else OFFSETS_3D)[connectivity]
+            rule = Rule(generator.sample(range(1, connectivity + 1), 3),
+                        generator.sample(range(connectivity + 1), 4))
+            alive = {cell for cell in product(*map(range, shape)) if generator.random() < 0.4}
+
+            grid = Grid2D(Point2D(*shape)) if len(shape) == 2 else Grid3D(Point3D(*shape))
+            for cell in alive:
+                grid.set(*cell, 1)
+            out = Automaton(grid, rule, connectivity)
+
+            for _ in range(5):
+                # Act
+                out.step()
+                alive = reference_step(alive, rule, offsets, shape)
+
+                # Assert
+                self.assertEqual(alive, alive_cells(out.to_grid()))
+
+    def test_05_sparse_glider(self):
+        """
+        Verify that a glider moves one cell diagonally every 4 generations on an unbounded board
+        """
+        # Arrange
+        out = SparseAutomaton(Point2D(x, y) for x, y in GLIDER)
+
+        # Act
+        out.step(400)
+
+        # Assert
+        self.assertEqual([Point2D(x + 100, y + 100) for x, y in sorted(GLIDER)], out.cells())
+        self.assertEqual((Point2D(100, 100), Point2D(103, 103)), out.bounding_box())
+        self.assertIn(Point2D(100, 101), out)
+        self.assertNotIn(Point2D(0, 1), out)
+        self.assertEqual({(x + 100, y + 100) for x, y in GLIDER}, alive_cells(out.to_grid()))
+
+    def test_06_sparse_matches_dense(self):
+        """
+        Verify that the sparse automaton matches the dense one in 3D, while inside the board
+        """
+        # Arrange
+        generator = random.Random(16)
+        rule = Rule.from_string('B5/S4567')
+        grid = Grid3D(Point3D(30, 30, 30), typecode='b')
+        cells = []
+        for cell in product(range(13, 17), repeat=3):
+            if generator.random() < 0.5:
+                grid.set(*cell, 1)
+                cells.append(Point3D(*cell))
+
+        dense = Automaton(grid, rule)
+        sparse = SparseAutomaton(cells, rule, dimensions=3)
+
+        # Act
+        dense.step(3)
+        sparse.step(3)
+
+        # Assert
+        self.assertEqual(alive_cells(dense.to_grid()), alive_cells(sparse.to_grid()))
+        self.assertEqual(dense.population, sparse.population)
+
+    def test_07_custom_function(self):
+        """
+        Verify a rule given by a function (cells alive only with an odd amount of neighbors)
+        """
+        # Arrange
+        rule = Rule(function=lambda state, count: count % 2)
+        grid = Grid2D(Point2D(3, 3))
+        grid.set(1, 1, 1)
+        out = Automaton(grid, rule, 4)
+
+        # Act
+        out.step()
+
+        # Assert
+        self.assertEqual({(0, 1), (1, 0), (1, 2), (2, 1)}, alive_cells(out.to_grid()))
+
+    def test_08_invalid_arguments(self):
+        """
+        Verify the errors for invalid rules and neighborhoods
+        """
+        # Arrange
+        grid = Grid2D(Point2D(3, 3))
+
+        # Act & Assert
+        self.assertRaises(ValueError, Rule.from_string, 'B3S23')
+        self.assertRaises(ValueError, Rule.from_string, 'B3/Sx')
+        self.assertRaises(ValueError, Automaton, grid, None, 6)
+        self.assertRaises(ValueError, SparseAutomaton, [], Rule.from_string('B0/S'))
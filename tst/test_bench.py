@@ -0,0 +1,107 @@
+"""
+Module containing the unittests for the bench module
+"""
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+
+from src.grid_points.bench import BENCHMARKS, compare, main, run_all
+
+
+class TestBench(unittest.TestCase):
+    """
+    Test cases for the benchmark suite
+    """
+    def test_01_registry(self):
+        """
+        Verify that the points (including the frozen ones and the baseline without slots),
+        the iterators (at several sizes) and the engines are covered
+        """
+        # Arrange
+        expected = ['Point2D()', 'Point3D.__add__', 'Point2D.__hash__', 'Point3D in set',
+                    'Point2D.distance_to', 'Point3D.is_within', 'GridIterator2D[16]',
+                    'GridIterator2D[512]', 'GridIterator3D[64]', 'Automaton.step[256]',
+                    'FrozenPoint2D()', 'FrozenPoint3D set insert', 'FrozenPoint2D in set',
+                    'DictPoint2D()', 'DictPoint3D()', 'DictPoint3D set insert',
+                    'DictPoint2D in set']
+
+        # Act
+        names = set(BENCHMARKS)
+
+        # Assert
+        for name in expected:
+            self.assertIn(name, names)
+
+    def test_02_run_all(self):
+        """
+        Verify that only the matching benchmarks are run
+        """
+        # Arrange
+        reported = []
+
+        # Act
+        results = run_all('GridIterator2D[16]', 1, lambda name, _: reported.append(name))
+
+        # Assert
+        self.assertEqual(['GridIterator2D[16]'], list(results))
+        self.assertEqual(['GridIterator2D[16]'], reported)
+        self.assertGreater(results['GridIterator2D[16]']['seconds'], 0)
+        self.assertGreaterEqual(results['GridIterator2D[16]']['memory'], 0)
+
+    def test_03_compare(self):
+        """
+        Verify the ratios and the regressions between two runs
+        """
+        # Arrange
+        baseline = {'a': {'seconds': 1.0, 'memory': 100.0},
+                    'b': {'seconds': 2.0, 'memory': 0.2},
+                    'c': {'seconds': 1.0, 'memory': 10.0},
+                    'old': {'seconds': 1.0, 'memory': 0.0}}
+        current = {'a': {'seconds': 1.05, 'memory': 100.0},
+                   'b': {'seconds': 1.0, 'memory': 0.9},
+                   'c': {'seconds': 1.0, 'memory': 20.0},
+                   'new': {'seconds': 1.0, 'memory': 0.0}}
+
+        # Act
+        rows = compare(baseline, current, 0.1)
+        strict = compare(baseline, current, 0.01)
+
+        # Assert
+        self.assertEqual([('a', 1.05, 1.0, False), ('b', 0.5, 4.5, False),
+                          ('c', 1.0, 2.0, True)], rows)
+        self.assertEqual([True, False, True], [row[3] for row in strict])
+
+    def test_04_command_line(self):
+        """
+        Verify that the results are saved as JSON and that compare exits with 1 on regressions
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange
+            baseline = os.path.join(directory, 'baseline.json')
+            slower = os.path.join(directory, 'slower.json')
+
+            # Act
+            with redirect_stdout(StringIO()):
+                run_code = main(['run', '--filter', 'Point2D.__hash__', '--repeat', '1',
+                                 '--output', baseline])
+            with open(baseline, encoding='utf-8') as file:
+                saved = json.load(file)
+            saved['results']['Point2D.__hash__']['seconds'] *= 2
+            with open(slower, 'w', encoding='utf-8') as file:
+                json.dump(saved, file)
+
+            with redirect_stdout(StringIO()) as output:
+                same_code = main(['compare', baseline, baseline])
+                slower_code = main(['compare', baseline, slower])
+
+        # Assert
+        self.assertEqual(0, run_code)
+        self.assertEqual(['Point2D.__hash__', 'FrozenPoint2D.__hash__', 'DictPoint2D.__hash__'],
+                         list(saved['results']))
+        self.assertIn('python', saved)
+        self.assertEqual(0, same_code)
+        self.assertEqual(1, slower_code)
+        self.assertIn('REGRESSION', output.getvalue())
@@ -0,0 +1,179 @@
+"""
+Module containing the unittests for the BitGrid2D class
+"""
+import random
+import unittest
+
+from src.grid_points.automaton import Automaton, Rule
+from src.grid_points.bit_grid_2d import BitGrid2D
+from src.grid_points.grid_2d import Grid2D
+from src.grid_points.point_2d import Point2D
+from src.grid_points.point_array_2d import PointArray2D
+
+
+def random_grid(generator: random.Random, end: Point2D, start: Point2D) -> Grid2D:
+    """
+    Create a dense grid with random 0/1 values
+    """
+    grid = Grid2D(end, start, 'b')
+    for index in range(len(grid)):
+        grid.data[index] = generator.random() < 0.35
+
+    return grid
+
+
+class TestBitGrid2D(unittest.TestCase):
+    """
+    Test cases for the BitGrid2D class
+    """
+    def test_01_get_set(self):
+        """
+        Verify setting, clearing and reading single cells
+        """
+        # Arrange
+        out = BitGrid2D(Point2D(4, 5), Point2D(-2, 1))
+
+        # Act
+        out.set(-2, 1, True)
+        out[Point2D(3, 4)] = True
+        out.set(0, 2, True)
+        out.set(0, 2, False)
+
+        # Assert
+        self.assertTrue(out.get(-2, 1))
+        self.assertTrue(out[Point2D(3, 4)])
+        self.assertFalse(out.get(0, 2))
+        self.assertEqual(2, out.count())
+        self.assertEqual(24, len(out))
+        self.assertIn(Point2D(3, 4), out)
+        self.assertNotIn(Point2D(0, 2), out)
+        self.assertNotIn(Point2D(10, 10), out)
+        self.assertRaises(IndexError, out.get, 4, 1)
+        self.assertRaises(IndexError, out.set, -3, 1, True)
+
+    def test_02_from_points_and_cells(self):
+        """
+        Verify the conversion from and to points
+        """
+        # Arrange
+        points = [Point2D(3, 1), Point2D(0, 0), Point2D(1, 2), Point2D(3, 1)]
+
+        # Act
+        out = BitGrid2D.from_points(points, Point2D(4, 3))
+        from_array = BitGrid2D.from_points(PointArray2D.from_points(points), Point2D(4, 3))
+
+        # Assert
+        self.assertEqual([Point2D(0, 0), Point2D(1, 2), Point2D(3, 1)], list(out.cells()))
+        self.assertEqual(out, from_array)
+        self.assertEqual(1 << 10 | 1 << 5 | 1, out.bits)
+        self.assertRaises(IndexError, BitGrid2D.from_points, [Point2D(4, 0)], Point2D(4, 3))
+
+    def test_03_grid_conversion(self):
+        """
+        Verify that converting a dense grid to bits and back keeps the values
+        """
+        # Arrange
+        grid = random_grid(random.Random(16), Point2D(13, 70), Point2D(-4, 3))
+
+        # Act
+        out = BitGrid2D.from_grid(grid)
+
+        # Assert
+        self.assertEqual(grid, out.to_grid())
+        self.assertEqual(sum(grid.data), out.count())
+        self.assertEqual(list(out.to_grid('q').data), list(grid.data))
+        self.assertEqual(Point2D(-4, 3), out.start)
+        self.assertEqual(Point2D(13, 70), out.end)
+        self.assertEqual(out, BitGrid2D.from_bytes(bytes(map(bool, grid.data)), grid.end,
+                                                   grid.start))
+        self.assertRaises(ValueError, BitGrid2D.from_bytes, b'\x01', grid.end, grid.start)
+
+    def test_04_operators(self):
+        """
+        Verify the bitwise operators against the cell sets
+        """
+        # Arrange
+        generator = random.Random(17)
+        end, start = Point2D(9, 11), Point2D(1, 2)
+        first = BitGrid2D.from_grid(random_grid(generator, end, start))
+        second = BitGrid2D.from_grid(random_grid(generator, end, start))
+        cells_1 = set(first.cells())
+        cells_2 = set(second.cells())
+        everything = set(BitGrid2D(end, start, True).cells())
+
+        # Act & Assert
+        self.assertEqual(cells_1 & cells_2, set((first & second).cells()))
+        self.assertEqual(cells_1 | cells_2, set((first | second).cells()))
+        self.assertEqual(cells_1 ^ cells_2, set((first ^ second).cells()))
+        self.assertEqual(cells_1 - cells_2, set((first - second).cells()))
+        self.assertEqual(everything - cells_1, set((~first).cells()))
+        self.assertRaises(ValueError, first.__and__, BitGrid2D(end))
+
+    def test_05_shift(self):
+        """
+        Verify that shifting moves the cells and drops the ones leaving the grid
+        """
+        # Arrange
+        grid = BitGrid2D.from_grid(random_grid(random.Random(18), Point2D(7, 9), Point2D(0, 0)))
+        cells = set(grid.cells())
+
+        for dx, dy in [(0, 0), (1, 0), (-2, 0), (0, 3), (0, -1), (2, -3), (-1, 4), (7, 0),
+                       (0, -9)]:
+            # Act
+            out = grid.shift(dx, dy)
+
+            # Assert
+            expected = {point + Point2D(dx, dy) for point in cells}
+            self.assertEqual({point for point in expected
+                              if 0 <= point.x < 7 and 0 <= point.y < 9}, set(out.cells()))
+
+    def test_06_neighbor_counts(self):
+        """
+        Verify the neighbor counts against the cell by cell count
+        """
+        # Arrange
+        grid = BitGrid2D.from_grid(random_grid(random.Random(19), Point2D(8, 6), Point2D(2, 2)))
+
+        for connectivity in (4, 8):
+            # Act
+            planes = grid.neighbor_counts(connectivity)
+            three = grid.neighbor_mask([3], connectivity)
+
+            # Assert
+            for point in BitGrid2D(grid.end, grid.start, True).cells():
+                expected = sum(neighbor in grid for neighbor in point.neighbors(connectivity))
+                count = sum(plane.get(point.x, point.y) << digit
+                            for digit, plane in enumerate(planes))
+                self.assertEqual(expected, count)
+                self.assertEqual(expected == 3, three.get(point.x, point.y))
+
+    def test_07_step_matches_automaton(self):
+        """
+        Verify that stepping the bits matches the dense automaton
+        """
+        # Arrange
+        grid = random_grid(random.Random(20), Point2D(21, 66), Point2D(-1, 0))
+
+        for rule, connectivity in [(None, 8), (Rule.from_string('B2/S'), 8),
+                                   (Rule((1, 3), (0, 2, 4)), 4)]:
+            automaton = Automaton(grid, rule, connectivity)
+            out = BitGrid2D.from_grid(grid)
+
+            for _ in range(6):
+                # Act
+                automaton.step()
+                out = out.step(rule, connectivity)
+
+                # Assert
+                self.assertEqual(automaton.to_grid(), out.to_grid())
+
+    def test_08_invalid_connectivity(self):
+        """
+        Verify that only the 2D neighborhoods are accepted
+        """
+        # Arrange
+        out = BitGrid2D(Point2D(3, 3))
+
+        # Act & Assert
+        self.assertRaises(ValueError, out.neighbor_counts, 6)
+        self.assertRaises(ValueError, out.step, None, 26)
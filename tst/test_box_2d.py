@@ -0,0 +1,113 @@
+"""
+Module containing the unittests for the Box2D class
+"""
+import unittest
+from itertools import product
+
+from src.grid_points.box_2d import Box2D
+from src.grid_points.grid_iterator_2d import GridIterator2D
+from src.grid_points.point_2d import Point2D
+from src.grid_points.point_array_2d import PointArray2D
+
+
+def cells(boxes) -> list:
+    """
+    Return the cells of boxes, with repetitions for overlapping boxes
+    """
+    return [(point.x, point.y) for box in boxes for point in GridIterator2D(box)]
+
+
+class TestBox2D(unittest.TestCase):
+    """
+    Test cases for the Box2D class
+    """
+    def test_01_init(self):
+        """
+        Verify the bounds, shape and volume of boxes
+        """
+        # Arrange
+        upper_bounds = Point2D(4, 5)
+        lower_bounds = Point2D(1, -1)
+
+        # Act
+        out = Box2D(upper_bounds, lower_bounds)
+        default = Box2D(upper_bounds)
+        empty = Box2D(lower_bounds, upper_bounds)
+
+        # Assert
+        self.assertEqual(upper_bounds, out.end)
+        self.assertEqual(lower_bounds, out.start)
+        self.assertEqual((3, 6), out.shape)
+        self.assertEqual(18, out.volume)
+        self.assertEqual(Point2D(0, 0), default.start)
+        self.assertEqual(0, empty.volume)
+        self.assertTrue(empty.is_empty())
+        self.assertFalse(out.is_empty())
+
+    def test_02_contains(self):
+        """
+        Verify the single and batched containment checks
+        """
+        # Arrange
+        out = Box2D(Point2D(3, 3), Point2D(1, 1))
+        points = PointArray2D([0, 1, 2, 3, 2], [1, 1, 2, 2, 3])
+
+        # Act
+        single = [point in out for point in points]
+        batched = out.contains(points)
+
+        # Assert
+        self.assertEqual([False, True, True, False, False], batched)
+        self.assertEqual(single, batched)
+        self.assertNotIn((1, 1), out)
+
+    def test_03_intersection(self):
+        """
+        Verify the intersection of overlapping and separate boxes
+        """
+        # Arrange
+        first = Box2D(Point2D(5, 5), Point2D(0, 0))
+        second = Box2D(Point2D(8, 3), Point2D(2, -2))
+        third = Box2D(Point2D(10, 10), Point2D(6, 6))
+
+        # Act & Assert
+        self.assertEqual(Box2D(Point2D(5, 3), Point2D(2, 0)), first & second)
+        self.assertEqual(first & second, second.intersection(first))
+        self.assertTrue((first & third).is_empty())
+
+    def test_04_difference_and_union(self):
+        """
+        Verify that difference and union return disjoint boxes with the expected cells
+        """
+        # Arrange
+        ranges = [(-1, 2), (0, 4), (1, 3), (3, 6)]
+        boxes = [Box2D(Point2D(x[1], y[1]), Point2D(x[0], y[0]))
+                 for x, y in product(ranges, repeat=2)]
+
+        # Act & Assert
+        for first, second in product(boxes, repeat=2):
+            first_cells = set(cells([first]))
+            second_cells = set(cells([second]))
+
+            difference = first.difference(second)
+            union = first.union(second)
+
+            self.assertLessEqual(len(difference), 4)
+            self.assertTrue(all(not box.is_empty() for box in difference + union))
+            self.assertEqual(sorted(first_cells - second_cells), sorted(cells(difference)))
+            self.assertEqual(sorted(first_cells | second_cells), sorted(cells(union)))
+
+    def test_05_equality(self):
+        """
+        Verify equality and hashing of boxes
+        """
+        # Arrange
+        first = Box2D(Point2D(3, 4), Point2D(1, 2))
+        second = Box2D(Point2D(3, 4), Point2D(1, 2))
+
+        # Act & Assert
+        self.assertEqual(first, second)
+        self.assertEqual(1, len({first, second}))
+        self.assertEqual("Box2D(Point2D(3, 4), Point2D(1, 2))", repr(first))
+        with self.assertRaises(NotImplementedError):
+            _ = first == 1
@@ -0,0 +1,113 @@
+"""
+Module containing the unittests for the Box3D class
+"""
+import unittest
+from itertools import product
+
+from src.grid_points.box_3d import Box3D
+from src.grid_points.grid_iterator_3d import GridIterator3D
+from src.grid_points.point_3d import Point3D
+from src.grid_points.point_array_3d import PointArray3D
+
+
+def cells(boxes) -> list:
+    """
+    Return the cells of boxes, with repetitions for overlapping boxes
+    """
+    return [(point.x, point.y, point.z) for box in boxes for point in GridIterator3D(box)]
+
+
+class TestBox3D(unittest.TestCase):
+    """
+    Test cases for the Box3D class
+    """
+    def test_01_init(self):
+        """
+        Verify the bounds, shape and volume of boxes
+        """
+        # Arrange
+        upper_bounds = Point3D(4, 5, 2)
+        lower_bounds = Point3D(1, -1, 0)
+
+        # Act
+        out = Box3D(upper_bounds, lower_bounds)
+        default = Box3D(upper_bounds)
+        empty = Box3D(lower_bounds, upper_bounds)
+
+        # Assert
+        self.assertEqual(upper_bounds, out.end)
+        self.assertEqual(lower_bounds, out.start)
+        self.assertEqual((3, 6, 2), out.shape)
+        self.assertEqual(36, out.volume)
+        self.assertEqual(Point3D(0, 0, 0), default.start)
+        self.assertEqual(0, empty.volume)
+        self.assertTrue(empty.is_empty())
+        self.assertFalse(out.is_empty())
+
+    def test_02_contains(self):
+        """
+        Verify the single and batched containment checks
+        """
+        # Arrange
+        out = Box3D(Point3D(3, 3, 3), Point3D(1, 1, 1))
+        points = PointArray3D([0, 1, 2, 3, 2, 2], [1, 1, 2, 2, 3, 2], [1, 1, 2, 1, 1, 0])
+
+        # Act
+        single = [point in out for point in points]
+        batched = out.contains(points)
+
+        # Assert
+        self.assertEqual([False, True, True, False, False, False], batched)
+        self.assertEqual(single, batched)
+        self.assertNotIn((1, 1), out)
+
+    def test_03_intersection(self):
+        """
+        Verify the intersection of overlapping and separate boxes
+        """
+        # Arrange
+        first = Box3D(Point3D(5, 5, 5), Point3D(0, 0, 0))
+        second = Box3D(Point3D(8, 3, 4), Point3D(2, -2, 1))
+        third = Box3D(Point3D(10, 10, 10), Point3D(6, 6, 0))
+
+        # Act & Assert
+        self.assertEqual(Box3D(Point3D(5, 3, 4), Point3D(2, 0, 1)), first & second)
+        self.assertEqual(first & second, second.intersection(first))
+        self.assertTrue((first & third).is_empty())
+
+    def test_04_difference_and_union(self):
+        """
+        Verify that difference and union return disjoint boxes with the expected cells
+        """
+        # Arrange
+        ranges = [(-1, 2), (1, 3), (2, 5)]
+        boxes = [Box3D(Point3D(x[1], y[1], z[1]), Point3D(x[0], y[0], z[0]))
+                 for x, y, z in product(ranges, repeat=3)]
+
+        # Act & Assert
+        for first, second in product(boxes, repeat=2):
+            first_cells = set(cells([first]))
+            second_cells = set(cells([second]))
+
+            difference = first.difference(second)
+            union = first.union(second)
+
+            self.assertLessEqual(len(difference), 6)
+            self.assertTrue(all(not box.is_empty() for box in difference + union))
+            self.assertEqual(sorted(first_cells - second_cells), sorted(cells(difference)))
+            self.assertEqual(sorted(first_cells | second_cells), sorted(cells(union)))
+
+    def test_05_equality(self):
+        """
+        Verify equality and hashing of boxes
+        """
+        # Arrange
+        first = Box3D(Point3D(3, 4, 5), Point3D(1, 2, 3))
+        second = Box3D(Point3D(3, 4, 5), Point3D(1, 2, 3))
+
+        # Act & Assert
+        self.assertEqual(first, second)
+        self.assertEqual(1, len({first, second}))
+        self.assertEqual("Box3D(Point3D(3, 4, 5), Point3D(1, 2, 3))", repr(first))
+        with self.assertRaises(NotImplementedError):
+            _ = first == 1
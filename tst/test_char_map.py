@@ -0,0 +1,105 @@
+"""
+Module containing the unittests for the char_map module
+"""
+import io
+import os
+import tempfile
+import unittest
+
+from src.grid_points.char_map import parse_bit_grid, parse_grid
+from src.grid_points.point_2d import Point2D
+
+MAZE = b"#####\r\n#S..#\n#.#E#\n###\n"
+
+
+class TestCharMap(unittest.TestCase):
+    """
+    Test cases for the character map parsers
+    """
+    def test_01_parse_grid(self):
+        """
+        Verify the values of the cells, the padding of short lines and the markers
+        """
+        # Arrange
+        source = MAZE
+
+        # Act
+        grid, markers = parse_grid(source, markers='SEX')
+
+        # Assert
+        self.assertEqual(Point2D(4, 5), grid.end)
+        self.assertEqual([1, 1, 1, 1, 1,
+                          1, 0, 0, 0, 1,
+                          1, 0, 1, 0, 1,
+                          1, 1, 1, 0, 0], list(grid.data))
+        self.assertEqual({'S': [Point2D(1, 1)], 'E': [Point2D(2, 3)], 'X': []}, markers)
+
+    def test_02_mapping_and_typecode(self):
+        """
+        Verify a custom mapping with values, which do not fit in a byte
+        """
+        # Arrange
+        mapping = {'#': -1, '.': 1000, 'S': 2.5}
+
+        # Act
+        grid, markers = parse_grid(MAZE, mapping, default=7, markers='.', typecode='d',
+                                   start=Point2D(10, -2))
+
+        # Assert
+        self.assertEqual(Point2D(10, -2), grid.start)
+        self.assertEqual([-1.0, 2.5, 1000.0, 1000.0, -1.0],
+                         [grid.get(11, y) for y in range(-2, 3)])
+        self.assertEqual(7.0, grid.get(12, 1))
+        self.assertEqual(7.0, grid.get(13, 2))
+        self.assertEqual([Point2D(11, 0), Point2D(11, 1), Point2D(12, -1)], markers['.'])
+
+    def test_03_sources(self):
+        """
+        Verify that bytes, files, binary streams and text streams give the same grid
+        """
+        # Arrange
+        expected, _ = parse_grid(MAZE)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'maze.txt')
+            with open(path, 'wb') as file:
+                file.write(MAZE)
+
+            # Act
+            from_file, _ = parse_grid(path)
+            from_binary, _ = parse_grid(io.BytesIO(MAZE))
+            from_text, _ = parse_grid(io.StringIO(MAZE.decode('ascii')))
+
+        # Assert
+        self.assertEqual(expected, from_file)
+        self.assertEqual(expected, from_binary)
+        self.assertEqual(expected, from_text)
+
+    def test_04_parse_bit_grid(self):
+        """
+        Verify that the bit grid matches the dense one
+        """
+        # Arrange
+        dense, expected_markers = parse_grid(MAZE, {'#': 1, '%': 1}, markers='SE')
+
+        # Act
+        out, markers = parse_bit_grid(MAZE, '#%', markers='SE')
+
+        # Assert
+        self.assertEqual(dense, out.to_grid())
+        self.assertEqual(expected_markers, markers)
+        self.assertEqual(13, out.count())
+
+    def test_05_empty(self):
+        """
+        Verify that an empty map gives an empty grid
+        """
+        # Arrange
+        source = b''
+
+        # Act
+        grid, markers = parse_grid(source, markers='S')
+
+        # Assert
+        self.assertEqual(0, len(grid))
+        self.assertEqual({'S': []}, markers)
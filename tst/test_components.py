@@ -0,0 +1,210 @@
+"""
+Module containing the unittests for the components module
+"""
+import random
+import unittest
+
+from src.grid_points.components import Component, flood_fill, label
+from src.grid_points.grid_2d import Grid2D
+from src.grid_points.grid_3d import Grid3D
+from src.grid_points.point_2d import Point2D
+from src.grid_points.point_3d import Point3D
+
+GARDEN = ["AAAA",
+          "BBCD",
+          "BBCC",
+          "EEEC"]
+
+
+def create_garden() -> Grid2D:
+    """
+    Create a grid from GARDEN, with the character codes as values
+    """
+    grid = Grid2D(Point2D(len(GARDEN), len(GARDEN[0])))
+    for x, line in enumerate(GARDEN):
+        for y, char in enumerate(line):
+            grid.set(x, y, ord(char))
+
+    return grid
+
+
+def create_random(grid, seed: int):
+    """
+    Fill a grid with random zeros and ones
+    """
+    generator = random.Random(seed)
+    for index in range(len(grid)):
+        grid.data[index] = generator.random() < 0.45
+
+    return grid
+
+
+def reference_region(grid, seed, connectivity) -> set:
+    """
+    Find the region of a cell with a plain search over points
+    """
+    value = grid[seed]
+    region = {seed}
+    stack = [seed]
+    while stack:
+        for neighbor in grid.neighbors(stack.pop(), connectivity):
+            if neighbor not in region and grid[neighbor] == value:
+                region.add(neighbor)
+                stack.append(neighbor)
+
+    return region
+
+
+class TestComponents(unittest.TestCase):
+    """
+    Test cases for the components module
+    """
+    def test_01_label_garden(self):
+        """
+        Verify the labels, areas, perimeters and bounding boxes of the regions of a garden
+        """
+        # Arrange
+        grid = create_garden()
+
+        # Act
+        labels, components = label(grid, background=None)
+
+        # Assert
+        self.assertEqual([
+            Component(1, ord('A'), 4, 10, Point2D(0, 0), Point2D(1, 4)),
+            Component(2, ord('B'), 4, 8, Point2D(1, 0), Point2D(3, 2)),
+            Component(3, ord('C'), 4, 10, Point2D(1, 2), Point2D(4, 4)),
+            Component(4, ord('D'), 1, 4, Point2D(1, 3), Point2D(2, 4)),
+            Component(5, ord('E'), 3, 8, Point2D(3, 0), Point2D(4, 3)),
+        ], components)
+        self.assertEqual([1, 1, 1, 1, 2, 2, 3, 4, 2, 2, 3, 3, 5, 5, 5, 3],
+                         labels.data.tolist())
+
+    def test_02_label_merges_provisional_labels(self):
+        """
+        Verify that regions, which are only joined late in the grid, get a single label
+        """
+        # Arrange
+        grid = Grid2D(Point2D(3, 7), Point2D(-1, 2))
+        for y in (2, 4, 6):
+            grid.fill(1, Point2D(1, y + 1), Point2D(-1, y))
+        grid.fill(1, Point2D(2, 7), Point2D(1, 2))
+
+        # Act
+        labels, components = label(grid)
+
+        # Assert
+        self.assertEqual(1, len(components))
+        self.assertEqual(Component(1, 1, 11, 24, Point2D(-1, 2), Point2D(2, 7)), components[0])
+        self.assertEqual(Point2D(-1, 2), labels.start)
+        self.assertEqual(0, labels.get(-1, 3))
+
+    def test_03_label_random(self):
+        """
+        Verify the components of random grids against a plain search
+        """
+        for connectivity in (4, 8):
+            # Arrange
+            grid = create_random(Grid2D(Point2D(20, 30)), connectivity)
+
+            # Act
+            labels, components = label(grid, connectivity)
+
+            # Assert
+            for component in components:
+                cells = [point for point in labels if labels[point] == component.label]
+                self.assertEqual(reference_region(grid, cells[0], connectivity), set(cells))
+                self.assertEqual(component.area, len(cells))
+                edges = sum(4 - sum(grid[neighbor] == 1 for neighbor in grid.neighbors(cell))
+                            for cell in cells)
+                self.assertEqual(edges, component.perimeter)
+                self.assertEqual(min(cell.x for cell in cells), component.start.x)
+                self.assertEqual(max(cell.y for cell in cells) + 1, component.end.y)
+
+            self.assertEqual(sum(grid.data), sum(component.area for component in components))
+
+    def test_04_label_3d(self):
+        """
+        Verify the components of a 3D grid, including the surface area
+        """
+        # Arrange
+        grid = Grid3D(Point3D(3, 3, 3))
+        grid.fill(1, Point3D(2, 2, 2))
+        grid.set(2, 2, 2, 1)
+
+        # Act
+        _, faces = label(grid)
+        _, corners = label(grid, 26)
+
+        # Assert
+        self.assertEqual([Component(1, 1, 8, 24, Point3D(0, 0, 0), Point3D(2, 2, 2)),
+                          Component(2, 1, 1, 6, Point3D(2, 2, 2), Point3D(3, 3, 3))], faces)
+        self.assertEqual(1, len(corners))
+        self.assertEqual(9, corners[0].area)
+
+    def test_05_flood_fill(self):
+        """
+        Verify the filled cells of flood fill against a plain search
+        """
+        for connectivity in (4, 8):
+            # Arrange
+            grid = create_random(Grid2D(Point2D(25, 20), Point2D(-5, 0)), connectivity)
+            original = grid.copy()
+            seed = Point2D(3, 7)
+            expected = reference_region(original, seed, connectivity)
+
+            # Act
+            filled = flood_fill(grid, seed, 5, connectivity)
+
+            # Assert
+            self.assertEqual(len(expected), filled)
+            for point in grid:
+                self.assertEqual(5 if point in expected else original[point], grid[point])
+
+    def test_06_flood_fill_3d(self):
+        """
+        Verify the filled cells of 3D flood fill against a plain search
+        """
+        for connectivity in (6, 26):
+            # Arrange
+            grid = create_random(Grid3D(Point3D(6, 7, 8), Point3D(0, -1, 2)), connectivity)
+            original = grid.copy()
+            seed = Point3D(2, 2, 5)
+            expected = reference_region(original, seed, connectivity)
+
+            # Act
+            filled = flood_fill(grid, seed, 5, connectivity)
+
+            # Assert
+            self.assertEqual(len(expected), filled)
+            for point in grid:
+                self.assertEqual(5 if point in expected else original[point], grid[point])
+
+    def test_07_invalid_arguments(self):
+        """
+        Verify the errors for seeds outside the grid and unsupported connectivity
+        """
+        # Arrange
+        grid = create_garden()
+
+        # Act & Assert
+        self.assertEqual(0, flood_fill(grid, Point2D(0, 0), ord('A')))
+        with self.assertRaises(IndexError):
+            flood_fill(grid, Point2D(4, 0), 0)
+        with self.assertRaises(ValueError):
+            label(grid, 6)
+
+    def test_08_empty_grids(self):
+        """
+        Verify that grids without cells along the last axis have no components
+        """
+        for grid in [Grid2D(Point2D(6, 0)), Grid3D(Point3D(4, 4, 0)), Grid2D(Point2D(0, 6))]:
+            # Act
+            labels, components = label(grid)
+
+            # Assert
+            self.assertEqual([], components)
+            self.assertEqual(grid.shape, labels.shape)
+            with self.assertRaises(IndexError):
+                flood_fill(grid, Point2D(0, 0) if isinstance(grid, Grid2D) else Point3D(0, 0, 0),
+                           1)
@@ -0,0 +1,154 @@
+"""
+Module containing the unittests for the CoordinateCompression class
+"""
+import random
+import unittest
+
+from src.grid_points.box_2d import Box2D
+from src.grid_points.box_3d import Box3D
+from src.grid_points.components import flood_fill
+from src.grid_points.compression import CoordinateCompression
+from src.grid_points.grid_2d import Grid2D
+from src.grid_points.grid_range_2d import GridRange2D
+from src.grid_points.point_2d import Point2D
+from src.grid_points.point_3d import Point3D
+from src.grid_points.point_array_3d import PointArray3D
+
+
+class TestCoordinateCompression(unittest.TestCase):
+    """
+    Test cases for the CoordinateCompression class
+    """
+    def test_01_compress(self):
+        """
+        Verify the breaks, weights and ranks of the compressed cells and the mapping back
+        to original coordinates
+        """
+        # Arrange
+        points = [Point2D(10 ** 9, 5), Point2D(-3, 5), Point2D(7, 2 * 10 ** 9)]
+
+        # Act
+        out = CoordinateCompression(points)
+        compressed = out.compress(points)
+
+        # Assert
+        self.assertEqual((5, 3), out.shape)
+        self.assertEqual([-3, -2, 7, 8, 10 ** 9, 10 ** 9 + 1], out.breaks(0))
+        self.assertEqual([1, 9, 1, 10 ** 9 - 8, 1], out.weights(0))
+        self.assertEqual([5, 6, 2 * 10 ** 9, 2 * 10 ** 9 + 1], out.breaks(1))
+        self.assertEqual(Box2D(Point2D(10 ** 9 + 1, 2 * 10 ** 9 + 1), Point2D(-3, 5)), out.bounds)
+        self.assertEqual([Point2D(4, 0), Point2D(0, 0), Point2D(2, 2)], compressed.to_points())
+        self.assertEqual(points, out.decompress(compressed).to_points())
+        self.assertEqual(Box2D(Point2D(7, 2 * 10 ** 9), Point2D(-2, 6)), out.cell(Point2D(1, 1)))
+        self.assertEqual(Point2D(1, 1), out.compress([Point2D(0, 10 ** 6)])[0])
+
+    def test_02_volume(self):
+        """
+        Verify the weighted area of the regions, inside and outside of a box
+        """
+        # Arrange
+        points = [Point2D(0, 0), Point2D(10 ** 6, 10 ** 6), Point2D(5, 10 ** 6)]
+        out = CoordinateCompression(points, Box2D(Point2D(10 ** 9, 10 ** 9), Point2D(-1, -1)))
+
+        # Act
+        grid = out.grid(points, value=3)
+
+        # Assert
+        self.assertEqual(3, out.volume(grid, 3))
+        self.assertEqual((10 ** 9 + 1) ** 2 - 3, out.volume(grid, 0))
+        self.assertEqual(2, out.volume(grid, 3, Box2D(Point2D(10 ** 6 + 1, 10 ** 7),
+                                                      Point2D(1, 0))))
+        self.assertEqual(100 * 200 - 1, out.volume(grid, 0, Box2D(Point2D(100, 200))))
+        self.assertEqual(0, out.volume(grid, 0, Box2D(Point2D(5, 5), Point2D(7, 7))))
+
+    def test_03_flood_fill(self):
+        """
+        Verify the flood fill and the containment queries against a dense grid
+        """
+        generator = random.Random(11)
+        for connectivity in [4, 8]:
+            # Arrange
+            bounds = Box2D(Point2D(30, 25), Point2D(-6, -4))
+            points = [Point2D(generator.randrange(-6, 30), generator.randrange(-4, 25))
+                      for _ in range(150)] + [Point2D(x, 10) for x in range(-6, 30)]
+            dense = Grid2D(bounds.end, bounds.start)
+            for point in points:
+                dense[point] = 1
+            seed = next(point for point in GridRange2D(bounds) if dense[point] == 0)
+            queries = [Point2D(generator.randrange(-8, 32), generator.randrange(-6, 27))
+                       for _ in range(200)]
+
+            out = CoordinateCompression(points, bounds)
+            grid = out.grid(points)
+
+            # Act
+            filled = out.flood_fill(grid, seed, 2, connectivity)
+            inside = out.contains(grid, queries, 2)
+
+            # Assert
+            self.assertEqual(flood_fill(dense, seed, 2, connectivity), filled)
+            self.assertEqual([point in dense and dense[point] == 2 for point in queries], inside)
+            self.assertEqual({point for point in GridRange2D(bounds) if dense[point] == 2},
+                             {point for box in out.boxes(grid, 2) for point in GridRange2D(box)})
+
+    def test_04_3d(self):
+        """
+        Verify that the inside of a hollow cube is separated from the rest of a huge space
+        """
+        # Arrange
+        corner = 10 ** 9
+        walls = PointArray3D.from_points(
+            Point3D(corner + x, corner + y, corner + z)
+            for x in range(4) for y in range(4) for z in range(4)
+            if {x, y, z} & {0, 3})
+        out = CoordinateCompression(walls, Box3D(Point3D(*[2 * corner] * 3)))
+        grid = out.grid(walls)
+
+        # Act
+        outside = out.flood_fill(grid, Point3D(0, 0, 0), 2, 26)
+        inside = out.flood_fill(grid, Point3D(corner + 1, corner + 2, corner + 1), 3)
+
+        # Assert
+        self.assertEqual((6, 6, 6), out.shape)
+        self.assertEqual(8, inside)
+        self.assertEqual((2 * corner) ** 3 - 56 - 8, outside)
+        self.assertEqual(56, out.volume(grid, 1))
+        self.assertEqual([True, False], out.contains(grid, [Point3D(*[corner + 2] * 3),
+                                                            Point3D(*[corner + 4] * 3)], 3))
+
+    def test_05_invalid(self):
+        """
+        Verify that points outside the bounds and grids of other shapes are rejected
+        """
+        # Arrange
+        out = CoordinateCompression([Point2D(5, 5)], Box2D(Point2D(10, 10)))
+        grid = out.grid([Point2D(5, 5)])
+
+        # Act & Assert
+        self.assertRaises(ValueError, CoordinateCompression, [])
+        self.assertRaises(ValueError, CoordinateCompression, [Point2D(10, 0)],
+                          Box2D(Point2D(10, 10)))
+        self.assertRaises(ValueError, out.compress, [Point2D(-1, 0)])
+        self.assertRaises(IndexError, out.decompress, [Point2D(3, 0)])
+        self.assertRaises(IndexError, out.cell, Point2D(0, 3))
+        self.assertRaises(IndexError, out.flood_fill, grid, Point2D(10, 0), 2)
+        self.assertRaises(ValueError, out.volume, Grid2D(Point2D(3, 4)), 0)
+        self.assertEqual([False, True], out.contains(grid, [Point2D(11, 5), Point2D(5, 5)], 1))
+
+    def test_06_empty_3d(self):
+        """
+        Verify that the bounds decide the dimensions of a compression without points
+        """
+        # Act
+        out = CoordinateCompression([], Box3D(Point3D(5, 5, 5)))
+        grid = out.grid([])
+
+        # Assert
+        self.assertEqual(3, out.dimensions)
+        self.assertEqual((1, 1, 1), out.shape)
+        self.assertEqual(Box3D(Point3D(5, 5, 5)), out.bounds)
+        self.assertEqual(PointArray3D([0], [0], [0]), out.compress([Point3D(1, 1, 1)]))
+        self.assertEqual(125, out.flood_fill(grid, Point3D(4, 0, 2), 1))
+        self.assertRaises(ValueError, out.compress, [Point2D(1, 1)])
+        self.assertRaises(ValueError, CoordinateCompression, [Point2D(1, 1)],
+                          Box3D(Point3D(5, 5, 5)))
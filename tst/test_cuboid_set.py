@@ -0,0 +1,142 @@
+"""
+Module containing the unittests for the CuboidSet class
+"""
+import random
+import unittest
+
+from src.grid_points.box_2d import Box2D
+from src.grid_points.box_3d import Box3D
+from src.grid_points.cuboid_set import CuboidSet
+from src.grid_points.grid_iterator_3d import GridIterator3D
+from src.grid_points.point_2d import Point2D
+from src.grid_points.point_3d import Point3D
+
+
+def random_box(generator: random.Random, low: int, high: int) -> Box3D:
+    """
+    Create a random, non-empty box inside [low, high) on every axis
+    """
+    bounds = [sorted(generator.sample(range(low, high + 1), 2)) for _ in range(3)]
+    return Box3D(Point3D(*(upper for _, upper in bounds)),
+                 Point3D(*(lower for lower, _ in bounds)))
+
+
+def cells(box: Box3D) -> set:
+    """
+    Return the cells of a box as a set of coordinates
+    """
+    return {(point.x, point.y, point.z) for point in GridIterator3D(box)}
+
+
+class TestCuboidSet(unittest.TestCase):
+    """
+    Test cases for the CuboidSet class
+    """
+    def test_01_add_remove(self):
+        """
+        Verify the volume after adding and removing overlapping boxes
+        """
+        # Arrange
+        out = CuboidSet()
+
+        # Act
+        out.add(Box3D(Point3D(3, 3, 3)))
+        out.add(Box3D(Point3D(4, 4, 4), Point3D(1, 1, 1)))
+        after_add = out.volume
+        out.remove(Box3D(Point3D(2, 2, 2), Point3D(1, 1, 1)))
+        after_remove = out.volume
+
+        # Assert
+        self.assertEqual(27 + 27 - 8, after_add)
+        self.assertEqual(45, after_remove)
+        self.assertNotIn(Point3D(1, 1, 1), out)
+        self.assertIn(Point3D(0, 0, 0), out)
+        self.assertIn(Point3D(3, 3, 3), out)
+
+    def test_02_random_operations(self):
+        """
+        Verify random sequences of operations against a set of cells
+        """
+        # Arrange
+        generator = random.Random(5)
+        out = CuboidSet()
+        expected: set = set()
+
+        for _ in range(60):
+            box = random_box(generator, -6, 6)
+            operation = generator.choice(('add', 'add', 'remove', 'intersect'))
+
+            # Act
+            if operation == 'add':
+                out.add(box)
+                expected |= cells(box)
+            elif operation == 'remove':
+                out.remove(box)
+                expected -= cells(box)
+            elif len(expected) > 100:
+                out.intersect(box)
+                expected &= cells(box)
+
+            # Assert
+            self.assertEqual(len(expected), out.volume)
+
+        for point in GridIterator3D(Box3D(Point3D(7, 7, 7), Point3D(-7, -7, -7))):
+            self.assertEqual((point.x, point.y, point.z) in expected, point in out)
+
+    def test_03_large_boxes(self):
+        """
+        Verify the volume of boxes, which are too large to enumerate
+        """
+        # Arrange
+        big = 10 ** 6
+        out = CuboidSet([Box3D(Point3D(big, big, big), Point3D(-big, -big, -big))])
+
+        # Act
+        out.remove(Box3D(Point3D(big, big, big)))
+        out.add(Box3D(Point3D(big // 2, big // 2, big // 2)))
+        copied = out.copy()
+        copied.intersect(Box3D(Point3D(1, 1, 1)))
+
+        # Assert
+        self.assertEqual(8 * big ** 3 - big ** 3 + (big // 2) ** 3, out.volume)
+        self.assertEqual(1, copied.volume)
+        self.assertGreater(out.volume, copied.volume)
+
+    def test_04_repeated_boxes(self):
+        """
+        Verify that repeated boxes do not grow the amount of terms and work with Box2D
+        """
+        # Arrange
+        out = CuboidSet()
+        box = Box2D(Point2D(5, 5))
+
+        # Act
+        for _ in range(100):
+            out.add(box)
+            out.add(Box2D(Point2D(6, 6), Point2D(1, 1)))
+
+        # Assert
+        self.assertEqual(25 + 25 - 16, out.volume)
+        self.assertLessEqual(out.terms, 3)
+        self.assertEqual(0, CuboidSet([Box2D(Point2D(0, 0), Point2D(1, 1))]).volume)
+
+    def test_05_mixed_dimensions(self):
+        """
+        Verify that the first box decides the dimensions and other boxes are rejected
+        """
+        # Arrange
+        out = CuboidSet([Box2D(Point2D(2, 2))])
+        empty = CuboidSet()
+        empty.add(Box3D(Point3D(0, 0, 0)))
+
+        # Act & Assert
+        self.assertEqual(2, out.dimensions)
+        self.assertEqual(3, empty.dimensions)
+        self.assertIsNone(CuboidSet().dimensions)
+        self.assertEqual(2, out.copy().dimensions)
+        self.assertRaises(ValueError, out.add, Box3D(Point3D(1, 1, 1)))
+        self.assertRaises(ValueError, out.remove, Box3D(Point3D(1, 1, 1)))
+        self.assertRaises(ValueError, out.intersect, Box3D(Point3D(1, 1, 1)))
+        self.assertRaises(ValueError, empty.add, Box2D(Point2D(1, 1)))
+        self.assertRaises(ValueError, CuboidSet, [Box3D(Point3D(1, 1, 1)), Box2D(Point2D(1, 1))])
+        self.assertEqual(4, out.volume)
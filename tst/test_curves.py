@@ -0,0 +1,176 @@
+"""
+Module containing the unittests for the curves module
+"""
+import random
+import unittest
+from array import array
+
+from src.grid_points.curves import (argsort, flat_order, hilbert_decode, hilbert_encode,
+                                    morton_decode, morton_encode, sort_points, traverse)
+from src.grid_points.grid_2d import Grid2D
+from src.grid_points.grid_3d import Grid3D
+from src.grid_points.point_2d import Point2D
+from src.grid_points.point_3d import Point3D
+from src.grid_points.point_array_2d import PointArray2D
+from src.grid_points.point_array_3d import PointArray3D
+
+
+def interleave(*coordinates: int) -> int:
+    """
+    Reference Morton index - interleave the bits one at a time
+    """
+    result = 0
+    dimensions = len(coordinates)
+    for bit in range(31):
+        for index, coordinate in enumerate(coordinates):
+            result |= ((coordinate >> bit) & 1) << (bit * dimensions + dimensions - 1 - index)
+
+    return result
+
+
+class TestCurves(unittest.TestCase):
+    """
+    Test cases for the space-filling curves
+    """
+    def test_01_morton_encode(self):
+        """
+        Verify the Morton indices against the bit-by-bit interleaving, up to the largest
+        coordinates
+        """
+        # Arrange
+        generator = random.Random(3)
+        points_2d = [Point2D(generator.randrange(2 ** 31), generator.randrange(2 ** 31))
+                     for _ in range(200)] + [Point2D(2 ** 31 - 1, 2 ** 31 - 1)]
+        points_3d = PointArray3D.from_points(
+            Point3D(generator.randrange(2 ** 21), generator.randrange(2 ** 21),
+                    generator.randrange(2 ** 21)) for _ in range(200))
+
+        # Act
+        codes_2d = morton_encode(points_2d)
+        codes_3d = morton_encode(points_3d)
+
+        # Assert
+        self.assertEqual([interleave(point.x, point.y) for point in points_2d], list(codes_2d))
+        self.assertEqual([interleave(point.x, point.y, point.z) for point in points_3d],
+                         list(codes_3d))
+        self.assertEqual(2 ** 62 - 1, codes_2d[-1])
+        self.assertEqual(array('q', [0, 1, 2, 3]), morton_encode(
+            [Point2D(0, 0), Point2D(0, 1), Point2D(1, 0), Point2D(1, 1)]))
+
+    def test_02_morton_decode(self):
+        """
+        Verify that decoding is the inverse of encoding
+        """
+        # Arrange
+        generator = random.Random(5)
+        points_2d = PointArray2D([generator.randrange(2 ** 31) for _ in range(100)],
+                                 [generator.randrange(2 ** 31) for _ in range(100)])
+        points_3d = PointArray3D.from_points(
+            Point3D(generator.randrange(2 ** 21), generator.randrange(2 ** 21),
+                    generator.randrange(2 ** 21)) for _ in range(100))
+
+        # Act
+        decoded_2d = morton_decode(morton_encode(points_2d))
+        decoded_3d = morton_decode(morton_encode(points_3d), 3)
+
+        # Assert
+        self.assertEqual(points_2d, decoded_2d)
+        self.assertEqual(points_3d, decoded_3d)
+        self.assertEqual(PointArray2D(), morton_decode([]))
+
+    def test_03_hilbert(self):
+        """
+        Verify that consecutive Hilbert indices are neighboring points, which cover the whole
+        curve, and that decoding is the inverse of encoding
+        """
+        for dimensions, order in [(2, 1), (2, 4), (3, 1), (3, 3)]:
+            # Arrange
+            count = 2 ** (dimensions * order)
+
+            # Act
+            points = hilbert_decode(range(count), dimensions, order).to_points()
+            codes = hilbert_encode(points, order)
+
+            # Assert
+            self.assertEqual(count, len(set(points)))
+            for previous, current in zip(points, points[1:]):
+                self.assertEqual(1, previous.distance_to(current))
+            self.assertEqual(list(range(count)), list(codes))
+
+        generator = random.Random(7)
+        large = [Point3D(generator.randrange(2 ** 21), generator.randrange(2 ** 21),
+                         generator.randrange(2 ** 21)) for _ in range(100)]
+        self.assertEqual(large, hilbert_decode(hilbert_encode(large, 21), 3, 21).to_points())
+
+    def test_04_invalid(self):
+        """
+        Verify that coordinates, indices, orders and curves out of range are rejected
+        """
+        # Act & Assert
+        self.assertRaises(ValueError, morton_encode, [Point2D(-1, 0)])
+        self.assertRaises(ValueError, morton_encode, [Point3D(0, 2 ** 21, 0)])
+        self.assertRaises(ValueError, morton_decode, [-1])
+        self.assertRaises(ValueError, morton_decode, [0], 4)
+        self.assertRaises(ValueError, hilbert_encode, [Point2D(16, 0)], 4)
+        self.assertRaises(ValueError, hilbert_encode, [Point3D(0, 0, 0)], 22)
+        self.assertRaises(ValueError, hilbert_decode, [256], 2, 4)
+        self.assertRaises(ValueError, argsort, [Point2D(0, 0)], 'peano')
+        self.assertRaises(ValueError, list, traverse(Point2D(2, 2), block_size=0))
+
+    def test_05_sort_points(self):
+        """
+        Verify that points with any coordinates are sorted by their curve indices
+        """
+        # Arrange
+        points = [Point2D(-3, 5), Point2D(-4, 4), Point2D(-3, 4), Point2D(-4, 5),
+                  Point2D(-2, 4)]
+
+        # Act
+        permutation = argsort(points)
+        morton = sort_points(points)
+        hilbert = sort_points(PointArray2D.from_points(points), 'hilbert')
+
+        # Assert
+        self.assertEqual([1, 3, 2, 0, 4], permutation)
+        self.assertEqual(PointArray2D([-4, -4, -3, -3, -2], [4, 5, 4, 5, 4]), morton)
+        self.assertEqual(PointArray2D([-4, -3, -3, -4, -2], [4, 4, 5, 5, 4]), hilbert)
+        self.assertEqual([], argsort([]))
+
+    def test_06_traverse(self):
+        """
+        Verify that the traversal visits every point of the grid once, in blocks
+        """
+        for curve in ['morton', 'hilbert']:
+            # Arrange
+            end, start = Point3D(7, 2, 5), Point3D(-2, 0, 1)
+
+            # Act
+            blocks = list(traverse(end, start, curve, 16))
+
+            # Assert
+            points = [point for block in blocks for point in block]
+            self.assertEqual(9 * 2 * 4, len(points))
+            self.assertEqual({Point3D(x, y, z) for x in range(-2, 7) for y in range(2)
+                              for z in range(1, 5)}, set(points))
+            self.assertTrue(all(0 < len(block) <= 16 for block in blocks))
+            self.assertEqual([], list(traverse(Point2D(0, 5), curve=curve)))
+
+    def test_07_flat_order(self):
+        """
+        Verify that the flat indices follow the curve and can lay out the storage of a grid
+        """
+        # Arrange
+        grid = Grid2D(Point2D(3, 4), Point2D(1, 1))
+        for index in range(len(grid)):
+            grid.data[index] = index * 10
+
+        # Act
+        order = flat_order(grid)
+        layout = array(grid.typecode, map(grid.data.__getitem__, order))
+
+        # Assert
+        self.assertEqual(array('q', [0, 1, 3, 4, 2, 5]), order)
+        self.assertEqual([grid[point] for point in next(traverse(grid.end, grid.start))],
+                         list(layout))
+        self.assertEqual(list(range(60)), sorted(flat_order(Grid3D(Point3D(3, 4, 5)),
+                                                            'hilbert')))
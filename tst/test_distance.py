@@ -0,0 +1,178 @@
+"""
+Module containing the unittests for the batched distance functions
+"""
+import unittest
+from array import array
+
+from src.grid_points.distance import (METRICS, distance_blocks, distance_matrix, distances_to,
+                                      k_nearest)
+from src.grid_points.point_2d import Point2D
+from src.grid_points.point_3d import Point3D
+from src.grid_points.point_array_2d import PointArray2D
+from src.grid_points.point_array_3d import PointArray3D
+
+
+class TestDistance(unittest.TestCase):
+    """
+    Test cases for the batched distance functions
+    """
+    def test_01_metrics_2d(self):
+        """
+        Verify every metric from one point to many 2D points
+        """
+        # Arrange
+        origin = Point2D(1, 1)
+        points = [Point2D(4, 5), Point2D(1, 1), Point2D(-1, 2)]
+        expected = {
+            'euclidean': [5.0, 0.0, 5 ** 0.5],
+            'squared_euclidean': [25.0, 0.0, 5.0],
+            'manhattan': [7.0, 0.0, 3.0],
+            'chebyshev': [4.0, 0.0, 2.0],
+        }
+
+        # Act
+        actual = {metric: list(distances_to(origin, points, metric)) for metric in METRICS}
+
+        # Assert
+        for metric in METRICS:
+            for expected_distance, actual_distance in zip(expected[metric], actual[metric]):
+                self.assertAlmostEqual(expected_distance, actual_distance)
+
+    def test_02_metrics_3d(self):
+        """
+        Verify every metric from one point to a PointArray3D
+        """
+        # Arrange
+        origin = Point3D(0, 0, 0)
+        points = PointArray3D([2, -1], [3, 0], [6, 0])
+        expected = {
+            'euclidean': [7.0, 1.0],
+            'squared_euclidean': [49.0, 1.0],
+            'manhattan': [11.0, 1.0],
+            'chebyshev': [6.0, 1.0],
+        }
+
+        # Act
+        actual = {metric: list(distances_to(origin, points, metric)) for metric in METRICS}
+
+        # Assert
+        self.assertEqual(expected, actual)
+
+    def test_03_matches_distance_to(self):
+        """
+        Verify that the euclidean metric matches Point2D.distance_to
+        """
+        # Arrange
+        origin = Point2D(3, -2)
+        points = [Point2D(x, 2 * x - 7) for x in range(-5, 5)]
+
+        # Act
+        actual = distances_to(origin, PointArray2D.from_points(points))
+
+        # Assert
+        for point, distance in zip(points, actual):
+            self.assertAlmostEqual(origin.distance_to(point), distance)
+
+    def test_04_unknown_metric(self):
+        """
+        Verify that an unknown metric is rejected
+        """
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            distances_to(Point2D(0, 0), [Point2D(1, 1)], 'cosine')
+
+        with self.assertRaises(ValueError):
+            distance_matrix([Point2D(0, 0)], [Point2D(1, 1)], 'cosine')
+
+    def test_05_dimension_mismatch(self):
+        """
+        Verify that a 3D origin can not be combined with 2D points
+        """
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            distances_to(Point3D(0, 0, 0), [Point2D(1, 1)])
+
+    def test_06_distance_matrix(self):
+        """
+        Verify the pairwise distance matrix, computed in blocks smaller than the input
+        """
+        # Arrange
+        sources = [Point2D(0, 0), Point2D(1, 2), Point2D(5, 5)]
+        targets = [Point2D(1, 1), Point2D(-3, 4)]
+
+        # Act
+        actual = distance_matrix(sources, targets, 'manhattan', block_size=2)
+
+        # Assert
+        expected = [[abs(s.x - t.x) + abs(s.y - t.y) for t in targets] for s in sources]
+        self.assertEqual(expected, actual)
+
+    def test_07_distance_blocks(self):
+        """
+        Verify that the blocks are bounded by the block size and report their offset
+        """
+        # Arrange
+        sources = PointArray2D(range(5), range(5))
+        targets = PointArray2D([0], [0])
+
+        # Act
+        blocks = list(distance_blocks(sources, targets, 'chebyshev', block_size=2))
+
+        # Assert
+        self.assertEqual([0, 2, 4], [begin for begin, _ in blocks])
+        self.assertEqual([2, 2, 1], [len(rows) for _, rows in blocks])
+
+    def test_08_k_nearest(self):
+        """
+        Verify the k-nearest query, including ties broken by position
+        """
+        # Arrange
+        origin = Point2D(0, 0)
+        points = [Point2D(5, 5), Point2D(1, 0), Point2D(0, 1), Point2D(-3, 0)]
+
+        # Act
+        nearest = k_nearest(origin, points, 3, 'manhattan')
+        all_points = k_nearest(origin, points, 10, 'chebyshev')
+
+        # Assert
+        self.assertEqual([1, 2, 3], nearest)
+        self.assertEqual([1, 2, 3, 0], all_points)
+
+    def test_09_empty_points(self):
+        """
+        Verify that empty sequences of points take the dimensions of the other side
+        """
+        # Act
+        distances = distances_to(Point3D(1, 2, 3), [])
+        nearest = k_nearest(Point3D(1, 2, 3), [], 2)
+        matrix = distance_matrix([Point3D(0, 0, 0), Point3D(1, 1, 1)], [])
+        empty_rows = distance_matrix([], [Point3D(0, 0, 0)])
+
+        # Assert
+        self.assertEqual(0, len(distances))
+        self.assertEqual([], nearest)
+        self.assertEqual([0, 0], [len(row) for row in matrix])
+        self.assertEqual([], empty_rows)
+
+    def test_10_large_coordinates(self):
+        """
+        Verify that the integer metrics are exact above 2 ** 53 and 2 ** 63
+        """
+        # Arrange
+        origin = Point3D(-10 ** 9, 0, 10 ** 9)
+        points = [Point3D(10 ** 9, 2 ** 53 + 1, 10 ** 9), Point3D(10 ** 9, 2 ** 53, 10 ** 9)]
+
+        # Act
+        squared = distances_to(Point2D(0, 0), [Point2D(2 ** 40 + 1, 0)], 'squared_euclidean')
+        manhattan = distances_to(origin, points, 'manhattan')
+        matrix = distance_matrix([Point2D(-10 ** 9, 10 ** 9)], [Point2D(10 ** 9, -10 ** 9)],
+                                 'squared_euclidean')
+        nearest = k_nearest(origin, points, 1, 'chebyshev')
+        euclidean = distances_to(Point2D(0, 0), [Point2D(3, 4)])
+
+        # Assert
+        self.assertEqual([(2 ** 40 + 1) ** 2], squared)
+        self.assertEqual([2 * 10 ** 9 + 2 ** 53 + 1, 2 * 10 ** 9 + 2 ** 53], manhattan)
+        self.assertEqual([[8 * 10 ** 18]], matrix)
+        self.assertEqual([1], nearest)
+        self.assertEqual(array('d', [5.0]), euclidean)
@@ -0,0 +1,218 @@
+"""
+Module containing the unittests for the FrozenPoint2D class
+"""
+import copy
+import pickle
+import unittest
+
+from src.grid_points.frozen_point_2d import FrozenPoint2D
+from src.grid_points.point_2d import Point2D
+
+
+class TestsFrozenPoint2D(unittest.TestCase):
+    """
+    Test cases for the FrozenPoint2D class
+    """
+    def test_01_properties(self):
+        """
+        Verify that the coordinates can be read
+        """
+        # Arrange
+        expected_x = 3
+        expected_y = 5
+        out = FrozenPoint2D(3, 5)
+
+        # Act
+        actual_x = out.x
+        actual_y = out.y
+
+        # Assert
+        self.assertEqual(expected_x, actual_x)
+        self.assertEqual(expected_y, actual_y)
+
+    def test_02_immutable(self):
+        """
+        Verify that the coordinates can not be changed and no new attributes can be added
+        """
+        # Arrange
+        out = FrozenPoint2D(3, 5)
+
+        # Act & Assert
+        with self.assertRaises(AttributeError):
+            out.x = 4
+
+        with self.assertRaises(AttributeError):
+            out.y = 6
+
+        with self.assertRaises(AttributeError):
+            out.z = 7  # pylint: disable=attribute-defined-outside-init
+
+        with self.assertRaises(AttributeError):
+            del out.x
+
+    def test_03_no_dict(self):
+        """
+        Verify that the instances do not carry a __dict__
+        """
+        # Arrange
+        out = FrozenPoint2D(3, 5)
+
+        # Act
+        has_dict = hasattr(out, '__dict__')
+
+        # Assert
+        self.assertFalse(has_dict)
+
+    def test_04_repr(self):
+        """
+        Verify __str__ and __repr__ work
+        """
+        # Arrange
+        out = FrozenPoint2D(3, 5)
+
+        # Act
+        actual_str = str(out)
+        actual_repr = repr(out)
+
+        # Assert
+        self.assertEqual('(3, 5)', actual_str)
+        self.assertEqual('FrozenPoint2D(3, 5)', actual_repr)
+
+    def test_05_hash_matches_point(self):
+        """
+        Verify that the cached hash is the same as the hash of an equal Point2D
+        """
+        # Arrange
+        out = FrozenPoint2D(3, 5)
+        mutable = Point2D(3, 5)
+
+        # Act
+        actual = hash(out)
+
+        # Assert
+        self.assertEqual(hash(mutable), actual)
+
+    def test_06_eq_mixed(self):
+        """
+        Verify equality works both ways between frozen and mutable points
+        """
+        # Arrange
+        out = FrozenPoint2D(3, 5)
+
+        # Act & Assert
+        self.assertEqual(out, Point2D(3, 5))
+        self.assertEqual(Point2D(3, 5), out)
+        self.assertNotEqual(out, FrozenPoint2D(3, 4))
+
+    def test_07_set_mixed(self):
+        """
+        Verify that frozen and mutable points can be looked up in the same set
+        """
+        # Arrange
+        visited = {FrozenPoint2D(1, 2), FrozenPoint2D(3, 4)}
+
+        # Act
+        is_mutable_inside = Point2D(1, 2) in visited
+        is_missing_inside = Point2D(2, 1) in visited
+
+        # Assert
+        self.assertTrue(is_mutable_inside)
+        self.assertFalse(is_missing_inside)
+
+    def test_08_arithmetic(self):
+        """
+        Verify that the arithmetic operators keep the frozen type
+        """
+        # Arrange
+        a = FrozenPoint2D(6, 12)
+        b = FrozenPoint2D(4, 6)
+
+        # Act
+        results = [a + b, a - b, a * b, a // b]
+
+        # Assert
+        self.assertEqual([Point2D(10, 18), Point2D(2, 6), Point2D(24, 72), Point2D(1, 2)],
+                         results)
+        for result in results:
+            self.assertIsInstance(result, FrozenPoint2D)
+
+    def test_09_arithmetic_mixed(self):
+        """
+        Verify that the arithmetic operators work with mutable points
+        """
+        # Arrange
+        frozen = FrozenPoint2D(1, 2)
+        mutable = Point2D(3, 4)
+
+        # Act
+        frozen_first = frozen + mutable
+        mutable_first = mutable + frozen
+
+        # Assert
+        self.assertEqual(Point2D(4, 6), frozen_first)
+        self.assertEqual(Point2D(4, 6), mutable_first)
+
+    def test_10_comparisons(self):
+        """
+        Verify that the comparison operators work with mutable points
+        """
+        # Arrange
+        a = FrozenPoint2D(3, 5)
+
+        # Act & Assert
+        self.assertTrue(a < Point2D(4, 6))
+        self.assertTrue(a <= Point2D(3, 5))
+        self.assertTrue(a > Point2D(2, 4))
+        self.assertTrue(a >= FrozenPoint2D(3, 5))
+        self.assertFalse(a < FrozenPoint2D(4, 5))
+
+    def test_11_distance_and_within(self):
+        """
+        Verify that distance_to and is_within work on frozen points
+        """
+        # Arrange
+        a = FrozenPoint2D(0, 0)
+        b = FrozenPoint2D(3, 4)
+
+        # Act
+        distance = a.distance_to(b)
+        is_inside = b.is_within(Point2D(4, 5))
+
+        # Assert
+        self.assertAlmostEqual(5.0, distance)
+        self.assertTrue(is_inside)
+
+    def test_12_pickle_and_copy(self):
+        """
+        Verify that frozen points survive pickling and copying
+        """
+        # Arrange
+        out = FrozenPoint2D(3, 5)
+
+        # Act
+        unpickled = pickle.loads(pickle.dumps(out))
+        copied = copy.deepcopy(out)
+
+        # Assert
+        self.assertEqual(out, unpickled)
+        self.assertIsInstance(unpickled, FrozenPoint2D)
+        self.assertEqual(hash(out), hash(unpickled))
+        self.assertIs(out, copied)
+
+    def test_13_freeze_thaw(self):
+        """
+        Verify the conversion from and to Point2D
+        """
+        # Arrange
+        mutable = Point2D(3, 5)
+
+        # Act
+        frozen = FrozenPoint2D.from_point(mutable)
+        thawed = frozen.thaw()
+        thawed.x = 4
+
+        # Assert
+        self.assertEqual(Point2D(3, 5), frozen)
+        self.assertIs(frozen, FrozenPoint2D.from_point(frozen))
+        self.assertNotIsInstance(thawed, FrozenPoint2D)
+        self.assertEqual(Point2D(4, 5), thawed)
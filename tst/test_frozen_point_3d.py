@@ -0,0 +1,225 @@
+"""
+Module containing the unittests for the FrozenPoint3D class
+"""
+import copy
+import pickle
+import unittest
+
+from src.grid_points.frozen_point_3d import FrozenPoint3D
+from src.grid_points.point_3d import Point3D
+
+
+class TestsFrozenPoint3D(unittest.TestCase):
+    """
+    Test cases for the FrozenPoint3D class
+    """
+    def test_01_properties(self):
+        """
+        Verify that the coordinates can be read
+        """
+        # Arrange
+        expected_x = 3
+        expected_y = 5
+        expected_z = 7
+        out = FrozenPoint3D(3, 5, 7)
+
+        # Act
+        actual_x = out.x
+        actual_y = out.y
+        actual_z = out.z
+
+        # Assert
+        self.assertEqual(expected_x, actual_x)
+        self.assertEqual(expected_y, actual_y)
+        self.assertEqual(expected_z, actual_z)
+
+    def test_02_immutable(self):
+        """
+        Verify that the coordinates can not be changed and no new attributes can be added
+        """
+        # Arrange
+        out = FrozenPoint3D(3, 5, 7)
+
+        # Act & Assert
+        with self.assertRaises(AttributeError):
+            out.x = 4
+
+        with self.assertRaises(AttributeError):
+            out.y = 6
+
+        with self.assertRaises(AttributeError):
+            out.z = 8
+
+        with self.assertRaises(AttributeError):
+            out.w = 7  # pylint: disable=attribute-defined-outside-init
+
+        with self.assertRaises(AttributeError):
+            del out.x
+
+    def test_03_no_dict(self):
+        """
+        Verify that the instances do not carry a __dict__
+        """
+        # Arrange
+        out = FrozenPoint3D(3, 5, 7)
+
+        # Act
+        has_dict = hasattr(out, '__dict__')
+
+        # Assert
+        self.assertFalse(has_dict)
+
+    def test_04_repr(self):
+        """
+        Verify __str__ and __repr__ work
+        """
+        # Arrange
+        out = FrozenPoint3D(3, 5, 7)
+
+        # Act
+        actual_str = str(out)
+        actual_repr = repr(out)
+
+        # Assert
+        self.assertEqual('(3, 5, 7)', actual_str)
+        self.assertEqual('FrozenPoint3D(3, 5, 7)', actual_repr)
+
+    def test_05_hash_matches_point(self):
+        """
+        Verify that the cached hash is the same as the hash of an equal Point3D
+        """
+        # Arrange
+        out = FrozenPoint3D(3, 5, 7)
+        mutable = Point3D(3, 5, 7)
+
+        # Act
+        actual = hash(out)
+
+        # Assert
+        self.assertEqual(hash(mutable), actual)
+
+    def test_06_eq_mixed(self):
+        """
+        Verify equality works both ways between frozen and mutable points
+        """
+        # Arrange
+        out = FrozenPoint3D(3, 5, 7)
+
+        # Act & Assert
+        self.assertEqual(out, Point3D(3, 5, 7))
+        self.assertEqual(Point3D(3, 5, 7), out)
+        self.assertNotEqual(out, FrozenPoint3D(3, 5, 6))
+
+    def test_07_set_mixed(self):
+        """
+        Verify that frozen and mutable points can be looked up in the same set
+        """
+        # Arrange
+        visited = {FrozenPoint3D(1, 2, 3), FrozenPoint3D(3, 4, 5)}
+
+        # Act
+        is_mutable_inside = Point3D(1, 2, 3) in visited
+        is_missing_inside = Point3D(3, 2, 1) in visited
+
+        # Assert
+        self.assertTrue(is_mutable_inside)
+        self.assertFalse(is_missing_inside)
+
+    def test_08_arithmetic(self):
+        """
+        Verify that the arithmetic operators keep the frozen type
+        """
+        # Arrange
+        a = FrozenPoint3D(6, 12, 9)
+        b = FrozenPoint3D(4, 6, 2)
+
+        # Act
+        results = [a + b, a - b, a * b, a // b]
+
+        # Assert
+        self.assertEqual([Point3D(10, 18, 11), Point3D(2, 6, 7), Point3D(24, 72, 18),
+                          Point3D(1, 2, 4)],
+                         results)
+        for result in results:
+            self.assertIsInstance(result, FrozenPoint3D)
+
+    def test_09_arithmetic_mixed(self):
+        """
+        Verify that the arithmetic operators work with mutable points
+        """
+        # Arrange
+        frozen = FrozenPoint3D(1, 2, 3)
+        mutable = Point3D(3, 4, 5)
+
+        # Act
+        frozen_first = frozen + mutable
+        mutable_first = mutable + frozen
+
+        # Assert
+        self.assertEqual(Point3D(4, 6, 8), frozen_first)
+        self.assertEqual(Point3D(4, 6, 8), mutable_first)
+
+    def test_10_comparisons(self):
+        """
+        Verify that the comparison operators work with mutable points
+        """
+        # Arrange
+        a = FrozenPoint3D(3, 5, 7)
+
+        # Act & Assert
+        self.assertTrue(a < Point3D(4, 6, 8))
+        self.assertTrue(a <= Point3D(3, 5, 7))
+        self.assertTrue(a > Point3D(2, 4, 6))
+        self.assertTrue(a >= FrozenPoint3D(3, 5, 7))
+        self.assertFalse(a < FrozenPoint3D(4, 5, 8))
+
+    def test_11_distance_and_within(self):
+        """
+        Verify that distance_to and is_within work on frozen points
+        """
+        # Arrange
+        a = FrozenPoint3D(0, 0, 0)
+        b = FrozenPoint3D(2, 3, 6)
+
+        # Act
+        distance = a.distance_to(b)
+        is_inside = b.is_within(Point3D(4, 5, 7))
+
+        # Assert
+        self.assertAlmostEqual(7.0, distance)
+        self.assertTrue(is_inside)
+
+    def test_12_pickle_and_copy(self):
+        """
+        Verify that frozen points survive pickling and copying
+        """
+        # Arrange
+        out = FrozenPoint3D(3, 5, 7)
+
+        # Act
+        unpickled = pickle.loads(pickle.dumps(out))
+        copied = copy.deepcopy(out)
+
+        # Assert
+        self.assertEqual(out, unpickled)
+        self.assertIsInstance(unpickled, FrozenPoint3D)
+        self.assertEqual(hash(out), hash(unpickled))
+        self.assertIs(out, copied)
+
+    def test_13_freeze_thaw(self):
+        """
+        Verify the conversion from and to Point3D
+        """
+        # Arrange
+        mutable = Point3D(3, 5, 7)
+
+        # Act
+        frozen = FrozenPoint3D.from_point(mutable)
+        thawed = frozen.thaw()
+        thawed.x = 4
+
+        # Assert
+        self.assertEqual(Point3D(3, 5, 7), frozen)
+        self.assertIs(frozen, FrozenPoint3D.from_point(frozen))
+        self.assertNotIsInstance(thawed, FrozenPoint3D)
+        self.assertEqual(Point3D(4, 5, 7), thawed)
@@ -0,0 +1,209 @@
+"""
+Module containing the unittests for the Grid2D class
+"""
+import pickle
+import unittest
+from array import array
+
+from src.grid_points.grid_2d import Grid2D
+from src.grid_points.grid_iterator_2d import GridIterator2D
+from src.grid_points.point_2d import Point2D
+
+
+class TestGrid2D(unittest.TestCase):
+    """
+    Test cases for the Grid2D class
+    """
+    def test_01_init(self):
+        """
+        Verify the bounds, shape and initial values of a new grid
+        """
+        # Arrange
+        upper_bounds = Point2D(4, 5)
+        lower_bounds = Point2D(1, -1)
+
+        # Act
+        out = Grid2D(upper_bounds, lower_bounds, 'b', fill=3)
+
+        # Assert
+        self.assertEqual(upper_bounds, out.end)
+        self.assertEqual(lower_bounds, out.start)
+        self.assertEqual((3, 6), out.shape)
+        self.assertEqual(18, len(out))
+        self.assertEqual('b', out.typecode)
+        self.assertEqual([3] * 18, list(out.values()))
+
+    def test_02_get_set_point(self):
+        """
+        Verify access by Point2D
+        """
+        # Arrange
+        out = Grid2D(Point2D(4, 5), Point2D(1, -1))
+        point = Point2D(2, 3)
+
+        # Act
+        out[point] = 42
+        actual = out[point]
+
+        # Assert
+        self.assertEqual(42, actual)
+        self.assertEqual(1, list(out.values()).count(42))
+
+    def test_03_get_set_coordinates(self):
+        """
+        Verify checked and unchecked access by raw coordinates
+        """
+        # Arrange
+        out = Grid2D(Point2D(4, 5), Point2D(1, -1))
+
+        # Act
+        out.set(3, -1, 7)
+        out.set_unchecked(1, 4, 8)
+
+        # Assert
+        self.assertEqual(7, out.get(3, -1))
+        self.assertEqual(7, out.get_unchecked(3, -1))
+        self.assertEqual(8, out[Point2D(1, 4)])
+
+    def test_04_out_of_bounds(self):
+        """
+        Verify that the checked access raises IndexError outside the grid
+        """
+        # Arrange
+        out = Grid2D(Point2D(4, 5), Point2D(1, -1))
+
+        # Act & Assert
+        with self.assertRaises(IndexError):
+            _ = out[Point2D(0, 0)]
+        with self.assertRaises(IndexError):
+            out[Point2D(4, 0)] = 1
+        with self.assertRaises(IndexError):
+            out.get(1, 5)
+        with self.assertRaises(IndexError):
+            out.set(1, -2, 1)
+
+    def test_05_layout(self):
+        """
+        Verify that the values are stored in the order of GridIterator2D
+        """
+        # Arrange
+        upper_bounds = Point2D(3, 4)
+        lower_bounds = Point2D(1, 1)
+        out = Grid2D(upper_bounds, lower_bounds)
+
+        # Act
+        for value, point in enumerate(GridIterator2D(upper_bounds, lower_bounds)):
+            out[point] = value
+
+        # Assert
+        self.assertEqual(list(range(6)), out.data.tolist())
+        self.assertEqual(list(GridIterator2D(upper_bounds, lower_bounds)), list(out))
+        self.assertEqual((Point2D(1, 2), 1), list(out.items())[1])
+
+    def test_06_contains(self):
+        """
+        Verify `in` checks the bounds of the grid
+        """
+        # Arrange
+        out = Grid2D(Point2D(4, 5), Point2D(1, -1))
+
+        # Act & Assert
+        self.assertIn(Point2D(1, -1), out)
+        self.assertIn(Point2D(3, 4), out)
+        self.assertNotIn(Point2D(4, 4), out)
+        self.assertNotIn((1, 1), out)
+
+    def test_07_fill(self):
+        """
+        Verify filling the whole grid and a region, which is clipped to the grid
+        """
+        # Arrange
+        out = Grid2D(Point2D(3, 3))
+
+        # Act
+        out.fill(1)
+        out.fill(5, Point2D(10, 2), Point2D(1, -4))
+
+        # Assert
+        self.assertEqual([1, 1, 1, 5, 5, 1, 5, 5, 1], out.data.tolist())
+
+    def test_08_copy(self):
+        """
+        Verify that a copy is equal, but does not share its buffer
+        """
+        # Arrange
+        out = Grid2D(Point2D(3, 3), typecode='d', fill=0.5)
+
+        # Act
+        copied = out.copy()
+        copied[Point2D(0, 0)] = 2.5
+
+        # Assert
+        self.assertEqual(0.5, out[Point2D(0, 0)])
+        self.assertNotEqual(out, copied)
+        copied[Point2D(0, 0)] = 0.5
+        self.assertEqual(out, copied)
+
+    def test_09_from_buffer(self):
+        """
+        Verify creating a grid over an existing buffer
+        """
+        # Arrange
+        data = array('H', range(6))
+
+        # Act
+        out = Grid2D.from_buffer(data, Point2D(3, 4), Point2D(1, 1))
+        out.set(2, 1, 9)
+
+        # Assert
+        self.assertEqual(1, out.get(1, 2))
+        self.assertEqual(9, data[3])
+        with self.assertRaises(ValueError):
+            Grid2D.from_buffer(data, Point2D(3, 3))
+
+    def test_10_neighbors(self):
+        """
+        Verify the neighbors of cells on the border and inside of the grid
+        """
+        # Arrange
+        out = Grid2D(Point2D(4, 5), Point2D(1, -1))
+
+        # Act & Assert
+        for connectivity in (4, 8):
+            for point in out:
+                expected = point.neighbors(connectivity, out.end, out.start)
+                indices = out.neighbor_indices(out.index(point.x, point.y), connectivity)
+
+                self.assertEqual(expected, out.neighbors(point, connectivity))
+                self.assertEqual([out.index(p.x, p.y) for p in expected], indices)
+
+    def test_11_pickle_and_array_interface(self):
+        """
+        Verify pickling with out-of-band buffers (which are shared, not copied) and
+        the description of the buffer for NumPy
+        """
+        # Arrange
+        grid = Grid2D(Point2D(4, 7), Point2D(1, 2), 'd')
+        for index in range(len(grid)):
+            grid.data[index] = index / 2
+
+        # Act
+        buffers: list = []
+        data = pickle.dumps(grid, 5, buffer_callback=buffers.append)
+        out = pickle.loads(data, buffers=buffers)
+        in_band = pickle.loads(pickle.dumps(grid, 2))
+        interface = grid.__array_interface__
+        out[Point2D(3, 4)] = -1.0
+
+        # Assert
+        self.assertEqual(grid, out)
+        self.assertEqual(-1.0, grid[Point2D(3, 4)])
+        self.assertEqual(6.0, in_band[Point2D(3, 4)])
+        self.assertIsInstance(out.data, memoryview)
+        self.assertIsInstance(in_band.data, array)
+        self.assertEqual('d', out.typecode)
+        self.assertEqual('d', in_band.typecode)
+        self.assertEqual(1, len(buffers))
+        self.assertEqual((3, 5), interface['shape'])
+        self.assertEqual('f8', interface['typestr'][1:])
+        self.assertIs(grid.data, interface['data'])
@@ -0,0 +1,135 @@
+"""
+Module containing the unittests for the Grid3D class
+"""
+import pickle
+import unittest
+
+from src.grid_points.grid_3d import Grid3D
+from src.grid_points.grid_iterator_3d import GridIterator3D
+from src.grid_points.point_3d import Point3D
+
+
+class TestGrid3D(unittest.TestCase):
+    """
+    Test cases for the Grid3D class
+    """
+    def test_01_init(self):
+        """
+        Verify the bounds, shape and initial values of a new grid
+        """
+        # Arrange
+        upper_bounds = Point3D(4, 5, 2)
+        lower_bounds = Point3D(1, -1, 0)
+
+        # Act
+        out = Grid3D(upper_bounds, lower_bounds, 'b', fill=3)
+
+        # Assert
+        self.assertEqual(upper_bounds, out.end)
+        self.assertEqual(lower_bounds, out.start)
+        self.assertEqual((3, 6, 2), out.shape)
+        self.assertEqual(36, len(out))
+        self.assertEqual([3] * 36, list(out.values()))
+
+    def test_02_access(self):
+        """
+        Verify access by Point3D and by raw coordinates
+        """
+        # Arrange
+        out = Grid3D(Point3D(4, 5, 2), Point3D(1, -1, 0))
+
+        # Act
+        out[Point3D(2, 3, 1)] = 42
+        out.set(3, -1, 0, 7)
+        out.set_unchecked(1, 4, 1, 8)
+
+        # Assert
+        self.assertEqual(42, out.get(2, 3, 1))
+        self.assertEqual(7, out.get_unchecked(3, -1, 0))
+        self.assertEqual(8, out[Point3D(1, 4, 1)])
+
+    def test_03_out_of_bounds(self):
+        """
+        Verify that the checked access raises IndexError outside the grid
+        """
+        # Arrange
+        out = Grid3D(Point3D(4, 5, 2), Point3D(1, -1, 0))
+
+        # Act & Assert
+        with self.assertRaises(IndexError):
+            _ = out[Point3D(1, 1, 2)]
+        with self.assertRaises(IndexError):
+            out.set(0, 0, 0, 1)
+
+    def test_04_layout(self):
+        """
+        Verify that the values are stored in the order of GridIterator3D
+        """
+        # Arrange
+        upper_bounds = Point3D(3, 4, 3)
+        lower_bounds = Point3D(1, 1, 1)
+        out = Grid3D(upper_bounds, lower_bounds)
+
+        # Act
+        for value, point in enumerate(GridIterator3D(upper_bounds, lower_bounds)):
+            out[point] = value
+
+        # Assert
+        self.assertEqual(list(range(12)), out.data.tolist())
+        self.assertEqual(list(GridIterator3D(upper_bounds, lower_bounds)), list(out))
+
+    def test_05_fill_copy(self):
+        """
+        Verify filling a region and copying
+        """
+        # Arrange
+        out = Grid3D(Point3D(2, 2, 2))
+
+        # Act
+        out.fill(5, Point3D(9, 1, 9), Point3D(0, 0, 1))
+        copied = out.copy()
+        copied.fill(0)
+
+        # Assert
+        self.assertEqual([0, 5, 0, 0, 0, 5, 0, 0], out.data.tolist())
+        self.assertEqual([0] * 8, copied.data.tolist())
+        self.assertIn(Point3D(1, 1, 1), out)
+        self.assertNotIn(Point3D(1, 1, 2), out)
+
+    def test_06_neighbors(self):
+        """
+        Verify the neighbors of cells on the border and inside of the grid
+        """
+        # Arrange
+        out = Grid3D(Point3D(3, 4, 5), Point3D(0, 1, -1))
+
+        # Act & Assert
+        for connectivity in (6, 26):
+            for point in out:
+                expected = point.neighbors(connectivity, out.end, out.start)
+                indices = out.neighbor_indices(out.index(point.x, point.y, point.z),
+                                               connectivity)
+
+                self.assertEqual(expected, out.neighbors(point, connectivity))
+                self.assertEqual([out.index(p.x, p.y, p.z) for p in expected], indices)
+
+    def test_07_pickle_and_array_interface(self):
+        """
+        Verify pickling with out-of-band buffers and the description of the buffer for NumPy
+        """
+        # Arrange
+        grid = Grid3D(Point3D(2, 3, 4), Point3D(0, 1, -1), 'B')
+        for index in range(len(grid)):
+            grid.data[index] = index
+
+        # Act
+        buffers: list = []
+        data = pickle.dumps(grid, 5, buffer_callback=buffers.append)
+        out = pickle.loads(data, buffers=buffers)
+        interface = grid.__array_interface__
+
+        # Assert
+        self.assertEqual(grid, out)
+        self.assertEqual(1, len(buffers))
+        self.assertEqual((2, 2, 5), interface['shape'])
+        self.assertEqual('|u1', interface['typestr'])
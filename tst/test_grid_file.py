@@ -0,0 +1,146 @@
+"""
+Module containing the unittests for the grid_file module
+"""
+import os
+import random
+import tempfile
+import unittest
+
+from src.grid_points.grid_2d import Grid2D
+from src.grid_points.grid_3d import Grid3D
+from src.grid_points.grid_file import HEADER, GridFile, save
+from src.grid_points.point_2d import Point2D
+from src.grid_points.point_3d import Point3D
+
+
+class TestGridFile(unittest.TestCase):
+    """
+    Test cases for the grid file format
+    """
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.path = os.path.join(self.directory.name, 'grid.bin')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_01_save_and_map_2d(self):
+        """
+        Verify that a saved 2D grid is mapped with the same bounds and values
+        """
+        # Arrange
+        generator = random.Random(17)
+        grid = Grid2D(Point2D(12, 9), Point2D(-3, 2), 'd')
+        for index in range(len(grid)):
+            grid.data[index] = generator.random()
+
+        # Act
+        save(grid, self.path)
+        with GridFile(self.path) as out:
+            mapped = out.grid
+
+            # Assert
+            self.assertEqual(grid, mapped)
+            self.assertEqual('d', mapped.typecode)
+            self.assertEqual(Point2D(-3, 2), mapped.start)
+            self.assertEqual(grid.get(5, 7), mapped.get(5, 7))
+            self.assertIsInstance(mapped.data, memoryview)
+            self.assertEqual(grid, mapped.copy())
+
+        self.assertEqual(HEADER.size + 15 * 7 * 8, os.path.getsize(self.path))
+
+    def test_02_save_and_map_3d(self):
+        """
+        Verify that a saved 3D grid is mapped with the same bounds and values
+        """
+        # Arrange
+        grid = Grid3D(Point3D(4, 5, 6), Point3D(1, -1, 2), 'h')
+        for index in range(len(grid)):
+            grid.data[index] = index - 30
+
+        # Act
+        save(grid, self.path)
+        with GridFile(self.path) as out:
+            # Assert
+            self.assertEqual(grid, out.grid)
+            self.assertEqual((3, 6, 4), out.grid.shape)
+
+    def test_03_modes(self):
+        """
+        Verify that read-only files reject changes, copy-on-write files keep them
+        in memory and writable files keep them in the file
+        """
+        # Arrange
+        save(Grid2D(Point2D(3, 3)), self.path)
+
+        # Act
+        with GridFile(self.path) as read_only:
+            self.assertRaises(TypeError, read_only.grid.set, 1, 1, 5)
+
+        with GridFile(self.path, 'c') as copy_on_write:
+            copy_on_write.grid.set(1, 1, 5)
+            changed_in_memory = copy_on_write.grid.get(1, 1)
+
+        with GridFile(self.path) as after_copy:
+            after_copy_value = after_copy.grid.get(1, 1)
+
+        with GridFile(self.path, 'r+') as writable:
+            writable.grid.set(2, 0, 7)
+            writable.grid.fill(3, Point2D(1, 3), Point2D(0, 1))
+
+        with GridFile(self.path) as after_write:
+            after_write_values = list(after_write.grid.values())
+
+        # Assert
+        self.assertEqual(5, changed_in_memory)
+        self.assertEqual(0, after_copy_value)
+        self.assertEqual([0, 3, 3, 0, 0, 0, 7, 0, 0], after_write_values)
+
+    def test_04_region(self):
+        """
+        Verify that a region is copied with its bounds and values
+        """
+        # Arrange
+        grid = Grid3D(Point3D(5, 6, 7), Point3D(0, 1, 2))
+        for index in range(len(grid)):
+            grid.data[index] = index
+        save(grid, self.path)
+
+        for start, end in [(Point3D(1, 2, 3), Point3D(4, 5, 6)),
+                           (Point3D(1, 1, 2), Point3D(3, 6, 7)),
+                           (Point3D(2, 3, 4), Point3D(3, 4, 5)),
+                           (Point3D(2, 3, 4), Point3D(2, 6, 7))]:
+            with GridFile(self.path) as out:
+                # Act
+                region = out.region(end, start)
+
+                # Assert
+                expected = Grid3D(end, start)
+                for point in expected:
+                    expected[point] = grid[point]
+                self.assertEqual(expected, region)
+                self.assertIsNot(out.grid.data, region.data)
+
+        with GridFile(self.path) as out:
+            self.assertEqual(grid, out.region(out.grid.end))
+            self.assertRaises(IndexError, out.region, Point3D(6, 6, 7))
+
+    def test_05_invalid_files(self):
+        """
+        Verify that files, which are not grid files, are rejected
+        """
+        # Arrange
+        save(Grid2D(Point2D(2, 2)), self.path)
+        with open(self.path, 'rb') as file:
+            content = file.read()
+        truncated = os.path.join(self.directory.name, 'truncated.bin')
+        with open(truncated, 'wb') as file:
+            file.write(content[:-1])
+        other = os.path.join(self.directory.name, 'other.bin')
+        with open(other, 'wb') as file:
+            file.write(b'not a grid file' * 10)
+
+        # Act & Assert
+        self.assertRaises(ValueError, GridFile, truncated)
+        self.assertRaises(ValueError, GridFile, other)
+        self.assertRaises(ValueError, GridFile, self.path, 'w')
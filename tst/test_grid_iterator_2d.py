@@ -4,6 +4,7 @@ Module containing the unittests for the GridIterator2D class
 
 import unittest
 
+from src.grid_points.box_2d import Box2D
 from src.grid_points.grid_iterator_2d import GridIterator2D
 from src.grid_points.point_2d import Point2D
 
@@ -85,3 +86,83 @@ class TestGridIterator2D(unittest.TestCase):
 
         # Assert
         self.assertEqual(expected_points, actual_points)
+
+    def test_05_blocks(self):
+        """
+        Verify that the blocks contain the same points as the point-at-a-time iteration
+        """
+        # Arrange
+        upper_bounds = Point2D(3, 4)
+        lower_bounds = Point2D(1, 1)
+        iterator = GridIterator2D(upper_bounds, lower_bounds)
+        expected_points = list(GridIterator2D(upper_bounds, lower_bounds))
+
+        # Act
+        blocks = list(iterator.blocks(4))
+
+        # Assert
+        self.assertEqual([4, 2], [len(block) for block in blocks])
+        self.assertEqual(expected_points, [point for block in blocks for point in block])
+
+    def test_06_box(self):
+        """
+        Verify that iterating over a box is the same as iterating over its bounds
+        """
+        # Arrange
+        end, start = Point2D(3, 4), Point2D(1, -1)
+
+        # Act
+        actual = list(GridIterator2D(Box2D(end, start)))
+
+        # Assert
+        self.assertEqual(list(GridIterator2D(end, start)), actual)
+
+    def test_07_curve_orders(self):
+        """
+        Verify the Morton and Hilbert orders, also on a grid, which is not a power of 2
+        """
+        # Arrange
+        end = Point2D(4, 4)
+        expected_morton = [Point2D(0, 0), Point2D(0, 1), Point2D(1, 0), Point2D(1, 1),
+                           Point2D(0, 2), Point2D(0, 3), Point2D(1, 2), Point2D(1, 3)]
+
+        # Act
+        morton = list(GridIterator2D(end, order='morton'))
+        hilbert = list(GridIterator2D(end, order='hilbert'))
+        clipped = list(GridIterator2D(Point2D(5, 2), Point2D(2, -1), 'morton'))
+
+        # Assert
+        self.assertEqual(expected_morton, morton[:8])
+        self.assertEqual(set(GridIterator2D(end)), set(hilbert))
+        for previous, current in zip(hilbert, hilbert[1:]):
+            self.assertEqual(1, previous.distance_to(current))
+        self.assertEqual([Point2D(2, -1), Point2D(2, 0), Point2D(3, -1), Point2D(3, 0),
+                          Point2D(2, 1), Point2D(3, 1), Point2D(4, -1), Point2D(4, 0),
+                          Point2D(4, 1)], clipped)
+
+    def test_08_steps_axes_and_tiles(self):
+        """
+        Verify reversed and strided steps, column-major order and tiles
+        """
+        # Arrange
+        end, start = Point2D(5, 5), Point2D(0, 0)
+
+        # Act
+        reversed_strided = list(GridIterator2D(end, start, step=Point2D(2, -2), axes='yx'))
+        tiled = list(GridIterator2D(Point2D(4, 3), tile=Point2D(2, 2)))
+        blocks = list(GridIterator2D(Point2D(4, 3), tile=Point2D(2, 2)).blocks(5))
+
+        # Assert
+        self.assertEqual([Point2D(0, 4), Point2D(2, 4), Point2D(4, 4),
+                          Point2D(0, 2), Point2D(2, 2), Point2D(4, 2),
+                          Point2D(0, 0), Point2D(2, 0), Point2D(4, 0)], reversed_strided)
+        self.assertEqual([Point2D(0, 0), Point2D(0, 1), Point2D(1, 0), Point2D(1, 1),
+                          Point2D(0, 2), Point2D(1, 2),
+                          Point2D(2, 0), Point2D(2, 1), Point2D(3, 0), Point2D(3, 1),
+                          Point2D(2, 2), Point2D(3, 2)], tiled)
+        self.assertEqual([5, 5, 2], [len(block) for block in blocks])
+        self.assertEqual(tiled, [point for block in blocks for point in block])
+        self.assertRaises(ValueError, GridIterator2D, end, start, step=Point2D(0, 1))
+        self.assertRaises(ValueError, GridIterator2D, end, start, axes='xx')
+        self.assertRaises(ValueError, GridIterator2D, end, start, tile=Point2D(2, 0))
+        self.assertRaises(ValueError, GridIterator2D, end, start, 'morton', axes='yx')
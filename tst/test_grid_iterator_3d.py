@@ -4,6 +4,7 @@ Module containing the unittests for the GridIterator3D class
 
 import unittest
 
+from src.grid_points.box_3d import Box3D
 from src.grid_points.grid_iterator_3d import GridIterator3D
 from src.grid_points.point_3d import Point3D
 
@@ -114,3 +115,81 @@ class TestGridIterator3D(unittest.TestCase):
 
         # Assert
         self.assertEqual(expected_points, actual_points)
+
+    def test_05_blocks(self):
+        """
+        Verify that the blocks contain the same points as the point-at-a-time iteration
+        """
+        # Arrange
+        upper_bounds = Point3D(3, 4, 3)
+        lower_bounds = Point3D(1, 1, 1)
+        iterator = GridIterator3D(upper_bounds, lower_bounds)
+        expected_points = list(GridIterator3D(upper_bounds, lower_bounds))
+
+        # Act
+        blocks = list(iterator.blocks(5))
+
+        # Assert
+        self.assertEqual([5, 5, 2], [len(block) for block in blocks])
+        self.assertEqual(expected_points, [point for block in blocks for point in block])
+
+    def test_06_box(self):
+        """
+        Verify that iterating over a box is the same as iterating over its bounds
+        """
+        # Arrange
+        end, start = Point3D(3, 4, 2), Point3D(1, -1, 0)
+
+        # Act
+        actual = list(GridIterator3D(Box3D(end, start)))
+
+        # Assert
+        self.assertEqual(list(GridIterator3D(end, start)), actual)
+
+    def test_07_curve_orders(self):
+        """
+        Verify that the curve orders visit every point once, with consecutive Hilbert points
+        being neighbors, and that the blocks follow the same order
+        """
+        # Arrange
+        end, start = Point3D(4, 3, 5), Point3D(0, -1, 1)
+        expected = set(GridIterator3D(end, start))
+
+        # Act
+        morton = list(GridIterator3D(end, start, 'morton'))
+        hilbert = list(GridIterator3D(end, start, 'hilbert'))
+        blocks = list(GridIterator3D(end, start, 'hilbert').blocks(8))
+
+        # Assert
+        self.assertEqual(Point3D(0, -1, 1), morton[0])
+        self.assertEqual(len(expected), len(morton))
+        self.assertEqual(expected, set(morton))
+        self.assertEqual(expected, set(hilbert))
+        self.assertEqual(hilbert, [point for block in blocks for point in block])
+        self.assertTrue(all(len(block) <= 8 for block in blocks))
+        self.assertRaises(ValueError, GridIterator3D, end, start, 'snake')
+
+    def test_08_steps_axes_and_tiles(self):
+        """
+        Verify that any order of the axes, reversed steps and tiles visit the expected cells
+        """
+        # Arrange
+        end, start = Point3D(4, 3, 5), Point3D(1, 0, -1)
+        expected = set(GridIterator3D(end, start))
+
+        # Act
+        fastest_x = list(GridIterator3D(end, start, axes='zyx'))
+        backwards = list(GridIterator3D(end, start, step=Point3D(-1, -1, -1)))
+        tiled = list(GridIterator3D(end, start, tile=Point3D(2, 2, 2), axes='yxz'))
+        strided = list(GridIterator3D(end, start, step=Point3D(2, 3, -4)))
+
+        # Assert
+        self.assertEqual([Point3D(1, 0, -1), Point3D(2, 0, -1), Point3D(3, 0, -1),
+                          Point3D(1, 1, -1)], fastest_x[:4])
+        self.assertEqual(expected, set(fastest_x))
+        self.assertEqual(list(reversed(list(GridIterator3D(end, start)))), backwards)
+        self.assertEqual(expected, set(tiled))
+        self.assertEqual([Point3D(1, 0, -1), Point3D(1, 0, 0), Point3D(2, 0, -1),
+                          Point3D(2, 0, 0)], tiled[:4])
+        self.assertEqual([Point3D(1, 0, 4), Point3D(1, 0, 0),
+                          Point3D(3, 0, 4), Point3D(3, 0, 0)], strided)
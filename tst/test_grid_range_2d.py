@@ -0,0 +1,216 @@
+"""
+Module containing the unittests for the GridRange2D class
+"""
+import unittest
+
+from src.grid_points.box_2d import Box2D
+from src.grid_points.grid_iterator_2d import GridIterator2D
+from src.grid_points.grid_range_2d import GridRange2D
+from src.grid_points.point_2d import Point2D
+
+
+class TestGridRange2D(unittest.TestCase):
+    """
+    Test cases for the GridRange2D class
+    """
+    def test_01_same_order_as_iterator(self):
+        """
+        Verify that the range returns the same points as GridIterator2D and is reusable
+        """
+        # Arrange
+        upper_bounds = Point2D(3, 4)
+        lower_bounds = Point2D(1, -1)
+        out = GridRange2D(upper_bounds, lower_bounds)
+
+        # Act
+        first_pass = list(out)
+        second_pass = list(out)
+
+        # Assert
+        self.assertEqual(list(GridIterator2D(upper_bounds, lower_bounds)), first_pass)
+        self.assertEqual(first_pass, second_pass)
+
+    def test_02_len(self):
+        """
+        Verify len() for regular, empty and inverted bounds
+        """
+        # Act & Assert
+        self.assertEqual(6, len(GridRange2D(Point2D(2, 3))))
+        self.assertEqual(0, len(GridRange2D(Point2D(0, 3))))
+        self.assertEqual(0, len(GridRange2D(Point2D(1, 1), Point2D(3, 0))))
+        self.assertEqual(10 ** 12, len(GridRange2D(Point2D(10 ** 6, 10 ** 6))))
+
+    def test_03_getitem(self):
+        """
+        Verify indexing, including negative indices and indices out of range
+        """
+        # Arrange
+        out = GridRange2D(Point2D(2, 3))
+
+        # Act
+        fourth = out[3]
+        last = out[-1]
+
+        # Assert
+        self.assertEqual(Point2D(1, 0), fourth)
+        self.assertEqual(Point2D(1, 2), last)
+        with self.assertRaises(IndexError):
+            _ = out[6]
+
+    def test_04_slicing(self):
+        """
+        Verify that slicing returns a lazy range with the selected points
+        """
+        # Arrange
+        out = GridRange2D(Point2D(2, 3))
+        points = list(out)
+
+        # Act
+        tail = out[2:]
+        every_other = out[::2]
+        nested = out[1:][::2]
+
+        # Assert
+        self.assertIsInstance(tail, GridRange2D)
+        self.assertEqual(points[2:], list(tail))
+        self.assertEqual(points[::2], list(every_other))
+        self.assertEqual(points[1:][::2], list(nested))
+        self.assertEqual(4, len(tail))
+
+    def test_05_contains(self):
+        """
+        Verify `in` for the full range and for slices
+        """
+        # Arrange
+        out = GridRange2D(Point2D(3, 4), Point2D(1, 1))
+        every_other = out[::2]
+
+        # Act & Assert
+        self.assertIn(Point2D(2, 3), out)
+        self.assertNotIn(Point2D(3, 3), out)
+        self.assertNotIn(Point2D(0, 1), out)
+        self.assertIn(Point2D(1, 1), every_other)
+        self.assertNotIn(Point2D(1, 2), every_other)
+        self.assertNotIn((1, 1), out)
+
+    def test_06_index_count(self):
+        """
+        Verify index() and count()
+        """
+        # Arrange
+        out = GridRange2D(Point2D(3, 4), Point2D(1, 1))
+
+        # Act
+        positions = [out.index(point) for point in out]
+
+        # Assert
+        self.assertEqual(list(range(len(out))), positions)
+        self.assertEqual(1, out.count(Point2D(2, 2)))
+        self.assertEqual(0, out.count(Point2D(5, 5)))
+        self.assertEqual(1, out[::-1].index(Point2D(2, 2)))
+        with self.assertRaises(ValueError):
+            out.index(Point2D(5, 5))
+        with self.assertRaises(ValueError):
+            out.index(Point2D(1, 1), 1)
+
+    def test_07_reversed(self):
+        """
+        Verify reversed() on the full range and on a slice
+        """
+        # Arrange
+        out = GridRange2D(Point2D(2, 3))
+        points = list(out)
+
+        # Act
+        actual = list(reversed(out))
+        actual_slice = list(reversed(out[1:4]))
+
+        # Assert
+        self.assertEqual(points[::-1], actual)
+        self.assertEqual(points[1:4][::-1], actual_slice)
+
+    def test_08_flat_index(self):
+        """
+        Verify the conversion between points and flat indices
+        """
+        # Arrange
+        out = GridRange2D(Point2D(3, 4), Point2D(1, 1))
+
+        # Act
+        flat_index = out.flat_index(Point2D(2, 1))
+        outside = out.flat_index(Point2D(3, 1))
+
+        # Assert
+        self.assertEqual(3, flat_index)
+        self.assertIsNone(outside)
+        self.assertEqual(Point2D(2, 1), out.point_at(3))
+
+    def test_09_eq_repr(self):
+        """
+        Verify equality and that repr() describes slices
+        """
+        # Arrange
+        out = GridRange2D(Point2D(2, 3))
+
+        # Act & Assert
+        self.assertEqual(GridRange2D(Point2D(2, 3), Point2D(0, 0)), out)
+        self.assertNotEqual(out[1:], out)
+        self.assertEqual('GridRange2D(Point2D(2, 3), Point2D(0, 0))', repr(out))
+        self.assertEqual('GridRange2D(Point2D(2, 3), Point2D(0, 0))[5::-1]', repr(out[::-1]))
+
+    def test_10_blocks(self):
+        """
+        Verify that iterating in blocks returns the same points, split by the block size
+        """
+        # Arrange
+        out = GridRange2D(Point2D(7, 5), Point2D(-1, 2))
+        points = list(out)
+
+        # Act
+        blocks = list(out.blocks(4))
+
+        # Assert
+        self.assertEqual([4] * 6, [len(block) for block in blocks])
+        self.assertEqual(points, [point for block in blocks for point in block])
+
+    def test_11_blocks_slices(self):
+        """
+        Verify iterating in blocks over contiguous and strided slices
+        """
+        # Arrange
+        out = GridRange2D(Point2D(7, 5), Point2D(-1, 2))
+        contiguous = out[5:17]
+        strided = out[3:][::-2]
+
+        # Act
+        contiguous_points = [point for block in contiguous.blocks(5) for point in block]
+        strided_points = [point for block in strided.blocks(5) for point in block]
+
+        # Assert
+        self.assertEqual(list(contiguous), contiguous_points)
+        self.assertEqual(list(strided), strided_points)
+
+    def test_12_blocks_invalid_size(self):
+        """
+        Verify that the block size must be positive
+        """
+        # Arrange
+        out = GridRange2D(Point2D(2, 2))
+
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            next(out.blocks(0))
+
+    def test_13_box(self):
+        """
+        Verify that a range over a box is the same as a range over its bounds
+        """
+        # Arrange
+        end, start = Point2D(3, 4), Point2D(1, -1)
+
+        # Act
+        out = GridRange2D(Box2D(end, start))
+
+        # Assert
+        self.assertEqual(GridRange2D(end, start), out)
+        self.assertEqual(Box2D(end, start).volume, len(out))
@@ -0,0 +1,123 @@
+"""
+Module containing the unittests for the GridRange3D class
+"""
+import unittest
+
+from src.grid_points.box_3d import Box3D
+from src.grid_points.grid_iterator_3d import GridIterator3D
+from src.grid_points.grid_range_3d import GridRange3D
+from src.grid_points.point_3d import Point3D
+
+
+class TestGridRange3D(unittest.TestCase):
+    """
+    Test cases for the GridRange3D class
+    """
+    def test_01_same_order_as_iterator(self):
+        """
+        Verify that the range returns the same points as GridIterator3D and is reusable
+        """
+        # Arrange
+        upper_bounds = Point3D(3, 4, 2)
+        lower_bounds = Point3D(1, -1, 0)
+        out = GridRange3D(upper_bounds, lower_bounds)
+
+        # Act
+        first_pass = list(out)
+        second_pass = list(out)
+
+        # Assert
+        self.assertEqual(list(GridIterator3D(upper_bounds, lower_bounds)), first_pass)
+        self.assertEqual(first_pass, second_pass)
+
+    def test_02_len(self):
+        """
+        Verify len() for regular and empty bounds
+        """
+        # Act & Assert
+        self.assertEqual(8, len(GridRange3D(Point3D(2, 2, 2))))
+        self.assertEqual(0, len(GridRange3D(Point3D(2, 2, 0))))
+        self.assertEqual(10 ** 18, len(GridRange3D(Point3D(10 ** 6, 10 ** 6, 10 ** 6))))
+
+    def test_03_getitem_slicing(self):
+        """
+        Verify indexing and slicing
+        """
+        # Arrange
+        out = GridRange3D(Point3D(2, 2, 2))
+        points = list(out)
+
+        # Act
+        third = out[2]
+        last = out[-1]
+        tail = out[3::2]
+
+        # Assert
+        self.assertEqual(Point3D(0, 1, 0), third)
+        self.assertEqual(Point3D(1, 1, 1), last)
+        self.assertEqual(points[3::2], list(tail))
+        with self.assertRaises(IndexError):
+            _ = out[8]
+
+    def test_04_contains_index(self):
+        """
+        Verify `in`, index() and count()
+        """
+        # Arrange
+        out = GridRange3D(Point3D(3, 4, 2), Point3D(1, -1, 0))
+
+        # Act
+        positions = [out.index(point) for point in out]
+
+        # Assert
+        self.assertEqual(list(range(len(out))), positions)
+        self.assertIn(Point3D(2, 3, 1), out)
+        self.assertNotIn(Point3D(2, 3, 2), out)
+        self.assertEqual(0, out[1:].count(Point3D(1, -1, 0)))
+        with self.assertRaises(ValueError):
+            out.index(Point3D(0, 0, 0))
+
+    def test_05_reversed(self):
+        """
+        Verify reversed()
+        """
+        # Arrange
+        out = GridRange3D(Point3D(2, 3, 2))
+
+        # Act
+        actual = list(reversed(out))
+
+        # Assert
+        self.assertEqual(list(out)[::-1], actual)
+        self.assertEqual(list(out)[::-1], list(out[::-1]))
+
+    def test_06_blocks(self):
+        """
+        Verify that iterating in blocks returns the same points, including over a slice
+        """
+        # Arrange
+        out = GridRange3D(Point3D(4, 3, 5), Point3D(1, -1, 2))
+        contiguous = out[4:40]
+
+        # Act
+        blocks = list(out.blocks(7))
+        slice_points = [point for block in contiguous.blocks(7) for point in block]
+
+        # Assert
+        self.assertEqual([7] * 5 + [1], [len(block) for block in blocks])
+        self.assertEqual(list(out), [point for block in blocks for point in block])
+        self.assertEqual(list(contiguous), slice_points)
+
+    def test_07_box(self):
+        """
+        Verify that a range over a box is the same as a range over its bounds
+        """
+        # Arrange
+        end, start = Point3D(3, 4, 2), Point3D(1, -1, 0)
+
+        # Act
+        out = GridRange3D(Box3D(end, start))
+
+        # Assert
+        self.assertEqual(GridRange3D(end, start), out)
+        self.assertEqual(Box3D(end, start).volume, len(out))
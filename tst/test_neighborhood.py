@@ -0,0 +1,52 @@
+"""
+Module containing the unittests for the neighborhood module
+"""
+import unittest
+
+from src.grid_points.neighborhood import offsets_2d, offsets_3d
+
+
+class TestNeighborhood(unittest.TestCase):
+    """
+    Test cases for the neighborhood module
+    """
+    def test_01_offsets_2d(self):
+        """
+        Verify the amount, uniqueness and order of the 2D offsets
+        """
+        # Act
+        von_neumann = offsets_2d(4)
+        moore = offsets_2d(8)
+
+        # Assert
+        self.assertEqual(((-1, 0), (0, -1), (0, 1), (1, 0)), von_neumann)
+        self.assertEqual(8, len(set(moore)))
+        self.assertEqual(sorted(moore), list(moore))
+        self.assertNotIn((0, 0), moore)
+        self.assertTrue(all(max(map(abs, offset)) == 1 for offset in moore))
+
+    def test_02_offsets_3d(self):
+        """
+        Verify the amount, uniqueness and order of the 3D offsets
+        """
+        # Act
+        von_neumann = offsets_3d(6)
+        moore = offsets_3d(26)
+
+        # Assert
+        self.assertEqual(6, len(set(von_neumann)))
+        self.assertEqual(sorted(von_neumann), list(von_neumann))
+        self.assertTrue(all(sum(map(abs, offset)) == 1 for offset in von_neumann))
+        self.assertEqual(26, len(set(moore)))
+        self.assertEqual(sorted(moore), list(moore))
+        self.assertNotIn((0, 0, 0), moore)
+
+    def test_03_invalid_connectivity(self):
+        """
+        Verify that unsupported connectivities are rejected
+        """
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            offsets_2d(6)
+        with self.assertRaises(ValueError):
+            offsets_3d(8)
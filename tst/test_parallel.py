@@ -0,0 +1,167 @@
+"""
+Module containing the unittests for the parallel grid traversal functions
+"""
+import pickle
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from operator import add
+
+from src.grid_points.grid_range_2d import GridRange2D
+from src.grid_points.grid_range_3d import GridRange3D
+from src.grid_points.parallel import parallel_map, parallel_map_reduce, partition
+from src.grid_points.point_2d import Point2D
+from src.grid_points.point_3d import Point3D
+
+
+def cell_value(point: Point2D) -> int:
+    """
+    Per-cell function used by the tests
+    """
+    return point.x * 100 + point.y
+
+
+def block_sum(block) -> int:
+    """
+    Per-block function used by the tests
+    """
+    return sum(block.xs) + sum(block.ys) + sum(block.zs)
+
+
+def concatenate(left: str, right: str) -> str:
+    """
+    Associative, but not commutative reducer used by the tests
+    """
+    return left + right
+
+
+class TestParallel(unittest.TestCase):
+    """
+    Test cases for the parallel grid traversal functions
+    """
+    def test_01_partition(self):
+        """
+        Verify that the shards are contiguous, balanced and cover the whole grid
+        """
+        # Arrange
+        grid = GridRange2D(Point2D(5, 3))
+
+        # Act
+        shards = partition(grid, 4)
+
+        # Assert
+        self.assertEqual([3, 4, 4, 4], [len(shard) for shard in shards])
+        self.assertEqual(list(grid), [point for shard in shards for point in shard])
+
+    def test_02_partition_more_shards_than_cells(self):
+        """
+        Verify that no empty shards are created
+        """
+        # Arrange
+        grid = GridRange2D(Point2D(1, 2))
+
+        # Act
+        shards = partition(grid, 5)
+
+        # Assert
+        self.assertEqual([1, 1], [len(shard) for shard in shards])
+        with self.assertRaises(ValueError):
+            partition(grid, 0)
+
+    def test_03_shards_pickle_as_bounds(self):
+        """
+        Verify that the size of a pickled shard does not depend on the size of the grid
+        """
+        # Arrange
+        small = partition(GridRange2D(Point2D(10, 10)), 2)[1]
+        large = partition(GridRange2D(Point2D(10 ** 6, 10 ** 6)), 2)[1]
+
+        # Act
+        small_size = len(pickle.dumps(small))
+        large_size = len(pickle.dumps(large))
+
+        # Assert
+        self.assertLess(large_size, small_size + 32)
+        self.assertEqual(list(small), list(pickle.loads(pickle.dumps(small))))
+
+    def test_04_map_reduce_threads(self):
+        """
+        Verify map/reduce over the cells with a thread pool
+        """
+        # Arrange
+        grid = GridRange2D(Point2D(7, 9), Point2D(-2, 1))
+        expected = sum(map(cell_value, grid))
+
+        # Act
+        actual = parallel_map_reduce(cell_value, add, grid, 0, executor='thread',
+                                     max_workers=3)
+
+        # Assert
+        self.assertEqual(expected, actual)
+
+    def test_05_deterministic_order(self):
+        """
+        Verify that the results are combined in the order of the grid
+        """
+        # Arrange
+        grid = GridRange2D(Point2D(4, 4))
+        expected = ''.join(str(point) for point in grid)
+
+        # Act
+        actual = parallel_map_reduce(str, concatenate, grid, '', executor='thread',
+                                     max_workers=4, shards=7)
+
+        # Assert
+        self.assertEqual(expected, actual)
+
+    def test_06_map_reduce_processes_blocks(self):
+        """
+        Verify map/reduce over blocks with a process pool
+        """
+        # Arrange
+        grid = GridRange3D(Point3D(6, 5, 4), Point3D(0, -1, 2))
+        expected = sum(point.x + point.y + point.z for point in grid)
+
+        # Act
+        actual = parallel_map_reduce(block_sum, add, grid, 0, executor='process',
+                                     max_workers=2, block_size=16)
+
+        # Assert
+        self.assertEqual(expected, actual)
+
+    def test_07_parallel_map(self):
+        """
+        Verify that parallel_map returns the results in the order of the grid
+        """
+        # Arrange
+        grid = GridRange2D(Point2D(5, 6))
+
+        # Act
+        with ThreadPoolExecutor(2) as executor:
+            actual = parallel_map(cell_value, grid, executor=executor, shards=4)
+
+        # Assert
+        self.assertEqual([cell_value(point) for point in grid], actual)
+
+    def test_08_empty_grid(self):
+        """
+        Verify that the initial value is returned for an empty grid
+        """
+        # Arrange
+        grid = GridRange2D(Point2D(0, 5))
+
+        # Act
+        actual = parallel_map_reduce(cell_value, add, grid, 42, executor='thread')
+
+        # Assert
+        self.assertEqual(42, actual)
+
+    def test_09_unknown_executor(self):
+        """
+        Verify that an unknown executor name is rejected
+        """
+        # Arrange
+        grid = GridRange2D(Point2D(2, 2))
+
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            parallel_map(cell_value, grid, executor='cluster')
@@ -0,0 +1,166 @@
+"""
+Module containing the unittests for the pathfinding module
+"""
+import unittest
+
+from src.grid_points.grid_2d import Grid2D
+from src.grid_points.grid_3d import Grid3D
+from src.grid_points.pathfinding import astar, bfs, dijkstra
+from src.grid_points.point_2d import Point2D
+from src.grid_points.point_3d import Point3D
+
+MAZE = ["..#....",
+        ".#..##.",
+        "...#...",
+        "##.#.#.",
+        "...#.#."]
+
+
+def create_maze() -> Grid2D:
+    """
+    Create a grid from MAZE, where walls are 1 and free cells are 0
+    """
+    grid = Grid2D(Point2D(len(MAZE), len(MAZE[0])))
+    for x, line in enumerate(MAZE):
+        for y, char in enumerate(line):
+            grid.set(x, y, int(char == '#'))
+
+    return grid
+
+
+def is_free(value: int) -> bool:
+    """
+    Return if a cell of the maze can be entered
+    """
+    return value == 0
+
+
+class TestPathfinding(unittest.TestCase):
+    """
+    Test cases for the pathfinding module
+    """
+    def assert_valid_path(self, grid, path, start, goal, connectivity):
+        """
+        Verify that a path is connected, free and goes from start to goal
+        """
+        self.assertEqual(start, path[0])
+        self.assertEqual(goal, path[-1])
+        for first, second in zip(path, path[1:]):
+            self.assertIn(second, grid.neighbors(first, connectivity))
+            self.assertEqual(0, grid[second])
+
+    def test_01_bfs(self):
+        """
+        Verify the shortest path in a maze
+        """
+        # Arrange
+        grid = create_maze()
+        start, goal = Point2D(4, 0), Point2D(4, 6)
+
+        # Act
+        result = bfs(grid, start, goal, is_free)
+
+        # Assert
+        self.assertIsNotNone(result)
+        steps, path = result
+        self.assertEqual(14, steps)
+        self.assertEqual(15, len(path))
+        self.assert_valid_path(grid, path, start, goal, 4)
+
+    def test_02_unreachable(self):
+        """
+        Verify that None is returned when the goal can not be reached
+        """
+        # Arrange
+        grid = create_maze()
+        grid.set(1, 3, 1)
+
+        # Act & Assert
+        self.assertIsNone(bfs(grid, Point2D(0, 0), Point2D(0, 6), is_free))
+        self.assertIsNone(dijkstra(grid, Point2D(0, 0), Point2D(0, 6), is_free))
+        self.assertIsNone(astar(grid, Point2D(0, 0), Point2D(0, 6), is_free))
+
+    def test_03_same_start_and_goal(self):
+        """
+        Verify the path from a cell to itself
+        """
+        # Arrange
+        grid = create_maze()
+
+        # Act & Assert
+        self.assertEqual((0, [Point2D(0, 0)]), bfs(grid, Point2D(0, 0), Point2D(0, 0)))
+        self.assertEqual((0, [Point2D(0, 0)]), astar(grid, Point2D(0, 0), Point2D(0, 0)))
+
+    def test_04_weighted(self):
+        """
+        Verify that Dijkstra and A* avoid expensive cells and agree on the cost
+        """
+        # Arrange
+        grid = Grid2D(Point2D(5, 5), fill=1)
+        grid.fill(9, Point2D(4, 4), Point2D(0, 1))
+        start, goal = Point2D(0, 0), Point2D(0, 4)
+
+        # Act
+        dijkstra_result = dijkstra(grid, start, goal, cost=lambda value: value)
+        astar_result = astar(grid, start, goal, cost=lambda value: value)
+
+        # Assert
+        self.assertEqual(12, dijkstra_result[0])
+        self.assertEqual(12, astar_result[0])
+        self.assertEqual(13, len(astar_result[1]))
+        self.assertNotIn(Point2D(0, 2), astar_result[1])
+
+    def test_05_astar_matches_bfs(self):
+        """
+        Verify that A* finds paths as short as BFS for every goal in the maze
+        """
+        # Arrange
+        grid = create_maze()
+        start = Point2D(0, 0)
+
+        # Act & Assert
+        for connectivity in (4, 8):
+            for goal in grid:
+                if grid[goal]:
+                    continue
+
+                expected = bfs(grid, start, goal, is_free, connectivity)
+                actual = astar(grid, start, goal, is_free, connectivity=connectivity)
+
+                self.assertEqual(expected is None, actual is None)
+                if expected is not None:
+                    self.assertEqual(expected[0], actual[0])
+                    self.assert_valid_path(grid, actual[1], start, goal, connectivity)
+
+    def test_06_3d(self):
+        """
+        Verify a search through a wall with a single hole in 3D
+        """
+        # Arrange
+        grid = Grid3D(Point3D(3, 3, 3), Point3D(0, 0, -1))
+        grid.fill(1, Point3D(3, 3, 2), Point3D(0, 0, 1))
+        grid.set(2, 2, 1, 0)
+        start, goal = Point3D(0, 0, 0), Point3D(0, 0, 2)
+
+        # Act
+        steps, path = bfs(grid, start, goal, is_free)
+        cost, diagonal = astar(grid, start, goal, is_free, connectivity=26)
+
+        # Assert
+        self.assertEqual(10, steps)
+        self.assertIn(Point3D(2, 2, 1), path)
+        self.assertEqual(4, cost)
+        self.assertIn(Point3D(2, 2, 1), diagonal)
+
+    def test_07_invalid_arguments(self):
+        """
+        Verify the errors for points outside the grid and unknown heuristics
+        """
+        # Arrange
+        grid = create_maze()
+
+        # Act & Assert
+        with self.assertRaises(IndexError):
+            bfs(grid, Point2D(0, 0), Point2D(9, 9))
+        with self.assertRaises(ValueError):
+            astar(grid, Point2D(0, 0), Point2D(0, 1), heuristic='euclidean')
@@ -1,6 +1,7 @@
 """
 Module containing the unittests for the Point2D class
 """
+import pickle
 import unittest
 
 from src.grid_points.point_2d import Point2D
@@ -433,3 +434,41 @@ class TestsPoint2D(unittest.TestCase):
         self.assertTrue(is_a_lt_b)
         self.assertFalse(is_a_lt_c)
         self.assertFalse(is_a_lt_d)
+
+    def test_19_neighbors(self):
+        """
+        Verify the neighbors of a point, with and without bounds
+        """
+        # Arrange
+        point = Point2D(0, 0)
+
+        # Act
+        unbounded = point.neighbors()
+        moore = point.neighbors(8)
+        bounded = point.neighbors(8, Point2D(3, 3))
+        shifted = point.neighbors(4, Point2D(1, 1), Point2D(-1, -1))
+
+        # Assert
+        self.assertEqual([Point2D(-1, 0), Point2D(0, -1), Point2D(0, 1), Point2D(1, 0)],
+                         unbounded)
+        self.assertEqual(8, len(moore))
+        self.assertEqual([Point2D(0, 1), Point2D(1, 0), Point2D(1, 1)], bounded)
+        self.assertEqual([Point2D(-1, 0), Point2D(0, -1)], shifted)
+        with self.assertRaises(ValueError):
+            point.neighbors(6)
+
+    def test_20_pickle(self):
+        """
+        Verify that a point pickles as its class and coordinates only
+        """
+        # Arrange
+        point = Point2D(3, -4)
+
+        # Act
+        data = pickle.dumps(point)
+        out = pickle.loads(data)
+
+        # Assert
+        self.assertEqual(point, out)
+        self.assertIsInstance(out, Point2D)
+        self.assertNotIn(b'_Point2D__x', data)
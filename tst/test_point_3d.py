@@ -1,6 +1,7 @@
 """
 Module containing the unittests for the Point3D class
 """
+import pickle
 import unittest
 
 from math import sqrt
@@ -619,3 +620,41 @@ class TestsPoint3D(unittest.TestCase):
         self.assertFalse(is_a_ge_c)
         self.assertFalse(is_a_ge_d)
         self.assertFalse(is_a_ge_e)
+
+    def test_25_neighbors(self):
+        """
+        Verify the neighbors of a point, with and without bounds
+        """
+        # Arrange
+        point = Point3D(0, 0, 0)
+
+        # Act
+        unbounded = point.neighbors()
+        moore = point.neighbors(26)
+        bounded = point.neighbors(6, Point3D(3, 3, 3))
+        corner = point.neighbors(26, Point3D(3, 3, 3))
+
+        # Assert
+        self.assertEqual(6, len(unbounded))
+        self.assertIn(Point3D(0, 0, -1), unbounded)
+        self.assertEqual(26, len(moore))
+        self.assertEqual([Point3D(0, 0, 1), Point3D(0, 1, 0), Point3D(1, 0, 0)], bounded)
+        self.assertEqual(7, len(corner))
+        with self.assertRaises(ValueError):
+            point.neighbors(4)
+
+    def test_26_pickle(self):
+        """
+        Verify that a point pickles as its class and coordinates only
+        """
+        # Arrange
+        point = Point3D(3, -4, 5)
+
+        # Act
+        data = pickle.dumps(point)
+        out = pickle.loads(data)
+
+        # Assert
+        self.assertEqual(point, out)
+        self.assertIsInstance(out, Point3D)
+        self.assertNotIn(b'_Point3D__x', data)
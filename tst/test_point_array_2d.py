@@ -0,0 +1,254 @@
+"""
+Module containing the unittests for the PointArray2D class
+"""
+import pickle
+import unittest
+from array import array
+
+from src.grid_points.point_2d import Point2D
+from src.grid_points.point_array_2d import PointArray2D
+
+
+class TestPointArray2D(unittest.TestCase):
+    """
+    Test cases for the PointArray2D class
+    """
+    def test_01_from_to_points(self):
+        """
+        Verify the conversion from and to a list of points
+        """
+        # Arrange
+        points = [Point2D(1, 2), Point2D(3, 4), Point2D(-5, 6)]
+
+        # Act
+        out = PointArray2D.from_points(points)
+        actual = out.to_points()
+
+        # Assert
+        self.assertEqual(points, actual)
+        self.assertEqual([1, 3, -5], out.xs.tolist())
+        self.assertEqual([2, 4, 6], out.ys.tolist())
+
+    def test_02_from_generator(self):
+        """
+        Verify that a batch can be created from a one-shot iterable
+        """
+        # Arrange
+        points = (Point2D(i, 2 * i) for i in range(3))
+
+        # Act
+        out = PointArray2D.from_points(points)
+
+        # Assert
+        self.assertEqual(PointArray2D([0, 1, 2], [0, 2, 4]), out)
+
+    def test_03_length_mismatch(self):
+        """
+        Verify that coordinate sequences of different length are rejected
+        """
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            PointArray2D([1, 2], [3])
+
+    def test_04_indexing(self):
+        """
+        Verify indexing and slicing
+        """
+        # Arrange
+        out = PointArray2D([1, 3, 5], [2, 4, 6])
+
+        # Act
+        second = out[1]
+        last = out[-1]
+        reversed_slice = out[::-1]
+
+        # Assert
+        self.assertEqual(Point2D(3, 4), second)
+        self.assertEqual(Point2D(5, 6), last)
+        self.assertEqual(PointArray2D([5, 3, 1], [6, 4, 2]), reversed_slice)
+
+    def test_05_setitem_append_extend(self):
+        """
+        Verify that the batch can be modified in place
+        """
+        # Arrange
+        out = PointArray2D([1], [2])
+
+        # Act
+        out[0] = Point2D(7, 8)
+        out.append(Point2D(9, 10))
+        out.extend([Point2D(11, 12)])
+        out.extend(PointArray2D([13], [14]))
+
+        # Assert
+        self.assertEqual(PointArray2D([7, 9, 11, 13], [8, 10, 12, 14]), out)
+
+    def test_06_sequence(self):
+        """
+        Verify len, iteration, containment and index
+        """
+        # Arrange
+        out = PointArray2D([1, 3], [2, 4])
+
+        # Act & Assert
+        self.assertEqual(2, len(out))
+        self.assertEqual([Point2D(1, 2), Point2D(3, 4)], list(out))
+        self.assertIn(Point2D(3, 4), out)
+        self.assertNotIn(Point2D(4, 3), out)
+        self.assertEqual(1, out.index(Point2D(3, 4)))
+
+    def test_07_broadcast(self):
+        """
+        Verify the operators when the other operand is a single point
+        """
+        # Arrange
+        out = PointArray2D([6, 12], [8, -9])
+        other = Point2D(4, 3)
+
+        # Act
+        added = out + other
+        subtracted = out - other
+        multiplied = out * other
+        divided = out // other
+
+        # Assert
+        self.assertEqual(PointArray2D([10, 16], [11, -6]), added)
+        self.assertEqual(PointArray2D([2, 8], [5, -12]), subtracted)
+        self.assertEqual(PointArray2D([24, 48], [24, -27]), multiplied)
+        self.assertEqual(PointArray2D([1, 3], [2, -3]), divided)
+
+    def test_08_elementwise(self):
+        """
+        Verify the operators when the other operand is a batch, compared to the point operators
+        """
+        # Arrange
+        left = [Point2D(6, 12), Point2D(-7, 3)]
+        right = [Point2D(4, 5), Point2D(2, -2)]
+        out = PointArray2D.from_points(left)
+        other = PointArray2D.from_points(right)
+
+        # Act
+        added = out + other
+        divided = out // other
+
+        # Assert
+        self.assertEqual([a + b for a, b in zip(left, right)], added.to_points())
+        self.assertEqual([a // b for a, b in zip(left, right)], divided.to_points())
+
+    def test_09_elementwise_length_mismatch(self):
+        """
+        Verify that batches of different length can not be combined
+        """
+        # Arrange
+        out = PointArray2D([1, 2], [3, 4])
+        other = PointArray2D([1], [3])
+
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            _ = out + other
+
+    def test_10_copy(self):
+        """
+        Verify that a copy does not share the buffers
+        """
+        # Arrange
+        out = PointArray2D([1, 2], [3, 4])
+
+        # Act
+        copied = out.copy()
+        copied[0] = Point2D(0, 0)
+
+        # Assert
+        self.assertEqual(Point2D(1, 3), out[0])
+        self.assertEqual(Point2D(0, 0), copied[0])
+
+    def test_11_neighbors(self):
+        """
+        Verify the batched neighbors match the neighbors of the single points
+        """
+        # Arrange
+        out = PointArray2D([0, 1, 2], [0, 1, 2])
+        end = Point2D(3, 3)
+
+        # Act
+        unbounded, unbounded_sources = out.neighbors(8)
+        bounded, bounded_sources = out.neighbors(4, end)
+
+        # Assert
+        self.assertEqual(24, len(unbounded))
+        self.assertEqual([0, 1, 2] * 8, unbounded_sources.tolist())
+        for point, source in zip(unbounded, unbounded_sources):
+            self.assertIn(point, out[source].neighbors(8))
+
+        # Points are only partially ordered, so the pairs are compared as coordinates
+        expected = [((neighbor.x, neighbor.y), i) for i, point in enumerate(out)
+                    for neighbor in point.neighbors(4, end)]
+        actual = [((neighbor.x, neighbor.y), i) for neighbor, i in zip(bounded, bounded_sources)]
+        self.assertEqual(sorted(expected), sorted(actual))
+
+    def test_12_pickle(self):
+        """
+        Verify pickling with every protocol and with out-of-band buffers
+        """
+        # Arrange
+        points = PointArray2D(range(-50, 50), range(100, 0, -1))
+
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            # Act
+            out = pickle.loads(pickle.dumps(points, protocol))
+
+            # Assert
+            self.assertEqual(points, out)
+
+        buffers: list = []
+        data = pickle.dumps(points, 5, buffer_callback=buffers.append)
+        out = pickle.loads(data, buffers=buffers)
+
+        self.assertEqual(points, out)
+        self.assertEqual(2, len(buffers))
+        self.assertLess(len(data), 100)
+
+    def test_13_broadcast_left(self):
+        """
+        Verify the operators when the single point is the left operand
+        """
+        # Arrange
+        out = PointArray2D([6, 12], [8, -9])
+        other = Point2D(40, 3)
+
+        # Act
+        added = other + out
+        subtracted = other - out
+        multiplied = other * out
+        divided = other // out
+
+        # Assert
+        self.assertEqual(PointArray2D([46, 52], [11, -6]), added)
+        self.assertEqual(PointArray2D([34, 28], [-5, 12]), subtracted)
+        self.assertEqual(PointArray2D([240, 480], [24, -27]), multiplied)
+        self.assertEqual(PointArray2D([6, 3], [0, -1]), divided)
+        self.assertEqual([other - point for point in out], subtracted.to_points())
+        with self.assertRaises(TypeError):
+            _ = other + 5
+
+    def test_14_from_arrays(self):
+        """
+        Verify that the arrays are shared unless they are copied, and the invalid arrays
+        """
+        # Arrange
+        xs = array('q', [1, 2])
+        ys = array('q', [3, 4])
+
+        # Act
+        shared = PointArray2D.from_arrays(xs, ys)
+        copied = PointArray2D.from_arrays(xs, ys, copy=True)
+        converted = PointArray2D.from_arrays(array('i', [5]), array('b', [6]), copy=True)
+        xs[0] = 10
+
+        # Assert
+        self.assertIs(xs, shared.xs)
+        self.assertEqual(Point2D(10, 3), shared[0])
+        self.assertEqual(Point2D(1, 3), copied[0])
+        self.assertEqual(PointArray2D([5], [6]), converted)
+        self.assertRaises(ValueError, PointArray2D.from_arrays, xs, array('q', [1]))
+        self.assertRaises(ValueError, PointArray2D.from_arrays, array('i', [5]), array('q', [6]))
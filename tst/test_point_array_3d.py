@@ -0,0 +1,209 @@
+"""
+Module containing the unittests for the PointArray3D class
+"""
+import pickle
+import unittest
+from array import array
+
+from src.grid_points.point_3d import Point3D
+from src.grid_points.point_array_3d import PointArray3D
+
+
+class TestPointArray3D(unittest.TestCase):
+    """
+    Test cases for the PointArray3D class
+    """
+    def test_01_from_to_points(self):
+        """
+        Verify the conversion from and to a list of points
+        """
+        # Arrange
+        points = [Point3D(1, 2, 3), Point3D(3, 4, 5), Point3D(-5, 6, -7)]
+
+        # Act
+        out = PointArray3D.from_points(points)
+        actual = out.to_points()
+
+        # Assert
+        self.assertEqual(points, actual)
+        self.assertEqual([1, 3, -5], out.xs.tolist())
+        self.assertEqual([2, 4, 6], out.ys.tolist())
+        self.assertEqual([3, 5, -7], out.zs.tolist())
+
+    def test_02_length_mismatch(self):
+        """
+        Verify that coordinate sequences of different length are rejected
+        """
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            PointArray3D([1, 2], [3, 4], [5])
+
+    def test_03_indexing(self):
+        """
+        Verify indexing and slicing
+        """
+        # Arrange
+        out = PointArray3D([1, 3, 5], [2, 4, 6], [0, 0, 1])
+
+        # Act
+        second = out[1]
+        reversed_slice = out[::-1]
+
+        # Assert
+        self.assertEqual(Point3D(3, 4, 0), second)
+        self.assertEqual(PointArray3D([5, 3, 1], [6, 4, 2], [1, 0, 0]), reversed_slice)
+
+    def test_04_setitem_append_extend(self):
+        """
+        Verify that the batch can be modified in place
+        """
+        # Arrange
+        out = PointArray3D([1], [2], [3])
+
+        # Act
+        out[0] = Point3D(7, 8, 9)
+        out.append(Point3D(10, 11, 12))
+        out.extend([Point3D(13, 14, 15)])
+
+        # Assert
+        self.assertEqual(PointArray3D([7, 10, 13], [8, 11, 14], [9, 12, 15]), out)
+
+    def test_05_broadcast(self):
+        """
+        Verify the operators when the other operand is a single point
+        """
+        # Arrange
+        out = PointArray3D([6, 12], [8, -9], [1, 2])
+        other = Point3D(4, 3, 2)
+
+        # Act
+        added = out + other
+        subtracted = out - other
+        multiplied = out * other
+        divided = out // other
+
+        # Assert
+        self.assertEqual(PointArray3D([10, 16], [11, -6], [3, 4]), added)
+        self.assertEqual(PointArray3D([2, 8], [5, -12], [-1, 0]), subtracted)
+        self.assertEqual(PointArray3D([24, 48], [24, -27], [2, 4]), multiplied)
+        self.assertEqual(PointArray3D([1, 3], [2, -3], [0, 1]), divided)
+
+    def test_06_elementwise(self):
+        """
+        Verify the operators when the other operand is a batch, compared to the point operators
+        """
+        # Arrange
+        left = [Point3D(6, 12, 1), Point3D(-7, 3, 8)]
+        right = [Point3D(4, 5, 1), Point3D(2, -2, 3)]
+        out = PointArray3D.from_points(left)
+        other = PointArray3D.from_points(right)
+
+        # Act
+        subtracted = out - other
+        multiplied = out * other
+
+        # Assert
+        self.assertEqual([a - b for a, b in zip(left, right)], subtracted.to_points())
+        self.assertEqual([a * b for a, b in zip(left, right)], multiplied.to_points())
+
+    def test_07_elementwise_length_mismatch(self):
+        """
+        Verify that batches of different length can not be combined
+        """
+        # Arrange
+        out = PointArray3D([1, 2], [3, 4], [5, 6])
+        other = PointArray3D([1], [3], [5])
+
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            _ = out * other
+
+    def test_08_neighbors(self):
+        """
+        Verify the batched neighbors match the neighbors of the single points
+        """
+        # Arrange
+        out = PointArray3D([0, 1], [0, 1], [0, 1])
+        end = Point3D(2, 2, 2)
+        start = Point3D(0, 0, 1)
+
+        # Act
+        unbounded, unbounded_sources = out.neighbors()
+        bounded, bounded_sources = out.neighbors(26, end, start)
+
+        # Assert
+        self.assertEqual(12, len(unbounded))
+        self.assertEqual([0, 1] * 6, unbounded_sources.tolist())
+
+        # Points are only partially ordered, so the pairs are compared as coordinates
+        expected = [((neighbor.x, neighbor.y, neighbor.z), i) for i, point in enumerate(out)
+                    for neighbor in point.neighbors(26, end, start)]
+        actual = [((neighbor.x, neighbor.y, neighbor.z), i)
+                  for neighbor, i in zip(bounded, bounded_sources)]
+        self.assertEqual(sorted(expected), sorted(actual))
+
+    def test_09_pickle(self):
+        """
+        Verify pickling with every protocol and with out-of-band buffers
+        """
+        # Arrange
+        points = PointArray3D(range(-50, 50), range(100, 0, -1), range(0, 200, 2))
+
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            # Act
+            out = pickle.loads(pickle.dumps(points, protocol))
+
+            # Assert
+            self.assertEqual(points, out)
+
+        buffers: list = []
+        data = pickle.dumps(points, 5, buffer_callback=buffers.append)
+        out = pickle.loads(data, buffers=buffers)
+
+        self.assertEqual(points, out)
+        self.assertEqual(3, len(buffers))
+        self.assertLess(len(data), 100)
+
+    def test_10_broadcast_left(self):
+        """
+        Verify the operators when the single point is the left operand
+        """
+        # Arrange
+        out = PointArray3D([6, 12], [8, -9], [1, 2])
+        other = Point3D(40, 3, 2)
+
+        # Act
+        added = other + out
+        subtracted = other - out
+        multiplied = other * out
+        divided = other // out
+
+        # Assert
+        self.assertEqual(PointArray3D([46, 52], [11, -6], [3, 4]), added)
+        self.assertEqual(PointArray3D([34, 28], [-5, 12], [1, 0]), subtracted)
+        self.assertEqual(PointArray3D([240, 480], [24, -27], [2, 4]), multiplied)
+        self.assertEqual(PointArray3D([6, 3], [0, -1], [2, 1]), divided)
+        self.assertEqual([other // point for point in out], divided.to_points())
+        with self.assertRaises(TypeError):
+            _ = other * 5
+
+    def test_11_from_arrays(self):
+        """
+        Verify that the arrays are shared unless they are copied, and the invalid arrays
+        """
+        # Arrange
+        xs = array('q', [1, 2])
+        ys = array('q', [3, 4])
+        zs = array('q', [5, 6])
+
+        # Act
+        shared = PointArray3D.from_arrays(xs, ys, zs)
+        copied = PointArray3D.from_arrays(xs, ys, zs, copy=True)
+        zs[1] = 0
+
+        # Assert
+        self.assertIs(zs, shared.zs)
+        self.assertEqual(Point3D(2, 4, 0), shared[1])
+        self.assertEqual(Point3D(2, 4, 6), copied[1])
+        self.assertRaises(ValueError, PointArray3D.from_arrays, xs, ys, array('q', [1]))
+        self.assertRaises(ValueError, PointArray3D.from_arrays, xs, ys, array('d', [1.0, 2.0]))
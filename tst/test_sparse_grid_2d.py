@@ -0,0 +1,130 @@
+"""
+Module containing the unittests for the SparseGrid2D class
+"""
+import unittest
+
+from src.grid_points.point_2d import Point2D
+from src.grid_points.sparse_grid_2d import SparseGrid2D
+
+
+class TestSparseGrid2D(unittest.TestCase):
+    """
+    Test cases for the SparseGrid2D class
+    """
+    def test_01_default(self):
+        """
+        Verify that cells, which were never set, have the default value and allocate nothing
+        """
+        # Arrange
+        out = SparseGrid2D(tile_size=8, default=-1)
+
+        # Act
+        value = out[Point2D(10 ** 9, -10 ** 9)]
+        out[Point2D(5, 5)] = -1
+
+        # Assert
+        self.assertEqual(-1, value)
+        self.assertEqual(0, out.tile_count)
+        self.assertEqual(0, len(out))
+
+    def test_02_get_set_negative(self):
+        """
+        Verify access to cells with negative coordinates, across tile borders
+        """
+        # Arrange
+        out = SparseGrid2D(tile_size=4)
+        points = [Point2D(-1, -1), Point2D(-4, 3), Point2D(-5, 4), Point2D(0, 0)]
+
+        # Act
+        for value, point in enumerate(points, start=1):
+            out[point] = value
+
+        # Assert
+        self.assertEqual([1, 2, 3, 4], [out[point] for point in points])
+        self.assertEqual(3, out.get(-5, 4))
+        self.assertEqual(0, out.get(-5, 3))
+        self.assertEqual(4, out.tile_count)
+
+    def test_03_tiles_released(self):
+        """
+        Verify that a tile is released when its last occupied cell is cleared
+        """
+        # Arrange
+        out = SparseGrid2D(tile_size=4)
+        out[Point2D(1, 1)] = 5
+        out[Point2D(2, 2)] = 6
+
+        # Act
+        del out[Point2D(1, 1)]
+        count_after_first = out.tile_count
+        out[Point2D(2, 2)] = 0
+
+        # Assert
+        self.assertEqual(1, count_after_first)
+        self.assertEqual(0, out.tile_count)
+        self.assertNotIn(Point2D(2, 2), out)
+
+    def test_04_items(self):
+        """
+        Verify that iteration returns exactly the occupied cells
+        """
+        # Arrange
+        out = SparseGrid2D(tile_size=4)
+        expected = {Point2D(-7, 3): 1, Point2D(0, 0): 2, Point2D(9, -12): 3}
+        for point, value in expected.items():
+            out[point] = value
+        out[Point2D(1, 1)] = 4
+        out[Point2D(1, 1)] = 0
+
+        # Act
+        actual = dict(out.items())
+
+        # Assert
+        self.assertEqual(expected, actual)
+        self.assertEqual(set(expected), set(out))
+        self.assertEqual(3, len(out))
+
+    def test_05_bounding_box(self):
+        """
+        Verify that the bounding box is exact and not aligned to the tiles
+        """
+        # Arrange
+        out = SparseGrid2D(tile_size=8)
+        out[Point2D(-3, 5)] = 1
+        out[Point2D(10, -2)] = 1
+        out[Point2D(4, 20)] = 1
+
+        # Act
+        start, end = out.bounding_box()
+
+        # Assert
+        self.assertEqual(Point2D(-3, -2), start)
+        self.assertEqual(Point2D(11, 21), end)
+        self.assertIsNone(SparseGrid2D().bounding_box())
+
+    def test_06_to_grid(self):
+        """
+        Verify the conversion to a dense grid
+        """
+        # Arrange
+        out = SparseGrid2D(tile_size=4)
+        out[Point2D(-2, 1)] = 7
+        out[Point2D(1, 3)] = 8
+
+        # Act
+        grid = out.to_grid()
+
+        # Assert
+        self.assertEqual(Point2D(-2, 1), grid.start)
+        self.assertEqual(Point2D(2, 4), grid.end)
+        self.assertEqual(7, grid[Point2D(-2, 1)])
+        self.assertEqual(8, grid[Point2D(1, 3)])
+        self.assertEqual(2, sum(1 for value in grid.values() if value))
+
+    def test_07_invalid_tile_size(self):
+        """
+        Verify that the tile size must be a power of two
+        """
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            SparseGrid2D(tile_size=12)
@@ -0,0 +1,83 @@
+"""
+Module containing the unittests for the SparseGrid3D class
+"""
+import unittest
+
+from src.grid_points.point_3d import Point3D
+from src.grid_points.sparse_grid_3d import SparseGrid3D
+
+
+class TestSparseGrid3D(unittest.TestCase):
+    """
+    Test cases for the SparseGrid3D class
+    """
+    def test_01_get_set_negative(self):
+        """
+        Verify access to cells with negative coordinates, across tile borders
+        """
+        # Arrange
+        out = SparseGrid3D(tile_size=4)
+        points = [Point3D(-1, -1, -1), Point3D(-4, 3, 0), Point3D(-5, 4, 7), Point3D(0, 0, 0)]
+
+        # Act
+        for value, point in enumerate(points, start=1):
+            out[point] = value
+
+        # Assert
+        self.assertEqual([1, 2, 3, 4], [out[point] for point in points])
+        self.assertEqual(0, out.get(-5, 4, 6))
+        self.assertEqual(4, out.tile_count)
+
+    def test_02_items_and_release(self):
+        """
+        Verify iteration over the occupied cells and releasing empty tiles
+        """
+        # Arrange
+        out = SparseGrid3D(tile_size=2)
+        expected = {Point3D(-7, 3, 1): 1, Point3D(0, 0, -9): 2}
+        for point, value in expected.items():
+            out[point] = value
+        out[Point3D(5, 5, 5)] = 3
+
+        # Act
+        del out[Point3D(5, 5, 5)]
+        actual = dict(out.items())
+
+        # Assert
+        self.assertEqual(expected, actual)
+        self.assertEqual(2, out.tile_count)
+        self.assertEqual(2, len(out))
+
+    def test_03_bounding_box(self):
+        """
+        Verify that the bounding box is exact on every axis
+        """
+        # Arrange
+        out = SparseGrid3D(tile_size=4)
+        out[Point3D(1, 6, 2)] = 1
+        out[Point3D(-3, 2, 9)] = 1
+
+        # Act
+        start, end = out.bounding_box()
+
+        # Assert
+        self.assertEqual(Point3D(-3, 2, 2), start)
+        self.assertEqual(Point3D(2, 7, 10), end)
+
+    def test_04_to_grid(self):
+        """
+        Verify the conversion to a dense grid
+        """
+        # Arrange
+        out = SparseGrid3D(tile_size=4)
+        out[Point3D(-2, 1, 0)] = 7
+        out[Point3D(1, 3, -1)] = 8
+
+        # Act
+        grid = out.to_grid()
+
+        # Assert
+        self.assertEqual(Point3D(-2, 1, -1), grid.start)
+        self.assertEqual(Point3D(2, 4, 1), grid.end)
+        self.assertEqual(7, grid[Point3D(-2, 1, 0)])
+        self.assertEqual(8, grid[Point3D(1, 3, -1)])
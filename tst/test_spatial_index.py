@@ -0,0 +1,194 @@
+"""
+Module containing the unittests for the spatial_index module
+"""
+import random
+import unittest
+
+from src.grid_points.point_2d import Point2D
+from src.grid_points.point_3d import Point3D
+from src.grid_points.point_array_2d import PointArray2D
+from src.grid_points.spatial_index import METRICS, HashGridIndex, KDTree
+
+DISTANCES = {
+    'euclidean': lambda a, b: sum((x - y) ** 2 for x, y in zip(a, b)) ** 0.5,
+    'manhattan': lambda a, b: sum(abs(x - y) for x, y in zip(a, b)),
+    'chebyshev': lambda a, b: max(abs(x - y) for x, y in zip(a, b)),
+}
+
+
+def coordinates(point) -> tuple:
+    """
+    Return the coordinates of a point as a tuple
+    """
+    if isinstance(point, Point3D):
+        return (point.x, point.y, point.z)
+
+    return (point.x, point.y)
+
+
+def random_points(count: int, dimensions: int, seed: int) -> list:
+    """
+    Create random points with a few duplicates
+    """
+    generator = random.Random(seed)
+    point_class = Point2D if dimensions == 2 else Point3D
+    points = [point_class(*(generator.randint(-50, 50) for _ in range(dimensions)))
+              for _ in range(count)]
+    return points + points[:5]
+
+
+def brute_radius(points, center, radius, metric) -> list:
+    """
+    Find the points within a radius with a linear scan
+    """
+    distance = DISTANCES[metric]
+    return [i for i, point in enumerate(points)
+            if distance(coordinates(center), coordinates(point)) <= radius + 1e-9]
+
+
+def brute_nearest(points, center, k, metric) -> list:
+    """
+    Find the nearest points with a linear scan
+    """
+    distance = DISTANCES[metric]
+    return sorted(range(len(points)),
+                  key=lambda i: (distance(coordinates(center), coordinates(points[i])), i))[:k]
+
+
+class TestSpatialIndex(unittest.TestCase):
+    """
+    Test cases for the spatial_index module
+    """
+    def check_queries(self, index, points, dimensions):
+        """
+        Verify every query of an index against a linear scan
+        """
+        point_class = Point2D if dimensions == 2 else Point3D
+        centers = random_points(10, dimensions, 7)
+
+        for center in centers:
+            for metric in METRICS:
+                for radius in (0, 7, 25.5):
+                    self.assertEqual(brute_radius(points, center, radius, metric),
+                                     index.radius(center, radius, metric))
+
+                for k in (1, 4, 30):
+                    self.assertEqual(brute_nearest(points, center, k, metric),
+                                     index.nearest(center, k, metric))
+
+            end = center + point_class(*([20] * dimensions))
+            self.assertEqual([i for i, point in enumerate(points) if point.is_within(end, center)],
+                             index.rectangle(end, center))
+
+    def test_01_hash_grid_2d(self):
+        """
+        Verify the queries of a 2D hash grid index
+        """
+        # Arrange
+        points = random_points(300, 2, 1)
+
+        # Act
+        index = HashGridIndex(points, cell_size=8)
+
+        # Assert
+        self.assertEqual(len(points), len(index))
+        self.check_queries(index, points, 2)
+
+    def test_02_hash_grid_3d(self):
+        """
+        Verify the queries of a 3D hash grid index
+        """
+        # Arrange
+        points = random_points(300, 3, 2)
+
+        # Act
+        index = HashGridIndex(points, cell_size=5)
+
+        # Assert
+        self.check_queries(index, points, 3)
+
+    def test_03_kd_tree_2d(self):
+        """
+        Verify the queries of a 2D k-d tree, built from a PointArray2D
+        """
+        # Arrange
+        points = random_points(300, 2, 3)
+
+        # Act
+        tree = KDTree(PointArray2D.from_points(points))
+
+        # Assert
+        self.assertEqual(len(points), len(tree))
+        self.assertEqual(points[10], tree[10])
+        self.check_queries(tree, points, 2)
+
+    def test_04_kd_tree_3d(self):
+        """
+        Verify the queries of a 3D k-d tree
+        """
+        # Arrange
+        points = random_points(300, 3, 4)
+
+        # Act
+        tree = KDTree(points)
+
+        # Assert
+        self.check_queries(tree, points, 3)
+
+    def test_05_insert_delete(self):
+        """
+        Verify that deleted points are no longer returned and ids are kept
+        """
+        # Arrange
+        index = HashGridIndex(cell_size=4)
+        first = index.insert(Point2D(1, 1))
+        second = index.insert(Point2D(2, 2))
+        third = index.insert(Point2D(-30, 40))
+
+        # Act
+        index.delete(second)
+
+        # Assert
+        self.assertEqual((0, 1, 2), (first, second, third))
+        self.assertEqual(2, len(index))
+        self.assertEqual([first, third], list(index))
+        self.assertNotIn(second, index)
+        self.assertEqual([first], index.radius(Point2D(2, 2), 2))
+        self.assertEqual([first, third], index.nearest(Point2D(2, 2), 5))
+        self.assertEqual(Point2D(-30, 40), index[third])
+        with self.assertRaises(KeyError):
+            index.delete(second)
+        with self.assertRaises(KeyError):
+            _ = index[second]
+
+    def test_06_empty_and_invalid(self):
+        """
+        Verify the queries of empty indexes and the invalid arguments
+        """
+        # Act & Assert
+        self.assertEqual([], HashGridIndex().nearest(Point2D(0, 0)))
+        self.assertEqual([], KDTree([]).nearest(Point2D(0, 0)))
+        self.assertEqual([], KDTree([]).radius(Point2D(0, 0), 5))
+        with self.assertRaises(ValueError):
+            HashGridIndex(cell_size=0)
+        with self.assertRaises(ValueError):
+            KDTree([Point2D(0, 0)]).radius(Point2D(0, 0), 1, 'squared_euclidean')
+
+    def test_07_far_points(self):
+        """
+        Verify that the nearest points are found quickly, when they are many cells away
+        """
+        # Arrange
+        index = HashGridIndex([Point2D(2000, 0)], cell_size=1)
+        cluster = HashGridIndex([Point3D(x, y, 0) for x in range(3) for y in range(3)] +
+                                [Point3D(-20000, 5, 20000)], cell_size=1)
+
+        # Act
+        nearest = index.nearest(Point2D(0, 0))
+        behind = index.nearest(Point2D(10 ** 6, -10 ** 6), 3, 'manhattan')
+        farthest = cluster.nearest(Point3D(-20000, 0, 20000), 10, 'chebyshev')
+
+        # Assert
+        self.assertEqual([0], nearest)
+        self.assertEqual([0], behind)
+        self.assertEqual([9, 0, 1, 2, 3, 4, 5, 6, 7, 8], farthest)
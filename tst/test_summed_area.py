@@ -0,0 +1,173 @@
+"""
+Module containing the unittests for the summed_area module
+"""
+import random
+import unittest
+
+from src.grid_points.box_2d import Box2D
+from src.grid_points.box_3d import Box3D
+from src.grid_points.grid_2d import Grid2D
+from src.grid_points.grid_3d import Grid3D
+from src.grid_points.grid_iterator_2d import GridIterator2D
+from src.grid_points.grid_iterator_3d import GridIterator3D
+from src.grid_points.point_2d import Point2D
+from src.grid_points.point_3d import Point3D
+from src.grid_points.point_array_2d import PointArray2D
+from src.grid_points.point_array_3d import PointArray3D
+from src.grid_points.summed_area import FenwickTree, SummedAreaTable
+
+
+def box_sum(grid, end, start, value=None):
+    """
+    Reference box sum - iterate over the cells of the box, which are inside the grid
+    """
+    iterator = GridIterator2D(end, start) if isinstance(grid, Grid2D) else \
+        GridIterator3D(end, start)
+    cells = [grid[point] for point in iterator if point in grid]
+    return sum(cells) if value is None else cells.count(value)
+
+
+def random_point(generator: random.Random, dimensions: int, low: int, high: int):
+    """
+    Create a random point with coordinates inside [low, high)
+    """
+    coordinates = [generator.randrange(low, high) for _ in range(dimensions)]
+    return Point2D(*coordinates) if dimensions == 2 else Point3D(*coordinates)
+
+
+class TestSummedArea(unittest.TestCase):
+    """
+    Test cases for the SummedAreaTable and FenwickTree classes
+    """
+    def test_01_summed_area_table(self):
+        """
+        Verify single box sums and counts in 2D, including boxes partially outside the grid
+        """
+        # Arrange
+        grid = Grid2D(Point2D(3, 4), Point2D(1, 1))
+        for index in range(len(grid)):
+            grid.data[index] = index + 1
+
+        # Act
+        out = SummedAreaTable(grid)
+        counts = SummedAreaTable(grid, value=4)
+
+        # Assert
+        self.assertEqual(21, out.total)
+        self.assertEqual(1 + 2 + 4 + 5, out.query(Point2D(3, 3)))
+        self.assertEqual(5 + 6, out.query(Point2D(10, 10), Point2D(2, 2)))
+        self.assertEqual(2 + 3, out.query(Box2D(Point2D(2, 4), Point2D(-5, 2))))
+        self.assertEqual(0, out.query(Point2D(2, 2), Point2D(3, 3)))
+        self.assertEqual(1, counts.query(Point2D(3, 2)))
+        self.assertEqual(0, counts.query(Point2D(3, 4), Point2D(1, 2)))
+        self.assertEqual(Point2D(1, 1), out.start)
+        self.assertEqual(Point2D(3, 4), out.end)
+
+    def test_02_random_queries(self):
+        """
+        Verify random single and batched queries in 2D and 3D against iterating over the boxes
+        """
+        generator = random.Random(13)
+        for dimensions in [2, 3]:
+            # Arrange
+            if dimensions == 2:
+                grid = Grid2D(Point2D(9, 7), Point2D(-3, 1))
+                batch = PointArray2D.from_points
+            else:
+                grid = Grid3D(Point3D(4, 5, 6), Point3D(-1, 0, 2), typecode='d')
+                batch = PointArray3D.from_points
+            for index in range(len(grid)):
+                grid.data[index] = generator.randrange(-5, 6)
+            starts = [random_point(generator, dimensions, -5, 10) for _ in range(50)]
+            ends = [random_point(generator, dimensions, -5, 10) for _ in range(50)]
+            expected = [box_sum(grid, end, start) for start, end in zip(starts, ends)]
+
+            # Act
+            table = SummedAreaTable(grid)
+            tree = FenwickTree(grid)
+
+            # Assert
+            self.assertEqual(expected, [table.query(end, start)
+                                        for start, end in zip(starts, ends)])
+            self.assertEqual(expected, table.query_many(batch(ends), batch(starts)))
+            self.assertEqual(expected, tree.query_many(batch(ends), batch(starts)))
+            self.assertEqual([box_sum(grid, end, grid.start) for end in ends],
+                             table.query_many(batch(ends)))
+            self.assertEqual(sum(grid.data), table.total)
+            self.assertEqual(sum(grid.data), tree.total)
+
+    def test_03_fenwick_updates(self):
+        """
+        Verify that the Fenwick tree follows the changes of a grid
+        """
+        generator = random.Random(17)
+        for grid in [Grid2D(Point2D(7, 12), Point2D(2, -3)), Grid3D(Point3D(5, 3, 4))]:
+            # Arrange
+            dimensions = len(grid.shape)
+            out = FenwickTree(grid, value=1)
+            starts = [random_point(generator, dimensions, -4, 13) for _ in range(30)]
+            ends = [random_point(generator, dimensions, -4, 13) for _ in range(30)]
+            points = list(grid.points())
+
+            # Act
+            for _ in range(100):
+                point = generator.choice(points)
+                grid[point] = generator.randrange(3)
+                out.update(point, grid[point])
+
+            # Assert
+            self.assertEqual([box_sum(grid, end, start, 1) for start, end in zip(starts, ends)],
+                             [out.query(end, start) for start, end in zip(starts, ends)])
+            self.assertEqual(list(grid.data).count(1), out.total)
+
+    def test_04_fenwick_add(self):
+        """
+        Verify adding to single cells and querying boxes
+        """
+        # Arrange
+        out = FenwickTree(Grid3D(Point3D(4, 4, 4)))
+
+        # Act
+        out.add(Point3D(1, 2, 3), 5)
+        out.add(Point3D(3, 3, 3), -2)
+        out.add(Point3D(1, 2, 3), 1)
+
+        # Assert
+        self.assertEqual(4, out.total)
+        self.assertEqual(6, out.query(Box3D(Point3D(2, 3, 4), Point3D(1, 2, 3))))
+        self.assertEqual(-2, out.query(Point3D(9, 9, 9), Point3D(2, 0, 0)))
+        self.assertEqual(0, out.query(Point3D(1, 4, 4)))
+
+    def test_05_invalid(self):
+        """
+        Verify that updates outside the grid and batches of different lengths are rejected
+        """
+        # Arrange
+        grid = Grid2D(Point2D(3, 3))
+        table = SummedAreaTable(grid)
+        tree = FenwickTree(grid)
+        ends = PointArray2D([1, 2], [1, 2])
+        starts = PointArray2D([0], [0])
+
+        # Act & Assert
+        self.assertRaises(IndexError, tree.add, Point2D(3, 0), 1)
+        self.assertRaises(IndexError, tree.update, Point2D(-1, 0), 1)
+        self.assertRaises(ValueError, table.query_many, ends, starts)
+        self.assertRaises(ValueError, tree.query_many, ends, starts)
+        self.assertEqual(0, SummedAreaTable(Grid2D(Point2D(0, 5))).query(Point2D(5, 5)))
+
+    def test_06_mixed_dimensions(self):
+        """
+        Verify that bounds with other dimensions than the grid are rejected
+        """
+        # Arrange
+        grid = Grid2D(Point2D(3, 3))
+        table = SummedAreaTable(grid)
+        tree = FenwickTree(grid)
+
+        for out in (table, tree):
+            # Act & Assert
+            self.assertRaises(ValueError, out.query_many, [Point2D(3, 3)], [Point3D(1, 1, 1)])
+            self.assertRaises(ValueError, out.query_many, [Point3D(3, 3, 3)])
+            self.assertRaises(ValueError, out.query, Point2D(3, 3), Point3D(1, 1, 1))
+            self.assertRaises(ValueError, out.query, Box3D(Point3D(3, 3, 3)))
@@ -0,0 +1,54 @@
+"""
+Module containing the unittests for the traversal module
+"""
+import unittest
+from array import array
+
+from src.grid_points.traversal import axis_order, axis_ranges, walk, walk_blocks
+
+
+class TestTraversal(unittest.TestCase):
+    """
+    Test cases for the arithmetic grid traversals
+    """
+    def test_01_axis_ranges(self):
+        """
+        Verify the ranges of forward, reversed and strided axes
+        """
+        # Act
+        ranges = axis_ranges((2, -1, 0), (7, 3, 0), (2, -1, -3))
+
+        # Assert
+        self.assertEqual([range(2, 7, 2), range(2, -2, -1), range(-1, -1, -3)], ranges)
+        self.assertEqual([range(0, 2), range(1, 3)], axis_ranges((0, 1), (2, 3)))
+        self.assertRaises(ValueError, axis_ranges, (0, 0), (2, 2), (1, 0))
+
+    def test_02_axis_order(self):
+        """
+        Verify the indices of the axes and the rejection of invalid orders
+        """
+        # Act & Assert
+        self.assertEqual([1, 0], axis_order('yx', 2))
+        self.assertEqual([2, 0, 1], axis_order('zxy', 3))
+        self.assertRaises(ValueError, axis_order, 'xz', 2)
+        self.assertRaises(ValueError, axis_order, 'xy', 3)
+
+    def test_03_walk(self):
+        """
+        Verify that tiles are walked completely in the order of the axes, including the partial
+        tiles at the border, and that the blocks follow the same order
+        """
+        # Arrange
+        ranges = [range(3), range(10, 13)]
+
+        # Act
+        cells = list(walk(ranges, [1, 0], (2, 2)))
+        blocks = list(walk_blocks(ranges, [1, 0], (2, 2), 4))
+
+        # Assert
+        self.assertEqual([(0, 10), (1, 10), (0, 11), (1, 11), (2, 10), (2, 11),
+                          (0, 12), (1, 12), (2, 12)], cells)
+        self.assertEqual([[array('q', [0, 1, 0, 1]), array('q', [10, 10, 11, 11])],
+                          [array('q', [2, 2, 0, 1]), array('q', [10, 11, 12, 12])],
+                          [array('q', [2]), array('q', [12])]], blocks)
+        self.assertRaises(ValueError, list, walk_blocks(ranges, [0, 1], None, 0))